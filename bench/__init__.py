@@ -0,0 +1,11 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Воспроизводимые замеры производительности на синтетической выгрузке.
+    python -m bench generate DIR [--seed N] [--size small]
+    python -m bench run [-o result.json] [--seed N] [--size small] [--repeat 5] [--only parse plugin.]
+    python -m bench compare base.json new.json [--threshold 10]
+compare завершается с кодом 1, если какой-либо замер замедлился больше порога (в процентах).
+"""
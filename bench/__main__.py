@@ -0,0 +1,68 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from typing import List, Optional
+import argparse
+import json
+import sys
+
+from bench.corpus import Generator
+from bench.micro import SIZES, run, compare
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='bench', description='Замеры производительности bslinter.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    generate = commands.add_parser('generate', help='записать синтетическую выгрузку')
+    generate.add_argument('root')
+    generate.add_argument('--seed', type=int, default=1)
+    generate.add_argument('--size', choices=SIZES, default='small')
+
+    bench = commands.add_parser('run', help='выполнить замеры')
+    bench.add_argument('-o', '--output', help='файл результата JSON (по умолчанию - stdout)')
+    bench.add_argument('--seed', type=int, default=1)
+    bench.add_argument('--size', choices=SIZES, default='small')
+    bench.add_argument('--repeat', type=int, default=5)
+    bench.add_argument('--root', help='готовая выгрузка вместо генерируемой')
+    bench.add_argument('--only', nargs='+', metavar='PREFIX', help='только замеры с указанными префиксами имен')
+
+    cmp = commands.add_parser('compare', help='сравнить два результата')
+    cmp.add_argument('base')
+    cmp.add_argument('new')
+    cmp.add_argument('--threshold', type=float, default=10.0, help='допустимое замедление, %% (по умолчанию %(default)s)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'generate':
+        modules = Generator(args.seed).configuration(args.root, **SIZES[args.size])
+        print('modules count: ', len(modules))
+        return 0
+
+    if args.command == 'run':
+        result = run(args.seed, args.size, args.repeat, args.only, args.root)
+        text = json.dumps(result, ensure_ascii=False, indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            print(text)
+        for name, item in result['benchmarks'].items():
+            print(f'{name:40} {item["min"] * 1000:10.1f} ms', file=sys.stderr)
+        return 0
+
+    with open(args.base, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(args.new, encoding='utf-8') as f:
+        new = json.load(f)
+    if (base['seed'], base['size']) != (new['seed'], new['size']):
+        print(f'warning: different corpora: seed {base["seed"]}/{new["seed"]}, size {base["size"]}/{new["size"]}')
+    regressions = 0
+    for name, old, cur, regression in compare(base, new, args.threshold / 100):
+        mark = 'REGRESSION' if regression else ''
+        print(f'{name:40} {old * 1000:10.1f} ms {cur * 1000:10.1f} ms {(cur / old - 1) * 100 if old else 0.0:+7.1f}% {mark}')
+        regressions += regression
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Генератор синтетической выгрузки конфигурации для замеров.
+Одно и то же зерно (seed) дает одинаковые файлы. В модулях есть области, инструкции
+препроцессора, директивы компиляции, тексты запросов, обработка исключений,
+закомментированный код; в метаданных - общие модули, документы с реквизитами и формами.
+"""
+
+from typing import List, Optional, Set
+import random
+import os.path
+
+WORDS = [
+    'Товар', 'Контрагент', 'Договор', 'Сумма', 'Количество', 'Цена', 'Склад', 'Организация',
+    'Партнер', 'Валюта', 'Курс', 'Остаток', 'Документ', 'Строка', 'Результат', 'Данные',
+    'Параметры', 'Отбор', 'Период', 'Статус', 'Номенклатура', 'Характеристика', 'Серия', 'Заказ',
+]
+
+QUERY = '''"ВЫБРАТЬ
+	|	Т.Ссылка КАК Ссылка,
+	|	Т.{0} КАК {0},
+	|	СУММА(Т.{1}) КАК {1}
+	|ИЗ
+	|	Документ.{2} КАК Т
+	|ГДЕ
+	|	Т.Дата МЕЖДУ &НачалоПериода И &КонецПериода
+	|	И НЕ Т.ПометкаУдаления
+	|СГРУППИРОВАТЬ ПО
+	|	Т.Ссылка,
+	|	Т.{0}"'''
+
+class Generator:
+
+    def __init__(self, seed: int = 1):
+        self.random = random.Random(seed)
+        self.methods: Set[str] = set() # имена методов уникальны во всей конфигурации
+
+    def name(self, words: int = 2) -> str:
+        return ''.join(self.random.choice(WORDS) for _ in range(words))
+
+    def names(self, count: int, words: int = 2, seen: Optional[Set[str]] = None) -> List[str]:
+        result: List[str] = []
+        seen = set() if seen is None else seen
+        while len(result) < count:
+            name = self.name(words) + (str(len(result)) if self.random.random() < 0.3 else '')
+            if name.lower() not in seen:
+                seen.add(name.lower())
+                result.append(name)
+        return result
+
+    #region bsl
+
+    def expression(self, variables: List[str]) -> str:
+        r = self.random.random()
+        if r < 0.3:
+            return f'{self.random.choice(variables)} + {self.random.randint(1, 100)}'
+        if r < 0.5:
+            return f'"{self.random.choice(WORDS)}: " + {self.random.choice(variables)}'
+        if r < 0.7:
+            return f'{self.random.choice(variables)} * {self.random.choice(variables)}'
+        if r < 0.85:
+            return f'Окр({self.random.choice(variables)} / {self.random.randint(2, 9)}, 2)'
+        return f'СтрДлина(Строка({self.random.choice(variables)}))'
+
+    def statements(self, variables: List[str], calls: List[str], documents: List[str],
+                   depth: int, indent: str) -> List[str]:
+        lines: List[str] = []
+        for _ in range(self.random.randint(2, 6)):
+            r = self.random.random()
+            if r < 0.25:
+                name = self.random.choice(variables)
+                lines.append(f'{indent}{name} = {self.expression(variables)};')
+            elif r < 0.35 and calls:
+                lines.append(f'{indent}{self.random.choice(calls)}();')
+            elif r < 0.45 and depth > 0:
+                lines.append(f'{indent}Если {self.random.choice(variables)} > {self.random.randint(0, 10)} Тогда')
+                lines += self.statements(variables, calls, documents, depth - 1, indent + '\t')
+                if self.random.random() < 0.5:
+                    lines.append(f'{indent}ИначеЕсли {self.random.choice(variables)} = 0 Тогда')
+                    lines += self.statements(variables, calls, documents, depth - 1, indent + '\t')
+                lines.append(f'{indent}Иначе')
+                lines += self.statements(variables, calls, documents, depth - 1, indent + '\t')
+                lines.append(f'{indent}КонецЕсли;')
+            elif r < 0.52 and depth > 0:
+                lines.append(f'{indent}Для Индекс = 1 По {self.random.randint(2, 20)} Цикл')
+                lines += self.statements(variables, calls, documents, depth - 1, indent + '\t')
+                lines.append(f'{indent}КонецЦикла;')
+            elif r < 0.58 and depth > 0:
+                lines.append(f'{indent}Попытка')
+                lines += self.statements(variables, calls, documents, depth - 1, indent + '\t')
+                lines.append(f'{indent}Исключение')
+                if self.random.random() < 0.7:
+                    lines.append(f'{indent}\tЗаписьЖурналаРегистрации("{self.name()}", , , , ОписаниеОшибки());')
+                lines.append(f'{indent}КонецПопытки;')
+            elif r < 0.63 and documents:
+                a, b = self.random.sample(WORDS, 2)
+                lines.append(f'{indent}Запрос = Новый Запрос;')
+                lines.append(f'{indent}Запрос.Текст = ' + QUERY.format(a, b, self.random.choice(documents)).replace('\n', '\n' + indent) + ';')
+                lines.append(f'{indent}Запрос.УстановитьПараметр("НачалоПериода", НачалоДня(ТекущаяДата()));')
+                lines.append(f'{indent}Запрос.УстановитьПараметр("КонецПериода", КонецДня(ТекущаяДата()));')
+                lines.append(f'{indent}Выборка = Запрос.Выполнить().Выбрать();')
+                lines.append(f'{indent}Пока Выборка.Следующий() Цикл')
+                lines.append(f'{indent}\t{self.random.choice(variables)} = Выборка.{b};')
+                lines.append(f'{indent}КонецЦикла;')
+            elif r < 0.68:
+                keys = self.random.sample(WORDS, 3)
+                lines.append(f'{indent}Структура = Новый Структура("{", ".join(keys)}", 1, 2, 3);')
+                lines.append(f'{indent}Структура.Вставить("{self.random.choice(WORDS)}", {self.random.choice(variables)});')
+            elif r < 0.73:
+                lines.append(f'{indent}Массив = Новый Массив;')
+                lines.append(f'{indent}Для Каждого Элемент Из Массив Цикл')
+                lines.append(f'{indent}\t{self.random.choice(variables)} = Элемент;')
+                lines.append(f'{indent}КонецЦикла;')
+            elif r < 0.78:
+                lines.append(f'{indent}// {self.random.choice(variables)} = {self.expression(variables)};')
+            elif r < 0.82:
+                lines.append(f'{indent}// TODO: {self.name(3).lower()}')
+            else:
+                name = self.random.choice(variables)
+                lines.append(f'{indent}{name} = {name} + {self.random.randint(1, 9)};')
+        return lines
+
+    def method(self, name: str, calls: List[str], documents: List[str], export: bool,
+               directive: Optional[str] = None) -> List[str]:
+        function = self.random.random() < 0.5
+        params = self.names(self.random.randint(0, 3), 1)
+        variables = [f'Лок{word}' for word in self.random.sample(WORDS, 3)]
+        header = []
+        for i, param in enumerate(params):
+            param = ('Знач ' if self.random.random() < 0.3 else '') + 'П' + param
+            if i == len(params) - 1 and self.random.random() < 0.3:
+                param += ' = Неопределено'
+            header.append(param)
+        lines: List[str] = []
+        if directive:
+            lines.append(directive)
+        kind, end = ('Функция', 'КонецФункции') if function else ('Процедура', 'КонецПроцедуры')
+        lines.append(f'{kind} {name}({", ".join(header)}){" Экспорт" if export else ""}')
+        lines.append('\t' + '; '.join(f'{v} = 0' for v in variables) + ';')
+        lines += self.statements(variables, calls, documents, 2, '\t')
+        if function:
+            lines.append(f'\tВозврат {self.random.choice(variables)};')
+        lines.append(end)
+        lines.append('')
+        if not params:
+            calls.append(name)
+        return lines
+
+    def module(self, methods: int, documents: List[str], server: bool = True, form: bool = False,
+               export: bool = True) -> str:
+        """
+        Текст модуля из methods методов, сгруппированных в области.
+        """
+        names = self.names(methods, 3, self.methods)
+        lines: List[str] = []
+        regions = ['ПрограммныйИнтерфейс', 'СлужебныеПроцедурыИФункции']
+        if form:
+            regions.insert(0, 'ОбработчикиСобытийФормы')
+        per_region = max(1, methods // len(regions))
+        calls: List[str] = [] # методы без параметров, объявленные выше
+        i = 0
+        for n, region in enumerate(regions):
+            lines.append(f'#Область {region}')
+            lines.append('')
+            count = per_region if n < len(regions) - 1 else methods - i
+            prep = server and not form and self.random.random() < 0.3
+            if prep:
+                lines.append('#Если Сервер Или ТолстыйКлиентОбычноеПриложение Тогда')
+                lines.append('')
+            for _ in range(count):
+                name = names[i]
+                directive = self.random.choice(['&НаКлиенте', '&НаСервере', '&НаСервереБезКонтекста']) if form else None
+                lines += self.method(name, calls, documents, export and region == 'ПрограммныйИнтерфейс' and not form, directive)
+                i += 1
+            if prep:
+                lines.append('#КонецЕсли')
+                lines.append('')
+            lines.append('#КонецОбласти')
+            lines.append('')
+        return '\n'.join(lines)
+
+    #endregion bsl
+
+    #region md
+
+    def configuration(self, root: str, common_modules: int = 20, documents: int = 10, forms: int = 1,
+                      attributes: int = 8, methods: int = 20) -> List[str]:
+        """
+        Записывает выгрузку конфигурации в каталог root. Возвращает пути модулей.
+        """
+        modules: List[str] = []
+
+        def write(path: str, text: str):
+            path = os.path.join(root, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8-sig') as f:
+                f.write(text)
+            if path.endswith('.bsl'):
+                modules.append(path)
+
+        common = self.names(common_modules)
+        docs = self.names(documents)
+        children = ''.join(f'<CommonModule>{name}</CommonModule>' for name in common)
+        children += ''.join(f'<Document>{name}</Document>' for name in docs)
+        write('Configuration.xml',
+              '<?xml version="1.0" encoding="UTF-8"?>\n'
+              '<MetaDataObject><Configuration><Properties><Name>Бенчмарк</Name></Properties>'
+              f'<ChildObjects>{children}</ChildObjects></Configuration></MetaDataObject>')
+        write('Ext/ManagedApplicationModule.bsl', self.module(max(1, methods // 4), docs, server=False, export=False))
+        for i, name in enumerate(common):
+            glob = 'true' if i % 10 == 0 else 'false'
+            write(f'CommonModules/{name}.xml',
+                  f'<MetaDataObject><CommonModule><Properties><Name>{name}</Name>'
+                  f'<Global>{glob}</Global><Server>true</Server></Properties></CommonModule></MetaDataObject>')
+            write(f'CommonModules/{name}/Ext/Module.bsl', self.module(self.random.randint(methods // 2, methods * 2), docs))
+        for name in docs:
+            fields = ''.join(
+                f'<Attribute uuid="{self.random.getrandbits(64):016x}"><Properties><Name>{field}</Name></Properties></Attribute>'
+                for field in self.names(attributes))
+            form_names = [f'Форма{n}' for n in ['Документа', 'Списка', 'Выбора'][:forms]]
+            refs = ''.join(f'<Form>{form}</Form>' for form in form_names)
+            write(f'Documents/{name}.xml',
+                  f'<MetaDataObject><Document><Properties><Name>{name}</Name></Properties>'
+                  f'<ChildObjects>{fields}{refs}</ChildObjects></Document></MetaDataObject>')
+            write(f'Documents/{name}/Ext/ObjectModule.bsl', self.module(methods, docs))
+            write(f'Documents/{name}/Ext/ManagerModule.bsl', self.module(max(1, methods // 2), docs))
+            for form in form_names:
+                write(f'Documents/{name}/Forms/{form}.xml',
+                      f'<MetaDataObject><Form><Properties><Name>{form}</Name><FormType>Managed</FormType>'
+                      '</Properties></Form></MetaDataObject>')
+                items = ''.join(f'<Attribute name="{field}" id="{n + 2}"/>'
+                                for n, field in enumerate(self.names(self.random.randint(1, attributes))))
+                write(f'Documents/{name}/Forms/{form}/Ext/Form.xml',
+                      f'<Form><Attributes><Attribute name="Объект" id="1"><MainAttribute>true</MainAttribute></Attribute>'
+                      f'{items}</Attributes></Form>')
+                write(f'Documents/{name}/Forms/{form}/Ext/Form/Module.bsl', self.module(methods, docs, form=True))
+        return modules
+
+    #endregion md
@@ -0,0 +1,172 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Микро-замеры на синтетической выгрузке (см. bench.corpus): лексер, парсер,
+обход AST, каждый плагин, разбор XML метаданных, запись отчета.
+Каждый замер повторяется repeat раз, в результат идут минимум и медиана.
+"""
+
+from typing import List, Dict, Any, Callable, Optional, Tuple
+import statistics
+import tempfile
+import platform
+import gc
+import os
+import os.path
+import sys
+import time
+
+from bsl.parser import Parser
+from bsl.enums import Tokens
+from bsl.ast import Module
+import bsl.visitor
+from md.base import XMLParser
+from md.visitor import ModuleFile
+import md.conf as cf
+import md.forms as fm
+from output.issues import Issue
+import runner.workers as workers
+from runner.pipeline import load
+import reports.sonar as sonar
+
+from bench.corpus import Generator
+
+VERSION = 1
+
+# Размеры выгрузки: общие модули, документы, методов в модуле.
+SIZES: Dict[str, Dict[str, int]] = {
+    'tiny': {'common_modules': 3, 'documents': 2, 'methods': 5},
+    'small': {'common_modules': 10, 'documents': 5, 'methods': 20},
+    'medium': {'common_modules': 40, 'documents': 20, 'methods': 20},
+    'large': {'common_modules': 200, 'documents': 100, 'methods': 25},
+}
+
+class Corpus:
+    """
+    Загруженная выгрузка: тексты модулей с областями видимости, их AST и файлы XML.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.modules: List[Tuple[ModuleFile, str]] = []
+        for module in load(root, []).modules:
+            if os.path.isfile(module.path):
+                with open(module.path, 'r', encoding='utf-8-sig') as f:
+                    self.modules.append((module, f.read()))
+        self.asts: List[Module] = [Parser(src, module.scope).parse() for module, src in self.modules]
+        self.xml = sorted(os.path.join(dirpath, name) for dirpath, _, names in os.walk(root)
+                          for name in names if name.endswith('.xml'))
+        self.lines = sum(src.count('\n') + 1 for _, src in self.modules)
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        strt = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - strt)
+    return {'min': min(times), 'median': statistics.median(times), 'repeat': repeat}
+
+#region benchmarks
+
+def bench_scan(corpus: Corpus):
+    for _, src in corpus.modules:
+        p = Parser(src)
+        while p.scan() != Tokens.EOF:
+            pass
+
+def bench_parse(corpus: Corpus):
+    for module, src in corpus.modules:
+        Parser(src, module.scope).parse()
+
+def bench_visitor(corpus: Corpus):
+    for ast in corpus.asts:
+        ast.visit(bsl.visitor.Visitor([]))
+
+def bench_plugin(cls: type) -> Callable[[Corpus], None]:
+    def run(corpus: Corpus):
+        for (module, src), ast in zip(corpus.modules, corpus.asts):
+            plugin = cls(module.path, src)
+            ast.visit(bsl.visitor.Visitor([plugin]))
+            plugin.close()
+    return run
+
+def bench_xml(corpus: Corpus):
+    for path in corpus.xml:
+        XMLParser(path, fm.Root if path.endswith(os.path.join('Ext', 'Form.xml')) else cf.Root).parse()
+
+def bench_report(corpus: Corpus, issues: int = 50000):
+    items: List[Issue] = []
+    for (module, src), ast in zip(corpus.modules, corpus.asts):
+        plugins = [cls(module.path, src) for cls in workers.registry.values()]
+        ast.visit(bsl.visitor.Visitor(plugins))
+        items.extend(issue for p in plugins for issue in p.close().items)
+    items = (items * (issues // max(len(items), 1) + 1))[:issues] if items else []
+
+    def run(_: Corpus):
+        with tempfile.TemporaryDirectory() as tmp, sonar.Writer(os.path.join(tmp, 'report.json')) as writer:
+            writer.write(items)
+    return run, len(items)
+
+#endregion benchmarks
+
+def benchmarks(corpus: Corpus) -> Dict[str, Tuple[Callable[[Corpus], None], str, int]]:
+    """
+    Замеры по именам: функция, единица объема и объем за один проход.
+    """
+    modules = len(corpus.modules)
+    result: Dict[str, Tuple[Callable[[Corpus], None], str, int]] = {
+        'scan': (bench_scan, 'lines', corpus.lines),
+        'parse': (bench_parse, 'lines', corpus.lines),
+        'visitor': (bench_visitor, 'modules', modules),
+    }
+    for name, cls in workers.registry.items():
+        result[f'plugin.{name}'] = (bench_plugin(cls), 'modules', modules)
+    result['xml'] = (bench_xml, 'files', len(corpus.xml))
+    report, issues = bench_report(corpus)
+    result['report'] = (report, 'issues', issues)
+    return result
+
+def run(seed: int = 1, size: str = 'small', repeat: int = 5, only: Optional[List[str]] = None,
+        root: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Генерирует выгрузку (в root или во временный каталог) и выполняет замеры.
+    only - префиксы имен замеров.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        root = root or os.path.join(tmp, 'src')
+        if not os.path.exists(os.path.join(root, 'Configuration.xml')):
+            Generator(seed).configuration(root, **SIZES[size])
+        workers.prepare()
+        corpus = Corpus(root)
+        results: Dict[str, Any] = {}
+        for name, (fn, unit, count) in benchmarks(corpus).items():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            result = measure(lambda: fn(corpus), repeat)
+            result[unit] = count
+            result['rate'] = count / result['min'] if result['min'] else 0.0
+            results[name] = result
+        return {
+            'version': VERSION,
+            'seed': seed,
+            'size': size,
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'corpus': {'modules': len(corpus.modules), 'lines': corpus.lines, 'xml': len(corpus.xml)},
+            'benchmarks': results,
+        }
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.1) -> List[Tuple[str, float, float, bool]]:
+    """
+    Сравнивает минимальное время замеров. Возвращает (имя, было, стало, регрессия)
+    для замеров, которые есть в обоих результатах; регрессия - замедление больше threshold.
+    """
+    result = []
+    for name, old in base['benchmarks'].items():
+        if (cur := new['benchmarks'].get(name)) is None:
+            continue
+        result.append((name, old['min'], cur['min'], cur['min'] > old['min'] * (1 + threshold)))
+    return result
@@ -88,6 +88,22 @@ Env = namedtuple('Env', [
     defaults=(False,False,False,False,False,False,False,False,False,False)
 )
 
+def env_mask(env: Env) -> int:
+    """
+    Битовая маска окружений (см. bsl.enums.Environments) по кортежу Env.
+    """
+    mask = 0
+    for i, value in enumerate(env):
+        if value:
+            mask |= 1 << i
+    return mask
+
+def mask_env(mask: int) -> Env:
+    """
+    Кортеж Env по битовой маске окружений.
+    """
+    return Env(*(mask >> i & 1 == 1 for i in range(len(Env._fields))))
+
 #region Declarations
 
 
@@ -101,6 +117,7 @@ class GlobalObject(Decl):
     def __init__(self, name, env, attribs=None, methods=None):
         self.Name: str = name
         self.Env: Env = env
+        self.EnvMask: int = env_mask(env)
         self.Attribs: Optional[List[str]] = attribs
         self.Methods: Optional[List[GlobalMethod]] = methods
         self.Place: Place = Place(0, 0, 0, 0, 0, 0)
@@ -127,6 +144,7 @@ class GlobalMethod(Decl):
     def __init__(self, name, retval, params, env):
         self.Name: str = name
         self.Env: Env = env
+        self.EnvMask: int = env_mask(env)
         self.Params: List[GlobalMethodParameter] = params
         self.RetVal: bool = retval
         self.Place: Place = Place(0, 0, 0, 0, 0, 0)
@@ -0,0 +1,996 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Объявления объектов и методов глобального контекста платформы.
+Каждая сущность объявлена один раз со своими английским и русским именами.
+Модуль импортируется только при построении снимка глобального контекста (см. bsl.glob).
+"""
+
+from bsl.ast import Env, GlobalMethodParameter as P
+from bsl.symbols import attrib, method
+
+props = [
+    attrib('MainInterface', 'ГлавныйИнтерфейс', Env(True, False, True, False, False, False, True, False, False, False)),
+    attrib('Constants', 'Константы', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('Catalogs', 'Справочники', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('Enums', 'Перечисления', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('DataProcessors', 'Обработки', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('Documents', 'Документы', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('InformationRegisters', 'РегистрыСведений', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('DocumentJournals', 'ЖурналыДокументов', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('FilterCriteria', 'КритерииОтбора', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('Metadata', 'Метаданные', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('AccumulationRegisters', 'РегистрыНакопления', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('WorkingDate', 'РабочаяДата', Env(True, False, True, False, False, False, True, False, False, False)),
+    attrib('WorkingDateUse', 'ИспользованиеРабочейДаты', Env(True, False, True, False, False, False, True, False, False, False)),
+    attrib('StyleLib', 'БиблиотекаСтилей', Env(True, False, True, False, False, False, True, False, False, False)),
+    attrib('ExternalDataProcessors', 'ВнешниеОбработки', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('Reports', 'Отчеты', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('ChartsOfCalculationTypes', 'ПланыВидовРасчета', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('CalculationRegisters', 'РегистрыРасчета', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('PictureLib', 'БиблиотекаКартинок', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('LaunchParameter', 'ПараметрЗапуска', Env(True, False, True, False, False, False, True, True, True, False)),
+    attrib('ChartsOfCharacteristicTypes', 'ПланыВидовХарактеристик', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('ChartsOfAccounts', 'ПланыСчетов', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('AccountingRegisters', 'РегистрыБухгалтерии', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('ExchangePlans', 'ПланыОбмена', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('InfoBaseUsers', 'ПользователиИнформационнойБазы', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('BusinessProcesses', 'БизнесПроцессы', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('Tasks', 'Задачи', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('SessionParameters', 'ПараметрыСеанса', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('Sequences', 'Последовательности', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('MainStyle', 'ГлавныйСтиль', Env(True, False, True, False, True, True, True, False, False, False)),
+    attrib('XDTOFactory', 'ФабрикаXDTO', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('WSReferences', 'WSСсылки', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('FullTextSearch', 'ПолнотекстовыйПоиск', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('XDTOSerializer', 'СериализаторXDTO', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ExternalReports', 'ВнешниеОтчеты', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('BackgroundJobs', 'ФоновыеЗадания', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('ScheduledJobs', 'РегламентныеЗадания', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('DataCompositionAppearanceTemplateLib', 'БиблиотекаМакетовОформленияКомпоновкиДанных', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('UserWorkHistory', 'ИсторияРаботыПользователя', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('SystemSettingsStorage', 'ХранилищеСистемныхНастроек', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('CommonSettingsStorage', 'ХранилищеОбщихНастроек', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('ReportsUserSettingsStorage', 'ХранилищеПользовательскихНастроекОтчетов', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('ReportsVariantsStorage', 'ХранилищеВариантовОтчетов', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('MailTools', 'СредстваПочты', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('DeliverableNotifications', 'ДоставляемыеУведомления', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('FormDataSettingsStorage', 'ХранилищеНастроекДанныхФорм', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('SettingsStorages', 'ХранилищаНастроек', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('CryptoTools', 'СредстваКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ExternalDataSources', 'ВнешниеИсточникиДанных', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('DynamicListsUserSettingsStorage', 'ХранилищеПользовательскихНастроекДинамическихСписков', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('LocationTools', 'СредстваГеопозиционирования', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('MultimediaTools', 'СредстваМультимедиа', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('TelephonyTools', 'СредстваТелефонии', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('DeliverableNotificationSend', 'ОтправкаДоставляемыхУведомлений', Env(True, True, True, False, True, True, True, True, False, False)),
+    attrib('ConfigurationExtensions', 'РасширенияКонфигурации', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('OSTaskbar', 'ПанельЗадачОС', Env(True, False, True, False, False, False, True, True, False, False)),
+    attrib('AdvertisingPresentationTools', 'СредстваОтображенияРекламы', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('InAppPurchasesValidation', 'ПроверкаВстроенныхПокупок', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('InAppPurchases', 'ВстроенныеПокупки', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('AdRepresentation', 'ОтображениеРекламы', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('InternetConnectionInformation', 'ИнформацияОбИнтернетСоединении', Env(False, False, True, True, True, False, False, False, False, False)),
+    attrib('FileStreams', 'ФайловыеПотоки', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataHistory', 'ИсторияДанных', Env(True, True, True, False, True, True, True, False, False, False)),
+    attrib('ClientApplication', 'КлиентскоеПриложение', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('CollaborationSystem', 'СистемаВзаимодействия', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ClientApplicationAgent', 'АгентКлиентскогоПриложения', Env(True, False, True, False, False, False, True, True, True, False)),
+    attrib('DatabaseCopies', 'КопииБазыДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DeviceTools', 'СредстваУстройства', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('GlobalSearch', 'ГлобальныйПоиск', Env(True, True, True, True, False, False, True, True, True, True)),
+    attrib('StandardGlobalSearchType', 'СтандартныйВидГлобальногоПоиска', Env(True, True, True, True, True, True, True, True, True, False)),
+]
+
+enums = [
+    attrib('SpreadsheetDocumentValuesReadingMode', 'СпособЧтенияЗначенийТабличногоДокумента', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('TextPositionRelativeToPicture', 'ПоложениеТекстаОтносительноКартинки', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('JSONLineBreak', 'ПереносСтрокJSON', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('DataCompositionFilterApplicationType', 'ТипПримененияОтбораКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionSettingsItemViewMode', 'РежимОтображенияЭлементаНастройкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionSettingsViewMode', 'РежимОтображенияНастроекКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentGroupHeaderPlacement', 'РасположениеЗаголовкаГруппировкиТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('StandardBeginningDateVariant', 'ВариантСтандартнойДатыНачала', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('StandardPeriodVariant', 'ВариантСтандартногоПериода', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('InternetMailMessageParseStatus', 'СтатусРазбораИнтернетПочтовогоСообщения', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('ChartAnimation', 'АнимацияДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ChartBubbleSizing', 'ВлияниеРазмераНаПузырекДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('FormItemOrientation', 'ОриентацияЭлементаФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChartScaleLabelLocation', 'ПоложениеПодписейШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ConfigurationExtensionsSource', 'ИсточникРасширенийКонфигурации', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('BubbleChartNegativeValuesShowMode', 'ОтображениеОтрицательныхЗначенийПузырьковойДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ChartTitleAreaPlacement', 'РасположениеОбластиЗаголовкаДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('SectionsPanelRepresentation', 'ОтображениеПанелиРазделов', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('UserNotificationStatus', 'СтатусОповещенияПользователя', Env(True, False, True, False, False, False, True, True, True, False)),
+    attrib('PrintDialogUseMode', 'РежимИспользованияДиалогаПечати', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('PositionInStream', 'ПозицияВПотоке', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('HTMLDocumentFieldMode', 'РежимПоляHTMLДокумента', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('PictureFormat', 'ФорматКартинки', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('BusinessProcessRoutePointType', 'ВидТочкиМаршрутаБизнесПроцесса', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('GraphicalSchemaGridDrawMode', 'РежимОтрисовкиСеткиГрафическойСхемы', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('ConnectorLineType', 'ТипСоединительнойЛинии', Env(True, False, False, False, True, True, True, False, True, False)),
+    attrib('ConnectorTextLocation', 'ПоложениеТекстаСоединительнойЛинии', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('FitPageMode', 'РежимРазмещенияНаСтранице', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('GraphicalSchemaItemPictureLocation', 'ПоложениеКартинкиЭлементаГрафическойСхемы', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('ContactDataRelationshipType', 'ТипОтношенийДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('ConfigurationExtensionApplicationIssueSeverity', 'ВажностьПроблемыПримененияРасширенияКонфигурации', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FormItemTitleLocation', 'ПоложениеЗаголовкаЭлементаФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('SelectionShowMode', 'РежимОтображенияВыделения', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ItemHorizontalLocation', 'ГоризонтальноеПоложениеЭлемента', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ColumnsGroup', 'ГруппировкаКолонок', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('UsualGroupRepresentation', 'ОтображениеОбычнойГруппы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ButtonRepresentation', 'ОтображениеКнопки', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('FormButtonType', 'ВидКнопкиФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('FormFieldType', 'ВидПоляФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('FormGroupType', 'ВидГруппыФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('TableRepresentation', 'ОтображениеТаблицы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('TableRowInputMode', 'РежимВводаСтрокТаблицы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('TableSelectionMode', 'РежимВыделенияТаблицы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('TableRowSelectionMode', 'РежимВыделенияСтрокиТаблицы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('FoldersAndItems', 'ГруппыИЭлементы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChartTrendlineFactor', 'ФакторЛинииТрендаДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('RequiredDataRelevance', 'ТребуемаяАктуальностьДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ByteOrderMarkUsage', 'ИспользованиеByteOrderMark', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('CollaborationSystemStandardCommand', 'СтандартнаяКомандаСистемыВзаимодействия', Env(True, True, True, False, False, False, True, True, True, False)),
+    attrib('StockChartUsedPointValue', 'ИспользуемоеЗначениеТочкиБиржевойДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('SizeChangeMode', 'РежимИзмененияРазмера', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('WarningOnEditRepresentation', 'ОтображениеПредупрежденияПриРедактировании', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('FormDecorationType', 'ВидДекорацииФормы', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('AccumulationRegisterAggregatePeriodicity', 'ПериодичностьАгрегатаРегистраНакопления', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionSettingsRefreshMethod', 'СпособВосстановленияНастроекКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('AccumulationRegisterAggregateUse', 'ИспользованиеАгрегатаРегистраНакопления', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ItemVerticalAlign', 'ВертикальноеПоложениеЭлемента', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('UpdateOnDataChange', 'ОбновлениеПриИзмененииДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('LinkedValueChangeMode', 'РежимИзмененияСвязанногоЗначения', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChartPointsConnectionType', 'ТипСоединенияТочекДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('FormItemAdditionType', 'ВидДополненияЭлементаФормы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('MainClientApplicationWindowMode', 'РежимОсновногоОкнаКлиентскогоПриложения', Env(True, False, True, False, False, False, True, True, True, False)),
+    attrib('ContactDataAddressType', 'ТипАдресаДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('ChartBubbleSizeValueSource', 'ИсточникЗначенияРазмераПузырькаДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('WindowsCertificateSelectMode', 'СпособВыбораСертификатаWindows', Env(True, False, True, False, False, False, True, True, False, False)),
+    attrib('AdministrationAssignmentRuleType', 'АдминистрированиеТипТребованияНазначения', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('EventLogEntryTransactionMode', 'РежимТранзакцииЗаписиЖурналаРегистрации', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('SynchronousExtensionAndAddInCallUseMode', 'РежимИспользованияСинхронныхВызововРасширенийИВнешнихКомпонент', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('UsualGroupControlRepresentation', 'ОтображениеУправленияОбычнойГруппы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('QuerySchemaPeriodAdditionType', 'ТипДополненияПериодамиСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FileDragMode', 'СпособПеретаскиванияФайлов', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('TimeScaleUnitType', 'ТипЕдиницыШкалыВремени', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('TimeScalePosition', 'ПоложениеШкалыВремени', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('GanttChartScaleKeeping', 'ПоддержкаМасштабаДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('TimeScaleDayFormat', 'ФорматДняШкалыВремени', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('GanttChartIntervalRepresentation', 'ОтображениеИнтервалаДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('GanttChartVerticalStretch', 'РастягиваниеПоВертикалиДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('GanttChartValueTextRepresentation', 'ОтображениеТекстаЗначенияДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('XBaseEncoding', 'КодировкаXBase', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('PivotChartValuesShowMode', 'ОтображениеЗначенийСводнойДиаграммы', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('PivotChartScaleKeeping', 'ПоддержкаМасштабаСводнойДиаграммы', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('PivotChartType', 'ТипСводнойДиаграммы', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('PivotChartLabelsOrientation', 'ОриентацияМетокСводнойДиаграммы', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('DendrogramOrientation', 'ОриентацияДендрограммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DendrogramScaleKeeping', 'ПоддержкаМасштабаДендрограммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('WebColors', 'WebЦвета', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('WindowsColors', 'WindowsЦвета', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('WindowsFonts', 'WindowsШрифты', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('AutoTimeMode', 'РежимАвтоВремя', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('AutoSeriesSeparation', 'АвтоРаздвижениеСерий', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('PictureLib', 'БиблиотекаКартинок', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('IntervalBoundVariant', 'ВариантГраницыИнтервала', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('PeriodSettingsVariant', 'ВариантНастройкиПериода', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('PeriodVariant', 'ВариантПериода', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('WindowLocationVariant', 'ВариантПоложенияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('WindowDockVariant', 'ВариантПрикрепленияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('WindowStateVariant', 'ВариантСостоянияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('VerticalAlign', 'ВертикальноеПоложение', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('BoundaryType', 'ВидГраницы', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('AccumulationRecordType', 'ВидДвиженияНакопления', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('PictureType', 'ВидКартинки', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChartLabelType', 'ВидПодписейКДиаграмме', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('BorderType', 'ВидРамки', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ComparisonType', 'ВидСравнения', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('AccountType', 'ВидСчета', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ColorType', 'ВидЦвета', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('FontType', 'ВидШрифта', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('HorizontalAlign', 'ГоризонтальноеПоложение', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ControlEdge', 'ГраницаЭлементаУправления', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('AllowedLength', 'ДопустимаяДлина', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('AllowedSign', 'ДопустимыйЗнак', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ColumnSizeChange', 'ИзменениеРазмераКолонки', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('WindowSizeChange', 'ИзменениеРазмераОкна', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('FoldersAndItemsUse', 'ИспользованиеГруппИЭлементов', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('UseMenuMode', 'ИспользованиеРежимаМеню', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ScrollBarUse', 'ИспользованиеПолосыПрокрутки', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentDetailUse', 'ИспользованиеРасшифровкиТабличногоДокумента', Env(True, True, False, False, True, True, True, True, True, False)),
+    attrib('PostingModeUse', 'ИспользованиеРежимаПроведения', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('SliceUse', 'ИспользованиеСреза', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('Key', 'Клавиша', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DialogReturnCode', 'КодВозвратаДиалога', Env(True, False, True, True, False, False, True, True, True, False)),
+    attrib('TextEncoding', 'КодировкаТекста', Env(True, True, False, False, True, True, True, True, False, False)),
+    attrib('MaxSeries', 'МаксимумСерий', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('SortDirection', 'НаправлениеСортировки', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('InitialTreeView', 'НачальноеОтображениеДерева', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('InitialListView', 'НачальноеОтображениеСписка', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('QueryResultIteration', 'ОбходРезультатаЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('Orientation', 'Ориентация', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ChartOrientation', 'ОриентацияДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('PageOrientation', 'ОриентацияСтраницы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ShowTabs', 'ОтображениеЗакладок', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('CommandBarButtonRepresentation', 'ОтображениеКнопкиКоманднойПанели', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('TrackBarMarkingAppearance', 'ОтображениеРазметкиПолосыРегулирования', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('TitleLocation', 'ПоложениеЗаголовка', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ButtonPictureLocation', 'ПоложениеКартинкиКнопки', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('LabelPictureLocation', 'ПоложениеКартинкиНадписи', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ColumnLocation', 'ПоложениеКолонки', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('PictureSize', 'РазмерКартинки', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('StyleBorders', 'РамкиСтиля', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ScrollingTextMode', 'РежимБегущейСтроки', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('TableBoxRowInputMode', 'РежимВводаСтрокТабличногоПоля', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('TableBoxRowSelectionMode', 'РежимВыделенияСтрокиТабличногоПоля', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('TableBoxSelectionMode', 'РежимВыделенияТабличногоПоля', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('QuestionDialogMode', 'РежимДиалогаВопрос', Env(True, False, True, True, False, False, True, True, True, False)),
+    attrib('FileDialogMode', 'РежимДиалогаВыбораФайла', Env(True, False, True, True, False, False, True, True, True, False)),
+    attrib('DocumentWriteMode', 'РежимЗаписиДокумента', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('RoundMode', 'РежимОкругления', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChartSpaceMode', 'РежимПробеловДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DocumentPostingMode', 'РежимПроведенияДокумента', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('WorkingDateMode', 'РежимРабочейДаты', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ListEditMode', 'СпособРедактированияСписка', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ProgressBarSmoothingMode', 'РежимСглаживанияИндикатора', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('Chars', 'Символы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('MessageStatus', 'СтатусСообщения', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('ChartType', 'ТипДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('QueryRecordType', 'ТипЗаписиЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('CommandBarButtonType', 'ТипКнопкиКоманднойПанели', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ChartLineType', 'ТипЛинииДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentDrawingLineType', 'ТипЛинииРисункаТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentCellLineType', 'ТипЛинииЯчейкиТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ChartMarkerType', 'ТипМаркераДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentStepDirectionType', 'ТипНаправленияПереходаТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentCellAreaType', 'ТипОбластиЯчеекТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('EnterKeyBehaviorType', 'ТипПоведенияКлавишиEnter', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentTextPlacementType', 'ТипРазмещенияТекстаТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ControlBorderType', 'ТипРамкиЭлементаУправления', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentDrawingType', 'ТипРисункаТабличногоДокумента', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentShiftType', 'ТипСмещенияТабличногоДокумента', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('SpreadsheetDocumentPatternType', 'ТипУзораТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('SpreadsheetDocumentFileType', 'ТипФайлаТабличногоДокумента', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('StyleColors', 'ЦветаСтиля', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DateFractions', 'ЧастиДаты', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('StyleFonts', 'ШрифтыСтиля', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('EventLogLevel', 'УровеньЖурналаРегистрации', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('RowGotoDirection', 'НаправлениеПереходаКСтроке', Env(True, False, True, False, False, False, True, True, False, False)),
+    attrib('DynamicListKeyType', 'ВидКлючаДинамическогоСписка', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ClientApplicationBaseFontVariant', 'ВариантОсновногоШрифтаКлиентскогоПриложения', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ShowChartScaleTitle', 'ОтображениеЗаголовкаШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ChartLabelLocation', 'ПоложениеПодписейКДиаграмме', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('RadarChartScaleType', 'ТипШкалыРадарнойДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('GaugeChartValueRepresentation', 'ОтображениеЗначенияИзмерительнойДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('GaugeChartValuesScaleLabelsLocation', 'ПоложениеПодписейШкалыЗначенийИзмерительнойДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('GanttChartLinkType', 'ТипСвязиДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('QuerySchemaAvailableTableParameterType', 'ТипПараметраДоступнойТаблицыСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('AnalysisDataType', 'ВидДанныхАнализа', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('PredictionModelColumnType', 'ТипКолонкиМоделиПрогноза', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisStandardizationType', 'ТипСтандартизацииАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisTimeIntervalUnitType', 'ТипЕдиницыИнтервалаВремениАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisResultTableFillType', 'ТипЗаполненияТаблицыРезультатаАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisNumericValueUseType', 'ТипИспользованияЧисловыхЗначенийАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisFieldType', 'ТипПоляАнализаДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataAnalysisColumnTypeClusterization', 'ТипКолонкиАнализаДанныхКластеризация', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisDistanceMetricType', 'ТипМерыРасстоянияАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ClusterizationMethod', 'МетодКластеризации', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisColumnTypeAssociationRules', 'ТипКолонкиАнализаДанныхПоискАссоциаций', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('AssociationRulesDataSourceType', 'ТипИсточникаДанныхПоискаАссоциаций', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('AssociationRulesPruneType', 'ТипОтсеченияПравилАссоциации', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisColumnTypeSequentialPatterns', 'ТипКолонкиАнализаДанныхПоискПоследовательностей', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisColumnTypeDecisionTree', 'ТипКолонкиАнализаДанныхДеревоРешений', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DecisionTreeSimplificationType', 'ТипУпрощенияДереваРешений', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisColumnTypeSummaryStatistics', 'ТипКолонкиАнализаДанныхОбщаяСтатистика', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('QueryBuilderDimensionType', 'ТипИзмеренияПостроителяЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataAnalysisAssociationRulesOrderType', 'ТипУпорядочиванияПравилАссоциацииАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataAnalysisSequentialPatternsOrderType', 'ТипУпорядочиванияШаблоновПоследовательностейАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ConfigurationExtensionScope', 'ОбластьДействияРасширенияКонфигурации', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('UsualGroupBehavior', 'ПоведениеОбычнойГруппы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChartValuesToolTipFillType', 'ЗаполнениеПодсказкиЗначенийДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('SearchInTableOnInput', 'ПоискВТаблицеПриВводе', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('ChartColorPalette', 'ПалитраЦветовДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChartLabelsOrientation', 'ОриентацияПодписейДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ExternalDataSourceState', 'СостояниеВнешнегоИсточникаДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FullTextSearchMode', 'РежимПолнотекстовогоПоиска', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('EditTextUpdate', 'ОбновлениеТекстаРедактирования', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('RadioButtonType', 'ВидПереключателя', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataCompositionPictureOutputType', 'ТипВыводаКартинкиКомпоновкиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('StandardCommandsGroup', 'СтандартнаяГруппаКоманд', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ChartValuesBySeriesConnectionType', 'ТипСоединенияЗначенийПоСериямДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ApplicationFormsOpenningMode', 'РежимОткрытияФормПриложения', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('StringEncodingMethod', 'СпособКодированияСтроки', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('PivotTableRowTotalPosition', 'ПоложениеИтоговСтрокСводнойТаблицы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('PivotTableColumnTotalPosition', 'ПоложениеИтоговКолонокСводнойТаблицы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ReportBuilderDimensionType', 'ТипИзмеренияПостроителяОтчета', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ReportBuilderDetailFillType', 'ВидЗаполненияРасшифровкиПостроителяОтчета', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('SpreadsheetDocumentAreaFillType', 'ТипЗаполненияОбластиТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataCompositionFixation', 'ФиксацияКомпоновкиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataCompositionConditionalAppearanceUse', 'ИспользованиеУсловногоОформленияКомпоновкиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ChartScaleTitleTextSource', 'СпособЗаполненияТекстаЗаголовкаШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataCompositionDataRelevanceOutputType', 'ТипВыводаАктуальностиДанныхКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ColumnEditMode', 'РежимРедактированияКолонки', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ChartTrendLineApproximationType', 'ТипАппроксимацииЛинииТрендаДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DragAllowedActions', 'ДопустимыеДействияПеретаскивания', Env(True, False, True, False, False, False, True, True, True, False)),
+    attrib('DragAction', 'ДействиеПеретаскивания', Env(True, False, True, False, False, False, True, True, True, False)),
+    attrib('ChartLegendPlacement', 'РасположениеЛегендыДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ContactDataURLType', 'ТипВебАдресаДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('AdministrationResourceConsumptionCounterFilterType', 'АдминистрированиеТипОтбораСчетчикаПотребленияРесурсов', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('AdministrationActionOnResourceConsumptionLimitExcess', 'АдминистрированиеДействиеПриПревышенииОграниченияПотребленияРесурсов', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('DeviceCameraType', 'ТипКамерыУстройства', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('ChartSelectionMode', 'РежимВыделенияДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ButtonShapeRepresentation', 'ОтображениеФигурыКнопки', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('UseInternetMailTokenAuthentication', 'ИспользованиеАутентификацииИнтернетПочтыПоТокену', Env(True, True, True, False, True, True, True, True, False, False)),
+    attrib('ChartReferenceLinePosition', 'ПоложениеИнформационнойЛинииДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('VideoQuality', 'КачествоВидеозаписи', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('ReportResultViewMode', 'РежимОтображенияРезультатаОтчета', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('AdministrationConnectionSecurityLevel', 'АдминистрированиеУровеньБезопасностиСоединений', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ContactDataInstantMessagingAddressType', 'ТипАдресаМгновенныхСообщенийДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('TransactionsIsolationLevel', 'УровеньИзоляцииТранзакций', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('CalendarEventRecurrence', 'ПовторениеСобытияКалендаря', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('CallLogCallType', 'ТипЗвонкаЖурналаЗвонков', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('InternetMailTextType', 'ТипТекстаПочтовогоСообщения', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('InternetMailTextProcessing', 'ОбработкаТекстаИнтернетПочтовогоСообщения', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('NumericValueType', 'ВидЧисловогоЗначения', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('ClientApplicationInterfaceVariant', 'ВариантИнтерфейсаКлиентскогоПриложения', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('XMLCanonicalizationType', 'ТипКаноническогоXML', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('DOMNodeType', 'ТипУзлаDOM', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('DOMDocumentPosition', 'ПозицияВДокументеDOM', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('DataCompositionBalanceType', 'ТипОстаткаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionAccountingBalanceType', 'ТипБухгалтерскогоОстаткаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionSortDirection', 'НаправлениеСортировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionAreaTemplateType', 'ТипМакетаОбластиКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionDataSetsLinkType', 'ТипСвязиНаборовДанныхКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionGroupType', 'ТипГруппировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionPeriodAdditionType', 'ТипДополненияПериодаКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionResultItemType', 'ТипЭлементаРезультатаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionResultNestedItemsLayout', 'РасположениеВложенныхЭлементовРезультатаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionFieldPlacement', 'РасположениеПоляКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionFilterItemsGroupType', 'ТипГруппыЭлементовОтбораКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionComparisonType', 'ВидСравненияКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionGroupFieldsPlacement', 'РасположениеПолейГруппировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionGroupPlacement', 'РасположениеГруппировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionAttributesPlacement', 'РасположениеРеквизитовКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionResourcesPlacement', 'РасположениеРесурсовКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionTotalPlacement', 'РасположениеИтоговКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('OnUnavailabilityDataCompositionSettingsAction', 'ДействиеПриНедоступностиНастроекКомпоновкиДанных', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('EventLogEntryTransactionStatus', 'СтатусТранзакцииЗаписиЖурналаРегистрации', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DOMNodeFilterParameters', 'ПараметрыОтбораУзловDOM', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('DOMXPathResultType', 'ТипРезультатаDOMXPath', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('DOMBuilderAction', 'ДействиеПостроителяDOM', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('XMLSpace', 'ПробельныеСимволыXML', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XMLValidationType', 'ТипПроверкиXML', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XMLAttributeType', 'ТипАтрибутаXML', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSComponentType', 'ТипКомпонентыXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSAttributeUseCategory', 'КатегорияИспользованияАтрибутаXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSXPathVariety', 'ВариантXPathXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSWhitespaceHandling', 'ОбработкаПробельныхСимволовXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSForm', 'ФормаПредставленияXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSConstraint', 'ОграничениеЗначенияXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSDisallowedSubstitutions', 'НедопустимыеПодстановкиXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSContentModel', 'МодельСодержимогоXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSSubstitutionGroupExclusions', 'ИсключенияГруппПодстановкиXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSIdentityConstraintCategory', 'КатегорияОграниченияИдентичностиXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSSimpleFinal', 'ЗавершенностьПростогоТипаXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSSimpleTypeVariety', 'ВариантПростогоТипаXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSComplexFinal', 'ЗавершенностьСоставногоТипаXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSSchemaFinal', 'ЗавершенностьСхемыXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSProcessContents', 'ОбработкаСодержимогоXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSNamespaceConstraintCategory', 'КатегорияОграниченияПространствИменXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSCompositor', 'ВидГруппыМоделиXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSDerivationMethod', 'МетодНаследованияXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('XSProhibitedSubstitutions', 'ЗапрещенныеПодстановкиXS', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('DataCompositionGroupTemplateType', 'ТипМакетаГруппировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionTextPlacementType', 'ТипРазмещенияТекстаКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionFieldsTitleType', 'ТипЗаголовкаПолейКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('SMTPAuthenticationMode', 'СпособSMTPАутентификации', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('POP3AuthenticationMode', 'СпособPOP3Аутентификации', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('InternetMailMessageImportance', 'ВажностьИнтернетПочтовогоСообщения', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('InternetMailAttachmentEncodingMode', 'СпособКодированияИнтернетПочтовогоВложения', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('InternetMailMessageNonASCIISymbolsEncodingMode', 'СпособКодированияНеASCIIСимволовИнтернетПочтовогоСообщения', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('DataLockMode', 'РежимБлокировкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataLockControlMode', 'РежимУправленияБлокировкойДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionTextOutputType', 'ТипВыводаТекстаКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('FullTextMode', 'РежимПолнотекстовогоПоиска', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataCompositionDetailsProcessingAction', 'ДействиеОбработкиРасшифровкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionPeriodType', 'ТипПериодаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ClientApplicationFormScaleVariant', 'ВариантМасштабаФормКлиентскогоПриложения', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ChartScaleTitlePlacement', 'РасположениеЗаголовкаШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('TelephonyToolsSMSType', 'ТипSMSСредствТелефонии', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('ChartPlotAreaPlacement', 'РасположениеОбластиПостроенияДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ChartScaleLocation', 'ПоложениеШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('AdministrationInfoBaseDeletionMode', 'АдминистрированиеРежимУдаленияИнформационнойБазы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('NewRowShowCheckVariant', 'ВариантПроверкиОтображенияНовойСтроки', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('WindowAppearanceModeVariant', 'ВариантСпособаОтображенияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('WindowAppearanceModeChange', 'ИзменениеСпособаОтображенияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('UseOutput', 'ИспользованиеВывода', Env(True, True, False, False, True, True, True, True, True, False)),
+    attrib('SearchDirection', 'НаправлениеПоиска', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ContactDataEmailAddressType', 'ТипАдресаЭлектроннойПочтыДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('CommandBarButtonAlignment', 'ВыравниваниеКнопокКоманднойПанели', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ChartGridLinesShowMode', 'ОтображениеЛинийСеткиДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('FormPagesRepresentation', 'ОтображениеСтраницФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('GraphicalSchemeElementSideType', 'ТипСтороныЭлементаГрафическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FormWindowOpeningMode', 'РежимОткрытияОкнаФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('SaveFormDataInSettings', 'СохранениеДанныхФормыВНастройках', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('AutoSaveFormDataInSettings', 'АвтоматическоеСохранениеДанныхФормыВНастройках', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataCompositionSettingsItemState', 'СостояниеЭлементаНастройкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChildFormItemsGroup', 'ГруппировкаПодчиненныхЭлементовФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChildFormItemsWidth', 'ШиринаПодчиненныхЭлементовФормы', Env(True, True, True, True, True, True, True, False, False, False)),
+    attrib('CommandParameterUseMode', 'РежимИспользованияПараметраКоманды', Env(True, True, False, False, True, True, True, True, True, False)),
+    attrib('FormItemCommandBarLabelLocation', 'ПоложениеКоманднойПанелиЭлементаФормы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataChangeType', 'ВидИзмененияДанных', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('FormCommandBarLabelLocation', 'ПоложениеКоманднойПанелиФормы', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('PlatformType', 'ТипПлатформы', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('AddInType', 'ТипВнешнейКомпоненты', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('CommandGroupCategory', 'КатегорияГруппыКоманд', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ClientConnectionSpeed', 'СкоростьКлиентскогоСоединения', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('XMLTypeAssignment', 'НазначениеТипаXML', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('DateSelectionMode', 'РежимВыделенияДаты', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('AutoChangeRecord', 'АвтоРегистрацияИзменений', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FileAccess', 'ДоступКФайлу', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('LocationRelativeToGeofence', 'ПоложениеОтносительноГеозоны', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('JSONCharactersEscapeMode', 'ЭкранированиеСимволовJSON', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('XMLNodeType', 'ТипУзлаXML', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('JSONDateWritingVariant', 'ВариантЗаписиДатыJSON', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('AllowedMessageNo', 'ДопустимыйНомерСообщения', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataItemSend', 'ОтправкаЭлементаДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataItemReceive', 'ПолучениеЭлементаДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('WSParameterDirection', 'WSНаправлениеПараметра', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FTPSecureConnectionUsageLevel', 'УровеньИспользованияЗащищенногоСоединенияFTP', Env(True, True, True, False, True, True, True, True, False, False)),
+    attrib('PointsConnectionAcrossSkippedChartValuesType', 'ТипСоединенияТочекПриПропущенныхЗначенияхДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ByteOrder', 'ПорядокБайтов', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ControlCollapseMode', 'РежимСверткиЭлементаУправления', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('SoundAlert', 'ЗвуковоеОповещение', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('GraphicalSchemaShapes', 'ФигурыГрафическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('PredefinedDataUpdate', 'ОбновлениеПредопределенныхДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('PivotTableLinesShowType', 'ТипОтображенияЛинийСводнойТаблицы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('SpreadsheetDocumentSelectionShowModeType', 'ТипОтображенияВыделенияТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('PresentationAdditionType', 'ТипДобавленияПредставлений', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('AppearanceAreaType', 'ТипОбластиОформления', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('AdStatus', 'СтатусРекламы', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('VerticalFormScroll', 'ВертикальнаяПрокруткаФормы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('FillChecking', 'ПроверкаЗаполнения', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ReportFormType', 'ТипФормыОтчета', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ClientRunMode', 'РежимЗапускаКлиентскогоПриложения', Env(True, True, True, False, True, True, True, True, False, False)),
+    attrib('JSONDateFormat', 'ФорматДатыJSON', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('InternetConnectionType', 'ТипИнтернетСоединения', Env(False, False, True, True, True, False, False, False, False, False)),
+    attrib('SearchControlLocation', 'ПоложениеУправленияПоиском', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('CheckBoxType', 'ВидФлажка', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ChartReferenceBandBorderPosition', 'ПоложениеГраницыИнформационногоИнтервалаДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('UseSpreadsheetDocumentWidthReduction', 'ИспользованиеШириныСжатияТабличногоДокумента', Env(True, False, False, False, True, True, True, False, False, False)),
+    attrib('IncompleteChoiceMode', 'РежимВыбораНезаполненного', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChartScaleMarkLocation', 'ПоложениеОтметокШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ToolTipRepresentation', 'ОтображениеПодсказки', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('FullTextSearchMetadataUse', 'ИспользованиеМетаданныхПолнотекстовогоПоиска', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('HashFunction', 'ХешФункция', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ChartSeriesOrderInLegend', 'ПорядокСерийВЛегендеДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('HTMLContentCategory', 'КатегорияСодержимогоHTML', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('DisplayImportance', 'ВажностьПриОтображении', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('CurrentRowUse', 'ИспользованиеТекущейСтроки', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('TableBehaviorOnHorizontalCompression', 'ПоведениеТаблицыПриСжатииПоГоризонтали', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('CollapseFormItemsByImportance', 'СворачиваниеЭлементовФормыПоВажности', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('TableCurrentRowUse', 'ИспользованиеТекущейСтрокиТаблицы', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('DatabaseCopyDBMSType', 'ТипСУБДКопииБазыДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('TelephonyToolsCallType', 'ТипЗвонкаСредствТелефонии', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('CameraLightingType', 'ТипПодсветкиКамеры', Env(False, False, True, True, True, False, False, False, False, False)),
+    attrib('MacOSCertificateSelectMode', 'СпособВыбораСертификатаMacOS', Env(True, False, True, False, False, False, True, True, False, False)),
+    attrib('CryptoInteractiveModeUse', 'ИспользованиеИнтерактивногоРежимаКриптографии', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('ViewScalingMode', 'РежимМасштабированияПросмотра', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ItemsAndTitlesAlignVariant', 'ВариантВыравниванияЭлементовИЗаголовков', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ClientApplicationAgentState', 'СостояниеАгентаКлиентскогоПриложения', Env(True, False, True, False, False, False, True, True, True, False)),
+    attrib('AdBannerRepresentation', 'ОтображениеРекламногоБаннера', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('MobileDeviceLibraryDirType', 'ТипКаталогаБиблиотекиМобильногоУстройства', Env(False, False, True, True, True, False, False, False, False, False)),
+    attrib('AutoCapitalizationOnTextInput', 'АвтоИзменениеРегистраПриВводеТекста', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('AutoCorrectionOnTextInput', 'АвтоИсправлениеПриВводеТекста', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('TelephonyToolsCallEventVariant', 'ВариантСобытияЗвонкаСредствТелефонии', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('ItemHeightControlVariant', 'ВариантУправленияВысотойЭлемента', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('TableHeightControlVariant', 'ВариантУправленияВысотойТаблицы', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('SpecialTextInputMode', 'СпециальныйРежимВводаТекста', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('FormPagesState', 'СостояниеСтраницФормы', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('AutoShowOpenButtonMode', 'РежимАвтоОтображенияКнопкиОткрытия', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('AutoShowClearButtonMode', 'РежимАвтоОтображенияКнопкиОчистки', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('SpellCheckingOnTextInput', 'ПроверкаПравописанияПриВводеТекста', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('OnScreenKeyboardReturnKeyText', 'ТекстКнопкиВводаЭкраннойКлавиатуры', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('FormButtonPictureLocation', 'ПоложениеКартинкиКнопкиФормы', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('DuplexPrintingType', 'ТипДвустороннейПечати', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('PagePlacementAlternation', 'ЧередованиеРасположенияСтраниц', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ParagraphType', 'ТипПараграфа', Env(True, True, False, False, True, True, True, True, True, False)),
+    attrib('PrintAccuracy', 'ТочностьПечати', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataBaseConfigurationUpdateState', 'СостояниеОбновленияКонфигурацииБазыДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DataBaseConfigurationUpdateExecutionInformationItemType', 'ТипЭлементаИнформацииОВыполненииОбновленияКонфигурацииБазыДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ChartValuesToolTipShowMode', 'ОтображениеПодсказкиЗначенийДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('DatabaseCopyReplicationType', 'ТипРепликацииКопииБазыДанных', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FileNamesEncodingInZipFile', 'КодировкаИменФайловВZipФайле', Env(True, True, True, False, True, True, True, True, False, False)),
+    attrib('ButtonShape', 'ФигураКнопки', Env(True, False, True, True, True, True, True, True, True, False)),
+    attrib('ContactDataPhoneNumberType', 'ТипНомераТелефонаДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
+    attrib('RefreshRequestMethod', 'СпособЗапросаОбновления', Env(False, False, True, True, True, True, False, False, False, False)),
+    attrib('FileOpenMode', 'РежимОткрытияФайла', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('FormItemSpacing', 'ИнтервалМеждуЭлементамиФормы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ChartSplineMode', 'РежимСглаживанияДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DimensionPlacementType', 'ТипРазмещенияИзмерений', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('DimensionAttributePlacementType', 'ТипРазмещенияРеквизитовИзмерений', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('TotalPlacementType', 'ТипРазмещенияИтогов', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('StandardAppearance', 'СтандартноеОформление', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ThroughAlign', 'СквозноеВыравнивание', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ChartBoundaryDetectionMethod', 'СпособОпределенияОграничивающегоЗначенияДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ShowInChartLegend', 'ОтображениеВЛегендеДиаграммы', Env(True, True, True, True, True, True, True, False, True, False)),
+    attrib('RoamingUsage', 'ИспользованиеРоуминга', Env(False, False, True, True, True, False, False, False, False, False)),
+    attrib('AdministrationProcessChoicePriority', 'АдминистрированиеПриоритетВыбораПроцесса', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('DataCompositionChartLegendPlacement', 'РасположениеЛегендыДиаграммыКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('BackgroundJobState', 'СостояниеФоновогоЗадания', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FullTextSearchRepresentationType', 'ВидОтображенияПолнотекстовогоПоиска', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FormConversationsRepresentation', 'ОтображениеОбсужденийФормы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('SearchStringLocation', 'ПоложениеСтрокиПоиска', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('InAppPurchaseService', 'СервисВстроенныхПокупок', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('ChartSemitransparencyMode', 'РежимПолупрозрачностиДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DeliverableNotificationSubscriberType', 'ТипПодписчикаДоставляемыхУведомлений', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('CommandBarButtonOrder', 'ПорядокКнопокКоманднойПанели', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('QuerySchemaJoinType', 'ТипСоединенияСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('XDTOFacetType', 'ВидФасетаXDTO', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('XMLForm', 'ФормаXML', Env(True, True, False, False, True, True, True, True, False, False)),
+    attrib('AccountingRecordType', 'ВидДвиженияБухгалтерии', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('FileCompareMethod', 'СпособСравненияФайлов', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('RepresentableDocumentBatchFileType', 'ТипФайлаПакетаОтображаемыхДокументов', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ViewStatusLocation', 'ПоложениеСостоянияПросмотра', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('ShowChartPopupReferenceLine', 'ОтображатьВсплывающуюИнформационнуюЛиниюДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('TaskListMode', 'РежимСпискаЗадач', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ChoiceHistoryOnInput', 'ИсторияВыбораПриВводе', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ChoiceButtonRepresentation', 'ОтображениеКнопкиВыбора', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataLineChangeType', 'ВидИзмененияСтрокиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('GeographicalSchemaLineType', 'ТипЛинииГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaPointObjectDrawingType', 'ТипОтображенияТочечногоОбъектаГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaLayerSeriesShowMode', 'ТипОтображенияСерииСлояГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaDataSourceOrganizationType', 'ТипОрганизацииИсточникаДанныхГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('PaintingReferencePointPosition', 'ПоложениеОпорнойТочкиОтрисовки', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaMarkerType', 'ТипМаркераГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaShowMode', 'РежимОтображенияГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaLayerSeriesImportModeType', 'ТипИмпортаСерийСлояГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaObjectFindType', 'ТипПоискаОбъектовГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaLegendItemShowScaleType', 'ТипОтображенияШкалыЭлементаЛегендыГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ZIPCompressionMethod', 'МетодСжатияZIP', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ZIPCompressionLevel', 'УровеньСжатияZIP', Env(True, True, True, False, True, True, True, True, False, False)),
+    attrib('ZIPEncryptionMethod', 'МетодШифрованияZIP', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ZIPStorePathMode', 'РежимСохраненияПутейZIP', Env(True, True, False, True, True, True, True, True, False, False)),
+    attrib('ZIPSubDirProcessingMode', 'РежимОбработкиПодкаталоговZIP', Env(True, True, False, True, True, True, True, True, False, False)),
+    attrib('ZIPRestoreFilePathsMode', 'РежимВосстановленияПутейФайловZIP', Env(True, True, False, False, True, True, True, True, False, False)),
+    attrib('SeriesValuesDrawingMode', 'РежимОтображенияЗначенийСерии', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('GeographicalSchemaProjection', 'ТипПроекцииГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('InterfaceCompatibilityMode', 'РежимСовместимостиИнтерфейса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ButtonGroupRepresentation', 'ОтображениеГруппыКнопок', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('BarcodeType', 'ТипШтрихКода', Env(False, False, True, True, False, False, False, False, False, False)),
+    attrib('AdministrationWorkProcessStatus', 'АдминистрированиеСостояниеРабочегоПроцесса', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ShowInChart', 'ОтображениеВДиаграмме', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('QuerySchemaUnionType', 'ТипОбъединенияСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ChartPointsAxisValuesSource', 'ИсточникЗначенийОсиТочекДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('QuerySchemaOrderDirection', 'НаправлениеПорядкаСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('CollaborationSystemCommandSource', 'ИсточникКомандСистемыВзаимодействия', Env(True, True, True, False, False, False, True, True, True, False)),
+    attrib('AdministrationResourceConsumptionCounterGroupType', 'АдминистрированиеТипГруппировкиСчетчикаПотребленияРесурсов', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('AutonumerationInForm', 'АвтонумерацияВФорме', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('QuerySchemaTotalCalculationFieldType', 'ТипКонтрольнойТочкиСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('FixingInTable', 'ФиксацияВТаблице', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('ResultCompositionMode', 'РежимКомпоновкиРезультата', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('AdditionalShowMode', 'ДополнительныйРежимОтображения', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('AutoShowStateMode', 'РежимАвтоОтображенияСостояния', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('CryptoCertificateIncludeMode', 'РежимВключенияСертификатовКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('CryptoCertificateCheckMode', 'РежимПроверкиСертификатаКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('CryptoCertificateStoreType', 'ТипХранилищаСертификатовКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('FormattedDocumentFileType', 'ТипФайлаФорматированногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('FormattedDocumentItemType', 'ТипЭлементаФорматированногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('CryptoCertificateStorePlacement', 'РасположениеХранилищаСертификатовКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionParameterUse', 'ИспользованиеПараметраКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('DataCompositionResourcesAutoPosition', 'АвтоПозицияРесурсовКомпоновкиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('DataCompositionGroupUseVariant', 'ВариантИспользованияГруппировкиКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, True, False)),
+    attrib('InternetMailProtocol', 'ПротоколИнтернетПочты', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('DataCompositionResourcesPlacementInChart', 'РасположениеРесурсовВДиаграммеКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
+    attrib('PlannerItemsTimeRepresentation', 'ОтображениеВремениЭлементовПланировщика', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('CalculationRegisterPeriodType', 'ВидПериодаРегистраРасчета', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('NonnumericChartValueUse', 'ИспользованиеНечисловыхЗначенийДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
+    attrib('ArrowStyle', 'СтильСтрелки', Env(True, False, True, False, True, True, True, True, False, False)),
+    attrib('PanelPictureLocation', 'ПоложениеКартинкиПанели', Env(True, False, False, False, False, False, True, False, False, False)),
+    attrib('DeliverableNotificationSendErrorType', 'ТипОшибкиОтправкиДоставляемогоУведомления', Env(True, True, True, False, True, True, True, True, False, False)),
+    attrib('SpreadsheetDocumentPointerType', 'ТипКурсоровТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('BarChartPointsOrder', 'ПорядокОтображенияТочекГоризонтальнойГистограммы', Env(True, True, True, False, True, True, True, True, True, False)),
+    attrib('JSONValueType', 'ТипЗначенияJSON', Env(True, True, True, True, True, True, True, True, False, False)),
+    attrib('SearchStringModeOnInputByString', 'СпособПоискаСтрокиПриВводеПоСтроке', Env(True, True, False, False, True, True, True, False, False, False)),
+    attrib('ColorDepth', 'ГлубинаЦвета', Env(True, True, True, False, True, True, True, True, False, False)),
+    attrib('ChoiceDataGetModeOnInputByString', 'РежимПолученияДанныхВыбораПриВводеПоСтроке', Env(True, True, False, False, True, True, True, True, True, False)),
+]
+
+methods = [
+    method('Find', 'Найти', True, [P('Line', True), P('SearchSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Min', 'Мин', True, [P('Value1ValueN', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Max', 'Макс', True, [P('Value1ValueN', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ErrorDescription', 'ОписаниеОшибки', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('FillPropertyValues', 'ЗаполнитьЗначенияСвойств', False, [P('Receiver', True), P('Source', True), P('ListOfProperties', False), P('ExcludeProperties', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ValueIsFilled', 'ЗначениеЗаполнено', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetURL', 'ПолучитьНавигационнуюСсылку', True, [P('Object', True), P('AttributeName', False), P('Index', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetAvailableLocaleCodes', 'ПолучитьДопустимыеКодыЛокализации', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ToUniversalTime', 'УниверсальноеВремя', True, [P('LocalTime', True), P('TimeZone', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('TimeZone', 'ЧасовойПояс', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('Eval', 'Вычислить', True, [P('Expression', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetAppearanceTemplate', 'ПолучитьМакетОформления', True, [P('Appearance', True)], Env(True, False, True, False, False, False, True, False, False, False)),
+    method('Base64Value', 'Base64Значение', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Base64String', 'Base64Строка', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('CurrentUniversalDate', 'ТекущаяУниверсальнаяДата', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ToLocalTime', 'МестноеВремя', True, [P('UniversalTime', True), P('TimeZone', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ErrorInfo', 'ИнформацияОбОшибке', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ProcessJobs', 'ВыполнитьОбработкуЗаданий', False, [P('ProcessingTime', False)], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('FindWindowByURL', 'НайтиОкноПоНавигационнойСсылке', True, [P('NavigationLink', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('GetWindows', 'ПолучитьОкна', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('GotoURL', 'ПерейтиПоНавигационнойСсылке', False, [P('NavigationLink', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('GetURLsPresentations', 'ПолучитьПредставленияНавигационныхСсылок', True, [P('ReferencesArrray', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ValueToFormData', 'ЗначениеВДанныеФормы', False, [P('Value', True), P('Object', True)], Env(True, False, True, False, True, True, True, False, False, False)),
+    method('FormDataToValue', 'ДанныеФормыВЗначение', True, [P('Object', True), P('Type', True)], Env(True, False, True, False, True, True, True, False, False, False)),
+    method('GetInfoBaseURL', 'ПолучитьНавигационнуюСсылкуИнформационнойБазы', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('LocaleCodePresentation', 'ПредставлениеКодаЛокализации', True, [P('LocalizationCode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetAvailableTimeZones', 'ПолучитьДопустимыеЧасовыеПояса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('TimeZonePresentation', 'ПредставлениеЧасовогоПояса', True, [P('TimeZone', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('DaylightTimeOffset', 'СмещениеЛетнегоВремени', True, [P('TimeZone', False), P('UniversalTime', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('StandardTimeOffset', 'СмещениеСтандартногоВремени', True, [P('TimeZone', False), P('UniversalTime', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetObjectAndFormAttributeConformity', 'ПолучитьСоответствиеОбъектаИРеквизитаФормы', True, [P('Object', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('Status', 'Состояние', False, [P('MessageText', False), P('Progress', False), P('Explanation', False), P('Picture', False)], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('EncodeString', 'КодироватьСтроку', True, [P('String', True), P('StringEncodingMethod', True), P('StringEncoding', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('DecodeString', 'РаскодироватьСтроку', True, [P('String', True), P('StringEncodingMethod', True), P('StringEncoding', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('CurrentUniversalDateInMilliseconds', 'ТекущаяУниверсальнаяДатаВМиллисекундах', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ProceedWithCall', 'ПродолжитьВызов', True, [P('Value1ValueN', False)], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('CopyFormData', 'КопироватьДанныеФормы', True, [P('Source', True), P('Receiver', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetHibernateSessionTerminateTime', 'ПолучитьВремяЗавершенияСпящегоСеанса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetCurrentInfoBaseSession', 'ПолучитьТекущийСеансИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('CheckScriptCircularRefs', 'ПроверитьЦиклическиеСсылкиВстроенногоЯзыка', True, [P('Value', False), P('ValueDescription', False)], Env(True, True, True, False, True, True, True, True, False, False)),
+    method('GetExternalResourcesMode', 'ПолучитьРежимВнешнихРесурсов', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('SetObjectAndFormAttributeConformity', 'УстановитьСоответствиеОбъектаИРеквизитаФормы', False, [P('Object', True), P('AttributeName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetObjectAndFormConformity', 'УстановитьСоответствиеОбъектаИФормы', False, [P('Object', True), P('FormIdAndAttributeName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetObjectAndFormConformity', 'ПолучитьСоответствиеОбъектаИФормы', True, [P('Object', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetClientAllFilesMask', 'ПолучитьМаскуВсеФайлыКлиента', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('InputValue', 'ВвестиЗначение', True, [P('Value', True), P('Tooltip', False), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('InputNumber', 'ВвестиЧисло', True, [P('Number', True), P('Tooltip', False), P('Length', False), P('Precision', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('InputString', 'ВвестиСтроку', True, [P('String', True), P('Tooltip', False), P('Length', False), P('Multiline', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('InputDate', 'ВвестиДату', True, [P('Date', True), P('Tooltip', False), P('DatePart', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginGettingFiles', 'НачатьПолучениеФайлов', False, [P('NotifyDescription', True), P('FilesToBeObtained', True), P('FilesLocation', False), P('Interactively', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ShowInputDate', 'ПоказатьВводДаты', False, [P('NotifyDescriptionOnCompletion', True), P('Date', False), P('Tooltip', False), P('DatePart', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ShowInputValue', 'ПоказатьВводЗначения', False, [P('NotifyDescriptionOnCompletion', True), P('Value', True), P('Tooltip', False), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ShowInputString', 'ПоказатьВводСтроки', True, [P('NotifyDescriptionOnCompletion', True), P('String', False), P('Tooltip', False), P('Length', False), P('Multiline', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ShowInputNumber', 'ПоказатьВводЧисла', True, [P('NotifyDescriptionOnCompletion', True), P('Number', True), P('Tooltip', False), P('Length', False), P('Precision', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BegOfQuarter', 'НачалоКвартала', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('EndOfQuarter', 'КонецКвартала', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BegOfYear', 'НачалоГода', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('DoQueryBox', 'Вопрос', True, [P('QueryText', True), P('Buttons', True), P('Timeout', False), P('DefaultButton', False), P('Title', False), P('TimeoutButton', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('DoMessageBox', 'Предупреждение', False, [P('MessageText', True), P('Timeout', False), P('Title', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('Message', 'Сообщить', False, [P('MessageText', True), P('Status', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Beep', 'Сигнал', False, [], Env(True, False, True, True, False, False, True, True, False, False)),
+    method('OpenValue', 'ОткрытьЗначение', False, [P('Value', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ClearMessages', 'ОчиститьСообщения', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('Notify', 'Оповестить', False, [P('EventName', False), P('Parameter', False), P('Source', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('OpenHelpContent', 'ОткрытьСодержаниеСправки', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('OpenHelpIndex', 'ОткрытьИндексСправки', True, [P('SearchText', False)], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('UserInterruptProcessing', 'ОбработкаПрерыванияПользователя', False, [], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('UserName', 'ИмяПользователя', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('OpenHelp', 'ОткрытьСправку', True, [P('Section', False)], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('ShowErrorInfo', 'ПоказатьИнформациюОбОшибке', False, [P('ErrorInfo', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BriefErrorDescription', 'КраткоеПредставлениеОшибки', True, [P('ErrorInfo', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('DetailErrorDescription', 'ПодробноеПредставлениеОшибки', True, [P('ErrorInfo', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetForm', 'ПолучитьФорму', True, [P('FormName', True), P('Parameters', False), P('Owner', False), P('Unique', False), P('Window', False), P('NavigationLink', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('CloseHelp', 'ЗакрытьСправку', False, [], Env(True, True, True, False, False, False, True, True, True, False)),
+    method('UserFullName', 'ПолноеИмяПользователя', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ShowUserNotification', 'ПоказатьОповещениеПользователя', False, [P('Text', False), P('ActionOnClick', False), P('Explanation', False), P('Picture', False), P('UserNotificationStatus', False), P('UniquenessKey', False)], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('NotifyChanged', 'ОповеститьОбИзменении', False, [P('Reference', True), P('ChangedType', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('OpenForm', 'ОткрытьФорму', True, [P('Form', True), P('Window', False), P('FormName', True), P('Parameters', False), P('Owner', False), P('Unique', False), P('Window', False), P('NavigationLink', False), P('NotifyOnCloseDescription', False), P('WindowOpeningMode', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('OpenFormModal', 'ОткрытьФормуМодально', True, [P('Form', True), P('FormName', True), P('Parameters', False), P('Owner', False), P('NavigationLink', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ActiveWindow', 'АктивноеОкно', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ShowQueryBox', 'ПоказатьВопрос', False, [P('NotifyDescriptionOnCompletion', True), P('QueryText', True), P('Buttons', True), P('Timeout', False), P('DefaultButton', False), P('Title', False), P('TimeoutButton', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ShowMessageBox', 'ПоказатьПредупреждение', False, [P('NotifyDescriptionOnCompletion', False), P('MessageText', True), P('Timeout', False), P('Title', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ShowValue', 'ПоказатьЗначение', False, [P('NotifyDescriptionOnCompletion', False), P('Value', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('ExecuteNotifyProcessing', 'ВыполнитьОбработкуОповещения', False, [P('NotificationPerformed', True), P('Result', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('CannotOpenForm', 'ЗапрещеноОткрытиеФорм', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('SaveValue', 'СохранитьЗначение', False, [P('Name', True), P('Value', True)], Env(True, False, True, False, False, False, True, False, False, False)),
+    method('RestoreValue', 'ВосстановитьЗначение', True, [P('Name', True)], Env(True, False, True, False, False, False, True, False, False, False)),
+    method('EndOfMinute', 'КонецМинуты', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('CurrentDate', 'ТекущаяДата', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('WeekOfYear', 'НеделяГода', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ValueToStringInternal', 'ЗначениеВСтрокуВнутр', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ComputerName', 'ИмяКомпьютера', True, [], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('ValueFromStringInternal', 'ЗначениеИзСтрокиВнутр', True, [P('Line', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ValueToFile', 'ЗначениеВФайл', True, [P('FileName', True), P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ValueFromFile', 'ЗначениеИзФайла', True, [P('FileName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SaveUserSettings', 'СохранитьНастройкиПользователя', False, [], Env(True, False, True, False, False, False, True, False, False, False)),
+    method('ClearUserSettings', 'ОчиститьНастройкиПользователя', False, [P('IBUserName', True), P('IBUser', True)], Env(True, False, True, False, False, False, True, False, False, False)),
+    method('BinDir', 'КаталогПрограммы', True, [], Env(True, True, True, False, True, True, True, True, False, False)),
+    method('TempFilesDir', 'КаталогВременныхФайлов', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('AttachIdleHandler', 'ПодключитьОбработчикОжидания', False, [P('ProcedureName', True), P('Interval', True), P('Single', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('DetachIdleHandler', 'ОтключитьОбработчикОжидания', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('Exit', 'ЗавершитьРаботуСистемы', False, [P('OptionRequest', False), P('RestartOnCompletion', False), P('AdditionalParametersOfCommandLine', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('LockApplication', 'ЗаблокироватьРаботуПользователя', False, [], Env(True, False, True, False, False, False, True, True, False, False)),
+    method('AccessRight', 'ПравоДоступа', True, [P('Right', True), P('MetadataObject', True), P('UserRole', False), P('StandardAttributeStandardTabularSection', False)], Env(True, True, True, True, True, True, True, False, False, False)),
+    method('IsInRole', 'РольДоступна', True, [P('Role', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('Terminate', 'ПрекратитьРаботуСистемы', False, [P('RestartOnCompletion', False), P('AdditionalParametersOfCommandLine', False)], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('CurrentLanguage', 'ТекущийЯзык', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('InfoBaseConnectionString', 'СтрокаСоединенияИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('AttachNotificationHandler', 'ПодключитьОбработчикОповещения', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('DetachNotificationHandler', 'ОтключитьОбработчикОповещения', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('AccessParameters', 'ПараметрыДоступа', True, [P('DescriptionOfTheRight', True), P('MetadataObject', True), P('FieldList', True), P('UserRole', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ApplicationPresentation', 'ПредставлениеПриложения', True, [P('ApplicationName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('CurrentSystemLanguage', 'ТекущийЯзыкСистемы', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('RunSystem', 'ЗапуститьСистему', False, [P('AdditionalParametersOfCommandLine', False), P('WaitForCompletion', False), P('ReturnCode', False)], Env(True, False, True, False, False, False, True, True, False, False)),
+    method('GetUserMessages', 'ПолучитьСообщенияПользователю', True, [P('ToDeleteGetting', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetClientConnectionSpeed', 'ПолучитьСкоростьКлиентскогоСоединения', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('CurrentRunMode', 'ТекущийРежимЗапуска', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('CurrentLocaleCode', 'ТекущийКодЛокализации', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetSessionTimeZone', 'УстановитьЧасовойПоясСеанса', False, [P('TimeZone', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SessionTimeZone', 'ЧасовойПоясСеанса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('CurrentSessionDate', 'ТекущаяДатаСеанса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('RightPresentation', 'ПредставлениеПрава', True, [P('NameOfRight', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('VerifyAccessRights', 'ВыполнитьПроверкуПравДоступа', False, [P('Right', True), P('MetadataObject', True), P('StandardAttributeStandardTabularSection', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('UserDataWorkDir', 'РабочийКаталогДанныхПользователя', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('DocumentsDir', 'КаталогДокументов', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginGettingUserDataWorkDir', 'НачатьПолучениеРабочегоКаталогаДанныхПользователя', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('MobileDeviceLibraryDir', 'КаталогБиблиотекиМобильногоУстройства', True, [P('DirType', True)], Env(False, False, True, True, True, False, False, False, False, False)),
+    method('GetClientDisplaysInformation', 'ПолучитьИнформациюЭкрановКлиента', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BeginGettingTempFilesDir', 'НачатьПолучениеКаталогаВременныхФайлов', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginGettingDocumentsDir', 'НачатьПолучениеКаталогаДокументов', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginGettingMobileDeviceLibraryDir', 'НачатьПолучениеКаталогаБиблиотекиМобильногоУстройства', False, [P('NotifyDescription', True), P('DirType', True)], Env(False, False, True, True, True, False, False, False, False, False)),
+    method('DetachLicensingClientParametersRequestHandler', 'ОтключитьОбработчикЗапросаНастроекКлиентаЛицензирования', False, [], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('AttachLicensingClientParametersRequestHandler', 'ПодключитьОбработчикЗапросаНастроекКлиентаЛицензирования', False, [P('ProcedureName', True)], Env(True, False, True, False, False, False, True, True, True, False)),
+    method('SessionBeginningOfCentury', 'НачалоСтолетияСеанса', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('BeginCreateBinaryDataFromFile', 'НачатьСозданиеДвоичныхДанныхИзФайла', False, [P('NotifyDescription', True), P('FileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('LoadAddIn', 'ЗагрузитьВнешнююКомпоненту', False, [P('FileName', True)], Env(True, False, True, False, False, False, True, False, False, False)),
+    method('InstallAddIn', 'УстановитьВнешнююКомпоненту', False, [P('Location', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('GetPassiveSessionHibernateTime', 'ПолучитьВремяЗасыпанияПассивногоСеанса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetHibernateSessionTerminateTime', 'УстановитьВремяЗавершенияСпящегоСеанса', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('AttachAddIn', 'ПодключитьВнешнююКомпоненту', True, [P('Location', True), P('Name', True), P('Type', False), P('ObjectIdentificator', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BeginInstallAddIn', 'НачатьУстановкуВнешнейКомпоненты', False, [P('NotifyDescriptionOnCompletion', False), P('Location', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('DynamicAddInInstallationSupported', 'ПоддерживаетсяДинамическаяУстановкаВнешнихКомпонент', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('System', 'КомандаСистемы', False, [P('CommandString', True), P('CurrentDirectory', False)], Env(True, False, True, False, False, False, True, True, False, False)),
+    method('BeginAttachingAddIn', 'НачатьПодключениеВнешнейКомпоненты', False, [P('NotifyDescription', False), P('ObjectId', False), P('NotifyDescription', True), P('Location', True), P('Name', True), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('EndOfHour', 'КонецЧаса', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('RunApp', 'ЗапуститьПриложение', False, [P('CommandString', True), P('CurrentDirectory', False), P('WaitForCompletion', False), P('ReturnCode', False)], Env(True, False, True, True, True, True, True, True, True, False)),
+    method('BeginPuttingFiles', 'НачатьПомещениеФайлов', False, [P('NotifyDescriptionOnCompletion', True), P('Files', False), P('Interactively', False), P('FormUniqueID', False), P('BeforeStartPutFilesNotifyDescription', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('GetCOMObject', 'ПолучитьCOMОбъект', True, [P('FileName', False), P('NameOfCOMClass', False)], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('WindowsUsers', 'ПользователиWindows', True, [], Env(True, False, True, False, False, False, True, True, False, False)),
+    method('OSUsers', 'ПользователиОС', True, [], Env(True, False, True, False, False, False, True, True, False, False)),
+    method('BeginRunningApplication', 'НачатьЗапускПриложения', False, [P('NotifyDescription', True), P('CommandLine', True), P('CurrentDirectory', False), P('WaitForCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginTransaction', 'НачатьТранзакцию', False, [P('LockMode', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('CommitTransaction', 'ЗафиксироватьТранзакцию', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('RollbackTransaction', 'ОтменитьТранзакцию', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetExclusiveMode', 'УстановитьМонопольныйРежим', False, [P('ExclusiveMode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetUserPasswordMinLength', 'ПолучитьМинимальнуюДлинуПаролейПользователей', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ExclusiveMode', 'МонопольныйРежим', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetInfoBaseConnections', 'ПолучитьСоединенияИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('InfoBaseConnectionNumber', 'НомерСоединенияИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ConfigurationChanged', 'КонфигурацияИзменена', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetRealTimeTimestamp', 'ПолучитьОперативнуюОтметкуВремени', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('InfoBaseLocaleCode', 'КодЛокализацииИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetInfoBasePredefinedData', 'ПолучитьОбновлениеПредопределенныхДанныхИнформационнойБазы', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
+    method('DataBaseConfigurationChangedDynamically', 'КонфигурацияБазыДанныхИзмененаДинамически', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetLockWaitTime', 'УстановитьВремяОжиданияБлокировкиДанных', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetLockWaitTime', 'ПолучитьВремяОжиданияБлокировкиДанных', True, [], Env(True, True, True, True, True, True, True, False, False, False)),
+    method('SetUserPasswordMinLength', 'УстановитьМинимальнуюДлинуПаролейПользователей', False, [P('Length', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetUserPasswordStrengthCheck', 'УстановитьПроверкуСложностиПаролейПользователей', False, [P('ComplexPassword', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetUserPasswordStrengthCheck', 'ПолучитьПроверкуСложностиПаролейПользователей', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('BegOfMinute', 'НачалоМинуты', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetConnectionsLock', 'ПолучитьБлокировкуУстановкиСоединений', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetConnectionsLock', 'УстановитьБлокировкуУстановкиСоединений', False, [P('Lock', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetDBStorageStructureInfo', 'ПолучитьСтруктуруХраненияБазыДанных', True, [P('MetadataObjects', False), P('DBMSNames', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('TransactionActive', 'ТранзакцияАктивна', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('RefreshObjectsNumbering', 'ОбновитьНумерациюОбъектов', False, [P('Metadata', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ConnectionStopRequest', 'НеобходимостьЗавершенияСоединения', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('InfoBaseSessionNumber', 'НомерСеансаИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetPrivilegedMode', 'УстановитьПривилегированныйРежим', False, [P('PrivilegedModeOn', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('PrivilegedMode', 'ПривилегированныйРежим', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetInfoBaseSessions', 'ПолучитьСеансыИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('LockDataForEdit', 'ЗаблокироватьДанныеДляРедактирования', False, [P('Key', True), P('DataVersion', False), P('FormIdentifier', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('UnlockDataForEdit', 'РазблокироватьДанныеДляРедактирования', False, [P('Key', False), P('FormIdentifier', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetSessionsLock', 'ПолучитьБлокировкуСеансов', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetSessionsLock', 'УстановитьБлокировкуСеансов', False, [P('Lock', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('RefreshReusableValues', 'ОбновитьПовторноИспользуемыеЗначения', False, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('SetSafeMode', 'УстановитьБезопасныйРежим', False, [P('SafeMode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SafeMode', 'БезопасныйРежим', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetChoiceData', 'ПолучитьДанныеВыбора', True, [P('ValueType', True), P('Parameters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('SetInfoBaseTimeZone', 'УстановитьЧасовойПоясИнформационнойБазы', False, [P('TimeZone', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetInfoBaseTimeZone', 'ПолучитьЧасовойПоясИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ConnectExternalDataSource', 'УстановитьСоединениеСВнешнимИсточникомДанных', False, [P('ExternalDataSourceName', False)], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('DisconnectExternalDataSource', 'РазорватьСоединениеСВнешнимИсточникомДанных', False, [P('ExternalDataSourceName', False)], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('GetDataBaseConfigurationUpdate', 'ПолучитьОбновлениеКонфигурацииБазыДанных', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetPassiveSessionHibernateTime', 'УстановитьВремяЗасыпанияПассивногоСеанса', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('EraseInfoBaseData', 'УдалитьДанныеИнформационнойБазы', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetDataSeparationSafeMode', 'УстановитьБезопасныйРежимРазделенияДанных', False, [P('CommonAttribute', True), P('Mode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('DataSeparationSafeMode', 'БезопасныйРежимРазделенияДанных', True, [P('CommonAttribute', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('InitializePredefinedData', 'ИнициализироватьПредопределенныеДанные', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetSafeModeDisabled', 'УстановитьОтключениеБезопасногоРежима', False, [P('Disable', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetSafeModeDisabled', 'ПолучитьОтключениеБезопасногоРежима', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetLicensingClientParameters', 'УстановитьНастройкиКлиентаЛицензирования', False, [P('Name', False), P('Password', False), P('AdditionalOption', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetConfigurationID', 'ПолучитьИдентификаторКонфигурации', True, [], Env(False, False, True, False, True, True, False, False, False, False)),
+    method('GetLicensingClientName', 'ПолучитьИмяКлиентаЛицензирования', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetLicensingClientAdditionalParameter', 'ПолучитьДополнительныйПараметрКлиентаЛицензирования', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetInfoBaseBeginningOfCentury', 'УстановитьНачалоСтолетияИнформационнойБазы', False, [P('BeginningOfCentury', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetInfoBaseBeginningOfCentury', 'ПолучитьНачалоСтолетияИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('FileCopy', 'КопироватьФайл', False, [P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('MoveFile', 'ПереместитьФайл', False, [P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('DeleteFiles', 'УдалитьФайлы', False, [P('Path', True), P('Mask', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('DeleteFromTempStorage', 'УдалитьИзВременногоХранилища', False, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetFromTempStorage', 'ПолучитьИзВременногоХранилища', True, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('FindFiles', 'НайтиФайлы', True, [P('Path', True), P('Mask', False), P('SearchInSubdirectories', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('CreateDirectory', 'СоздатьКаталог', False, [P('DirectoryName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('IsTempStorageURL', 'ЭтоАдресВременногоХранилища', True, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetTempFileName', 'ПолучитьИмяВременногоФайла', True, [P('Extension', False)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('BeginCopyingFile', 'НачатьКопированиеФайла', False, [P('NotifyDescription', True), P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginMovingFile', 'НачатьПеремещениеФайла', False, [P('NotifyDescription', True), P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginDeletingFiles', 'НачатьУдалениеФайлов', False, [P('NotifyDescription', True), P('Path', True), P('Mask', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('SplitFile', 'РазделитьФайл', True, [P('FileName', True), P('SegmentSize', True), P('Path', False)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('MergeFiles', 'ОбъединитьФайлы', False, [P('SearchTemplate', True), P('ResultingFileName', True), P('SegmentNames', True), P('ResultingFileName', True)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('GetFile', 'ПолучитьФайл', True, [P('Address', True), P('FileName', False), P('Interactively', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('PutToTempStorage', 'ПоместитьВоВременноеХранилище', True, [P('Data', True), P('Address', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('AttachFileSystemExtension', 'ПодключитьРасширениеРаботыСФайлами', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('InstallFileSystemExtension', 'УстановитьРасширениеРаботыСФайлами', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginAttachingFileSystemExtension', 'НачатьПодключениеРасширенияРаботыСФайлами', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('RequestUserPermission', 'ЗапроситьРазрешениеПользователя', True, [P('Calls', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('GetAllFilesMask', 'ПолучитьМаскуВсеФайлы', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetServerAllFilesMask', 'ПолучитьМаскуВсеФайлыСервера', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
+    method('GetPathSeparator', 'ПолучитьРазделительПути', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetClientPathSeparator', 'ПолучитьРазделительПутиКлиента', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetServerPathSeparator', 'ПолучитьРазделительПутиСервера', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
+    method('BeginInstallFileSystemExtension', 'НачатьУстановкуРасширенияРаботыСФайлами', False, [P('NotifyDescriptionOnCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginPutFile', 'НачатьПомещениеФайла', True, [P('NotifyDescriptionOnCompletion', False), P('Address', False), P('File', False), P('Interactively', False), P('FormUniqueID', False), P('BeforeStartPutFileNotifyDescription', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginRequestingUserPermission', 'НачатьЗапросРазрешенияПользователя', False, [P('NotifyDescription', True), P('Calls', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginFindingFiles', 'НачатьПоискФайлов', False, [P('NotifyDescription', True), P('Path', True), P('Mask', False), P('SearchInSubdirectories', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginCreatingDirectory', 'НачатьСозданиеКаталога', False, [P('NotifyDescription', True), P('DirectoryName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('FindMarkedForDeletion', 'НайтиПомеченныеНаУдаление', True, [P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('FindByRef', 'НайтиПоСсылкам', True, [P('ReferenceList', True), P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('DeleteObjects', 'УдалитьОбъекты', False, [P('ReferenceList', True), P('Check', False), P('DataFound', False), P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetInfoBasePredefinedDataUpdate', 'УстановитьОбновлениеПредопределенныхДанныхИнформационнойБазы', False, [P('PredefinedDataUpdate', False)], Env(True, False, True, False, True, True, True, False, False, False)),
+    method('NumberInWords', 'ЧислоПрописью', True, [P('Number', True), P('FormatString', False), P('NumerationItemOptions', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('NStr', 'НСтр', True, [P('InitialString', True), P('LanguageCode', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Int', 'Цел', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Format', 'Формат', True, [P('Value', True), P('FormatString', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('PeriodPresentation', 'ПредставлениеПериода', True, [P('BeginningDateOfPeriod', True), P('EndingDateOfPeriod', True), P('FormatString', False)], Env(True, True, True, False, True, True, True, True, True, False)),
+    method('StrTemplate', 'СтрШаблон', True, [P('Template', True), P('Value1-Value10', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StringWithNumber', 'СтрокаСЧислом', True, [P('SourceString', True), P('Number', True), P('NumericValueType', True), P('Parameters', False)], Env(True, False, True, True, True, True, True, True, True, False)),
+    method('GetCommonTemplate', 'ПолучитьОбщийМакет', True, [P('CommonTemplate', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetCommonForm', 'ПолучитьОбщуюФорму', True, [P('Form', False), P('Owner', False), P('UniquenessKey', False)], Env(True, False, True, False, False, False, True, False, False, False)),
+    method('PredefinedValue', 'ПредопределенноеЗначение', True, [P('PredefinedValueName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetPredefinedValueFullName', 'ПолучитьПолноеИмяПредопределенногоЗначения', True, [P('PredefinedValue', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Round', 'Окр', True, [P('Number', True), P('DigitCapacity', False), P('RoundingMode', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Log', 'Log', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Log10', 'Log10', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BegOfHour', 'НачалоЧаса', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ACos', 'ACos', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ASin', 'ASin', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ATan', 'ATan', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Cos', 'Cos', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Exp', 'Exp', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Pow', 'Pow', True, [P('Base', True), P('Factor', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Sin', 'Sin', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Sqrt', 'Sqrt', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Tan', 'Tan', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('XMLString', 'XMLСтрока', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('XMLValue', 'XMLЗначение', True, [P('Type', True), P('XMLString', True)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('BegOfWeek', 'НачалоНедели', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('EndOfWeek', 'КонецНедели', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('WriteXML', 'ЗаписатьXML', False, [P('WriteXML', True), P('Value', True), P('TypeAssignment', False), P('WriteXML', True), P('Value', True), P('FullName', True), P('TypeAssignment', False), P('WriteXML', True), P('Value', True), P('LocalName', True), P('NamespaceURI', True), P('TypeAssignment', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ReadXML', 'ПрочитатьXML', True, [P('ReadXML', True), P('ValueType', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('CanReadXML', 'ВозможностьЧтенияXML', True, [P('ReadXML', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('XMLType', 'XMLТип', True, [P('Type', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('FromXMLType', 'ИзXMLТипа', True, [P('XMLType', True), P('TypeName', True), P('NamespaceURI', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetLocationByAddress', 'ПолучитьМестоположениеПоАдресу', True, [P('Address', False)], Env(False, False, True, True, False, False, False, False, False, False)),
+    method('GetXMLType', 'ПолучитьXMLТип', True, [P('ReadXML', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('XMLTypeOf', 'XMLТипЗнч', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('FindDisallowedXMLCharacters', 'НайтиНедопустимыеСимволыXML', True, [P('CharacterString', True), P('StartPosition', False), P('Version', False)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('ImportXDTOModel', 'ИмпортМоделиXDTO', True, [P('XMLSchemaSet', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('CreateXDTOFactory', 'СоздатьФабрикуXDTO', True, [P('Path', True), P('Packages', False), P('Paths', True), P('Packages', False)], Env(True, True, True, False, True, True, True, True, False, False)),
+    method('TypeOf', 'ТипЗнч', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Type', 'Тип', True, [P('TypeName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Boolean', 'Булево', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Number', 'Число', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BegOfMonth', 'НачалоМесяца', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('EndOfMonth', 'КонецМесяца', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('String', 'Строка', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Date', 'Дата', True, [P('Value', True), P('Year', True), P('Month', True), P('Day', True), P('Hour', False), P('Minute', False), P('Second', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('EndOfYear', 'КонецГода', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('NumberFromHexString', 'ЧислоИзШестнадцатеричнойСтроки', True, [P('HexString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('NumberFromBinaryString', 'ЧислоИзДвоичнойСтроки', True, [P('BinaryString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetAddressByLocation', 'ПолучитьАдресПоМестоположению', True, [P('Location', True)], Env(False, False, True, True, False, False, False, False, False, False)),
+    method('ShowOnMap', 'ПоказатьНаКарте', False, [P('Location', True)], Env(False, False, True, True, False, False, False, False, False, False)),
+    method('MapRepresentationSupported', 'ПоддерживаетсяОтображениеКарты', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetFunctionalOption', 'ПолучитьФункциональнуюОпцию', True, [P('Name', True), P('Parameters', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetInterfaceFunctionalOption', 'ПолучитьФункциональнуюОпциюИнтерфейса', True, [P('Name', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('GetInterfaceFunctionalOptionParameters', 'ПолучитьПараметрыФункциональныхОпцийИнтерфейса', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('SetInterfaceFunctionalOptionParameters', 'УстановитьПараметрыФункциональныхОпцийИнтерфейса', False, [P('ParametersToBeSpecified', True), P('ParametersToBeReset', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('RefreshInterface', 'ОбновитьИнтерфейс', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('AddMonth', 'ДобавитьМесяц', True, [P('Date', True), P('CountOfMonths', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Year', 'Год', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Month', 'Месяц', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('DayOfYear', 'ДеньГода', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('WeekDay', 'ДеньНедели', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BegOfDay', 'НачалоДня', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('EndOfDay', 'КонецДня', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Day', 'День', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Hour', 'Час', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Minute', 'Минута', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Second', 'Секунда', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('WriteJSON', 'ЗаписатьJSON', False, [P('JSONWriter', True), P('Value', True), P('SerializationSettings', False), P('ConversionFunctionName', False), P('ConversionFunctionModule', False), P('ConversionFunctionAdditionalParameters', False)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('ConcatBinaryDataBuffers', 'СоединитьБуферыДвоичныхДанных', True, [P('Parts', True), P('Separator', False), P('ByteOrder', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('ReadJSON', 'ПрочитатьJSON', True, [P('JSONReader', True), P('ReadToMap', False), P('PropertiesWithDateValuesNames', False), P('ExpectedDateFormat', False), P('ReviverFunctionName', False), P('ReviverFunctionModule', False), P('ReviverFunctionAdditionalParameters', False), P('RetriverPropertiesNames', False), P('MaximumNesting', False)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('ReadJSONDate', 'ПрочитатьДатуJSON', True, [P('String', True), P('Format', True)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('WriteJSONDate', 'ЗаписатьДатуJSON', True, [P('Date', True), P('Format', True), P('DateWritingVariant', False)], Env(True, True, True, True, True, True, True, True, False, False)),
+    method('ConcatBinaryData', 'СоединитьДвоичныеДанные', True, [P('BinaryDataArray', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('SplitBinaryData', 'РазделитьДвоичныеДанные', True, [P('BinaryData', True), P('PartSize', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataFromString', 'ПолучитьДвоичныеДанныеИзСтроки', True, [P('String', True), P('TextEncoding', False), P('WriteBOM', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataBufferFromString', 'ПолучитьБуферДвоичныхДанныхИзСтроки', True, [P('String', True), P('TextEncoding', False), P('WriteBOM', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetStringFromBinaryData', 'ПолучитьСтрокуИзДвоичныхДанных', True, [P('BinaryData', True), P('TextEncoding', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetStringFromBinaryDataBuffer', 'ПолучитьСтрокуИзБуфераДвоичныхДанных', True, [P('Buffer', True), P('TextEncoding', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataFromBase64String', 'ПолучитьДвоичныеДанныеИзBase64Строки', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataBufferFromBase64String', 'ПолучитьБуферДвоичныхДанныхИзBase64Строки', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBase64StringFromBinaryData', 'ПолучитьBase64СтрокуИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBase64StringFromBinaryDataBuffer', 'ПолучитьBase64СтрокуИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataFromBase64BinaryData', 'ПолучитьДвоичныеДанныеИзBase64ДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataBufferFromBase64BinaryDataBuffer', 'ПолучитьБуферДвоичныхДанныхИзBase64БуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBase64BinaryDataFromBinaryData', 'ПолучитьBase64ДвоичныеДанныеИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBase64BinaryDataBufferFromBinaryDataBuffer', 'ПолучитьBase64БуферДвоичныхДанныхИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataFromHexString', 'ПолучитьДвоичныеДанныеИзHexСтроки', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataBufferFromHexString', 'ПолучитьБуферДвоичныхДанныхИзHexСтроки', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetHexStringFromBinaryData', 'ПолучитьHexСтрокуИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetHexStringFromBinaryDataBuffer', 'ПолучитьHexСтрокуИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataFromHexBinaryData', 'ПолучитьДвоичныеДанныеИзHexДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataBufferFromHexBinaryDataBuffer', 'ПолучитьБуферДвоичныхДанныхИзHexБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetHexBinaryDataFromBinaryData', 'ПолучитьHexДвоичныеДанныеИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetHexBinaryDataBufferFromBinaryDataBuffer', 'ПолучитьHexБуферДвоичныхДанныхИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataBufferFromBinaryData', 'ПолучитьБуферДвоичныхДанныхИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetBinaryDataFromBinaryDataBuffer', 'ПолучитьДвоичныеДанныеИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('CheckBit', 'ПроверитьБит', True, [P('Number', True), P('BitNumber', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('CheckByBitMask', 'ПроверитьПоБитовойМаске', True, [P('Number', True), P('Mask', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('SetBit', 'УстановитьБит', True, [P('Number', True), P('BitNumber', True), P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BitwiseAnd', 'ПобитовоеИ', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BitwiseOr', 'ПобитовоеИли', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BitwiseNot', 'ПобитовоеНе', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BitwiseXor', 'ПобитовоеИсключительноеИли', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BitwiseAndNot', 'ПобитовоеИНе', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BitwiseShiftLeft', 'ПобитовыйСдвигВлево', True, [P('Number', True), P('Offset', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('BitwiseShiftRight', 'ПобитовыйСдвигВправо', True, [P('Number', True), P('Offset', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('WriteLogEvent', 'ЗаписьЖурналаРегистрации', False, [P('EventName', True), P('Level', False), P('MetadataObject', False), P('Data', False), P('Commentaries', False), P('TransactionMode', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('EventLogEventPresentation', 'ПредставлениеСобытияЖурналаРегистрации', True, [P('EventIdentifier', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('UnloadEventLog', 'ВыгрузитьЖурналРегистрации', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetEventLogUsing', 'ПолучитьИспользованиеЖурналаРегистрации', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetEventLogUsing', 'УстановитьИспользованиеЖурналаРегистрации', False, [P('Levels', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('BeginAttachingCryptoExtension', 'НачатьПодключениеРасширенияРаботыСКриптографией', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('StrLen', 'СтрДлина', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetEventLogFilterValues', 'ПолучитьЗначенияОтбораЖурналаРегистрации', True, [P('Columns', False), P('InputFileName', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('Left', 'Лев', True, [P('Line', True), P('CountOfCharacters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('UnloadEventLog', 'ВыгрузитьЖурналРегистрации', False, [P('Destination', True), P('Filter', False), P('Columns', False), P('InputFileName', False), P('MaximumCount', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('CopyEventLog', 'СкопироватьЖурналРегистрации', False, [P('InputFileName', False), P('OutputFileName', False), P('Filter', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetEventLogEventUse', 'УстановитьИспользованиеСобытияЖурналаРегистрации', False, [P('EventName', True), P('Use', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetEventLogEventUse', 'ПолучитьИспользованиеСобытияЖурналаРегистрации', True, [P('EventName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('ClearEventLog', 'ОчиститьЖурналРегистрации', False, [P('Filter', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('SetStandardODataInterfaceContent', 'УстановитьСоставСтандартногоИнтерфейсаOData', False, [P('MetadataObjects', True)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetStandardODataInterfaceContent', 'ПолучитьСоставСтандартногоИнтерфейсаOData', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('InstallCryptoExtension', 'УстановитьРасширениеРаботыСКриптографией', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('AttachCryptoExtension', 'ПодключитьРасширениеРаботыСКриптографией', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('BeginInstallCryptoExtension', 'НачатьУстановкуРасширенияРаботыСКриптографией', False, [P('NotifyDescriptionOnCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
+    method('TrimL', 'СокрЛ', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('TrimR', 'СокрП', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('TrimAll', 'СокрЛП', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Right', 'Прав', True, [P('Line', True), P('CountOfCharacters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Mid', 'Сред', True, [P('Line', True), P('InitialNumber', True), P('CountOfCharacters', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Upper', 'ВРег', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Lower', 'НРег', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Char', 'Символ', True, [P('CharacterCode', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('CharCode', 'КодСимвола', True, [P('Line', True), P('CharacterNumber', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('IsBlankString', 'ПустаяСтрока', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrReplace', 'СтрЗаменить', True, [P('Line', True), P('SearchSubstring', True), P('ReplaceSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrLineCount', 'СтрЧислоСтрок', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrGetLine', 'СтрПолучитьСтроку', True, [P('Line', True), P('LineNumber', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrOccurrenceCount', 'СтрЧислоВхождений', True, [P('Line', True), P('SearchSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('Title', 'ТРег', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrCompare', 'СтрСравнить', True, [P('String1', True), P('String2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrStartsWith', 'СтрНачинаетсяС', True, [P('String', True), P('SearchString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrEndsWith', 'СтрЗаканчиваетсяНа', True, [P('String', True), P('SearchString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrSplit', 'СтрРазделить', True, [P('String', True), P('Separator', True), P('IncludeBlank', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrConcat', 'СтрСоединить', True, [P('Strings', True), P('Separator', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('StrFind', 'СтрНайти', True, [P('Line', True), P('SearchSubstring', True), P('SearchDirection', False), P('StartIndex', False), P('EntryNumber', False)], Env(True, True, True, True, True, True, True, True, True, False)),
+    method('GetStringDeclensions', 'ПолучитьСклоненияСтроки', True, [P('DeclinedString', True), P('StringDescription', False), P('FormatString', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    method('GetStringDeclensionsByNumber', 'ПолучитьСклоненияСтрокиПоЧислу', True, [P('String', True), P('Number', True), P('UnitsOfMeasurement', False), P('StringDescription', False), P('FormatString', False), P('NumberFormatString', False)], Env(True, True, True, False, True, True, True, False, False, False)),
+    # deprecated
+    method('ClientApplicationInterfaceCurrentVariant', 'ТекущийВариантИнтерфейсаКлиентскогоПриложения', True, [], Env()),
+]
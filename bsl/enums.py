@@ -2,7 +2,7 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from enum import Enum, auto
+from enum import Enum, IntFlag, auto
 
 class EnumBase(Enum):
 
@@ -119,3 +119,18 @@ class PrepSymbols(EnumBase):
     EXTERNALCONNECTION = ВНЕШНЕЕСОЕДИНЕНИЕ = auto()
     THINCLIENT = ТОНКИЙКЛИЕНТ = auto()
     WEBCLIENT = ВЕБКЛИЕНТ = auto()
+
+class Environments(IntFlag):
+    """
+    Окружения исполнения. Порядок битов совпадает с порядком полей bsl.ast.Env.
+    """
+    CLIENT = auto()
+    EXTERNALCONNECTION = auto()
+    MOBILEAPPLICATION = auto()
+    MOBILECLIENT = auto()
+    MOBILESERVER = auto()
+    SERVER = auto()
+    THICKCLIENT = auto()
+    THINCLIENT = auto()
+    WEBCLIENT = auto()
+    INTEGRATION = auto()
@@ -1,1971 +1,122 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
 
-from bsl.ast import Scope, Item, GlobalObject, GlobalMethod, Env, GlobalMethodParameter as P
+"""
+Глобальный контекст платформы.
+Объявления из bsl.context один раз сводятся в компактный снимок (marshal) в __pycache__,
+ключ снимка - хэш исходников bsl.context и bsl.glob. Последующие импорты загружают только снимок,
+а узлы Item создаются лениво, при первом обращении к имени.
+Каждая сущность хранится в снимке один раз, английские и русские имена
+ведут к ней через индекс синонимов (см. bsl.symbols.SymbolTable).
+"""
 
-props = [
-    GlobalObject('MainInterface', Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalObject('ГлавныйИнтерфейс', Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalObject('Constants', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Константы', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Catalogs', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Справочники', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Enums', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Перечисления', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('DataProcessors', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Обработки', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Documents', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Документы', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('InformationRegisters', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('РегистрыСведений', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('DocumentJournals', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ЖурналыДокументов', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('FilterCriteria', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('КритерииОтбора', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Metadata', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Метаданные', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('AccumulationRegisters', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('РегистрыНакопления', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('WorkingDate', Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalObject('РабочаяДата', Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalObject('WorkingDateUse', Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalObject('ИспользованиеРабочейДаты', Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalObject('StyleLib', Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalObject('БиблиотекаСтилей', Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalObject('ExternalDataProcessors', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ВнешниеОбработки', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Reports', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Отчеты', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ChartsOfCalculationTypes', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ПланыВидовРасчета', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('CalculationRegisters', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('РегистрыРасчета', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('PictureLib', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('БиблиотекаКартинок', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('LaunchParameter', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('ПараметрЗапуска', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('ChartsOfCharacteristicTypes', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ПланыВидовХарактеристик', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ChartsOfAccounts', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ПланыСчетов', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('AccountingRegisters', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('РегистрыБухгалтерии', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ExchangePlans', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ПланыОбмена', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('InfoBaseUsers', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ПользователиИнформационнойБазы', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('BusinessProcesses', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('БизнесПроцессы', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Tasks', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Задачи', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('SessionParameters', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ПараметрыСеанса', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Sequences', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('Последовательности', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('MainStyle', Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalObject('ГлавныйСтиль', Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalObject('XDTOFactory', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ФабрикаXDTO', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('WSReferences', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('WSСсылки', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('FullTextSearch', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ПолнотекстовыйПоиск', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('XDTOSerializer', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('СериализаторXDTO', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ExternalReports', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ВнешниеОтчеты', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('BackgroundJobs', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ФоновыеЗадания', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ScheduledJobs', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('РегламентныеЗадания', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionAppearanceTemplateLib', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('БиблиотекаМакетовОформленияКомпоновкиДанных', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('UserWorkHistory', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ИсторияРаботыПользователя', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('SystemSettingsStorage', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ХранилищеСистемныхНастроек', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('CommonSettingsStorage', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ХранилищеОбщихНастроек', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ReportsUserSettingsStorage', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ХранилищеПользовательскихНастроекОтчетов', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ReportsVariantsStorage', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ХранилищеВариантовОтчетов', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('MailTools', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('СредстваПочты', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('DeliverableNotifications', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('ДоставляемыеУведомления', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('FormDataSettingsStorage', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ХранилищеНастроекДанныхФорм', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('SettingsStorages', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ХранилищаНастроек', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('CryptoTools', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('СредстваКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ExternalDataSources', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ВнешниеИсточникиДанных', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('DynamicListsUserSettingsStorage', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ХранилищеПользовательскихНастроекДинамическихСписков', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('LocationTools', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('СредстваГеопозиционирования', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('MultimediaTools', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('СредстваМультимедиа', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('TelephonyTools', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('СредстваТелефонии', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('DeliverableNotificationSend', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ОтправкаДоставляемыхУведомлений', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ConfigurationExtensions', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасширенияКонфигурации', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('OSTaskbar', Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalObject('ПанельЗадачОС', Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalObject('AdvertisingPresentationTools', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('СредстваОтображенияРекламы', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('InAppPurchasesValidation', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ПроверкаВстроенныхПокупок', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('InAppPurchases', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('ВстроенныеПокупки', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('AdRepresentation', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('ОтображениеРекламы', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('InternetConnectionInformation', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('ИнформацияОбИнтернетСоединении', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('FileStreams', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ФайловыеПотоки', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataHistory', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ИсторияДанных', Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalObject('ClientApplication', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('КлиентскоеПриложение', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('CollaborationSystem', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('СистемаВзаимодействия', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ClientApplicationAgent', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('АгентКлиентскогоПриложения', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('DatabaseCopies', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('КопииБазыДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DeviceTools', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('СредстваУстройства', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('GlobalSearch', Env(True, True, True, True, False, False, True, True, True, True)),
-    GlobalObject('ГлобальныйПоиск', Env(True, True, True, True, False, False, True, True, True, True)),
-    GlobalObject('StandardGlobalSearchType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('СтандартныйВидГлобальногоПоиска', Env(True, True, True, True, True, True, True, True, True, False)),
-]
+from typing import Dict, List, Optional, Tuple, Any
+from bsl.ast import Scope, Item, GlobalObject, GlobalMethod, GlobalMethodParameter as P, env_mask, mask_env
+from bsl.symbols import Prop, SymbolTable
+import importlib.util
+import hashlib
+import marshal
+import os.path
+import sys
 
-enums = [
-    GlobalObject('SpreadsheetDocumentValuesReadingMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СпособЧтенияЗначенийТабличногоДокумента', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('TextPositionRelativeToPicture', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеТекстаОтносительноКартинки', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('JSONLineBreak', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ПереносСтрокJSON', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('DataCompositionFilterApplicationType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипПримененияОтбораКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionSettingsItemViewMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимОтображенияЭлементаНастройкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionSettingsViewMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимОтображенияНастроекКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentGroupHeaderPlacement', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РасположениеЗаголовкаГруппировкиТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('StandardBeginningDateVariant', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВариантСтандартнойДатыНачала', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('StandardPeriodVariant', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВариантСтандартногоПериода', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('InternetMailMessageParseStatus', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('СтатусРазбораИнтернетПочтовогоСообщения', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ChartAnimation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('АнимацияДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartBubbleSizing', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВлияниеРазмераНаПузырекДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('FormItemOrientation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОриентацияЭлементаФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartScaleLabelLocation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеПодписейШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ConfigurationExtensionsSource', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ИсточникРасширенийКонфигурации', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('BubbleChartNegativeValuesShowMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеОтрицательныхЗначенийПузырьковойДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartTitleAreaPlacement', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('РасположениеОбластиЗаголовкаДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('SectionsPanelRepresentation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеПанелиРазделов', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('UserNotificationStatus', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('СтатусОповещенияПользователя', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('PrintDialogUseMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимИспользованияДиалогаПечати', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('PositionInStream', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПозицияВПотоке', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('HTMLDocumentFieldMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимПоляHTMLДокумента', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('PictureFormat', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ФорматКартинки', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('BusinessProcessRoutePointType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидТочкиМаршрутаБизнесПроцесса', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('GraphicalSchemaGridDrawMode', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('РежимОтрисовкиСеткиГрафическойСхемы', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('ConnectorLineType', Env(True, False, False, False, True, True, True, False, True, False)),
-    GlobalObject('ТипСоединительнойЛинии', Env(True, False, False, False, True, True, True, False, True, False)),
-    GlobalObject('ConnectorTextLocation', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('ПоложениеТекстаСоединительнойЛинии', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('FitPageMode', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('РежимРазмещенияНаСтранице', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('GraphicalSchemaItemPictureLocation', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('ПоложениеКартинкиЭлементаГрафическойСхемы', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('ContactDataRelationshipType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипОтношенийДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ConfigurationExtensionApplicationIssueSeverity', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ВажностьПроблемыПримененияРасширенияКонфигурации', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FormItemTitleLocation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеЗаголовкаЭлементаФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('SelectionShowMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимОтображенияВыделения', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ItemHorizontalLocation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ГоризонтальноеПоложениеЭлемента', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ColumnsGroup', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ГруппировкаКолонок', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('UsualGroupRepresentation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеОбычнойГруппы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ButtonRepresentation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеКнопки', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('FormButtonType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидКнопкиФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('FormFieldType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидПоляФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('FormGroupType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидГруппыФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('TableRepresentation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеТаблицы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('TableRowInputMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимВводаСтрокТаблицы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('TableSelectionMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимВыделенияТаблицы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('TableRowSelectionMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимВыделенияСтрокиТаблицы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('FoldersAndItems', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ГруппыИЭлементы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartTrendlineFactor', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ФакторЛинииТрендаДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('RequiredDataRelevance', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТребуемаяАктуальностьДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ByteOrderMarkUsage', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ИспользованиеByteOrderMark', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('CollaborationSystemStandardCommand', Env(True, True, True, False, False, False, True, True, True, False)),
-    GlobalObject('СтандартнаяКомандаСистемыВзаимодействия', Env(True, True, True, False, False, False, True, True, True, False)),
-    GlobalObject('StockChartUsedPointValue', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ИспользуемоеЗначениеТочкиБиржевойДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('SizeChangeMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимИзмененияРазмера', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('WarningOnEditRepresentation', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеПредупрежденияПриРедактировании', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('FormDecorationType', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидДекорацииФормы', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('AccumulationRegisterAggregatePeriodicity', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ПериодичностьАгрегатаРегистраНакопления', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionSettingsRefreshMethod', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('СпособВосстановленияНастроекКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('AccumulationRegisterAggregateUse', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ИспользованиеАгрегатаРегистраНакопления', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ItemVerticalAlign', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВертикальноеПоложениеЭлемента', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('UpdateOnDataChange', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОбновлениеПриИзмененииДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('LinkedValueChangeMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимИзмененияСвязанногоЗначения', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartPointsConnectionType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипСоединенияТочекДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('FormItemAdditionType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидДополненияЭлементаФормы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('MainClientApplicationWindowMode', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('РежимОсновногоОкнаКлиентскогоПриложения', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('ContactDataAddressType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипАдресаДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ChartBubbleSizeValueSource', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ИсточникЗначенияРазмераПузырькаДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('WindowsCertificateSelectMode', Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalObject('СпособВыбораСертификатаWindows', Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalObject('AdministrationAssignmentRuleType', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('АдминистрированиеТипТребованияНазначения', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('EventLogEntryTransactionMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимТранзакцииЗаписиЖурналаРегистрации', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('SynchronousExtensionAndAddInCallUseMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимИспользованияСинхронныхВызововРасширенийИВнешнихКомпонент', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('UsualGroupControlRepresentation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеУправленияОбычнойГруппы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('QuerySchemaPeriodAdditionType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипДополненияПериодамиСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FileDragMode', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('СпособПеретаскиванияФайлов', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('TimeScaleUnitType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипЕдиницыШкалыВремени', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('TimeScalePosition', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеШкалыВремени', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('GanttChartScaleKeeping', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоддержкаМасштабаДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('TimeScaleDayFormat', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ФорматДняШкалыВремени', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('GanttChartIntervalRepresentation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеИнтервалаДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('GanttChartVerticalStretch', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РастягиваниеПоВертикалиДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('GanttChartValueTextRepresentation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеТекстаЗначенияДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('XBaseEncoding', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('КодировкаXBase', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('PivotChartValuesShowMode', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('ОтображениеЗначенийСводнойДиаграммы', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('PivotChartScaleKeeping', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('ПоддержкаМасштабаСводнойДиаграммы', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('PivotChartType', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('ТипСводнойДиаграммы', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('PivotChartLabelsOrientation', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('ОриентацияМетокСводнойДиаграммы', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('DendrogramOrientation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОриентацияДендрограммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DendrogramScaleKeeping', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоддержкаМасштабаДендрограммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('WebColors', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('WebЦвета', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('WindowsColors', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('WindowsЦвета', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('WindowsFonts', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('WindowsШрифты', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('AutoTimeMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимАвтоВремя', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('AutoSeriesSeparation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('АвтоРаздвижениеСерий', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('PictureLib', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('БиблиотекаКартинок', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('IntervalBoundVariant', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВариантГраницыИнтервала', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('PeriodSettingsVariant', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВариантНастройкиПериода', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('PeriodVariant', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВариантПериода', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('WindowLocationVariant', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВариантПоложенияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('WindowDockVariant', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВариантПрикрепленияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('WindowStateVariant', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВариантСостоянияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('VerticalAlign', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВертикальноеПоложение', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('BoundaryType', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ВидГраницы', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('AccumulationRecordType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидДвиженияНакопления', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('PictureType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидКартинки', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartLabelType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидПодписейКДиаграмме', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('BorderType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидРамки', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ComparisonType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидСравнения', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('AccountType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидСчета', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ColorType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидЦвета', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('FontType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидШрифта', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('HorizontalAlign', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ГоризонтальноеПоложение', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ControlEdge', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ГраницаЭлементаУправления', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('AllowedLength', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ДопустимаяДлина', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('AllowedSign', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ДопустимыйЗнак', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ColumnSizeChange', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ИзменениеРазмераКолонки', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('WindowSizeChange', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ИзменениеРазмераОкна', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('FoldersAndItemsUse', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ИспользованиеГруппИЭлементов', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('UseMenuMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ИспользованиеРежимаМеню', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ScrollBarUse', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ИспользованиеПолосыПрокрутки', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentDetailUse', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('ИспользованиеРасшифровкиТабличногоДокумента', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('PostingModeUse', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ИспользованиеРежимаПроведения', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('SliceUse', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ИспользованиеСреза', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('Key', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('Клавиша', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DialogReturnCode', Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalObject('КодВозвратаДиалога', Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalObject('TextEncoding', Env(True, True, False, False, True, True, True, True, False, False)),
-    GlobalObject('КодировкаТекста', Env(True, True, False, False, True, True, True, True, False, False)),
-    GlobalObject('MaxSeries', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('МаксимумСерий', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('SortDirection', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('НаправлениеСортировки', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('InitialTreeView', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('НачальноеОтображениеДерева', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('InitialListView', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('НачальноеОтображениеСписка', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('QueryResultIteration', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ОбходРезультатаЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('Orientation', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('Ориентация', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ChartOrientation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОриентацияДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('PageOrientation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОриентацияСтраницы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ShowTabs', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ОтображениеЗакладок', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('CommandBarButtonRepresentation', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ОтображениеКнопкиКоманднойПанели', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('TrackBarMarkingAppearance', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеРазметкиПолосыРегулирования', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('TitleLocation', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ПоложениеЗаголовка', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ButtonPictureLocation', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ПоложениеКартинкиКнопки', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('LabelPictureLocation', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ПоложениеКартинкиНадписи', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ColumnLocation', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ПоложениеКолонки', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('PictureSize', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РазмерКартинки', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('StyleBorders', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РамкиСтиля', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ScrollingTextMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимБегущейСтроки', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('TableBoxRowInputMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимВводаСтрокТабличногоПоля', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('TableBoxRowSelectionMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимВыделенияСтрокиТабличногоПоля', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('TableBoxSelectionMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимВыделенияТабличногоПоля', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('QuestionDialogMode', Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalObject('РежимДиалогаВопрос', Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalObject('FileDialogMode', Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalObject('РежимДиалогаВыбораФайла', Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalObject('DocumentWriteMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимЗаписиДокумента', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('RoundMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимОкругления', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartSpaceMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимПробеловДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DocumentPostingMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимПроведенияДокумента', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('WorkingDateMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимРабочейДаты', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ListEditMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('СпособРедактированияСписка', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ProgressBarSmoothingMode', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимСглаживанияИндикатора', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('Chars', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('Символы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('MessageStatus', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('СтатусСообщения', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('QueryRecordType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипЗаписиЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('CommandBarButtonType', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ТипКнопкиКоманднойПанели', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ChartLineType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипЛинииДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentDrawingLineType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипЛинииРисункаТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentCellLineType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипЛинииЯчейкиТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartMarkerType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипМаркераДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentStepDirectionType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипНаправленияПереходаТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentCellAreaType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипОбластиЯчеекТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('EnterKeyBehaviorType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипПоведенияКлавишиEnter', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentTextPlacementType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипРазмещенияТекстаТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ControlBorderType', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипРамкиЭлементаУправления', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentDrawingType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипРисункаТабличногоДокумента', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentShiftType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипСмещенияТабличногоДокумента', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('SpreadsheetDocumentPatternType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипУзораТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('SpreadsheetDocumentFileType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипФайлаТабличногоДокумента', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('StyleColors', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ЦветаСтиля', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DateFractions', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ЧастиДаты', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('StyleFonts', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ШрифтыСтиля', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('EventLogLevel', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('УровеньЖурналаРегистрации', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('RowGotoDirection', Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalObject('НаправлениеПереходаКСтроке', Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalObject('DynamicListKeyType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ВидКлючаДинамическогоСписка', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ClientApplicationBaseFontVariant', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВариантОсновногоШрифтаКлиентскогоПриложения', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ShowChartScaleTitle', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеЗаголовкаШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartLabelLocation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеПодписейКДиаграмме', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('RadarChartScaleType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипШкалыРадарнойДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('GaugeChartValueRepresentation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеЗначенияИзмерительнойДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('GaugeChartValuesScaleLabelsLocation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеПодписейШкалыЗначенийИзмерительнойДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('GanttChartLinkType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипСвязиДиаграммыГанта', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('QuerySchemaAvailableTableParameterType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипПараметраДоступнойТаблицыСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('AnalysisDataType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидДанныхАнализа', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('PredictionModelColumnType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипКолонкиМоделиПрогноза', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisStandardizationType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипСтандартизацииАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisTimeIntervalUnitType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипЕдиницыИнтервалаВремениАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisResultTableFillType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипЗаполненияТаблицыРезультатаАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisNumericValueUseType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипИспользованияЧисловыхЗначенийАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisFieldType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипПоляАнализаДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataAnalysisColumnTypeClusterization', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипКолонкиАнализаДанныхКластеризация', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisDistanceMetricType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипМерыРасстоянияАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ClusterizationMethod', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('МетодКластеризации', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisColumnTypeAssociationRules', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипКолонкиАнализаДанныхПоискАссоциаций', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('AssociationRulesDataSourceType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипИсточникаДанныхПоискаАссоциаций', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('AssociationRulesPruneType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипОтсеченияПравилАссоциации', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisColumnTypeSequentialPatterns', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипКолонкиАнализаДанныхПоискПоследовательностей', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisColumnTypeDecisionTree', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипКолонкиАнализаДанныхДеревоРешений', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DecisionTreeSimplificationType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипУпрощенияДереваРешений', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisColumnTypeSummaryStatistics', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипКолонкиАнализаДанныхОбщаяСтатистика', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('QueryBuilderDimensionType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипИзмеренияПостроителяЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataAnalysisAssociationRulesOrderType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипУпорядочиванияПравилАссоциацииАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataAnalysisSequentialPatternsOrderType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипУпорядочиванияШаблоновПоследовательностейАнализаДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ConfigurationExtensionScope', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ОбластьДействияРасширенияКонфигурации', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('UsualGroupBehavior', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоведениеОбычнойГруппы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartValuesToolTipFillType', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ЗаполнениеПодсказкиЗначенийДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('SearchInTableOnInput', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоискВТаблицеПриВводе', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartColorPalette', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПалитраЦветовДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartLabelsOrientation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОриентацияПодписейДиаграммы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ExternalDataSourceState', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СостояниеВнешнегоИсточникаДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FullTextSearchMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимПолнотекстовогоПоиска', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('EditTextUpdate', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОбновлениеТекстаРедактирования', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('RadioButtonType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидПереключателя', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionPictureOutputType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипВыводаКартинкиКомпоновкиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('StandardCommandsGroup', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СтандартнаяГруппаКоманд', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ChartValuesBySeriesConnectionType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипСоединенияЗначенийПоСериямДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ApplicationFormsOpenningMode', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимОткрытияФормПриложения', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('StringEncodingMethod', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СпособКодированияСтроки', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('PivotTableRowTotalPosition', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ПоложениеИтоговСтрокСводнойТаблицы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('PivotTableColumnTotalPosition', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ПоложениеИтоговКолонокСводнойТаблицы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ReportBuilderDimensionType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипИзмеренияПостроителяОтчета', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ReportBuilderDetailFillType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ВидЗаполненияРасшифровкиПостроителяОтчета', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('SpreadsheetDocumentAreaFillType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипЗаполненияОбластиТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionFixation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ФиксацияКомпоновкиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionConditionalAppearanceUse', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ИспользованиеУсловногоОформленияКомпоновкиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartScaleTitleTextSource', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('СпособЗаполненияТекстаЗаголовкаШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionDataRelevanceOutputType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипВыводаАктуальностиДанныхКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ColumnEditMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимРедактированияКолонки', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartTrendLineApproximationType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипАппроксимацииЛинииТрендаДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DragAllowedActions', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('ДопустимыеДействияПеретаскивания', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('DragAction', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('ДействиеПеретаскивания', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('ChartLegendPlacement', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('РасположениеЛегендыДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ContactDataURLType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипВебАдресаДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('AdministrationResourceConsumptionCounterFilterType', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('АдминистрированиеТипОтбораСчетчикаПотребленияРесурсов', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('AdministrationActionOnResourceConsumptionLimitExcess', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('АдминистрированиеДействиеПриПревышенииОграниченияПотребленияРесурсов', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('DeviceCameraType', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('ТипКамерыУстройства', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('ChartSelectionMode', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимВыделенияДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ButtonShapeRepresentation', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеФигурыКнопки', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('UseInternetMailTokenAuthentication', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ИспользованиеАутентификацииИнтернетПочтыПоТокену', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ChartReferenceLinePosition', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеИнформационнойЛинииДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('VideoQuality', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('КачествоВидеозаписи', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('ReportResultViewMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимОтображенияРезультатаОтчета', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('AdministrationConnectionSecurityLevel', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('АдминистрированиеУровеньБезопасностиСоединений', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ContactDataInstantMessagingAddressType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипАдресаМгновенныхСообщенийДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('TransactionsIsolationLevel', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('УровеньИзоляцииТранзакций', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('CalendarEventRecurrence', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ПовторениеСобытияКалендаря', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('CallLogCallType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипЗвонкаЖурналаЗвонков', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('InternetMailTextType', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ТипТекстаПочтовогоСообщения', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('InternetMailTextProcessing', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ОбработкаТекстаИнтернетПочтовогоСообщения', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('NumericValueType', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидЧисловогоЗначения', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ClientApplicationInterfaceVariant', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВариантИнтерфейсаКлиентскогоПриложения', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('XMLCanonicalizationType', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ТипКаноническогоXML', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('DOMNodeType', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ТипУзлаDOM', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('DOMDocumentPosition', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ПозицияВДокументеDOM', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('DataCompositionBalanceType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипОстаткаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionAccountingBalanceType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипБухгалтерскогоОстаткаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionSortDirection', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('НаправлениеСортировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionAreaTemplateType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипМакетаОбластиКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionDataSetsLinkType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипСвязиНаборовДанныхКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionGroupType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипГруппировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionPeriodAdditionType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипДополненияПериодаКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionResultItemType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипЭлементаРезультатаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionResultNestedItemsLayout', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РасположениеВложенныхЭлементовРезультатаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionFieldPlacement', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеПоляКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionFilterItemsGroupType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипГруппыЭлементовОтбораКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionComparisonType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВидСравненияКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionGroupFieldsPlacement', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеПолейГруппировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionGroupPlacement', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеГруппировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionAttributesPlacement', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеРеквизитовКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionResourcesPlacement', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеРесурсовКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionTotalPlacement', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеИтоговКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('OnUnavailabilityDataCompositionSettingsAction', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ДействиеПриНедоступностиНастроекКомпоновкиДанных', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('EventLogEntryTransactionStatus', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СтатусТранзакцииЗаписиЖурналаРегистрации', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DOMNodeFilterParameters', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ПараметрыОтбораУзловDOM', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('DOMXPathResultType', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ТипРезультатаDOMXPath', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('DOMBuilderAction', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ДействиеПостроителяDOM', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('XMLSpace', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ПробельныеСимволыXML', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XMLValidationType', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ТипПроверкиXML', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XMLAttributeType', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ТипАтрибутаXML', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSComponentType', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ТипКомпонентыXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSAttributeUseCategory', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('КатегорияИспользованияАтрибутаXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSXPathVariety', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ВариантXPathXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSWhitespaceHandling', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ОбработкаПробельныхСимволовXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSForm', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ФормаПредставленияXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSConstraint', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ОграничениеЗначенияXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSDisallowedSubstitutions', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('НедопустимыеПодстановкиXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSContentModel', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('МодельСодержимогоXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSSubstitutionGroupExclusions', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ИсключенияГруппПодстановкиXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSIdentityConstraintCategory', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('КатегорияОграниченияИдентичностиXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSSimpleFinal', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ЗавершенностьПростогоТипаXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSSimpleTypeVariety', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ВариантПростогоТипаXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSComplexFinal', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ЗавершенностьСоставногоТипаXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSSchemaFinal', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ЗавершенностьСхемыXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSProcessContents', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ОбработкаСодержимогоXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSNamespaceConstraintCategory', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('КатегорияОграниченияПространствИменXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSCompositor', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ВидГруппыМоделиXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSDerivationMethod', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('МетодНаследованияXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('XSProhibitedSubstitutions', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ЗапрещенныеПодстановкиXS', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionGroupTemplateType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипМакетаГруппировкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionTextPlacementType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипРазмещенияТекстаКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionFieldsTitleType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипЗаголовкаПолейКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('SMTPAuthenticationMode', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('СпособSMTPАутентификации', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('POP3AuthenticationMode', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('СпособPOP3Аутентификации', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('InternetMailMessageImportance', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ВажностьИнтернетПочтовогоСообщения', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('InternetMailAttachmentEncodingMode', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('СпособКодированияИнтернетПочтовогоВложения', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('InternetMailMessageNonASCIISymbolsEncodingMode', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('СпособКодированияНеASCIIСимволовИнтернетПочтовогоСообщения', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('DataLockMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимБлокировкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataLockControlMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимУправленияБлокировкойДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionTextOutputType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипВыводаТекстаКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('FullTextMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимПолнотекстовогоПоиска', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataCompositionDetailsProcessingAction', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ДействиеОбработкиРасшифровкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionPeriodType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипПериодаКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ClientApplicationFormScaleVariant', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВариантМасштабаФормКлиентскогоПриложения', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartScaleTitlePlacement', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РасположениеЗаголовкаШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('TelephonyToolsSMSType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипSMSСредствТелефонии', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ChartPlotAreaPlacement', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('РасположениеОбластиПостроенияДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartScaleLocation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('AdministrationInfoBaseDeletionMode', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('АдминистрированиеРежимУдаленияИнформационнойБазы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('NewRowShowCheckVariant', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВариантПроверкиОтображенияНовойСтроки', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('WindowAppearanceModeVariant', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВариантСпособаОтображенияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('WindowAppearanceModeChange', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ИзменениеСпособаОтображенияОкна', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('UseOutput', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('ИспользованиеВывода', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('SearchDirection', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('НаправлениеПоиска', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ContactDataEmailAddressType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипАдресаЭлектроннойПочтыДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('CommandBarButtonAlignment', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ВыравниваниеКнопокКоманднойПанели', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ChartGridLinesShowMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеЛинийСеткиДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('FormPagesRepresentation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеСтраницФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('GraphicalSchemeElementSideType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипСтороныЭлементаГрафическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FormWindowOpeningMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимОткрытияОкнаФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('SaveFormDataInSettings', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('СохранениеДанныхФормыВНастройках', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('AutoSaveFormDataInSettings', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('АвтоматическоеСохранениеДанныхФормыВНастройках', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionSettingsItemState', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('СостояниеЭлементаНастройкиКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChildFormItemsGroup', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ГруппировкаПодчиненныхЭлементовФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChildFormItemsWidth', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('ШиринаПодчиненныхЭлементовФормы', Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalObject('CommandParameterUseMode', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('РежимИспользованияПараметраКоманды', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('FormItemCommandBarLabelLocation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеКоманднойПанелиЭлементаФормы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataChangeType', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидИзмененияДанных', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('FormCommandBarLabelLocation', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеКоманднойПанелиФормы', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('PlatformType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипПлатформы', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('AddInType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипВнешнейКомпоненты', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('CommandGroupCategory', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('КатегорияГруппыКоманд', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ClientConnectionSpeed', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('СкоростьКлиентскогоСоединения', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('XMLTypeAssignment', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('НазначениеТипаXML', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('DateSelectionMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимВыделенияДаты', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('AutoChangeRecord', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('АвтоРегистрацияИзменений', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FileAccess', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ДоступКФайлу', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('LocationRelativeToGeofence', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ПоложениеОтносительноГеозоны', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('JSONCharactersEscapeMode', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ЭкранированиеСимволовJSON', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('XMLNodeType', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ТипУзлаXML', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('JSONDateWritingVariant', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ВариантЗаписиДатыJSON', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('AllowedMessageNo', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ДопустимыйНомерСообщения', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataItemSend', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ОтправкаЭлементаДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataItemReceive', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ПолучениеЭлементаДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('WSParameterDirection', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('WSНаправлениеПараметра', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FTPSecureConnectionUsageLevel', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('УровеньИспользованияЗащищенногоСоединенияFTP', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('PointsConnectionAcrossSkippedChartValuesType', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипСоединенияТочекПриПропущенныхЗначенияхДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ByteOrder', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПорядокБайтов', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ControlCollapseMode', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('РежимСверткиЭлементаУправления', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('SoundAlert', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ЗвуковоеОповещение', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('GraphicalSchemaShapes', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ФигурыГрафическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('PredefinedDataUpdate', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОбновлениеПредопределенныхДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('PivotTableLinesShowType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипОтображенияЛинийСводнойТаблицы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('SpreadsheetDocumentSelectionShowModeType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипОтображенияВыделенияТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('PresentationAdditionType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипДобавленияПредставлений', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('AppearanceAreaType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипОбластиОформления', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('AdStatus', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('СтатусРекламы', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('VerticalFormScroll', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВертикальнаяПрокруткаФормы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('FillChecking', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПроверкаЗаполнения', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ReportFormType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипФормыОтчета', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ClientRunMode', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('РежимЗапускаКлиентскогоПриложения', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('JSONDateFormat', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ФорматДатыJSON', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('InternetConnectionType', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('ТипИнтернетСоединения', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('SearchControlLocation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеУправленияПоиском', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('CheckBoxType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидФлажка', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartReferenceBandBorderPosition', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеГраницыИнформационногоИнтервалаДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('UseSpreadsheetDocumentWidthReduction', Env(True, False, False, False, True, True, True, False, False, False)),
-    GlobalObject('ИспользованиеШириныСжатияТабличногоДокумента', Env(True, False, False, False, True, True, True, False, False, False)),
-    GlobalObject('IncompleteChoiceMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимВыбораНезаполненного', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChartScaleMarkLocation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеОтметокШкалыДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ToolTipRepresentation', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеПодсказки', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('FullTextSearchMetadataUse', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ИспользованиеМетаданныхПолнотекстовогоПоиска', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('HashFunction', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ХешФункция', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ChartSeriesOrderInLegend', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПорядокСерийВЛегендеДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('HTMLContentCategory', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('КатегорияСодержимогоHTML', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('DisplayImportance', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('ВажностьПриОтображении', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('CurrentRowUse', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('ИспользованиеТекущейСтроки', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('TableBehaviorOnHorizontalCompression', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('ПоведениеТаблицыПриСжатииПоГоризонтали', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('CollapseFormItemsByImportance', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('СворачиваниеЭлементовФормыПоВажности', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('TableCurrentRowUse', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('ИспользованиеТекущейСтрокиТаблицы', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('DatabaseCopyDBMSType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипСУБДКопииБазыДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('TelephonyToolsCallType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипЗвонкаСредствТелефонии', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('CameraLightingType', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('ТипПодсветкиКамеры', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('MacOSCertificateSelectMode', Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalObject('СпособВыбораСертификатаMacOS', Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalObject('CryptoInteractiveModeUse', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ИспользованиеИнтерактивногоРежимаКриптографии', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ViewScalingMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимМасштабированияПросмотра', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ItemsAndTitlesAlignVariant', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВариантВыравниванияЭлементовИЗаголовков', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ClientApplicationAgentState', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('СостояниеАгентаКлиентскогоПриложения', Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalObject('AdBannerRepresentation', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('ОтображениеРекламногоБаннера', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('MobileDeviceLibraryDirType', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('ТипКаталогаБиблиотекиМобильногоУстройства', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('AutoCapitalizationOnTextInput', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('АвтоИзменениеРегистраПриВводеТекста', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('AutoCorrectionOnTextInput', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('АвтоИсправлениеПриВводеТекста', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('TelephonyToolsCallEventVariant', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ВариантСобытияЗвонкаСредствТелефонии', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ItemHeightControlVariant', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('ВариантУправленияВысотойЭлемента', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('TableHeightControlVariant', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ВариантУправленияВысотойТаблицы', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('SpecialTextInputMode', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('СпециальныйРежимВводаТекста', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('FormPagesState', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('СостояниеСтраницФормы', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('AutoShowOpenButtonMode', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('РежимАвтоОтображенияКнопкиОткрытия', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('AutoShowClearButtonMode', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('РежимАвтоОтображенияКнопкиОчистки', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('SpellCheckingOnTextInput', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('ПроверкаПравописанияПриВводеТекста', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('OnScreenKeyboardReturnKeyText', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТекстКнопкиВводаЭкраннойКлавиатуры', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('FormButtonPictureLocation', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеКартинкиКнопкиФормы', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('DuplexPrintingType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипДвустороннейПечати', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('PagePlacementAlternation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ЧередованиеРасположенияСтраниц', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ParagraphType', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('ТипПараграфа', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('PrintAccuracy', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТочностьПечати', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataBaseConfigurationUpdateState', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СостояниеОбновленияКонфигурацииБазыДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DataBaseConfigurationUpdateExecutionInformationItemType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипЭлементаИнформацииОВыполненииОбновленияКонфигурацииБазыДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ChartValuesToolTipShowMode', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеПодсказкиЗначенийДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('DatabaseCopyReplicationType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипРепликацииКопииБазыДанных', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FileNamesEncodingInZipFile', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('КодировкаИменФайловВZipФайле', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ButtonShape', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ФигураКнопки', Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalObject('ContactDataPhoneNumberType', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('ТипНомераТелефонаДанныхКонтакта', Env(False, True, True, True, True, True, False, False, False, False)),
-    GlobalObject('RefreshRequestMethod', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('СпособЗапросаОбновления', Env(False, False, True, True, True, True, False, False, False, False)),
-    GlobalObject('FileOpenMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимОткрытияФайла', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('FormItemSpacing', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ИнтервалМеждуЭлементамиФормы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartSplineMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимСглаживанияДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DimensionPlacementType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипРазмещенияИзмерений', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('DimensionAttributePlacementType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипРазмещенияРеквизитовИзмерений', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('TotalPlacementType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипРазмещенияИтогов', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('StandardAppearance', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СтандартноеОформление', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ThroughAlign', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('СквозноеВыравнивание', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ChartBoundaryDetectionMethod', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('СпособОпределенияОграничивающегоЗначенияДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ShowInChartLegend', Env(True, True, True, True, True, True, True, False, True, False)),
-    GlobalObject('ОтображениеВЛегендеДиаграммы', Env(True, True, True, True, True, True, True, False, True, False)),
-    GlobalObject('RoamingUsage', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('ИспользованиеРоуминга', Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalObject('AdministrationProcessChoicePriority', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('АдминистрированиеПриоритетВыбораПроцесса', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionChartLegendPlacement', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеЛегендыДиаграммыКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('BackgroundJobState', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СостояниеФоновогоЗадания', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FullTextSearchRepresentationType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ВидОтображенияПолнотекстовогоПоиска', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FormConversationsRepresentation', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеОбсужденийФормы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('SearchStringLocation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеСтрокиПоиска', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('InAppPurchaseService', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('СервисВстроенныхПокупок', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ChartSemitransparencyMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимПолупрозрачностиДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DeliverableNotificationSubscriberType', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ТипПодписчикаДоставляемыхУведомлений', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('CommandBarButtonOrder', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ПорядокКнопокКоманднойПанели', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('QuerySchemaJoinType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипСоединенияСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('XDTOFacetType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ВидФасетаXDTO', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('XMLForm', Env(True, True, False, False, True, True, True, True, False, False)),
-    GlobalObject('ФормаXML', Env(True, True, False, False, True, True, True, True, False, False)),
-    GlobalObject('AccountingRecordType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидДвиженияБухгалтерии', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('FileCompareMethod', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('СпособСравненияФайлов', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('RepresentableDocumentBatchFileType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипФайлаПакетаОтображаемыхДокументов', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ViewStatusLocation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПоложениеСостоянияПросмотра', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ShowChartPopupReferenceLine', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображатьВсплывающуюИнформационнуюЛиниюДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('TaskListMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимСпискаЗадач', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ChoiceHistoryOnInput', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ИсторияВыбораПриВводе', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ChoiceButtonRepresentation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеКнопкиВыбора', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataLineChangeType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидИзмененияСтрокиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('GeographicalSchemaLineType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипЛинииГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaPointObjectDrawingType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипОтображенияТочечногоОбъектаГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaLayerSeriesShowMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипОтображенияСерииСлояГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaDataSourceOrganizationType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипОрганизацииИсточникаДанныхГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('PaintingReferencePointPosition', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ПоложениеОпорнойТочкиОтрисовки', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaMarkerType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипМаркераГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaShowMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимОтображенияГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaLayerSeriesImportModeType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипИмпортаСерийСлояГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaObjectFindType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипПоискаОбъектовГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaLegendItemShowScaleType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипОтображенияШкалыЭлементаЛегендыГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ZIPCompressionMethod', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('МетодСжатияZIP', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ZIPCompressionLevel', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('УровеньСжатияZIP', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ZIPEncryptionMethod', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('МетодШифрованияZIP', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ZIPStorePathMode', Env(True, True, False, True, True, True, True, True, False, False)),
-    GlobalObject('РежимСохраненияПутейZIP', Env(True, True, False, True, True, True, True, True, False, False)),
-    GlobalObject('ZIPSubDirProcessingMode', Env(True, True, False, True, True, True, True, True, False, False)),
-    GlobalObject('РежимОбработкиПодкаталоговZIP', Env(True, True, False, True, True, True, True, True, False, False)),
-    GlobalObject('ZIPRestoreFilePathsMode', Env(True, True, False, False, True, True, True, True, False, False)),
-    GlobalObject('РежимВосстановленияПутейФайловZIP', Env(True, True, False, False, True, True, True, True, False, False)),
-    GlobalObject('SeriesValuesDrawingMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимОтображенияЗначенийСерии', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('GeographicalSchemaProjection', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипПроекцииГеографическойСхемы', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('InterfaceCompatibilityMode', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('РежимСовместимостиИнтерфейса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ButtonGroupRepresentation', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеГруппыКнопок', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('BarcodeType', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('ТипШтрихКода', Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalObject('AdministrationWorkProcessStatus', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('АдминистрированиеСостояниеРабочегоПроцесса', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ShowInChart', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеВДиаграмме', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('QuerySchemaUnionType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипОбъединенияСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ChartPointsAxisValuesSource', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ИсточникЗначенийОсиТочекДиаграммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('QuerySchemaOrderDirection', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('НаправлениеПорядкаСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('CollaborationSystemCommandSource', Env(True, True, True, False, False, False, True, True, True, False)),
-    GlobalObject('ИсточникКомандСистемыВзаимодействия', Env(True, True, True, False, False, False, True, True, True, False)),
-    GlobalObject('AdministrationResourceConsumptionCounterGroupType', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('АдминистрированиеТипГруппировкиСчетчикаПотребленияРесурсов', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('AutonumerationInForm', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('АвтонумерацияВФорме', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('QuerySchemaTotalCalculationFieldType', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ТипКонтрольнойТочкиСхемыЗапроса', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('FixingInTable', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ФиксацияВТаблице', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ResultCompositionMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимКомпоновкиРезультата', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('AdditionalShowMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ДополнительныйРежимОтображения', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('AutoShowStateMode', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('РежимАвтоОтображенияСостояния', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('CryptoCertificateIncludeMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимВключенияСертификатовКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('CryptoCertificateCheckMode', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РежимПроверкиСертификатаКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('CryptoCertificateStoreType', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ТипХранилищаСертификатовКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('FormattedDocumentFileType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипФайлаФорматированногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('FormattedDocumentItemType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипЭлементаФорматированногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('CryptoCertificateStorePlacement', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеХранилищаСертификатовКриптографии', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionParameterUse', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('ИспользованиеПараметраКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionResourcesAutoPosition', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('АвтоПозицияРесурсовКомпоновкиДанных', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('DataCompositionGroupUseVariant', Env(True, True, False, False, True, True, True, False, True, False)),
-    GlobalObject('ВариантИспользованияГруппировкиКомпоновкиДанных', Env(True, True, False, False, True, True, True, False, True, False)),
-    GlobalObject('InternetMailProtocol', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ПротоколИнтернетПочты', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('DataCompositionResourcesPlacementInChart', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('РасположениеРесурсовВДиаграммеКомпоновкиДанных', Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalObject('PlannerItemsTimeRepresentation', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ОтображениеВремениЭлементовПланировщика', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('CalculationRegisterPeriodType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ВидПериодаРегистраРасчета', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('NonnumericChartValueUse', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ИспользованиеНечисловыхЗначенийДиаграммы', Env(True, False, True, False, True, True, True, True, True, False)),
-    GlobalObject('ArrowStyle', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('СтильСтрелки', Env(True, False, True, False, True, True, True, True, False, False)),
-    GlobalObject('PanelPictureLocation', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('ПоложениеКартинкиПанели', Env(True, False, False, False, False, False, True, False, False, False)),
-    GlobalObject('DeliverableNotificationSendErrorType', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ТипОшибкиОтправкиДоставляемогоУведомления', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('SpreadsheetDocumentPointerType', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ТипКурсоровТабличногоДокумента', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('BarChartPointsOrder', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('ПорядокОтображенияТочекГоризонтальнойГистограммы', Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalObject('JSONValueType', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('ТипЗначенияJSON', Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalObject('SearchStringModeOnInputByString', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('СпособПоискаСтрокиПриВводеПоСтроке', Env(True, True, False, False, True, True, True, False, False, False)),
-    GlobalObject('ColorDepth', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ГлубинаЦвета', Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalObject('ChoiceDataGetModeOnInputByString', Env(True, True, False, False, True, True, True, True, True, False)),
-    GlobalObject('РежимПолученияДанныхВыбораПриВводеПоСтроке', Env(True, True, False, False, True, True, True, True, True, False)),
-]
+# Записи снимка:
+# объект - ((имена), маска окружений)
+# метод  - ((имена), возвращает значение, ((имя параметра, обязательный), ...), маска окружений)
+# Первое имя - каноническое (английское), им называются Item и объявление.
+Record = Tuple[Any, ...]
+Index = Dict[str, int]
 
-methods = [
-    GlobalMethod('Find', True, [P('Line', True), P('SearchSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Найти', True, [P('Line', True), P('SearchSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Min', True, [P('Value1ValueN', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Мин', True, [P('Value1ValueN', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Max', True, [P('Value1ValueN', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Макс', True, [P('Value1ValueN', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ErrorDescription', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ОписаниеОшибки', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('FillPropertyValues', False, [P('Receiver', True), P('Source', True), P('ListOfProperties', False), P('ExcludeProperties', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ЗаполнитьЗначенияСвойств', False, [P('Receiver', True), P('Source', True), P('ListOfProperties', False), P('ExcludeProperties', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ValueIsFilled', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ЗначениеЗаполнено', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetURL', True, [P('Object', True), P('AttributeName', False), P('Index', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьНавигационнуюСсылку', True, [P('Object', True), P('AttributeName', False), P('Index', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetAvailableLocaleCodes', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьДопустимыеКодыЛокализации', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ToUniversalTime', True, [P('LocalTime', True), P('TimeZone', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('УниверсальноеВремя', True, [P('LocalTime', True), P('TimeZone', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('TimeZone', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЧасовойПояс', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('Eval', True, [P('Expression', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Вычислить', True, [P('Expression', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetAppearanceTemplate', True, [P('Appearance', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('ПолучитьМакетОформления', True, [P('Appearance', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('Base64Value', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Base64Значение', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Base64String', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Base64Строка', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('CurrentUniversalDate', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ТекущаяУниверсальнаяДата', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ToLocalTime', True, [P('UniversalTime', True), P('TimeZone', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('МестноеВремя', True, [P('UniversalTime', True), P('TimeZone', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ErrorInfo', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ИнформацияОбОшибке', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ProcessJobs', False, [P('ProcessingTime', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ВыполнитьОбработкуЗаданий', False, [P('ProcessingTime', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('FindWindowByURL', True, [P('NavigationLink', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НайтиОкноПоНавигационнойСсылке', True, [P('NavigationLink', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('GetWindows', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПолучитьОкна', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('GotoURL', False, [P('NavigationLink', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПерейтиПоНавигационнойСсылке', False, [P('NavigationLink', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('GetURLsPresentations', True, [P('ReferencesArrray', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьПредставленияНавигационныхСсылок', True, [P('ReferencesArrray', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ValueToFormData', False, [P('Value', True), P('Object', True)], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗначениеВДанныеФормы', False, [P('Value', True), P('Object', True)], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('FormDataToValue', True, [P('Object', True), P('Type', True)], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ДанныеФормыВЗначение', True, [P('Object', True), P('Type', True)], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetInfoBaseURL', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьНавигационнуюСсылкуИнформационнойБазы', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('LocaleCodePresentation', True, [P('LocalizationCode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПредставлениеКодаЛокализации', True, [P('LocalizationCode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetAvailableTimeZones', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьДопустимыеЧасовыеПояса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('TimeZonePresentation', True, [P('TimeZone', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПредставлениеЧасовогоПояса', True, [P('TimeZone', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('DaylightTimeOffset', True, [P('TimeZone', False), P('UniversalTime', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('СмещениеЛетнегоВремени', True, [P('TimeZone', False), P('UniversalTime', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('StandardTimeOffset', True, [P('TimeZone', False), P('UniversalTime', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('СмещениеСтандартногоВремени', True, [P('TimeZone', False), P('UniversalTime', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetObjectAndFormAttributeConformity', True, [P('Object', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСоответствиеОбъектаИРеквизитаФормы', True, [P('Object', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('Status', False, [P('MessageText', False), P('Progress', False), P('Explanation', False), P('Picture', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('Состояние', False, [P('MessageText', False), P('Progress', False), P('Explanation', False), P('Picture', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('EncodeString', True, [P('String', True), P('StringEncodingMethod', True), P('StringEncoding', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('КодироватьСтроку', True, [P('String', True), P('StringEncodingMethod', True), P('StringEncoding', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('DecodeString', True, [P('String', True), P('StringEncodingMethod', True), P('StringEncoding', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('РаскодироватьСтроку', True, [P('String', True), P('StringEncodingMethod', True), P('StringEncoding', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('CurrentUniversalDateInMilliseconds', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ТекущаяУниверсальнаяДатаВМиллисекундах', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ProceedWithCall', True, [P('Value1ValueN', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('ПродолжитьВызов', True, [P('Value1ValueN', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('CopyFormData', True, [P('Source', True), P('Receiver', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КопироватьДанныеФормы', True, [P('Source', True), P('Receiver', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetHibernateSessionTerminateTime', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьВремяЗавершенияСпящегоСеанса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetCurrentInfoBaseSession', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьТекущийСеансИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('CheckScriptCircularRefs', True, [P('Value', False), P('ValueDescription', False)], Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalMethod('ПроверитьЦиклическиеСсылкиВстроенногоЯзыка', True, [P('Value', False), P('ValueDescription', False)], Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalMethod('GetExternalResourcesMode', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьРежимВнешнихРесурсов', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('SetObjectAndFormAttributeConformity', False, [P('Object', True), P('AttributeName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьСоответствиеОбъектаИРеквизитаФормы', False, [P('Object', True), P('AttributeName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetObjectAndFormConformity', False, [P('Object', True), P('FormIdAndAttributeName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьСоответствиеОбъектаИФормы', False, [P('Object', True), P('FormIdAndAttributeName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetObjectAndFormConformity', True, [P('Object', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСоответствиеОбъектаИФормы', True, [P('Object', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetClientAllFilesMask', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьМаскуВсеФайлыКлиента', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('InputValue', True, [P('Value', True), P('Tooltip', False), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ВвестиЗначение', True, [P('Value', True), P('Tooltip', False), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('InputNumber', True, [P('Number', True), P('Tooltip', False), P('Length', False), P('Precision', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ВвестиЧисло', True, [P('Number', True), P('Tooltip', False), P('Length', False), P('Precision', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('InputString', True, [P('String', True), P('Tooltip', False), P('Length', False), P('Multiline', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ВвестиСтроку', True, [P('String', True), P('Tooltip', False), P('Length', False), P('Multiline', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('InputDate', True, [P('Date', True), P('Tooltip', False), P('DatePart', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ВвестиДату', True, [P('Date', True), P('Tooltip', False), P('DatePart', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginGettingFiles', False, [P('NotifyDescription', True), P('FilesToBeObtained', True), P('FilesLocation', False), P('Interactively', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПолучениеФайлов', False, [P('NotifyDescription', True), P('FilesToBeObtained', True), P('FilesLocation', False), P('Interactively', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ShowInputDate', False, [P('NotifyDescriptionOnCompletion', True), P('Date', False), P('Tooltip', False), P('DatePart', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьВводДаты', False, [P('NotifyDescriptionOnCompletion', True), P('Date', False), P('Tooltip', False), P('DatePart', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ShowInputValue', False, [P('NotifyDescriptionOnCompletion', True), P('Value', True), P('Tooltip', False), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьВводЗначения', False, [P('NotifyDescriptionOnCompletion', True), P('Value', True), P('Tooltip', False), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ShowInputString', True, [P('NotifyDescriptionOnCompletion', True), P('String', False), P('Tooltip', False), P('Length', False), P('Multiline', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьВводСтроки', True, [P('NotifyDescriptionOnCompletion', True), P('String', False), P('Tooltip', False), P('Length', False), P('Multiline', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ShowInputNumber', True, [P('NotifyDescriptionOnCompletion', True), P('Number', True), P('Tooltip', False), P('Length', False), P('Precision', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьВводЧисла', True, [P('NotifyDescriptionOnCompletion', True), P('Number', True), P('Tooltip', False), P('Length', False), P('Precision', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BegOfQuarter', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НачалоКвартала', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('EndOfQuarter', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КонецКвартала', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BegOfYear', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НачалоГода', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('DoQueryBox', True, [P('QueryText', True), P('Buttons', True), P('Timeout', False), P('DefaultButton', False), P('Title', False), P('TimeoutButton', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('Вопрос', True, [P('QueryText', True), P('Buttons', True), P('Timeout', False), P('DefaultButton', False), P('Title', False), P('TimeoutButton', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('DoMessageBox', False, [P('MessageText', True), P('Timeout', False), P('Title', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('Предупреждение', False, [P('MessageText', True), P('Timeout', False), P('Title', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('Message', False, [P('MessageText', True), P('Status', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Сообщить', False, [P('MessageText', True), P('Status', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Beep', False, [], Env(True, False, True, True, False, False, True, True, False, False)),
-    GlobalMethod('Сигнал', False, [], Env(True, False, True, True, False, False, True, True, False, False)),
-    GlobalMethod('OpenValue', False, [P('Value', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ОткрытьЗначение', False, [P('Value', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ClearMessages', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ОчиститьСообщения', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('Notify', False, [P('EventName', False), P('Parameter', False), P('Source', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('Оповестить', False, [P('EventName', False), P('Parameter', False), P('Source', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('OpenHelpContent', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ОткрытьСодержаниеСправки', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('OpenHelpIndex', True, [P('SearchText', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ОткрытьИндексСправки', True, [P('SearchText', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('UserInterruptProcessing', False, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ОбработкаПрерыванияПользователя', False, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('UserName', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('ИмяПользователя', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('OpenHelp', True, [P('Section', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ОткрытьСправку', True, [P('Section', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ShowErrorInfo', False, [P('ErrorInfo', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьИнформациюОбОшибке', False, [P('ErrorInfo', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BriefErrorDescription', True, [P('ErrorInfo', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КраткоеПредставлениеОшибки', True, [P('ErrorInfo', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('DetailErrorDescription', True, [P('ErrorInfo', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПодробноеПредставлениеОшибки', True, [P('ErrorInfo', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetForm', True, [P('FormName', True), P('Parameters', False), P('Owner', False), P('Unique', False), P('Window', False), P('NavigationLink', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПолучитьФорму', True, [P('FormName', True), P('Parameters', False), P('Owner', False), P('Unique', False), P('Window', False), P('NavigationLink', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('CloseHelp', False, [], Env(True, True, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ЗакрытьСправку', False, [], Env(True, True, True, False, False, False, True, True, True, False)),
-    GlobalMethod('UserFullName', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолноеИмяПользователя', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ShowUserNotification', False, [P('Text', False), P('ActionOnClick', False), P('Explanation', False), P('Picture', False), P('UserNotificationStatus', False), P('UniquenessKey', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьОповещениеПользователя', False, [P('Text', False), P('ActionOnClick', False), P('Explanation', False), P('Picture', False), P('UserNotificationStatus', False), P('UniquenessKey', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('NotifyChanged', False, [P('Reference', True), P('ChangedType', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ОповеститьОбИзменении', False, [P('Reference', True), P('ChangedType', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('OpenForm', True, [P('Form', True), P('Window', False), P('FormName', True), P('Parameters', False), P('Owner', False), P('Unique', False), P('Window', False), P('NavigationLink', False), P('NotifyOnCloseDescription', False), P('WindowOpeningMode', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ОткрытьФорму', True, [P('Form', True), P('Window', False), P('FormName', True), P('Parameters', False), P('Owner', False), P('Unique', False), P('Window', False), P('NavigationLink', False), P('NotifyOnCloseDescription', False), P('WindowOpeningMode', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('OpenFormModal', True, [P('Form', True), P('FormName', True), P('Parameters', False), P('Owner', False), P('NavigationLink', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ОткрытьФормуМодально', True, [P('Form', True), P('FormName', True), P('Parameters', False), P('Owner', False), P('NavigationLink', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ActiveWindow', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('АктивноеОкно', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ShowQueryBox', False, [P('NotifyDescriptionOnCompletion', True), P('QueryText', True), P('Buttons', True), P('Timeout', False), P('DefaultButton', False), P('Title', False), P('TimeoutButton', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьВопрос', False, [P('NotifyDescriptionOnCompletion', True), P('QueryText', True), P('Buttons', True), P('Timeout', False), P('DefaultButton', False), P('Title', False), P('TimeoutButton', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ShowMessageBox', False, [P('NotifyDescriptionOnCompletion', False), P('MessageText', True), P('Timeout', False), P('Title', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьПредупреждение', False, [P('NotifyDescriptionOnCompletion', False), P('MessageText', True), P('Timeout', False), P('Title', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ShowValue', False, [P('NotifyDescriptionOnCompletion', False), P('Value', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоказатьЗначение', False, [P('NotifyDescriptionOnCompletion', False), P('Value', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ExecuteNotifyProcessing', False, [P('NotificationPerformed', True), P('Result', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ВыполнитьОбработкуОповещения', False, [P('NotificationPerformed', True), P('Result', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('CannotOpenForm', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ЗапрещеноОткрытиеФорм', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('SaveValue', False, [P('Name', True), P('Value', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('СохранитьЗначение', False, [P('Name', True), P('Value', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('RestoreValue', True, [P('Name', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('ВосстановитьЗначение', True, [P('Name', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('EndOfMinute', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КонецМинуты', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('CurrentDate', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ТекущаяДата', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('WeekOfYear', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НеделяГода', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ValueToStringInternal', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗначениеВСтрокуВнутр', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ComputerName', True, [], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ИмяКомпьютера', True, [], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ValueFromStringInternal', True, [P('Line', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗначениеИзСтрокиВнутр', True, [P('Line', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ValueToFile', True, [P('FileName', True), P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗначениеВФайл', True, [P('FileName', True), P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ValueFromFile', True, [P('FileName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗначениеИзФайла', True, [P('FileName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SaveUserSettings', False, [], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('СохранитьНастройкиПользователя', False, [], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('ClearUserSettings', False, [P('IBUserName', True), P('IBUser', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('ОчиститьНастройкиПользователя', False, [P('IBUserName', True), P('IBUser', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('BinDir', True, [], Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalMethod('КаталогПрограммы', True, [], Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalMethod('TempFilesDir', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КаталогВременныхФайлов', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('AttachIdleHandler', False, [P('ProcedureName', True), P('Interval', True), P('Single', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПодключитьОбработчикОжидания', False, [P('ProcedureName', True), P('Interval', True), P('Single', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('DetachIdleHandler', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ОтключитьОбработчикОжидания', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('Exit', False, [P('OptionRequest', False), P('RestartOnCompletion', False), P('AdditionalParametersOfCommandLine', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ЗавершитьРаботуСистемы', False, [P('OptionRequest', False), P('RestartOnCompletion', False), P('AdditionalParametersOfCommandLine', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('LockApplication', False, [], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('ЗаблокироватьРаботуПользователя', False, [], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('AccessRight', True, [P('Right', True), P('MetadataObject', True), P('UserRole', False), P('StandardAttributeStandardTabularSection', False)], Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalMethod('ПравоДоступа', True, [P('Right', True), P('MetadataObject', True), P('UserRole', False), P('StandardAttributeStandardTabularSection', False)], Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalMethod('IsInRole', True, [P('Role', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('РольДоступна', True, [P('Role', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('Terminate', False, [P('RestartOnCompletion', False), P('AdditionalParametersOfCommandLine', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ПрекратитьРаботуСистемы', False, [P('RestartOnCompletion', False), P('AdditionalParametersOfCommandLine', False)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('CurrentLanguage', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ТекущийЯзык', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('InfoBaseConnectionString', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('СтрокаСоединенияИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('AttachNotificationHandler', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПодключитьОбработчикОповещения', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('DetachNotificationHandler', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ОтключитьОбработчикОповещения', False, [P('ProcedureName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('AccessParameters', True, [P('DescriptionOfTheRight', True), P('MetadataObject', True), P('FieldList', True), P('UserRole', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПараметрыДоступа', True, [P('DescriptionOfTheRight', True), P('MetadataObject', True), P('FieldList', True), P('UserRole', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ApplicationPresentation', True, [P('ApplicationName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПредставлениеПриложения', True, [P('ApplicationName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('CurrentSystemLanguage', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ТекущийЯзыкСистемы', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('RunSystem', False, [P('AdditionalParametersOfCommandLine', False), P('WaitForCompletion', False), P('ReturnCode', False)], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('ЗапуститьСистему', False, [P('AdditionalParametersOfCommandLine', False), P('WaitForCompletion', False), P('ReturnCode', False)], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('GetUserMessages', True, [P('ToDeleteGetting', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСообщенияПользователю', True, [P('ToDeleteGetting', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetClientConnectionSpeed', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьСкоростьКлиентскогоСоединения', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('CurrentRunMode', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('ТекущийРежимЗапуска', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('CurrentLocaleCode', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ТекущийКодЛокализации', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetSessionTimeZone', False, [P('TimeZone', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьЧасовойПоясСеанса', False, [P('TimeZone', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SessionTimeZone', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЧасовойПоясСеанса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('CurrentSessionDate', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ТекущаяДатаСеанса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('RightPresentation', True, [P('NameOfRight', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПредставлениеПрава', True, [P('NameOfRight', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('VerifyAccessRights', False, [P('Right', True), P('MetadataObject', True), P('StandardAttributeStandardTabularSection', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ВыполнитьПроверкуПравДоступа', False, [P('Right', True), P('MetadataObject', True), P('StandardAttributeStandardTabularSection', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('UserDataWorkDir', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('РабочийКаталогДанныхПользователя', True, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('DocumentsDir', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('КаталогДокументов', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginGettingUserDataWorkDir', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПолучениеРабочегоКаталогаДанныхПользователя', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('MobileDeviceLibraryDir', True, [P('DirType', True)], Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalMethod('КаталогБиблиотекиМобильногоУстройства', True, [P('DirType', True)], Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalMethod('GetClientDisplaysInformation', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьИнформациюЭкрановКлиента', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BeginGettingTempFilesDir', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПолучениеКаталогаВременныхФайлов', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginGettingDocumentsDir', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПолучениеКаталогаДокументов', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginGettingMobileDeviceLibraryDir', False, [P('NotifyDescription', True), P('DirType', True)], Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalMethod('НачатьПолучениеКаталогаБиблиотекиМобильногоУстройства', False, [P('NotifyDescription', True), P('DirType', True)], Env(False, False, True, True, True, False, False, False, False, False)),
-    GlobalMethod('DetachLicensingClientParametersRequestHandler', False, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ОтключитьОбработчикЗапросаНастроекКлиентаЛицензирования', False, [], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('AttachLicensingClientParametersRequestHandler', False, [P('ProcedureName', True)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('ПодключитьОбработчикЗапросаНастроекКлиентаЛицензирования', False, [P('ProcedureName', True)], Env(True, False, True, False, False, False, True, True, True, False)),
-    GlobalMethod('SessionBeginningOfCentury', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('НачалоСтолетияСеанса', True, [], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('BeginCreateBinaryDataFromFile', False, [P('NotifyDescription', True), P('FileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьСозданиеДвоичныхДанныхИзФайла', False, [P('NotifyDescription', True), P('FileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('LoadAddIn', False, [P('FileName', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('ЗагрузитьВнешнююКомпоненту', False, [P('FileName', True)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('InstallAddIn', False, [P('Location', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('УстановитьВнешнююКомпоненту', False, [P('Location', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('GetPassiveSessionHibernateTime', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьВремяЗасыпанияПассивногоСеанса', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetHibernateSessionTerminateTime', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьВремяЗавершенияСпящегоСеанса', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('AttachAddIn', True, [P('Location', True), P('Name', True), P('Type', False), P('ObjectIdentificator', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПодключитьВнешнююКомпоненту', True, [P('Location', True), P('Name', True), P('Type', False), P('ObjectIdentificator', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BeginInstallAddIn', False, [P('NotifyDescriptionOnCompletion', False), P('Location', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьУстановкуВнешнейКомпоненты', False, [P('NotifyDescriptionOnCompletion', False), P('Location', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('DynamicAddInInstallationSupported', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПоддерживаетсяДинамическаяУстановкаВнешнихКомпонент', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('System', False, [P('CommandString', True), P('CurrentDirectory', False)], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('КомандаСистемы', False, [P('CommandString', True), P('CurrentDirectory', False)], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('BeginAttachingAddIn', False, [P('NotifyDescription', False), P('ObjectId', False), P('NotifyDescription', True), P('Location', True), P('Name', True), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПодключениеВнешнейКомпоненты', False, [P('NotifyDescription', False), P('ObjectId', False), P('NotifyDescription', True), P('Location', True), P('Name', True), P('Type', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('EndOfHour', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КонецЧаса', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('RunApp', False, [P('CommandString', True), P('CurrentDirectory', False), P('WaitForCompletion', False), P('ReturnCode', False)], Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ЗапуститьПриложение', False, [P('CommandString', True), P('CurrentDirectory', False), P('WaitForCompletion', False), P('ReturnCode', False)], Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BeginPuttingFiles', False, [P('NotifyDescriptionOnCompletion', True), P('Files', False), P('Interactively', False), P('FormUniqueID', False), P('BeforeStartPutFilesNotifyDescription', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПомещениеФайлов', False, [P('NotifyDescriptionOnCompletion', True), P('Files', False), P('Interactively', False), P('FormUniqueID', False), P('BeforeStartPutFilesNotifyDescription', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('GetCOMObject', True, [P('FileName', False), P('NameOfCOMClass', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьCOMОбъект', True, [P('FileName', False), P('NameOfCOMClass', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('WindowsUsers', True, [], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('ПользователиWindows', True, [], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('OSUsers', True, [], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('ПользователиОС', True, [], Env(True, False, True, False, False, False, True, True, False, False)),
-    GlobalMethod('BeginRunningApplication', False, [P('NotifyDescription', True), P('CommandLine', True), P('CurrentDirectory', False), P('WaitForCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьЗапускПриложения', False, [P('NotifyDescription', True), P('CommandLine', True), P('CurrentDirectory', False), P('WaitForCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginTransaction', False, [P('LockMode', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('НачатьТранзакцию', False, [P('LockMode', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('CommitTransaction', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗафиксироватьТранзакцию', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('RollbackTransaction', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ОтменитьТранзакцию', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetExclusiveMode', False, [P('ExclusiveMode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьМонопольныйРежим', False, [P('ExclusiveMode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetUserPasswordMinLength', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьМинимальнуюДлинуПаролейПользователей', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ExclusiveMode', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('МонопольныйРежим', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetInfoBaseConnections', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСоединенияИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('InfoBaseConnectionNumber', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('НомерСоединенияИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ConfigurationChanged', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('КонфигурацияИзменена', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetRealTimeTimestamp', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьОперативнуюОтметкуВремени', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('InfoBaseLocaleCode', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('КодЛокализацииИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetInfoBasePredefinedData', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьОбновлениеПредопределенныхДанныхИнформационнойБазы', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('DataBaseConfigurationChangedDynamically', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('КонфигурацияБазыДанныхИзмененаДинамически', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetLockWaitTime', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьВремяОжиданияБлокировкиДанных', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetLockWaitTime', True, [], Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьВремяОжиданияБлокировкиДанных', True, [], Env(True, True, True, True, True, True, True, False, False, False)),
-    GlobalMethod('SetUserPasswordMinLength', False, [P('Length', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьМинимальнуюДлинуПаролейПользователей', False, [P('Length', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetUserPasswordStrengthCheck', False, [P('ComplexPassword', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьПроверкуСложностиПаролейПользователей', False, [P('ComplexPassword', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetUserPasswordStrengthCheck', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьПроверкуСложностиПаролейПользователей', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('BegOfMinute', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НачалоМинуты', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetConnectionsLock', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьБлокировкуУстановкиСоединений', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetConnectionsLock', False, [P('Lock', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьБлокировкуУстановкиСоединений', False, [P('Lock', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetDBStorageStructureInfo', True, [P('MetadataObjects', False), P('DBMSNames', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСтруктуруХраненияБазыДанных', True, [P('MetadataObjects', False), P('DBMSNames', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('TransactionActive', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ТранзакцияАктивна', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('RefreshObjectsNumbering', False, [P('Metadata', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ОбновитьНумерациюОбъектов', False, [P('Metadata', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ConnectionStopRequest', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('НеобходимостьЗавершенияСоединения', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('InfoBaseSessionNumber', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('НомерСеансаИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetPrivilegedMode', False, [P('PrivilegedModeOn', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьПривилегированныйРежим', False, [P('PrivilegedModeOn', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('PrivilegedMode', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПривилегированныйРежим', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetInfoBaseSessions', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСеансыИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('LockDataForEdit', False, [P('Key', True), P('DataVersion', False), P('FormIdentifier', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗаблокироватьДанныеДляРедактирования', False, [P('Key', True), P('DataVersion', False), P('FormIdentifier', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('UnlockDataForEdit', False, [P('Key', False), P('FormIdentifier', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('РазблокироватьДанныеДляРедактирования', False, [P('Key', False), P('FormIdentifier', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetSessionsLock', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьБлокировкуСеансов', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetSessionsLock', False, [P('Lock', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьБлокировкуСеансов', False, [P('Lock', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('RefreshReusableValues', False, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ОбновитьПовторноИспользуемыеЗначения', False, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('SetSafeMode', False, [P('SafeMode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьБезопасныйРежим', False, [P('SafeMode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SafeMode', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('БезопасныйРежим', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetChoiceData', True, [P('ValueType', True), P('Parameters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьДанныеВыбора', True, [P('ValueType', True), P('Parameters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('SetInfoBaseTimeZone', False, [P('TimeZone', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьЧасовойПоясИнформационнойБазы', False, [P('TimeZone', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetInfoBaseTimeZone', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьЧасовойПоясИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ConnectExternalDataSource', False, [P('ExternalDataSourceName', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('УстановитьСоединениеСВнешнимИсточникомДанных', False, [P('ExternalDataSourceName', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('DisconnectExternalDataSource', False, [P('ExternalDataSourceName', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('РазорватьСоединениеСВнешнимИсточникомДанных', False, [P('ExternalDataSourceName', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('GetDataBaseConfigurationUpdate', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьОбновлениеКонфигурацииБазыДанных', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetPassiveSessionHibernateTime', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьВремяЗасыпанияПассивногоСеанса', False, [P('Timeout', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('EraseInfoBaseData', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УдалитьДанныеИнформационнойБазы', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetDataSeparationSafeMode', False, [P('CommonAttribute', True), P('Mode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьБезопасныйРежимРазделенияДанных', False, [P('CommonAttribute', True), P('Mode', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('DataSeparationSafeMode', True, [P('CommonAttribute', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('БезопасныйРежимРазделенияДанных', True, [P('CommonAttribute', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('InitializePredefinedData', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ИнициализироватьПредопределенныеДанные', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetSafeModeDisabled', False, [P('Disable', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьОтключениеБезопасногоРежима', False, [P('Disable', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetSafeModeDisabled', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьОтключениеБезопасногоРежима', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetLicensingClientParameters', False, [P('Name', False), P('Password', False), P('AdditionalOption', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьНастройкиКлиентаЛицензирования', False, [P('Name', False), P('Password', False), P('AdditionalOption', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetConfigurationID', True, [], Env(False, False, True, False, True, True, False, False, False, False)),
-    GlobalMethod('ПолучитьИдентификаторКонфигурации', True, [], Env(False, False, True, False, True, True, False, False, False, False)),
-    GlobalMethod('GetLicensingClientName', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьИмяКлиентаЛицензирования', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetLicensingClientAdditionalParameter', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьДополнительныйПараметрКлиентаЛицензирования', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetInfoBaseBeginningOfCentury', False, [P('BeginningOfCentury', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьНачалоСтолетияИнформационнойБазы', False, [P('BeginningOfCentury', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetInfoBaseBeginningOfCentury', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьНачалоСтолетияИнформационнойБазы', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('FileCopy', False, [P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КопироватьФайл', False, [P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('MoveFile', False, [P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПереместитьФайл', False, [P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('DeleteFiles', False, [P('Path', True), P('Mask', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('УдалитьФайлы', False, [P('Path', True), P('Mask', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('DeleteFromTempStorage', False, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('УдалитьИзВременногоХранилища', False, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetFromTempStorage', True, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьИзВременногоХранилища', True, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('FindFiles', True, [P('Path', True), P('Mask', False), P('SearchInSubdirectories', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НайтиФайлы', True, [P('Path', True), P('Mask', False), P('SearchInSubdirectories', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('CreateDirectory', False, [P('DirectoryName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СоздатьКаталог', False, [P('DirectoryName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('IsTempStorageURL', True, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ЭтоАдресВременногоХранилища', True, [P('Address', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetTempFileName', True, [P('Extension', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ПолучитьИмяВременногоФайла', True, [P('Extension', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('BeginCopyingFile', False, [P('NotifyDescription', True), P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьКопированиеФайла', False, [P('NotifyDescription', True), P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginMovingFile', False, [P('NotifyDescription', True), P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПеремещениеФайла', False, [P('NotifyDescription', True), P('SourceFileName', True), P('ReceiverFileName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginDeletingFiles', False, [P('NotifyDescription', True), P('Path', True), P('Mask', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьУдалениеФайлов', False, [P('NotifyDescription', True), P('Path', True), P('Mask', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('SplitFile', True, [P('FileName', True), P('SegmentSize', True), P('Path', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('РазделитьФайл', True, [P('FileName', True), P('SegmentSize', True), P('Path', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('MergeFiles', False, [P('SearchTemplate', True), P('ResultingFileName', True), P('SegmentNames', True), P('ResultingFileName', True)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ОбъединитьФайлы', False, [P('SearchTemplate', True), P('ResultingFileName', True), P('SegmentNames', True), P('ResultingFileName', True)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('GetFile', True, [P('Address', True), P('FileName', False), P('Interactively', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПолучитьФайл', True, [P('Address', True), P('FileName', False), P('Interactively', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('PutToTempStorage', True, [P('Data', True), P('Address', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПоместитьВоВременноеХранилище', True, [P('Data', True), P('Address', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('AttachFileSystemExtension', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПодключитьРасширениеРаботыСФайлами', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('InstallFileSystemExtension', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('УстановитьРасширениеРаботыСФайлами', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginAttachingFileSystemExtension', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПодключениеРасширенияРаботыСФайлами', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('RequestUserPermission', True, [P('Calls', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ЗапроситьРазрешениеПользователя', True, [P('Calls', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('GetAllFilesMask', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьМаскуВсеФайлы', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetServerAllFilesMask', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьМаскуВсеФайлыСервера', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetPathSeparator', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьРазделительПути', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetClientPathSeparator', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьРазделительПутиКлиента', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetServerPathSeparator', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьРазделительПутиСервера', True, [], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('BeginInstallFileSystemExtension', False, [P('NotifyDescriptionOnCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьУстановкуРасширенияРаботыСФайлами', False, [P('NotifyDescriptionOnCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginPutFile', True, [P('NotifyDescriptionOnCompletion', False), P('Address', False), P('File', False), P('Interactively', False), P('FormUniqueID', False), P('BeforeStartPutFileNotifyDescription', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПомещениеФайла', True, [P('NotifyDescriptionOnCompletion', False), P('Address', False), P('File', False), P('Interactively', False), P('FormUniqueID', False), P('BeforeStartPutFileNotifyDescription', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginRequestingUserPermission', False, [P('NotifyDescription', True), P('Calls', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьЗапросРазрешенияПользователя', False, [P('NotifyDescription', True), P('Calls', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginFindingFiles', False, [P('NotifyDescription', True), P('Path', True), P('Mask', False), P('SearchInSubdirectories', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПоискФайлов', False, [P('NotifyDescription', True), P('Path', True), P('Mask', False), P('SearchInSubdirectories', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginCreatingDirectory', False, [P('NotifyDescription', True), P('DirectoryName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьСозданиеКаталога', False, [P('NotifyDescription', True), P('DirectoryName', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('FindMarkedForDeletion', True, [P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('НайтиПомеченныеНаУдаление', True, [P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('FindByRef', True, [P('ReferenceList', True), P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('НайтиПоСсылкам', True, [P('ReferenceList', True), P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('DeleteObjects', False, [P('ReferenceList', True), P('Check', False), P('DataFound', False), P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УдалитьОбъекты', False, [P('ReferenceList', True), P('Check', False), P('DataFound', False), P('SearchArea', False), P('IncludeObjects', False), P('ExcludeObjects', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetInfoBasePredefinedDataUpdate', False, [P('PredefinedDataUpdate', False)], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьОбновлениеПредопределенныхДанныхИнформационнойБазы', False, [P('PredefinedDataUpdate', False)], Env(True, False, True, False, True, True, True, False, False, False)),
-    GlobalMethod('NumberInWords', True, [P('Number', True), P('FormatString', False), P('NumerationItemOptions', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ЧислоПрописью', True, [P('Number', True), P('FormatString', False), P('NumerationItemOptions', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('NStr', True, [P('InitialString', True), P('LanguageCode', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НСтр', True, [P('InitialString', True), P('LanguageCode', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Int', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Цел', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Format', True, [P('Value', True), P('FormatString', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Формат', True, [P('Value', True), P('FormatString', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('PeriodPresentation', True, [P('BeginningDateOfPeriod', True), P('EndingDateOfPeriod', True), P('FormatString', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('ПредставлениеПериода', True, [P('BeginningDateOfPeriod', True), P('EndingDateOfPeriod', True), P('FormatString', False)], Env(True, True, True, False, True, True, True, True, True, False)),
-    GlobalMethod('StrTemplate', True, [P('Template', True), P('Value1-Value10', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрШаблон', True, [P('Template', True), P('Value1-Value10', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StringWithNumber', True, [P('SourceString', True), P('Number', True), P('NumericValueType', True), P('Parameters', False)], Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрокаСЧислом', True, [P('SourceString', True), P('Number', True), P('NumericValueType', True), P('Parameters', False)], Env(True, False, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetCommonTemplate', True, [P('CommonTemplate', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьОбщийМакет', True, [P('CommonTemplate', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetCommonForm', True, [P('Form', False), P('Owner', False), P('UniquenessKey', False)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('ПолучитьОбщуюФорму', True, [P('Form', False), P('Owner', False), P('UniquenessKey', False)], Env(True, False, True, False, False, False, True, False, False, False)),
-    GlobalMethod('PredefinedValue', True, [P('PredefinedValueName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПредопределенноеЗначение', True, [P('PredefinedValueName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetPredefinedValueFullName', True, [P('PredefinedValue', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьПолноеИмяПредопределенногоЗначения', True, [P('PredefinedValue', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Round', True, [P('Number', True), P('DigitCapacity', False), P('RoundingMode', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Окр', True, [P('Number', True), P('DigitCapacity', False), P('RoundingMode', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Log', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Log', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Log10', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Log10', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BegOfHour', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НачалоЧаса', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ACos', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ACos', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ASin', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ASin', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ATan', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ATan', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Cos', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Cos', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Exp', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Exp', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Pow', True, [P('Base', True), P('Factor', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Pow', True, [P('Base', True), P('Factor', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Sin', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Sin', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Sqrt', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Sqrt', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Tan', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Tan', True, [P('Angle', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('XMLString', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('XMLСтрока', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('XMLValue', True, [P('Type', True), P('XMLString', True)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('XMLЗначение', True, [P('Type', True), P('XMLString', True)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('BegOfWeek', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НачалоНедели', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('EndOfWeek', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КонецНедели', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('WriteXML', False, [P('WriteXML', True), P('Value', True), P('TypeAssignment', False), P('WriteXML', True), P('Value', True), P('FullName', True), P('TypeAssignment', False), P('WriteXML', True), P('Value', True), P('LocalName', True), P('NamespaceURI', True), P('TypeAssignment', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗаписатьXML', False, [P('WriteXML', True), P('Value', True), P('TypeAssignment', False), P('WriteXML', True), P('Value', True), P('FullName', True), P('TypeAssignment', False), P('WriteXML', True), P('Value', True), P('LocalName', True), P('NamespaceURI', True), P('TypeAssignment', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ReadXML', True, [P('ReadXML', True), P('ValueType', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПрочитатьXML', True, [P('ReadXML', True), P('ValueType', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('CanReadXML', True, [P('ReadXML', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ВозможностьЧтенияXML', True, [P('ReadXML', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('XMLType', True, [P('Type', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('XMLТип', True, [P('Type', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('FromXMLType', True, [P('XMLType', True), P('TypeName', True), P('NamespaceURI', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ИзXMLТипа', True, [P('XMLType', True), P('TypeName', True), P('NamespaceURI', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetLocationByAddress', True, [P('Address', False)], Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalMethod('ПолучитьМестоположениеПоАдресу', True, [P('Address', False)], Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalMethod('GetXMLType', True, [P('ReadXML', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьXMLТип', True, [P('ReadXML', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('XMLTypeOf', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('XMLТипЗнч', True, [P('Value', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('FindDisallowedXMLCharacters', True, [P('CharacterString', True), P('StartPosition', False), P('Version', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('НайтиНедопустимыеСимволыXML', True, [P('CharacterString', True), P('StartPosition', False), P('Version', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ImportXDTOModel', True, [P('XMLSchemaSet', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ИмпортМоделиXDTO', True, [P('XMLSchemaSet', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('CreateXDTOFactory', True, [P('Path', True), P('Packages', False), P('Paths', True), P('Packages', False)], Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalMethod('СоздатьФабрикуXDTO', True, [P('Path', True), P('Packages', False), P('Paths', True), P('Packages', False)], Env(True, True, True, False, True, True, True, True, False, False)),
-    GlobalMethod('TypeOf', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ТипЗнч', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Type', True, [P('TypeName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Тип', True, [P('TypeName', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Boolean', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Булево', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Number', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Число', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BegOfMonth', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НачалоМесяца', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('EndOfMonth', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КонецМесяца', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('String', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Строка', True, [P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Date', True, [P('Value', True), P('Year', True), P('Month', True), P('Day', True), P('Hour', False), P('Minute', False), P('Second', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Дата', True, [P('Value', True), P('Year', True), P('Month', True), P('Day', True), P('Hour', False), P('Minute', False), P('Second', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('EndOfYear', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КонецГода', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('NumberFromHexString', True, [P('HexString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ЧислоИзШестнадцатеричнойСтроки', True, [P('HexString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('NumberFromBinaryString', True, [P('BinaryString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ЧислоИзДвоичнойСтроки', True, [P('BinaryString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetAddressByLocation', True, [P('Location', True)], Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalMethod('ПолучитьАдресПоМестоположению', True, [P('Location', True)], Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalMethod('ShowOnMap', False, [P('Location', True)], Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalMethod('ПоказатьНаКарте', False, [P('Location', True)], Env(False, False, True, True, False, False, False, False, False, False)),
-    GlobalMethod('MapRepresentationSupported', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПоддерживаетсяОтображениеКарты', True, [], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetFunctionalOption', True, [P('Name', True), P('Parameters', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьФункциональнуюОпцию', True, [P('Name', True), P('Parameters', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetInterfaceFunctionalOption', True, [P('Name', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПолучитьФункциональнуюОпциюИнтерфейса', True, [P('Name', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('GetInterfaceFunctionalOptionParameters', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПолучитьПараметрыФункциональныхОпцийИнтерфейса', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('SetInterfaceFunctionalOptionParameters', False, [P('ParametersToBeSpecified', True), P('ParametersToBeReset', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('УстановитьПараметрыФункциональныхОпцийИнтерфейса', False, [P('ParametersToBeSpecified', True), P('ParametersToBeReset', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('RefreshInterface', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ОбновитьИнтерфейс', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('AddMonth', True, [P('Date', True), P('CountOfMonths', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ДобавитьМесяц', True, [P('Date', True), P('CountOfMonths', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Year', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Год', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Month', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Месяц', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('DayOfYear', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ДеньГода', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('WeekDay', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ДеньНедели', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BegOfDay', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НачалоДня', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('EndOfDay', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КонецДня', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Day', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('День', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Hour', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Час', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Minute', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Минута', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Second', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Секунда', True, [P('Date', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('WriteJSON', False, [P('JSONWriter', True), P('Value', True), P('SerializationSettings', False), P('ConversionFunctionName', False), P('ConversionFunctionModule', False), P('ConversionFunctionAdditionalParameters', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ЗаписатьJSON', False, [P('JSONWriter', True), P('Value', True), P('SerializationSettings', False), P('ConversionFunctionName', False), P('ConversionFunctionModule', False), P('ConversionFunctionAdditionalParameters', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ConcatBinaryDataBuffers', True, [P('Parts', True), P('Separator', False), P('ByteOrder', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СоединитьБуферыДвоичныхДанных', True, [P('Parts', True), P('Separator', False), P('ByteOrder', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ReadJSON', True, [P('JSONReader', True), P('ReadToMap', False), P('PropertiesWithDateValuesNames', False), P('ExpectedDateFormat', False), P('ReviverFunctionName', False), P('ReviverFunctionModule', False), P('ReviverFunctionAdditionalParameters', False), P('RetriverPropertiesNames', False), P('MaximumNesting', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ПрочитатьJSON', True, [P('JSONReader', True), P('ReadToMap', False), P('PropertiesWithDateValuesNames', False), P('ExpectedDateFormat', False), P('ReviverFunctionName', False), P('ReviverFunctionModule', False), P('ReviverFunctionAdditionalParameters', False), P('RetriverPropertiesNames', False), P('MaximumNesting', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ReadJSONDate', True, [P('String', True), P('Format', True)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ПрочитатьДатуJSON', True, [P('String', True), P('Format', True)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('WriteJSONDate', True, [P('Date', True), P('Format', True), P('DateWritingVariant', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ЗаписатьДатуJSON', True, [P('Date', True), P('Format', True), P('DateWritingVariant', False)], Env(True, True, True, True, True, True, True, True, False, False)),
-    GlobalMethod('ConcatBinaryData', True, [P('BinaryDataArray', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СоединитьДвоичныеДанные', True, [P('BinaryDataArray', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('SplitBinaryData', True, [P('BinaryData', True), P('PartSize', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('РазделитьДвоичныеДанные', True, [P('BinaryData', True), P('PartSize', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataFromString', True, [P('String', True), P('TextEncoding', False), P('WriteBOM', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьДвоичныеДанныеИзСтроки', True, [P('String', True), P('TextEncoding', False), P('WriteBOM', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataBufferFromString', True, [P('String', True), P('TextEncoding', False), P('WriteBOM', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьБуферДвоичныхДанныхИзСтроки', True, [P('String', True), P('TextEncoding', False), P('WriteBOM', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetStringFromBinaryData', True, [P('BinaryData', True), P('TextEncoding', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьСтрокуИзДвоичныхДанных', True, [P('BinaryData', True), P('TextEncoding', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetStringFromBinaryDataBuffer', True, [P('Buffer', True), P('TextEncoding', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьСтрокуИзБуфераДвоичныхДанных', True, [P('Buffer', True), P('TextEncoding', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataFromBase64String', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьДвоичныеДанныеИзBase64Строки', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataBufferFromBase64String', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьБуферДвоичныхДанныхИзBase64Строки', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBase64StringFromBinaryData', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьBase64СтрокуИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBase64StringFromBinaryDataBuffer', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьBase64СтрокуИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataFromBase64BinaryData', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьДвоичныеДанныеИзBase64ДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataBufferFromBase64BinaryDataBuffer', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьБуферДвоичныхДанныхИзBase64БуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBase64BinaryDataFromBinaryData', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьBase64ДвоичныеДанныеИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBase64BinaryDataBufferFromBinaryDataBuffer', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьBase64БуферДвоичныхДанныхИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataFromHexString', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьДвоичныеДанныеИзHexСтроки', True, [P('String', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataBufferFromHexString', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьБуферДвоичныхДанныхИзHexСтроки', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetHexStringFromBinaryData', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьHexСтрокуИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetHexStringFromBinaryDataBuffer', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьHexСтрокуИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataFromHexBinaryData', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьДвоичныеДанныеИзHexДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataBufferFromHexBinaryDataBuffer', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьБуферДвоичныхДанныхИзHexБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetHexBinaryDataFromBinaryData', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьHexДвоичныеДанныеИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetHexBinaryDataBufferFromBinaryDataBuffer', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьHexБуферДвоичныхДанныхИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataBufferFromBinaryData', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьБуферДвоичныхДанныхИзДвоичныхДанных', True, [P('BinaryData', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetBinaryDataFromBinaryDataBuffer', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПолучитьДвоичныеДанныеИзБуфераДвоичныхДанных', True, [P('Buffer', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('CheckBit', True, [P('Number', True), P('BitNumber', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПроверитьБит', True, [P('Number', True), P('BitNumber', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('CheckByBitMask', True, [P('Number', True), P('Mask', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПроверитьПоБитовойМаске', True, [P('Number', True), P('Mask', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('SetBit', True, [P('Number', True), P('BitNumber', True), P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('УстановитьБит', True, [P('Number', True), P('BitNumber', True), P('Value', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BitwiseAnd', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПобитовоеИ', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BitwiseOr', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПобитовоеИли', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BitwiseNot', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПобитовоеНе', True, [P('Number', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BitwiseXor', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПобитовоеИсключительноеИли', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BitwiseAndNot', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПобитовоеИНе', True, [P('Number1', True), P('Number2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BitwiseShiftLeft', True, [P('Number', True), P('Offset', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПобитовыйСдвигВлево', True, [P('Number', True), P('Offset', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('BitwiseShiftRight', True, [P('Number', True), P('Offset', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПобитовыйСдвигВправо', True, [P('Number', True), P('Offset', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('WriteLogEvent', False, [P('EventName', True), P('Level', False), P('MetadataObject', False), P('Data', False), P('Commentaries', False), P('TransactionMode', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ЗаписьЖурналаРегистрации', False, [P('EventName', True), P('Level', False), P('MetadataObject', False), P('Data', False), P('Commentaries', False), P('TransactionMode', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('EventLogEventPresentation', True, [P('EventIdentifier', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПредставлениеСобытияЖурналаРегистрации', True, [P('EventIdentifier', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('UnloadEventLog', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ВыгрузитьЖурналРегистрации', False, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetEventLogUsing', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьИспользованиеЖурналаРегистрации', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetEventLogUsing', False, [P('Levels', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьИспользованиеЖурналаРегистрации', False, [P('Levels', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('BeginAttachingCryptoExtension', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьПодключениеРасширенияРаботыСКриптографией', False, [P('NotifyDescription', True)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('StrLen', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрДлина', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetEventLogFilterValues', True, [P('Columns', False), P('InputFileName', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьЗначенияОтбораЖурналаРегистрации', True, [P('Columns', False), P('InputFileName', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('Left', True, [P('Line', True), P('CountOfCharacters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Лев', True, [P('Line', True), P('CountOfCharacters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('UnloadEventLog', False, [P('Destination', True), P('Filter', False), P('Columns', False), P('InputFileName', False), P('MaximumCount', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ВыгрузитьЖурналРегистрации', False, [P('Destination', True), P('Filter', False), P('Columns', False), P('InputFileName', False), P('MaximumCount', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('CopyEventLog', False, [P('InputFileName', False), P('OutputFileName', False), P('Filter', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('СкопироватьЖурналРегистрации', False, [P('InputFileName', False), P('OutputFileName', False), P('Filter', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetEventLogEventUse', False, [P('EventName', True), P('Use', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьИспользованиеСобытияЖурналаРегистрации', False, [P('EventName', True), P('Use', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetEventLogEventUse', True, [P('EventName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьИспользованиеСобытияЖурналаРегистрации', True, [P('EventName', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ClearEventLog', False, [P('Filter', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ОчиститьЖурналРегистрации', False, [P('Filter', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('SetStandardODataInterfaceContent', False, [P('MetadataObjects', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('УстановитьСоставСтандартногоИнтерфейсаOData', False, [P('MetadataObjects', True)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetStandardODataInterfaceContent', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСоставСтандартногоИнтерфейсаOData', True, [], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('InstallCryptoExtension', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('УстановитьРасширениеРаботыСКриптографией', False, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('AttachCryptoExtension', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('ПодключитьРасширениеРаботыСКриптографией', True, [], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('BeginInstallCryptoExtension', False, [P('NotifyDescriptionOnCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('НачатьУстановкуРасширенияРаботыСКриптографией', False, [P('NotifyDescriptionOnCompletion', False)], Env(True, False, True, True, False, False, True, True, True, False)),
-    GlobalMethod('TrimL', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СокрЛ', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('TrimR', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СокрП', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('TrimAll', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СокрЛП', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Right', True, [P('Line', True), P('CountOfCharacters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Прав', True, [P('Line', True), P('CountOfCharacters', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Mid', True, [P('Line', True), P('InitialNumber', True), P('CountOfCharacters', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Сред', True, [P('Line', True), P('InitialNumber', True), P('CountOfCharacters', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Upper', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ВРег', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Lower', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('НРег', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Char', True, [P('CharacterCode', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Символ', True, [P('CharacterCode', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('CharCode', True, [P('Line', True), P('CharacterNumber', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('КодСимвола', True, [P('Line', True), P('CharacterNumber', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('IsBlankString', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ПустаяСтрока', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrReplace', True, [P('Line', True), P('SearchSubstring', True), P('ReplaceSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрЗаменить', True, [P('Line', True), P('SearchSubstring', True), P('ReplaceSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrLineCount', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрЧислоСтрок', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrGetLine', True, [P('Line', True), P('LineNumber', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрПолучитьСтроку', True, [P('Line', True), P('LineNumber', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrOccurrenceCount', True, [P('Line', True), P('SearchSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрЧислоВхождений', True, [P('Line', True), P('SearchSubstring', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('Title', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('ТРег', True, [P('Line', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrCompare', True, [P('String1', True), P('String2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрСравнить', True, [P('String1', True), P('String2', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrStartsWith', True, [P('String', True), P('SearchString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрНачинаетсяС', True, [P('String', True), P('SearchString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrEndsWith', True, [P('String', True), P('SearchString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрЗаканчиваетсяНа', True, [P('String', True), P('SearchString', True)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrSplit', True, [P('String', True), P('Separator', True), P('IncludeBlank', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрРазделить', True, [P('String', True), P('Separator', True), P('IncludeBlank', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrConcat', True, [P('Strings', True), P('Separator', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрСоединить', True, [P('Strings', True), P('Separator', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('StrFind', True, [P('Line', True), P('SearchSubstring', True), P('SearchDirection', False), P('StartIndex', False), P('EntryNumber', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('СтрНайти', True, [P('Line', True), P('SearchSubstring', True), P('SearchDirection', False), P('StartIndex', False), P('EntryNumber', False)], Env(True, True, True, True, True, True, True, True, True, False)),
-    GlobalMethod('GetStringDeclensions', True, [P('DeclinedString', True), P('StringDescription', False), P('FormatString', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСклоненияСтроки', True, [P('DeclinedString', True), P('StringDescription', False), P('FormatString', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('GetStringDeclensionsByNumber', True, [P('String', True), P('Number', True), P('UnitsOfMeasurement', False), P('StringDescription', False), P('FormatString', False), P('NumberFormatString', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    GlobalMethod('ПолучитьСклоненияСтрокиПоЧислу', True, [P('String', True), P('Number', True), P('UnitsOfMeasurement', False), P('StringDescription', False), P('FormatString', False), P('NumberFormatString', False)], Env(True, True, True, False, True, True, True, False, False, False)),
-    # deprecated
-    GlobalMethod('ClientApplicationInterfaceCurrentVariant', True, [], Env()),
-    GlobalMethod('ТекущийВариантИнтерфейсаКлиентскогоПриложения', True, [], Env()),
-]
+def make_var(record: Record) -> Item:
+    names, mask = record
+    return Item(names[0], GlobalObject(names[0], mask_env(mask)))
 
-scope = Scope()
+def make_method(record: Record) -> Item:
+    names, retval, params, mask = record
+    return Item(names[0], GlobalMethod(names[0], retval, [P(*param) for param in params], mask_env(mask)))
+
+def table(kind: str) -> SymbolTable:
+    return getattr(scope, kind)
+
+def names(prop: Prop) -> Tuple[str, ...]:
+    unique: Dict[str, str] = {}
+    for name in prop.names:
+        unique.setdefault(name.lower(), name)
+    return tuple(unique.values())
+
+def index(entries: List[Record]) -> Index:
+    result: Index = {}
+    for i, entry in enumerate(entries):
+        for name in entry[0]:
+            result[name.lower()] = i
+    return result
+
+def build() -> Tuple[List[Record], Index, List[Record], Index]:
+    """
+    Строит записи снимка и индексы синонимов по объявлениям из bsl.context.
+    """
+    import bsl.context as context
+    variables: List[Record] = []
+    methods: List[Record] = []
+    for prop in context.props + context.enums:
+        obj: GlobalObject = prop.item.Decl
+        variables.append((names(prop), env_mask(obj.Env)))
+    for prop in context.methods:
+        method: GlobalMethod = prop.item.Decl
+        params = tuple((param.Name, param.Required) for param in method.Params)
+        methods.append((names(prop), method.RetVal, params, env_mask(method.Env)))
+    return variables, index(variables), methods, index(methods)
 
-for obj in props:
-    scope.Vars[obj.Name.lower()] = Item(obj.Name, obj)
+def snapshot_source() -> str:
+    spec = importlib.util.find_spec('bsl.context')
+    assert spec is not None and spec.origin is not None
+    return spec.origin
 
-for obj in enums:
-    scope.Vars[obj.Name.lower()] = Item(obj.Name, obj)
+def snapshot_path(source: str) -> Optional[str]:
+    try:
+        pyc = importlib.util.cache_from_source(source)
+    except NotImplementedError:
+        return None
+    return os.path.splitext(pyc)[0] + '.snapshot'
+
+def snapshot_key(source: str) -> str:
+    # в ключ входит и этот модуль, т.к. он определяет формат записей
+    h = hashlib.sha1(sys.version.encode())
+    for path in [source, __file__]:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+def load() -> Tuple[List[Record], Index, List[Record], Index]:
+    """
+    Загружает снимок глобального контекста, при отсутствии или устаревании строит его заново.
+    """
+    source = snapshot_source()
+    path = snapshot_path(source)
+    key = snapshot_key(source)
+    if path:
+        try:
+            with open(path, 'rb') as f:
+                cached_key, *tables = marshal.loads(f.read())
+            if cached_key == key:
+                return tuple(tables)  # type: ignore
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+    tables = build()
+    if path:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f'{path}.{os.getpid()}'
+            with open(tmp, 'wb') as f:
+                marshal.dump((key, *tables), f)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # снимок не обязателен, например каталог только для чтения
+    return tables
+
+scope = Scope()
 
-for method in methods:
-    scope.Methods[method.Name.lower()] = Item(method.Name, method)
\ No newline at end of file
+_variables, _variables_index, _methods, _methods_index = load()
+# таблицы не сериализуются: в другом процессе берется его собственный глобальный контекст
+scope.Vars = SymbolTable(_variables, _variables_index, make_var, (table, ('Vars',)))  # type: ignore
+scope.Methods = SymbolTable(_methods, _methods_index, make_method, (table, ('Methods',)))  # type: ignore
@@ -0,0 +1,98 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Таблицы символов платформы.
+Сущность (объект или метод) хранится один раз, а все ее написания
+(английское, русское) в нижнем регистре ведут к ней через индекс синонимов.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Any
+from collections import namedtuple
+from collections.abc import MutableMapping
+from bsl.ast import Item, GlobalObject, GlobalMethod
+
+Prop = namedtuple('Prop', 'names item')
+
+def attrib(name, runame, context) -> Prop:
+    decl = GlobalObject(name, context)
+    return Prop([name, runame], Item(name, decl))
+
+def method(name, runame, retval, params, context) -> Prop:
+    decl = GlobalMethod(name, retval, params, context)
+    return Prop([name, runame], Item(name, decl))
+
+def aliases(props: List[Prop]) -> Dict[str, Item]:
+    """
+    Индекс синонимов: каждое написание имени в нижнем регистре -> общий Item сущности.
+    """
+    index: Dict[str, Item] = {}
+    for prop in props:
+        for name in prop.names:
+            index[name.lower()] = prop.item
+    return index
+
+class SymbolTable(MutableMapping):
+    """
+    Таблица символов: записи сущностей и индекс синонимов "имя -> номер записи".
+    Item создается из записи при первом обращении по любому из ее имен
+    и далее разделяется всеми синонимами.
+    Имена, присвоенные явно, хранятся отдельно и перекрывают синонимы.
+    Параметр reduce задает, как таблица передается в другой процесс (см. pickle).
+    """
+
+    def __init__(self, entries: Sequence[Tuple[Any, ...]], index: Dict[str, int],
+                 make: Callable[[Tuple[Any, ...]], Item], reduce=None):
+        self.entries = entries
+        self.index = index
+        self.make = make
+        self.reduce = reduce
+        self.items: List[Optional[Item]] = [None] * len(entries)
+        self.extra: Dict[str, Item] = {}
+
+    def get(self, name, default=None):
+        i = self.index.get(name)
+        if i is None:
+            return self.extra.get(name, default)
+        item = self.items[i]
+        if item is None:
+            item = self.items[i] = self.make(self.entries[i])
+        return item
+
+    def __getitem__(self, name) -> Item:
+        item = self.get(name)
+        if item is None:
+            raise KeyError(name)
+        return item
+
+    def __setitem__(self, name, item: Item):
+        self.index.pop(name, None)
+        self.extra[name] = item
+
+    def __delitem__(self, name):
+        found = self.index.pop(name, None) is not None
+        found = self.extra.pop(name, None) is not None or found
+        if not found:
+            raise KeyError(name)
+
+    def __contains__(self, name) -> bool:
+        return name in self.index or name in self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.index
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(self.index) + len(self.extra)
+
+    def __reduce__(self):
+        if self.reduce is not None:
+            return self.reduce
+        return (SymbolTable, (self.entries, self.index, self.make), self.__dict__)
+
+    def entity(self, name) -> Optional[int]:
+        """
+        Номер сущности по любому из ее имен - единый идентификатор для обоих языков.
+        """
+        return self.index.get(name.lower())
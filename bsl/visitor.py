@@ -2,15 +2,17 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from typing import List, Dict, Callable, Any
+from typing import List, Dict, Callable, Any, Optional
 from plugins import Plugin
+from plugins.profile import Profile
 from collections import defaultdict
+import time
 
 Node = Any  # ast.Node импортировать нельзя, ибо питон не умеет циклические зависимости
 
 class Visitor:
 
-    def __init__(self, plugins: List[Plugin]):
+    def __init__(self, plugins: List[Plugin], profile: Optional[Profile] = None):
 
         methods = [func for func in dir(self)
                             if callable(getattr(self, func))
@@ -26,6 +28,15 @@ class Visitor:
                 if hook := getattr(plugin, name, None):
                     hooks.append(hook)
 
+        # профилирование: позиции (плагин, обработчик) в профиле по обработчикам
+        self.profile = profile
+        if profile is not None:
+            self.slots: Dict[str, List[int]] = {
+                name: [profile.slot((type(plugin).__name__, name)) for plugin in plugins if getattr(plugin, name, None)]
+                for name in methods
+            }
+            self.perform = self.perform_profiled # type: ignore
+
         self.stack: List[Node] = []
         self.counters: Dict[type, int] = defaultdict(int)
 
@@ -45,6 +56,17 @@ class Visitor:
             except Exception as e:
                 print(e)  # TODO: писать в log
 
+    def perform_profiled(self, func_name, node):
+        calls, times = self.profile.counters() # type: ignore
+        for hook, slot in zip(self.hooks[func_name], self.slots[func_name]):
+            strt = time.perf_counter()
+            try:
+                hook(node, self.stack, self.counters)
+            except Exception as e:
+                print(e)
+            times[slot] += time.perf_counter() - strt
+            calls[slot] += 1
+
 
     # Module
 
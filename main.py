@@ -2,94 +2,343 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
+"""
+bslinter - анализ конфигурации 1С, выгруженной в файлы.
+Пример: python main.py C:/dev/sonarqube/myprj/src -o bsl-generic-json.json -j 8
+"""
+
 from typing import List, Optional
 
-from md.base import XMLParser
-import md.conf as cf
-import md.visitor
-import bsl.visitor
-import bsl.ast as ast
-from bsl.parser import Parser
-
-import plugins.bsl.comments as comments
-import plugins.bsl.warnings as warnings
-import plugins.bsl.errors as errors
-from plugins.md.conf.translation import DocumentStandardAttributes
-from plugins.md.conf.rights import InteractiveDelete
+from runner.pipeline import Pipeline, BACKENDS, plugin_names
+from runner.daemon import Daemon
+from runner.stats import Stats
+import runner.metrics as metrics
+import runner.workers as workers
+from runner.changes import Cache, Changes, GitError, changed_paths, revision, base, since, check
+from runner.history import History
+from runner.checkpoint import Checkpoint
 import reports.sonar as sonar
+from output.merge import Sorter
+import output.trace as trace
+import output.memory as memory
+import sources
+from sources.git import GitSource
+from sources.archive import open_archive
 
-import time
-import concurrent.futures
+import argparse
 import os.path
+import socket
+import time
 
-def parse(module):
-    if os.path.isfile(module.path):
-        with open(module.path, 'r', encoding='utf-8-sig') as f:
-            src = f.read()
-            parser = Parser(src, module.scope)
-            try:
-                ast = parser.parse()
-                plugins = [
-                    comments.ClosingComments(module.path, src),
-                    comments.CommentedOutCode(module.path, src),
-                    warnings.UnusedVariables(module.path, src),
-                    warnings.EmptyExcept(module.path, src),
-                    warnings.Concatenation(module.path, src),
-                    warnings.StructureConstructor(module.path, src),
-                    errors.DuplicateConditions(module.path, src),
-                ]
-                visitor = bsl.visitor.Visitor(plugins)
-                ast.visit(visitor)
-                results = [p.close().items for p in plugins]
-                return results
-            except Exception as e:
-                print(module.path)
-                print(e)
-
-
-def main():
-
-    issues = []
+def arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='bslinter', description='Анализ конфигурации 1С, выгруженной в файлы.')
+    parser.add_argument('root', help='каталог выгрузки конфигурации или путь к Configuration.xml')
+    parser.add_argument('-o', '--output', default='bsl-generic-json.json',
+                        help='файл отчета в формате Sonar generic issue (по умолчанию %(default)s)')
+    parser.add_argument('--split', type=int, default=None, metavar='MB',
+                        help='делить отчет на файлы не больше указанного размера')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='число рабочих процессов или потоков (по умолчанию по числу ядер)')
+    parser.add_argument('-b', '--backend', choices=BACKENDS, default='process',
+                        help='способ параллельного анализа модулей (по умолчанию %(default)s)')
+    parser.add_argument('--cache', metavar='PATH',
+                        help='кэш результатов по модулям (по умолчанию OUTPUT.cache при --changed)')
+    parser.add_argument('--changed', metavar='REVISIONS',
+                        help='анализировать только модули, затронутые изменениями git в диапазоне (например, main..HEAD), '
+                             'остальные результаты взять из кэша')
+    parser.add_argument('--revision', metavar='REV',
+                        help='читать выгрузку из ревизии git без извлечения файлов; ROOT - путь внутри репозитория')
+    parser.add_argument('--repo', default='.', metavar='PATH',
+                        help='репозиторий git для --revision (по умолчанию текущий каталог)')
+    parser.add_argument('--archive', metavar='PATH',
+                        help='читать выгрузку из архива zip или tar (.tar.gz) без распаковки; ROOT - путь внутри архива')
+    parser.add_argument('--serve', metavar='SOCKET',
+                        help='запустить демон на Unix-сокете (клиент: python -m runner.client)')
+    parser.add_argument('--prefetch', type=int, default=64, metavar='N',
+                        help='читать заранее не больше N модулей (по умолчанию %(default)s)')
+    parser.add_argument('--cpu-budget', type=float, metavar='SEC',
+                        help='пропускать модули, анализ которых занимает больше SEC секунд процессора '
+                             '(процесс после такого модуля заменяется новым)')
+    parser.add_argument('--memory-budget', type=int, metavar='MB',
+                        help='пропускать модули, анализ которых требует больше MB мегабайт памяти')
+    parser.add_argument('--no-dedup', dest='dedup', action='store_false',
+                        help='анализировать одинаковые модули по отдельности')
+    parser.add_argument('--stats', metavar='PATH',
+                        help='записать время по модулям, плагинам и видам метаданных в файл JSON')
+    parser.add_argument('--top', type=int, default=None, metavar='N',
+                        help='вывести N самых медленных модулей и плагинов (по умолчанию 10 при --stats)')
+    parser.add_argument('--sort', action='store_true',
+                        help='упорядочить замечания в отчете по пути и строке (сортировка во временных файлах, '
+                             'память не зависит от числа замечаний)')
+    parser.add_argument('--sort-buffer', type=int, default=100000, metavar='N',
+                        help='замечаний в памяти до сброса во временный файл при --sort (по умолчанию %(default)s)')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='записать трассировку запуска (чтение, разбор, обход модулей, загрузка метаданных, '
+                             'запись отчета по процессам) в файл JSON для chrome://tracing или Perfetto')
+    parser.add_argument('--memory', metavar='PATH',
+                        help='замерить память (пик по процессам, выделения по этапам, объем узлов метаданных и AST) '
+                             'и записать в файл JSON; анализ замедляется в несколько раз')
+    parser.add_argument('--checkpoint', metavar='PATH',
+                        help='сохранять результаты готовых модулей в файл по ходу запуска (удаляется после успешного запуска)')
+    parser.add_argument('--checkpoint-interval', type=float, default=30.0, metavar='SEC',
+                        help='сохранять результаты не реже чем раз в SEC секунд (по умолчанию %(default)s)')
+    parser.add_argument('--resume', action='store_true',
+                        help='продолжить прерванный запуск: взять результаты модулей, текст и области видимости которых '
+                             'не изменились, из контрольной точки (по умолчанию OUTPUT.checkpoint)')
+    parser.add_argument('--history', metavar='PATH',
+                        help='история запусков (sqlite): самые долгие по прошлым запускам модули анализируются первыми '
+                             '(в пределах окна из --prefetch прочитанных модулей, а не по всей конфигурации), '
+                             'выводятся предупреждения о замедлении модулей и плагинов; включает замер плагинов')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='записать метрики в формате Prometheus в файл (для textfile collector); '
+                             'демон обновляет файл после каждого запроса')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help='отдавать метрики в формате Prometheus по HTTP на 127.0.0.1:PORT/metrics')
+    parser.add_argument('-p', '--plugins',
+                        help='плагины через запятую (по умолчанию все): ' + ', '.join(plugin_names()))
+    args = parser.parse_args(argv)
+    if (args.checkpoint or args.resume) and (args.cache or args.changed):
+        parser.error('--checkpoint и --resume несовместимы с --cache и --changed')
+    if args.changed and (error := check(args.root, args.changed)):
+        parser.error(f'--changed: {error}')
+    if args.checkpoint_interval <= 0:
+        parser.error('интервал контрольных точек должен быть положительным')
+    if args.serve is not None and not hasattr(socket, 'AF_UNIX'):
+        parser.error('--serve требует Unix-сокетов, на этой платформе они недоступны')
+    if args.revision is not None and args.archive is not None:
+        parser.error('--revision и --archive несовместимы')
+    if args.archive is not None and not os.path.isfile(args.archive):
+        parser.error(f'не найден архив {args.archive}')
+    if args.revision is None and args.archive is None and not os.path.exists(args.root):
+        parser.error(f'не найден путь {args.root}')
+    if args.plugins is not None:
+        args.plugins = [name.strip() for name in args.plugins.split(',') if name.strip()]
+        if unknown := [name for name in args.plugins if name not in plugin_names()]:
+            parser.error(f'неизвестные плагины: {", ".join(unknown)}')
+    if args.split is not None and args.split < 1:
+        parser.error('размер файла отчета должен быть положительным')
+    if args.metrics_port is not None and not 0 < args.metrics_port < 65536:
+        parser.error('неверный порт метрик')
+    if (args.cpu_budget is not None or args.memory_budget is not None) and (args.backend != 'process' or args.serve):
+        parser.error('бюджеты модулей действуют только при анализе в процессах (-b process, без --serve)')
+    if (args.cpu_budget is not None or args.memory_budget is not None) and not workers.can_fork():
+        parser.error('бюджеты модулей требуют fork, на этой платформе он недоступен')
+    if args.cpu_budget is not None and args.cpu_budget <= 0:
+        parser.error('бюджет процессорного времени должен быть положительным')
+    if args.memory_budget is not None and args.memory_budget < 1:
+        parser.error('бюджет памяти должен быть положительным')
+    if args.sort_buffer < 1:
+        parser.error('размер буфера сортировки должен быть положительным')
+    if args.top is not None and args.top < 1:
+        parser.error('число строк таблицы должно быть положительным')
+    if args.prefetch < 1:
+        parser.error('глубина предварительного чтения должна быть положительной')
+    if args.workers is not None and args.workers < 1:
+        parser.error('число рабочих должно быть положительным')
+    return args
 
-    strt = time.perf_counter()
+def main(argv: Optional[List[str]] = None):
 
-    path = "C:/dev/sonarqube/myprj/src/Configuration.xml"
-    plugins = [
-        DocumentStandardAttributes(),
-        InteractiveDelete(),
-    ]
-    root = XMLParser(path, cf.Root).parse()
-    visitor = md.visitor.Visitor(plugins)
-    mdo: Optional[cf.MetaDataObject] = root.MetaDataObject
-    if mdo is not None and mdo.Configuration is not None:
-        mdo.Configuration.visit(visitor)
+    args = arguments(argv)
 
-    results = [p.close().items for p in plugins]
-    for result in results:
-        for issue in result:
-            issues.append(issue)
+    if args.revision is not None:
+        sources.use(GitSource(args.repo, args.revision))
+    elif args.archive is not None:
+        sources.use(open_archive(args.archive))
 
-    print('md time: ', time.perf_counter() - strt)
+    try:
+        run(args)
+    finally:
+        sources.use(sources.FileSource())
 
-    # -------------------------------------------------------------------------
+def run(args: argparse.Namespace):
+
+    server = metrics.registry.serve(args.metrics_port) if args.metrics_port is not None else None
+    try:
+        lint(args)
+        if args.metrics:
+            metrics.registry.write(args.metrics)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+def lint(args: argparse.Namespace):
+
+    if args.serve:
+        serve(args)
+        return
 
     strt = time.perf_counter()
 
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        results_list = executor.map(parse, visitor.modules)
+    pipeline = Pipeline(args.backend, args.workers, args.plugins, args.dedup, args.prefetch)
+    pipeline.cpu_budget, pipeline.memory_budget = args.cpu_budget, args.memory_budget
+    changes = open_cache(args, pipeline)
+    checkpoint = open_checkpoint(args, pipeline)
+    history = open_history(args, pipeline)
+    limit = args.split * 1024 * 1024 if args.split else None
+    if args.trace:
+        trace.start()
+    if args.memory:
+        memory.start()
+    sorter = Sorter(args.sort_buffer) if args.sort else None
+    try:
+        with sonar.Writer(args.output, limit) as writer:
+            def write(result):
+                with trace.span('write', 'report'), memory.phase('reporting'):
+                    if sorter is not None:
+                        sorter.write(result)
+                    else:
+                        writer.write(result)
+            # модули пишутся по мере готовности, еще во время загрузки метаданных
+            pipeline.sink = write
+            for result in pipeline.run(args.root):
+                write(result)
+            if sorter is not None:
+                with trace.span('write', 'report'), memory.phase('reporting'):
+                    writer.write(sorter)
+        if history is not None:
+            assert pipeline.stats is not None
+            history.save(time.perf_counter() - strt, pipeline.stats.profile)
+        if checkpoint is not None:
+            checkpoint.remove()
+    finally:
+        events = trace.stop()
+        recorder = memory.stop()
+        if history is not None:
+            history.close()
+        if checkpoint is not None:
+            checkpoint.close()
+        if sorter is not None:
+            sorter.close()
+    if args.trace:
+        trace.save(args.trace, events)
+    if changes is not None:
+        changes.result.revision = revision(args.root)
+        changes.result.save(cache_path(args))
+
+    summary(pipeline, writer, sorter, changes, checkpoint if args.resume else None, time.perf_counter() - strt)
+    profile(args, pipeline, history, recorder)
+
+def serve(args: argparse.Namespace):
+    """
+    Режим демона (--serve): конфигурация загружается один раз, модули проверяются по запросам.
+    """
+    daemon = Daemon(args.root, args.workers, args.plugins)
+    daemon.metrics = args.metrics
+    daemon.start()
+    print('modules count: ', len(daemon.modules))
+    try:
+        daemon.serve(args.serve)
+    finally:
+        daemon.stop()
+
+def cache_path(args: argparse.Namespace) -> str:
+    return args.cache or args.output + '.cache'
+
+def open_cache(args: argparse.Namespace, pipeline: Pipeline) -> Optional[Changes]:
+    """
+    Кэш результатов (--cache, --changed): неизмененные модули берутся из него.
+    """
+    if not (args.cache or args.changed):
+        return None
+    cache = Cache.load(cache_path(args))
+    changed = None
+    if args.changed and cache.revision is None:
+        print('cache not found, all modules will be linted')
+    elif args.changed:
+        revisions = args.changed
+        if (start := revision(args.root, base(revisions))) != cache.revision:
+            # иначе модули, измененные между ревизией кэша и началом диапазона, остались бы со старыми результатами
+            revisions = since(revisions, cache.revision)
+            print(f'warning: cache was built at {cache.revision}, range starts at {start}, linting changes in {revisions}')
+        try:
+            changed = changed_paths(args.root, revisions)
+        except GitError:
+            print(f'cache revision {cache.revision} not found, all modules will be linted')
+    changes = Changes(cache, changed)
+    pipeline.reuse = changes.reuse
+    pipeline.store = changes.store
+    return changes
+
+def open_checkpoint(args: argparse.Namespace, pipeline: Pipeline) -> Optional[Checkpoint]:
+    """
+    Контрольная точка (--checkpoint, --resume): прерванный анализ продолжается с нее.
+    """
+    if not (args.checkpoint or args.resume):
+        return None
+    path = args.checkpoint or args.output + '.checkpoint'
+    if args.resume:
+        checkpoint = Checkpoint.load(path, args.checkpoint_interval)
+        pipeline.reuse = checkpoint.reuse
+    else:
+        checkpoint = Checkpoint(path, args.checkpoint_interval)
+    pipeline.store = checkpoint.store
+    return checkpoint
+
+def open_history(args: argparse.Namespace, pipeline: Pipeline) -> Optional[History]:
+    """
+    Статистика плагинов (--stats, --top) и история запусков (--history).
+    """
+    if args.stats or args.top or args.history:
+        pipeline.stats = Stats()
+    if not args.history:
+        return None
+    history = History(args.history)
+    pipeline.cost = history.cost
+    pipeline.record = history.record
+    return history
+
+def summary(pipeline: Pipeline, writer: sonar.Writer, sorter: Optional[Sorter],
+            changes: Optional[Changes], resumed: Optional[Checkpoint], elapsed: float):
+    """
+    Итоги запуска: модули, время, замечания, пропущенные по бюджету модули.
+    """
+    if changes is not None:
+        print('modules reused: ', pipeline.reused)
+    if resumed is not None:
+        print('modules resumed: ', resumed.resumed)
+
+    if pipeline.first is not None:
+        print('first module: ', pipeline.first)
+    print('modules count: ', pipeline.modules)
+    if pipeline.duplicates:
+        print('modules deduplicated: ', f'{pipeline.duplicates} ({pipeline.dedup_ratio:.1%})')
+    print('time: ', elapsed)
+    print('cpu time: ', pipeline.cpu_time)
+    print('io time: ', pipeline.io_time)
+    print('io wait: ', pipeline.io_wait)
+    print('issues count: ', writer.count)
+    for path, budget, timing in pipeline.skipped:
+        if timing is None:
+            print(f'skipped: over budget (worker killed): {path}')
+        else:
+            print(f'skipped: over budget ({budget}): {path} '
+                  f'(cpu {timing.cpu:.2f} s, parse {timing.parse:.2f} s, visit {timing.visit:.2f} s)')
+    if pipeline.recycled:
+        print('workers recycled: ', pipeline.recycled)
+    if len(writer.paths) > 1:
+        print('report files: ', len(writer.paths))
+    if sorter is not None and sorter.spilled:
+        print('sort runs: ', sorter.spilled)
 
-    with open("C:/dev/sonarqube/myprj/bsl-generic-json.json", 'w', encoding='utf-8') as f:
-        for results in results_list:
-            if results:
-                for result in results:
-                    for issue in result:
-                        issues.append(issue)
-        x = sonar.fromIssues(issues)
-        f.write(x.toJSON())
+def profile(args: argparse.Namespace, pipeline: Pipeline, history: Optional[History],
+            recorder: Optional[memory.Recorder]):
+    """
+    Отчеты профилирования: предупреждения истории, статистика плагинов (--stats, --top), память (--memory).
+    """
+    if history is not None:
+        for warning in history.warnings:
+            print(warning)
 
-    print('bsl time: ', time.perf_counter() - strt)
+    if pipeline.stats is not None and (args.stats or args.top):
+        print(pipeline.stats.table(args.top or 10))
+        if args.stats:
+            pipeline.stats.save(args.stats)
 
-    print('issues count: ', len(issues))
+    if recorder is not None:
+        print(recorder.table(args.top or 10))
+        recorder.save(args.memory)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
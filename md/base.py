@@ -3,9 +3,17 @@
 # license that can be found in the LICENSE file.
 
 import xml.parsers.expat
+import importlib.util
+import hashlib
+import marshal
+import os.path
+import sys
+import types
 from enum import EnumMeta
 from typing import Optional, Dict, Tuple, List, Any, get_type_hints, get_args, get_origin # type: ignore
 from md.visitor import Visitor
+import output.trace as trace
+import sources
 
 class TypeDescription:
     def __init__(self, mt, ls):
@@ -52,8 +60,8 @@ class XMLParser:
 
     def parse(self):
 
-        with open(self.path, 'r', encoding='utf-8-sig') as f:
-            src = f.read()
+        with trace.span('XMLParser.parse', 'md', path=self.path):
+            src = sources.read_text(self.path)
             self.parser.Parse(src)
         # self.parser.ParseFile(open(self.path, mode='rb'))  # быстрее, но подглючивает (вставляет лишние переносы строк)
         return self.item
@@ -151,13 +159,106 @@ class XMLParser:
             pass
 
 def fill_types(ns: dict):
-    for cls in ns.values():
-        if type(cls) == type and issubclass(cls, XMLData):
-            hints = get_type_hints(cls)
-            cls._types = {}
-            for name, hint in hints.items():
-                if name != '_types':
-                    args = get_args(hint)
-                    orig = get_origin(hint)
-                    meta = args[0]
-                    cls._types[name] = TypeDescription(meta, orig == list or issubclass(meta, OrderedXMLData))
+    """
+    Заполняет таблицы _types классов модуля по их аннотациям.
+    Вычисление через get_type_hints дорогое, поэтому результат кэшируется
+    в __pycache__ рядом с модулем. Ключ кэша - хэш исходников модулей проекта,
+    от которых зависят аннотации (см. types_cache_key). Устаревший или битый кэш пересчитывается.
+    """
+    classes = {name: cls for name, cls in ns.items()
+                if type(cls) == type and issubclass(cls, XMLData)}
+    path = types_cache_path(ns)
+    key = types_cache_key(ns, classes)
+    if path and key and load_types(classes, path, key):
+        return
+    build_types(classes)
+    if path and key:
+        save_types(classes, path, key)
+
+def build_types(classes: Dict[str, type]):
+    for cls in classes.values():
+        hints = get_type_hints(cls)
+        cls._types = {}
+        for name, hint in hints.items():
+            if name != '_types':
+                args = get_args(hint)
+                orig = get_origin(hint)
+                meta = args[0]
+                cls._types[name] = TypeDescription(meta, orig == list or issubclass(meta, OrderedXMLData))
+
+def types_cache_path(ns: dict) -> Optional[str]:
+    source = ns.get('__file__')
+    if not source:
+        return None
+    try:
+        pyc = importlib.util.cache_from_source(source)
+    except NotImplementedError:
+        return None
+    return os.path.splitext(pyc)[0] + '.types'
+
+# каталог проекта: модули вне его (стандартная библиотека) в ключ кэша не входят
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def types_cache_key(ns: dict, classes: Dict[str, type]) -> Optional[str]:
+    """
+    Хэш исходников модулей, в которых объявлены классы и их предки (OrderedXMLData и т.п.),
+    и модулей, из которых пространство имен берет типы аннотаций (md.common, md.enums и т.п.).
+    """
+    names = {base.__module__ for cls in classes.values() for base in cls.__mro__}
+    for value in ns.values():
+        if isinstance(value, types.ModuleType):
+            names.add(value.__name__)
+        elif isinstance(value, type):
+            names.add(value.__module__)
+    h = hashlib.sha1(sys.version.encode())
+    for name in sorted(names):
+        source = getattr(sys.modules.get(name), '__file__', None)
+        if not source:
+            if name == ns.get('__name__'):
+                return None
+            continue
+        if not os.path.abspath(source).startswith(ROOT + os.sep):
+            continue
+        h.update(name.encode())
+        with open(source, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+def load_types(classes: Dict[str, type], path: str, key: str) -> bool:
+    try:
+        with open(path, 'rb') as f:
+            cached_key, tables = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return False
+    if cached_key != key or tables.keys() != classes.keys():
+        return False
+    try:
+        for name, fields in tables.items():
+            classes[name]._types = {
+                field: TypeDescription(resolve_type(module, qualname), ls)
+                for field, module, qualname, ls in fields
+            }
+    except (KeyError, AttributeError):
+        return False
+    return True
+
+def save_types(classes: Dict[str, type], path: str, key: str):
+    tables = {
+        name: tuple((field, td.meta.__module__, td.meta.__qualname__, td.list)
+                    for field, td in cls._types.items())
+        for name, cls in classes.items()
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}'
+        with open(tmp, 'wb') as f:
+            marshal.dump((key, tables), f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # кэш не обязателен, например каталог только для чтения
+
+def resolve_type(module: str, qualname: str):
+    obj = sys.modules[module]
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
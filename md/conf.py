@@ -14,10 +14,12 @@ from md.common import LocalStringType, LocalStringTypeItem, MDObjectRef, TypeDes
 import md.forms as fm
 import md.rights as rights
 
-from bsl.ast import Item, GlobalObject, Env, VarModDecl
+from bsl.ast import Scope, Item, GlobalObject, Env, VarModDecl
 from bsl.parser import Parser
 
 import md.context as context
+import output.memory as memory
+import sources
 
 import os.path
 
@@ -1049,17 +1051,19 @@ class CommonModuleProperties(XMLData):
             item = Item(self.Name, attribute)
             visitor.scope.Vars[self.Name.lower()] = item
 
-        context.CommonModule.fill(visitor.scope)
+        scope = Scope(visitor.scope)
+        context.CommonModule.fill(scope)
         module_dir, _ = os.path.splitext(self._path)
         module = ModuleFile(
             ModuleKinds.CommonModule,
             os.path.join(module_dir, 'Ext/Module.bsl'),
-            visitor.scope
+            scope,
+            [self._path]
         )
         if self.Global == enums.Bool.TRUE:
             visitor.global_modules.append(module)
         else:
-            visitor.modules.append(module)
+            visitor.add_module(module)
 
         visitor.visit_CommonModuleProperties(self)
         if self.Synonym is not None:
@@ -1198,22 +1202,46 @@ class ConfigurationChildObjects(XMLData):
     def visit(self, visitor: Visitor):
 
         visitor.visit_ConfigurationChildObjects(self)
-        self.visit_Languages(visitor)
-        self.visit_Roles(visitor)
-        self.visit_CommonModules(visitor)
-        self.visit_Documents(visitor)
+        with visitor.phase('Language', len(self.Language or [])):
+            self.visit_Languages(visitor)
+        with visitor.phase('Role', len(self.Role or [])):
+            self.visit_Roles(visitor)
+        with visitor.phase('CommonModule', len(self.CommonModule or [])):
+            self.visit_CommonModules(visitor)
+        with visitor.phase('Interface', len(visitor.global_modules) + 1), memory.phase('scopes', sites=True):
+            self.visit_Interfaces(visitor)
+        visitor.seal()
+        with visitor.phase('Document', len(self.Document or [])):
+            self.visit_Documents(visitor)
         visitor.leave_ConfigurationChildObjects(self)
 
+    def visit_Interfaces(self, visitor: Visitor):
+        """
+        Дополняет область видимости конфигурации экспортом модуля управляемого приложения
+        и глобальных общих модулей.
+        """
         dirname = os.path.dirname(self._path)
         module = ModuleFile(
             ModuleKinds.CommonModule,
             os.path.join(dirname, 'Ext/ManagedApplicationModule.bsl'),
             visitor.scope
         )
-        visitor.modules.append(module)
+        visitor.add_module(module)
+
+        s = sources.read_text(module.path)
+        p = Parser(s, module.scope)
+        try:
+            m = p.parse()
+            for item in m.Interface:
+                if isinstance(item.Decl, VarModDecl):
+                    visitor.scope.Vars[item.Name.lower()] = item
+                else:
+                    visitor.scope.Methods[item.Name.lower()] = item
+        except Exception as e:
+            print(module.path, e)
 
-        with open(module.path, 'r', encoding='utf-8-sig') as f:
-            s = f.read()
+        for module in visitor.global_modules:
+            s = sources.read_text(module.path)
             p = Parser(s, module.scope)
             try:
                 m = p.parse()
@@ -1225,20 +1253,6 @@ class ConfigurationChildObjects(XMLData):
             except Exception as e:
                 print(module.path, e)
 
-        for module in visitor.global_modules:
-            with open(module.path, 'r', encoding='utf-8-sig') as f:
-                s = f.read()
-                p = Parser(s, module.scope)
-                try:
-                    m = p.parse()
-                    for item in m.Interface:
-                        if isinstance(item.Decl, VarModDecl):
-                            visitor.scope.Vars[item.Name.lower()] = item
-                        else:
-                            visitor.scope.Methods[item.Name.lower()] = item
-                except Exception as e:
-                    print(module.path, e)
-
     def visit_Languages(self, visitor: Visitor):
         dirname = os.path.dirname(self._path)
         if names := self.Language:
@@ -1434,7 +1448,7 @@ class DocumentChildObjects(XMLData):
 
     def visit(self, visitor: Visitor):
 
-        scope = visitor.open_scope()
+        scope = visitor.open_scope(self._path)
 
         visitor.visit_DocumentChildObjects(self)
         self.visit_Attributes(visitor)
@@ -1447,7 +1461,7 @@ class DocumentChildObjects(XMLData):
         context.DocumentObject.fill(scope)
 
         modules_dir = os.path.join(os.path.splitext(self._path)[0], 'Ext')
-        visitor.modules.append(
+        visitor.add_module(
             ModuleFile(
                 ModuleKinds.ObjectModule,
                 os.path.join(modules_dir, 'ObjectModule.bsl'),
@@ -1488,7 +1502,7 @@ class Document(XMLFile):
 
     def visit(self, visitor: Visitor):
 
-        visitor.open_scope()
+        visitor.open_scope(self._path)
 
         visitor.visit_Document(self)
         if self.Properties:
@@ -1499,14 +1513,16 @@ class Document(XMLFile):
 
         visitor.close_scope()
 
-        context.DocumentManager.fill(visitor.scope)
+        scope = Scope(visitor.scope)
+        context.DocumentManager.fill(scope)
 
         modules_dir = os.path.join(os.path.splitext(self._path)[0], 'Ext')
-        visitor.modules.append(
+        visitor.add_module(
             ModuleFile(
                 ModuleKinds.ManagerModule,
                 os.path.join(modules_dir, 'ManagerModule.bsl'),
-                visitor.scope
+                scope,
+                [self._path]
             )
         )
 
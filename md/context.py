@@ -2,19 +2,9 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from bsl.ast import Item, GlobalObject, GlobalMethod, GlobalMethodParameter as P, Env
-from collections import namedtuple
-from typing import List
-
-Prop = namedtuple('Prop', 'names item')
-
-def attrib(name, runame, context):
-    decl = GlobalObject(name, context)
-    return Prop([name, runame] , Item(name, decl))
-
-def method(name, runame, retval, params, context):
-    decl = GlobalMethod(name, retval, params, context)
-    return Prop([name, runame] , Item(name, decl))
+from bsl.ast import Item, GlobalMethodParameter as P, Env
+from bsl.symbols import Prop, attrib, method, aliases
+from typing import List, Dict, Tuple
 
 class Context():
 
@@ -22,21 +12,28 @@ class Context():
     attribs: List[Prop] = []
     methods: List[Prop] = []
 
+    @classmethod
+    def index(cls) -> Tuple[Dict[str, Item], Dict[str, Item], Dict[str, Item]]:
+        """
+        Индексы синонимов контекста, строятся один раз на класс.
+        """
+        index = cls.__dict__.get('_index')
+        if index is None:
+            index = (aliases(cls.standard), aliases(cls.attribs), aliases(cls.methods))
+            cls._index = index
+        return index
+
     @classmethod
     def fill(cls, scope):
 
-        for prop in cls.standard:
-            for name in prop.names:
-                if not scope.Vars.get(name):
-                    scope.Vars[name.lower()] = prop.item
+        standard, attribs, methods = cls.index()
 
-        for prop in cls.attribs:
-            for name in prop.names:
-                scope.Vars[name.lower()] = prop.item
+        for name, item in standard.items():
+            if name not in scope.Vars:
+                scope.Vars[name] = item
 
-        for prop in cls.methods:
-            for name in prop.names:
-                scope.Methods[name.lower()] = prop.item
+        scope.Vars.update(attribs)
+        scope.Methods.update(methods)
 
 class ClientApplicationForm(Context):
     # TODO: выделить в отдельный класс расширения формы для документов, справочников и т.д.
@@ -246,7 +246,7 @@ class ManagedForm(XMLData):
 
     def visit(self, visitor: Visitor):
 
-        scope = visitor.open_scope()
+        scope = visitor.open_scope(self._path)
 
         visitor.visit_ManagedForm(self)
         for name in self._subnodes:
@@ -257,11 +257,12 @@ class ManagedForm(XMLData):
         visitor.close_scope()
 
         module_dir, _ = os.path.splitext(self._path)
-        visitor.modules.append(
+        visitor.add_module(
             ModuleFile(
                 ModuleKinds.ManagedFormModule,
                 os.path.join(module_dir, 'Module.bsl'),
-                scope
+                scope,
+                [self._path]
             )
         )
 
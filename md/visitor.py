@@ -3,11 +3,15 @@
 # license that can be found in the LICENSE file.
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Optional, Iterator
+from contextlib import contextmanager
+import time
 from enum import Enum, auto
 from bsl.glob import scope as global_scope
 from bsl.ast import Scope
 from plugins import Plugin
+from plugins.profile import Profile
+import output.trace as trace
 
 class ModuleKinds(Enum):
     ObjectModule = auto()
@@ -17,17 +21,20 @@ class ModuleKinds(Enum):
 
 class ModuleFile:
 
-    def __init__(self, kind, path, scope=None):
+    def __init__(self, kind, path, scope=None, deps=None):
         self.kind: ModuleKinds = kind
         self.path: str = path
         self.scope = scope
+        # файлы метаданных, из которых построена область видимости модуля
+        # (кроме области конфигурации, см. runner.changes)
+        self.deps: List[str] = deps or []
 
     def __repr__(self):
         return f'{self.kind.name}: {self.path}'
 
 class Visitor:
 
-    def __init__(self, plugins: List[Plugin]):
+    def __init__(self, plugins: List[Plugin], profile: Optional[Profile] = None):
 
         methods = [func for func in dir(self)
                             if callable(getattr(self, func))
@@ -43,10 +50,67 @@ class Visitor:
                 if hook := getattr(plugin, name, None):
                     hooks.append(hook)
 
+        # профилирование: позиции (плагин, обработчик) в профиле по обработчикам
+        self.profile = profile
+        if profile is not None:
+            self.slots: Dict[str, List[int]] = {
+                name: [profile.slot((type(plugin).__name__, name)) for plugin in plugins if getattr(plugin, name, None)]
+                for name in methods
+            }
+            self.perform = self.perform_profiled # type: ignore
+
         self.modules: List[ModuleFile] = []
         self.global_modules: List[ModuleFile] = []
 
         self.scope: Scope = global_scope
+        self.sources: List[str] = [] # файлы метаданных открытых областей видимости
+
+        # Вызывается для каждого модуля, область видимости которого готова
+        # (см. seal); позволяет анализировать модули, не дожидаясь загрузки всех метаданных.
+        self.on_ready: Optional[Callable[[ModuleFile], None]] = None
+        self.sealed = False
+
+        # время загрузки по видам объектов метаданных: вид -> [сек., объектов] (см. phase)
+        self.phases: Dict[str, List[float]] = {}
+        self.ready_time = 0.0 # сек. в on_ready
+
+    def add_module(self, module: ModuleFile):
+        module.deps = [path for path in self.sources if path and path not in module.deps] + module.deps
+        self.modules.append(module)
+        if self.sealed and self.on_ready:
+            self.ready(module)
+
+    def ready(self, module: ModuleFile):
+        assert self.on_ready is not None
+        strt = time.perf_counter()
+        self.on_ready(module)
+        self.ready_time += time.perf_counter() - strt
+
+    @contextmanager
+    def phase(self, kind: str, objects: int = 0) -> Iterator[None]:
+        """
+        Учитывает время загрузки объектов вида kind, без времени on_ready.
+        """
+        strt = time.perf_counter()
+        ready = self.ready_time
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            entry = self.phases.setdefault(kind, [0.0, 0])
+            entry[0] += end - strt - (self.ready_time - ready)
+            entry[1] += objects
+            trace.complete(kind, 'metadata', strt, end, objects=objects)
+
+    def seal(self):
+        """
+        Область видимости конфигурации заполнена (общие модули, интерфейсы глобальных модулей).
+        Накопленные модули передаются в on_ready, последующие - по мере добавления.
+        """
+        self.sealed = True
+        if self.on_ready:
+            for module in self.modules:
+                self.ready(module)
 
     def perform(self, func_name, node):
         for hook in self.hooks[func_name]:
@@ -55,15 +119,28 @@ class Visitor:
             except Exception as e:
                 print(e)
 
-    def open_scope(self) -> Scope:
+    def perform_profiled(self, func_name, node):
+        calls, times = self.profile.counters() # type: ignore
+        for hook, slot in zip(self.hooks[func_name], self.slots[func_name]):
+            strt = time.perf_counter()
+            try:
+                hook(node)
+            except Exception as e:
+                print(e)
+            times[slot] += time.perf_counter() - strt
+            calls[slot] += 1
+
+    def open_scope(self, source: str = '') -> Scope:
         scope = Scope(self.scope)
         self.scope = scope
+        self.sources.append(source)
         return scope
 
     def close_scope(self) -> Scope:
         scope = self.scope.Outer
         assert scope is not None
         self.scope = scope
+        self.sources.pop()
         return scope
 
     #region conf
@@ -0,0 +1,247 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Профиль памяти запуска: выделения tracemalloc по этапам (phase), пиковая резидентная память
+основного и рабочих процессов, объем узлов метаданных и AST по типам (census).
+Включается start. Этапы вкладываются друг в друга: прирост и пик выделений относятся
+к самому вложенному открытому этапу. Места выделения (sites=True) - разница снимков
+на границах этапа вместе с вложенными этапами; снимок дорог, поэтому только для крупных этапов.
+Объем узла - sys.getsizeof самого объекта, его __dict__ и контейнеров в атрибутах.
+"""
+
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+from contextlib import nullcontext
+import tracemalloc
+import json
+import sys
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None # type: ignore
+
+NULL = nullcontext()
+
+def peak_rss() -> int:
+    """
+    Пиковая резидентная память текущего процесса, Кб (0, если неизвестна).
+    """
+    if resource is None:
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+#region census
+
+def sizeof(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if (attrs := getattr(obj, '__dict__', None)) is not None:
+        size += sys.getsizeof(attrs)
+        for value in attrs.values():
+            if isinstance(value, (list, dict, tuple)):
+                size += sys.getsizeof(value)
+    return size
+
+def walk(root: Any, types: Tuple[type, ...], exclude: Iterable[Any] = ()) -> Iterator[Any]:
+    """
+    Объекты типов types, достижимые из root через атрибуты, списки и словари
+    (объекты других типов и exclude не обходятся).
+    """
+    seen = {id(obj) for obj in exclude}
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.values())
+            continue
+        if not isinstance(obj, types) or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        yield obj
+        if (attrs := getattr(obj, '__dict__', None)) is not None:
+            stack.extend(attrs.values())
+
+def count(objects: Iterable[Any], types: Tuple[type, ...]) -> Dict[str, List[int]]:
+    """
+    Число и объем объектов типов types по имени класса.
+    """
+    result: Dict[str, List[int]] = {}
+    for obj in objects:
+        if isinstance(obj, types):
+            entry = result.setdefault(type(obj).__name__, [0, 0])
+            entry[0] += 1
+            entry[1] += sizeof(obj)
+    return result
+
+def merge(into: Dict[str, List[int]], other: Dict[str, List[int]]):
+    for name, (n, size) in other.items():
+        entry = into.setdefault(name, [0, 0])
+        entry[0] += n
+        entry[1] += size
+
+#endregion census
+
+class Phase:
+
+    def __init__(self):
+        self.net = 0                     # прирост выделенной памяти, байт
+        self.peak = 0                    # пик выделенной памяти, байт
+        self.sites: Dict[str, int] = {}  # место выделения (файл:строка) -> прирост, байт
+
+class Recorder:
+
+    def __init__(self, frames: int = 1, sites: int = 10):
+        self.limit = sites                      # мест выделения с одной границы этапа
+        self.phases: Dict[str, Phase] = {}
+        self.census: Dict[str, Dict[str, List[int]]] = {} # набор объектов -> тип -> [число, байт]
+        self.rss = 0                                      # пиковая память основного процесса, Кб
+        self.workers: Dict[int, int] = {}                 # pid -> пиковая память, Кб
+        self.modules: List[Tuple[str, int]] = []          # путь, пик выделений при анализе, байт
+        self.stack: List[Tuple[str, Optional[tracemalloc.Snapshot]]] = []
+        self.started = not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start(frames)
+        self.mark = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def switch(self):
+        """
+        Относит выделения с прошлого переключения к текущему этапу.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        if self.stack:
+            phase = self.phases[self.stack[-1][0]]
+            phase.net += current - self.mark
+            phase.peak = max(phase.peak, peak)
+        tracemalloc.reset_peak()
+        self.mark = current
+
+    def snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def enter(self, name: str, sites: bool = False):
+        self.switch()
+        self.phases.setdefault(name, Phase())
+        self.stack.append((name, self.snapshot() if sites else None))
+
+    def exit(self, name: str):
+        self.switch()
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == name:
+                _, before = self.stack.pop(i)
+                break
+        else:
+            return
+        if before is not None and tracemalloc.is_tracing():
+            phase = self.phases[name]
+            diffs = [d for d in self.snapshot().compare_to(before, 'lineno') if d.size_diff > 0]
+            for diff in diffs[:self.limit]:
+                frame = diff.traceback[0]
+                site = f'{frame.filename}:{frame.lineno}'
+                phase.sites[site] = phase.sites.get(site, 0) + diff.size_diff
+
+    def worker(self, path: str, pid: int, rss: int, heap: int, nodes: Optional[Dict[str, List[int]]]):
+        """
+        Учитывает замеры рабочего процесса по одному модулю (см. runner.stats.Timing).
+        """
+        if rss:
+            self.workers[pid] = max(self.workers.get(pid, 0), rss)
+        if heap:
+            self.modules.append((path, heap))
+        if nodes:
+            merge(self.census.setdefault('ast', {}), nodes)
+
+    def close(self):
+        self.switch()
+        self.rss = peak_rss()
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+
+    def table(self, count: int = 10) -> str:
+        lines = [f'peak rss: {self.rss} KB']
+        for pid, rss in sorted(self.workers.items()):
+            lines.append(f'peak rss worker {pid}: {rss} KB')
+        lines.append('memory by phase:')
+        lines.append(f'{"net KB":>10} {"peak KB":>10}  phase')
+        for name, phase in self.phases.items():
+            lines.append(f'{phase.net / 1024:10.1f} {phase.peak / 1024:10.1f}  {name}')
+            for site, size in sorted(phase.sites.items(), key=lambda item: item[1], reverse=True)[:count]:
+                lines.append(f'{size / 1024:10.1f} {"":>10}    {site}')
+        for name, types in self.census.items():
+            lines.append(f'{name} nodes:')
+            lines.append(f'{"KB":>10} {"count":>10}  type')
+            for kind, (n, size) in sorted(types.items(), key=lambda item: item[1][1], reverse=True)[:count]:
+                lines.append(f'{size / 1024:10.1f} {n:10}  {kind}')
+        if self.modules:
+            lines.append('largest modules (peak allocated while analyzed):')
+            for path, heap in sorted(self.modules, key=lambda item: item[1], reverse=True)[:count]:
+                lines.append(f'{heap / 1024:10.1f} KB  {path}')
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'rss': self.rss,
+            'workers': {str(pid): rss for pid, rss in self.workers.items()},
+            'phases': {name: {'net': phase.net, 'peak': phase.peak, 'sites': phase.sites}
+                       for name, phase in self.phases.items()},
+            'census': {name: {kind: {'count': n, 'bytes': size} for kind, (n, size) in types.items()}
+                       for name, types in self.census.items()},
+            'modules': [{'path': path, 'peak': heap}
+                        for path, heap in sorted(self.modules, key=lambda item: item[1], reverse=True)],
+        }
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=1)
+
+current: Optional[Recorder] = None # None - профиль памяти выключен
+
+def start(frames: int = 1) -> Recorder:
+    global current
+    current = Recorder(frames)
+    return current
+
+def stop() -> Optional[Recorder]:
+    global current
+    result, current = current, None
+    if result is not None:
+        result.close()
+    return result
+
+def enabled() -> bool:
+    return current is not None
+
+class Span:
+
+    def __init__(self, recorder: Recorder, name: str, sites: bool):
+        self.recorder = recorder
+        self.name = name
+        self.sites = sites
+
+    def __enter__(self) -> 'Span':
+        self.recorder.enter(self.name, self.sites)
+        return self
+
+    def __exit__(self, *args):
+        self.recorder.exit(self.name)
+
+def phase(name: str, sites: bool = False):
+    """
+    Контекстный менеджер этапа (ничего не делает, если профиль выключен).
+    """
+    if current is None:
+        return NULL
+    return Span(current, name, sites)
+
+def census(name: str, objects: Iterable[Any], types: Tuple[type, ...]):
+    if current is not None:
+        merge(current.census.setdefault(name, {}), count(objects, types))
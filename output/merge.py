@@ -0,0 +1,119 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Сортировка замечаний по пути и строке во внешней памяти.
+Замечания копятся в буфере не больше buffer штук, полный буфер сортируется и
+сбрасывается во временный файл (run) порциями marshal. В конце файлы сливаются
+(heapq.merge, не больше FANIN файлов за проход), в памяти - по порции на файл.
+Порядок полностью определяется замечаниями и не зависит от порядка анализа модулей.
+"""
+
+from typing import List, Tuple, Iterable, Iterator, Optional
+import heapq
+import marshal
+import tempfile
+import os
+
+from output.issues import Issue, Location, Kind, Severity
+import output.trace as trace
+
+# путь, startLine, startColumn, endLine, endColumn, вид, важность, сообщение, трудоемкость
+Key = Tuple[str, int, int, int, int, str, str, str, int]
+
+CHUNK = 4096 # записей в порции файла
+FANIN = 64   # файлов, сливаемых за один проход
+
+def key(issue: Issue) -> Key:
+    location = issue.location
+    return (location.filepath, location.startLine, location.startColumn, location.endLine, location.endColumn,
+            issue.kind.name, issue.severity.name, issue.message, issue.effort)
+
+def issue(item: Key) -> Issue:
+    path, beg_line, beg_column, end_line, end_column, kind, severity, message, effort = item
+    return Issue(Kind[kind], Severity[severity], message, effort,
+                 Location(path, beg_line, end_line, beg_column, end_column))
+
+def read(path: str) -> Iterator[Key]:
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                chunk = marshal.load(f)
+            except EOFError:
+                return
+            yield from chunk
+
+class Sorter:
+
+    def __init__(self, buffer: int = 100000, directory: Optional[str] = None):
+        self.buffer = buffer
+        self.directory = directory # каталог временных файлов (по умолчанию системный)
+        self.items: List[Key] = []
+        self.runs: List[str] = []
+        self.count = 0
+        self.spilled = 0           # сброшено файлов, включая промежуточные слияния
+
+    def __enter__(self) -> 'Sorter':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, issues: Iterable[Issue]):
+        for item in issues:
+            self.items.append(key(item))
+            self.count += 1
+            if len(self.items) >= self.buffer:
+                self.spill()
+
+    def dump(self, items: Iterable[Key]) -> str:
+        fd, path = tempfile.mkstemp(prefix='bslinter-', suffix='.run', dir=self.directory)
+        self.spilled += 1
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                chunk: List[Key] = []
+                for item in items:
+                    chunk.append(item)
+                    if len(chunk) == CHUNK:
+                        marshal.dump(chunk, f)
+                        chunk = []
+                if chunk:
+                    marshal.dump(chunk, f)
+        except BaseException:
+            os.unlink(path)
+            raise
+        return path
+
+    def spill(self):
+        with trace.span('spill', 'report', count=len(self.items)):
+            self.items.sort()
+            self.runs.append(self.dump(self.items))
+            self.items = []
+
+    def __iter__(self) -> Iterator[Issue]:
+        """
+        Все замечания по порядку. Если файлов нет, сортируется только буфер.
+        """
+        if not self.runs:
+            self.items.sort()
+            for item in self.items:
+                yield issue(item)
+            return
+        if self.items:
+            self.spill()
+        with trace.span('merge', 'report', runs=len(self.runs)):
+            while len(self.runs) > FANIN:
+                group, self.runs = self.runs[:FANIN], self.runs[FANIN:]
+                self.runs.append(self.dump(heapq.merge(*map(read, group))))
+                for path in group:
+                    os.unlink(path)
+        for item in heapq.merge(*map(read, self.runs)):
+            yield issue(item)
+
+    def close(self):
+        for path in self.runs:
+            if os.path.exists(path):
+                os.unlink(path)
+        self.runs = []
+        self.items = []
@@ -0,0 +1,98 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Трассировка запуска в формате Trace Event Format (открывается в chrome://tracing и Perfetto).
+Включается start. Отрезки основного процесса пишутся через span, отрезки рабочих процессов
+добавляются через complete по меткам из их результатов: time.perf_counter - монотонные часы,
+общие для всех процессов машины. Выключенная трассировка стоит одного вызова span.
+"""
+
+from typing import List, Dict, Any, Optional
+from contextlib import nullcontext
+import threading
+import json
+import os
+import time
+
+events: Optional[List[Dict[str, Any]]] = None # None - трассировка выключена
+origin = 0.0                                  # perf_counter начала трассировки
+threads: Dict[int, str] = {}                  # потоки основного процесса: id -> имя
+
+NULL = nullcontext()
+
+def start():
+    global events, origin
+    events = []
+    origin = time.perf_counter()
+    threads.clear()
+
+def stop() -> List[Dict[str, Any]]:
+    global events
+    result, events = events or [], None
+    return result
+
+def enabled() -> bool:
+    return events is not None
+
+def complete(name: str, cat: str, begin: float, end: float,
+             pid: Optional[int] = None, tid: Optional[int] = None, **args):
+    """
+    Добавляет завершенный отрезок (событие "X"), время - по time.perf_counter.
+    Без pid и tid - текущий поток основного процесса.
+    """
+    if events is None:
+        return
+    if pid is None:
+        pid = os.getpid()
+    if tid is None:
+        tid = threading.get_native_id()
+        if tid not in threads:
+            threads[tid] = threading.current_thread().name
+    event: Dict[str, Any] = {
+        'name': name, 'cat': cat, 'ph': 'X', 'pid': pid, 'tid': tid,
+        'ts': (begin - origin) * 1e6, 'dur': (end - begin) * 1e6,
+    }
+    if args:
+        event['args'] = args
+    events.append(event)
+
+class Span:
+
+    def __init__(self, name: str, cat: str, args: Dict[str, Any]):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.begin = 0.0
+
+    def __enter__(self) -> 'Span':
+        self.begin = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        complete(self.name, self.cat, self.begin, time.perf_counter(), **self.args)
+
+def span(name: str, cat: str, **args):
+    """
+    Контекстный менеджер отрезка в текущем потоке (ничего не делает, если трассировка выключена).
+    """
+    if events is None:
+        return NULL
+    return Span(name, cat, args)
+
+def metadata(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Имена процессов и потоков для просмотрщика.
+    """
+    main = os.getpid()
+    result: List[Dict[str, Any]] = [{'name': 'process_name', 'ph': 'M', 'pid': main, 'args': {'name': 'bslinter'}}]
+    for pid in sorted({event['pid'] for event in items} - {main}):
+        result.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': f'worker {pid}'}})
+    for tid, name in threads.items():
+        result.append({'name': 'thread_name', 'ph': 'M', 'pid': main, 'tid': tid, 'args': {'name': name}})
+    return result
+
+def save(path: str, items: List[Dict[str, Any]]):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': metadata(items) + items, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
@@ -0,0 +1,75 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Компактная передача замечаний из рабочего процесса в основной.
+Замечания модуля упаковываются в Batch: таблица путей, таблица сообщений
+(каждое уникальное сообщение передается один раз) и плоский массив int,
+по ROW чисел на замечание. Объекты Issue создаются только при обходе Batch.
+"""
+
+from typing import List, Dict, Iterable, Iterator, Tuple
+from array import array
+
+from output.issues import Issue, Location, Kind, Severity
+
+# kind, severity, сообщение, трудоемкость, путь, startLine, endLine, startColumn, endColumn
+ROW = 9
+
+_kinds = list(Kind)
+_severities = list(Severity)
+_kind_index = {kind: i for i, kind in enumerate(_kinds)}
+_severity_index = {severity: i for i, severity in enumerate(_severities)}
+
+class Batch:
+
+    __slots__ = ('paths', 'messages', 'rows')
+
+    def __init__(self, paths: Tuple[str, ...], messages: Tuple[str, ...], rows: array):
+        self.paths = paths
+        self.messages = messages
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows) // ROW
+
+    def __iter__(self) -> Iterator[Issue]:
+        rows, paths, messages = self.rows, self.paths, self.messages
+        for i in range(0, len(rows), ROW):
+            kind, severity, message, effort, path, beg_line, end_line, beg_column, end_column = rows[i:i+ROW]
+            yield Issue(
+                _kinds[kind],
+                _severities[severity],
+                messages[message],
+                effort,
+                Location(paths[path], beg_line, end_line, beg_column, end_column)
+            )
+
+    def __reduce__(self):
+        return Batch, (self.paths, self.messages, self.rows)
+
+    def rebase(self, old: str, new: str) -> 'Batch':
+        """
+        Те же замечания с путем new вместо old (строки и сообщения общие).
+        """
+        return Batch(tuple(new if path == old else path for path in self.paths), self.messages, self.rows)
+
+def pack(issues: Iterable[Issue]) -> Batch:
+    paths: Dict[str, int] = {}
+    messages: Dict[str, int] = {}
+    rows = array('i')
+    for issue in issues:
+        location = issue.location
+        rows.extend((
+            _kind_index[issue.kind],
+            _severity_index[issue.severity],
+            messages.setdefault(issue.message, len(messages)),
+            issue.effort,
+            paths.setdefault(location.filepath, len(paths)),
+            location.startLine,
+            location.endLine,
+            location.startColumn,
+            location.endColumn,
+        ))
+    return Batch(tuple(paths), tuple(messages), rows)
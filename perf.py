@@ -4,43 +4,133 @@
 
 """
 Замер производительности анализа файлов *.bsl.
+Запуск с аргументом imports замеряет время импорта глобального контекста и схем метаданных.
+Запуск с аргументом workers сравнивает запуск рабочих процессов через fork и spawn.
+Запуск с аргументом wire сравнивает передачу замечаний списками Issue и пакетами output.wire.
+Иначе аргумент - путь к выгрузке. Воспроизводимые замеры на синтетической выгрузке - пакет bench.
 """
 
 from bsl.parser import Parser
 from bsl.visitor import Visitor
+from runner.reader import Reader
 
 import time
 import pathlib
+import subprocess
+import sys
 import concurrent.futures
+import collections
+
+def parse(path, s):
+    strt = time.process_time()
+    p = Parser(s)
+    try:
+        AST = p.parse()
+        visitor = Visitor([])
+        AST.visit(visitor) # обход AST в холостую без плагинов
+    except Exception as e:
+        print(f"Не удалось разобрать модуль: {path}")
+    return p.cur_line, time.process_time() - strt
+
+def import_time(module: str) -> float:
+    """
+    Время импорта модуля в чистом процессе интерпретатора (сек.).
+    """
+    code = f'import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)'
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+def imports(count: int = 10):
+    """
+    Замер времени импорта глобального контекста и схем метаданных
+    без кэшей (снимок bsl.glob, таблицы типов md) и с кэшами.
+    """
+    root = pathlib.Path(__file__).parent
+    for module in ['bsl.glob', 'md.rights', 'md.forms', 'md.conf']:
+        cold = []
+        for _ in range(count):
+            for pattern in ['bsl/__pycache__/*.snapshot', 'md/__pycache__/*.types']:
+                for path in root.glob(pattern):
+                    path.unlink()
+            cold.append(import_time(module))
+        warm = [import_time(module) for _ in range(count)]
+        print(f'{module}: без кэша {min(cold)*1000:.1f} мс, с кэшем {min(warm)*1000:.1f} мс')
+
+def startup(workers: int = 4):
+    """
+    Сравнение запуска рабочих процессов: fork с gc.freeze() против spawn.
+    Время - от создания пула до начала работы процесса, память - Кб на процесс.
+    """
+    import md.conf
+    import runner.workers as rw
+    for method in ['fork', 'spawn']:
+        stats = rw.startup(method, workers)
+        starts = [elapsed for elapsed, _ in stats]
+        private = sum(mem['Private'] for _, mem in stats) // len(stats)
+        rss = sum(mem['Rss'] for _, mem in stats) // len(stats)
+        pss = sum(mem['Pss'] for _, mem in stats) // len(stats)
+        print(f'{method}: старт {min(starts)*1000:.0f}-{max(starts)*1000:.0f} мс, '
+              f'Rss {rss} Кб, Pss {pss} Кб, своя {private} Кб')
+
+def transfer(modules: int = 2000, per_module: int = 100):
+    """
+    Передача замечаний из рабочего процесса: pickle списков Issue против output.wire.Batch.
+    """
+    import pickle
+    from output.issues import Issue, Location, Kind, Severity
+    import output.wire as wire
+    results = [
+        [Issue(Kind.CODE_SMELL, Severity.INFO, f'Переменная "П{i % 10}" не используется после присваивания', 2,
+               Location(f'C:/src/CommonModules/Модуль{m}/Ext/Module.bsl', i, i, 5, 15)) for i in range(per_module)]
+        for m in range(modules)
+    ]
+    variants = [
+        ('Issue', lambda issues: [issues], lambda data: pickle.loads(data)[0]),
+        ('Batch', wire.pack, lambda data: list(pickle.loads(data))),
+    ]
+    for name, encode, decode in variants:
+        strt = time.perf_counter()
+        data = [pickle.dumps(encode(issues)) for issues in results]
+        dumped = time.perf_counter() - strt
+        strt = time.perf_counter()
+        count = sum(len(decode(item)) for item in data)
+        loaded = time.perf_counter() - strt
+        print(f'{name}: {sum(map(len, data)) / count:.0f} байт на замечание, '
+              f'упаковка {dumped*1000:.0f} мс, распаковка с созданием Issue {loaded*1000:.0f} мс')
+
+def main(mypath: str = "C:/temp/RUERP24"):
 
-def parse(path):
-    with open(str(path), 'r', encoding='utf-8-sig') as f:
-        s = f.read()
-        p = Parser(s)
-        try:
-            AST = p.parse()
-            visitor = Visitor([])
-            AST.visit(visitor) # обход AST в холостую без плагинов
-        except Exception as e:
-            print(f"Не удалось разобрать модуль: {path}")
-        return p.cur_line
-
-def main():
-
-    mypath = "C:/temp/RUERP24" # путь к выгрузке конфигурации
     print(f"Выполняется анализ файлов *.bsl в папке {mypath}...")
     print("Пожалуйста, дождитесь окончания (это не долго)")
 
     strt = time.perf_counter()
 
-    result = list(pathlib.Path(mypath).rglob("*.[bB][sS][lL]"))
+    paths = [str(path) for path in pathlib.Path(mypath).rglob("*.[bB][sS][lL]")]
 
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        result = executor.map(parse, result)
+    # файлы читаются потоками заранее, процессы получают готовый текст
+    with concurrent.futures.ProcessPoolExecutor() as executor, Reader() as reader:
+        futures = collections.deque()
+        result = []
+        for path, text in reader.iterate(paths):
+            if text is not None:
+                futures.append(executor.submit(parse, path, text.text))
+            while futures and (futures[0].done() or len(futures) >= reader.depth):
+                result.append(futures.popleft().result())
+        result.extend(future.result() for future in futures)
 
     print('Время анализа (сек.):', time.perf_counter() - strt)
+    print('Время процессора (сек.):', sum(cpu for _, cpu in result))
+    print('Время чтения (сек.):', reader.io_time)
+    print('Ожидание чтения (сек.):', reader.io_wait)
 
-    print('Строк исходного кода проанализировано:', sum(result))
+    print('Строк исходного кода проанализировано:', sum(lines for lines, _ in result))
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ['imports']:
+        imports()
+    elif sys.argv[1:] == ['workers']:
+        startup()
+    elif sys.argv[1:] == ['wire']:
+        transfer()
+    else:
+        main(*sys.argv[1:2])
@@ -3,8 +3,9 @@
 # license that can be found in the LICENSE file.
 
 import bsl.ast as ast
-from bsl.enums import Tokens
-from typing import List
+from bsl.enums import Tokens, Keywords, Directives, PrepSymbols, Environments as E
+from typing import List, Dict, Optional
+import re
 from output.issues import Issue, Issues, Kind, Severity, Location, IssueCollector
 import os.path
 
@@ -48,4 +49,165 @@ class DuplicateConditions(IssueCollector):
                 place.BegColumn,
                 place.EndColumn,
             )
-        ))
\ No newline at end of file
+        ))
+
+# Маски окружений в виде int, т.к. операции над IntFlag заметно медленнее.
+# Флаги Client и MobileApplication в описаниях платформы выставлены и у серверных методов,
+# поэтому клиент проверяется по конкретным видам клиентов.
+CLIENT = int(E.THINCLIENT | E.WEBCLIENT | E.THICKCLIENT)
+SERVER = int(E.SERVER)
+ALL = int(E.THINCLIENT | E.WEBCLIENT | E.THICKCLIENT | E.MOBILECLIENT
+          | E.SERVER | E.MOBILESERVER | E.EXTERNALCONNECTION)
+
+directive_env: Dict[Optional[Directives], int] = {
+    Directives.ATCLIENT: CLIENT,
+    Directives.ATSERVER: SERVER,
+    Directives.ATSERVERNOCONTEXT: SERVER,
+    Directives.ATCLIENTATSERVERNOCONTEXT: CLIENT | SERVER,
+    Directives.ATCLIENTATSERVER: CLIENT | SERVER,
+}
+
+prep_symbol_env: Dict[PrepSymbols, int] = {
+    PrepSymbols.CLIENT: CLIENT,
+    PrepSymbols.ATCLIENT: CLIENT,
+    PrepSymbols.ATSERVER: SERVER,
+    PrepSymbols.SERVER: SERVER,
+    PrepSymbols.MOBILEAPPCLIENT: int(E.MOBILECLIENT),
+    PrepSymbols.MOBILEAPPSERVER: int(E.MOBILESERVER),
+    PrepSymbols.THICKCLIENTORDINARYAPPLICATION: int(E.THICKCLIENT),
+    PrepSymbols.THICKCLIENTMANAGEDAPPLICATION: int(E.THICKCLIENT),
+    PrepSymbols.EXTERNALCONNECTION: int(E.EXTERNALCONNECTION),
+    PrepSymbols.THINCLIENT: int(E.THINCLIENT),
+    PrepSymbols.WEBCLIENT: int(E.WEBCLIENT),
+}
+
+def prep_env(expr: ast.PrepExpr) -> int:
+    """
+    Маска окружений, в которых истинно условие инструкции препроцессора.
+    """
+    if isinstance(expr, ast.PrepSymExpr):
+        symbol = PrepSymbols.get(expr.Symbol)
+        return prep_symbol_env.get(symbol, 0) if symbol is not None else 0
+    if isinstance(expr, ast.PrepParenExpr):
+        return prep_env(expr.Expr)
+    if isinstance(expr, ast.PrepNotExpr):
+        return ALL & ~prep_env(expr.Expr)
+    if isinstance(expr, ast.PrepBinaryExpr):
+        if expr.Operator == Keywords.AND:
+            return prep_env(expr.Left) & prep_env(expr.Right)
+        return prep_env(expr.Left) | prep_env(expr.Right)
+    return ALL
+
+def positive(expr: ast.PrepExpr) -> bool:
+    """
+    Сужает ли условие окружение само по себе. Отрицание сужает только уже суженное
+    директивой или другим условием: окружение кода вне них неизвестно, а не ALL.
+    """
+    if isinstance(expr, ast.PrepSymExpr):
+        return True
+    if isinstance(expr, ast.PrepParenExpr):
+        return positive(expr.Expr)
+    if isinstance(expr, ast.PrepBinaryExpr):
+        if expr.Operator == Keywords.AND:
+            return positive(expr.Left) or positive(expr.Right)
+        return positive(expr.Left) and positive(expr.Right)
+    return False
+
+IDENT = re.compile(r'\w+')
+
+class UnavailableMethods(IssueCollector):
+    """
+    Вызовы методов глобального контекста, недоступных в текущем окружении.
+    Окружение определяется директивой метода (&НаКлиенте, &НаСервере...)
+    и блоками препроцессора (#Если Сервер Тогда...), и хранится битовой маской,
+    поэтому проверка вызова - одна операция над масками.
+    Код вне директив и блоков препроцессора не проверяется, как и ветки, окружение которых
+    вне директивы задано только отрицанием (НЕ, #Иначе, см. positive).
+    """
+
+    def __init__(self, path, src):
+        self.path = path
+        self.src = src
+        self.directive = ALL
+        # [маска текущей ветки, объединение масок пройденных веток, сужает ли ветка окружение (см. positive)]
+        self.prep: List[List[int]] = []
+        self.active = 0
+        self.errors: List[Issue] = []
+
+    def close(self) -> Issues:
+        return Issues(self.errors)
+
+    def update(self):
+        env = self.directive
+        narrowed = env != ALL
+        for branch, _, narrows in self.prep:
+            env &= branch
+            narrowed = narrowed or bool(narrows)
+        # если ни директива, ни условие препроцессора окружение не сузили, то проверять не с чем
+        self.active = env if narrowed and env != ALL else 0
+
+    def visit_MethodDecl(self, node: ast.MethodDecl, stack, counters):
+        self.directive = directive_env.get(node.Sign.Directive, ALL)
+        self.update()
+
+    def leave_MethodDecl(self, node: ast.MethodDecl, stack, counters):
+        self.directive = ALL
+        self.update()
+
+    def visit_PrepIfInst(self, node: ast.PrepIfInst, stack, counters):
+        env = prep_env(node.Cond)
+        self.prep.append([env, env, positive(node.Cond)])
+        self.update()
+
+    def visit_PrepElsIfInst(self, node: ast.PrepElsIfInst, stack, counters):
+        if self.prep:
+            frame = self.prep[-1]
+            env = prep_env(node.Cond)
+            frame[0] = env & ~frame[1]
+            frame[1] |= env
+            frame[2] = positive(node.Cond)
+            self.update()
+
+    def visit_PrepElseInst(self, node: ast.PrepElseInst, stack, counters):
+        if self.prep:
+            frame = self.prep[-1]
+            frame[0] = ALL & ~frame[1]
+            frame[2] = False
+            self.update()
+
+    def visit_PrepEndIfInst(self, node: ast.PrepEndIfInst, stack, counters):
+        if self.prep:
+            self.prep.pop()
+            self.update()
+
+    def visit_IdentExpr(self, node: ast.IdentExpr, stack, counters):
+        if not self.active or node.Args is None:
+            return
+        decl = node.Head.Decl
+        if type(decl) is ast.GlobalMethod and self.active & ~decl.EnvMask and decl.EnvMask:
+            missing = self.active & ~decl.EnvMask
+            names = ', '.join(name for i, name in enumerate(ast.Env._fields) if missing >> i & 1)
+            self.issue(f'Метод "{self.spelling(node)}" недоступен в окружении: {names}', node.Place)
+
+    def spelling(self, node: ast.IdentExpr) -> str:
+        """
+        Имя метода так, как оно написано в исходнике (у Item глобального контекста имя английское).
+        """
+        if match := IDENT.match(self.src, node.Place.BegPos):
+            return match.group()
+        return node.Head.Name
+
+    def issue(self, msg, place):
+        self.errors.append(Issue(
+            Kind.BUG,
+            Severity.MAJOR,
+            msg,
+            2,
+            Location(
+                os.path.normpath(self.path),
+                place.BegLine,
+                place.EndLine,
+                place.BegColumn,
+                place.EndColumn,
+            )
+        ))
@@ -198,6 +198,8 @@ class Deprecated(IssueCollector):
         self.path = path
         self.src = src
         self.errors: List[Issue] = []
+        # английские имена: у метода глобального контекста один Item на оба написания,
+        # поэтому вызовы по-русски (ПолучитьФайл) находятся так же
         self.deprecated = [
             'getfiles',
             'getfile',
@@ -0,0 +1,78 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Профиль обработчиков плагинов: число вызовов и суммарное время по паре (плагин, обработчик).
+Заполняется посетителями bsl.visitor.Visitor и md.visitor.Visitor, если профиль им передан.
+Ключи профиля для набора классов плагинов строятся одинаково в любом процессе (см. keys),
+поэтому рабочий процесс передает только массивы чисел, а основной складывает их по позициям (merge).
+"""
+
+from typing import List, Dict, Tuple, Iterable, Any
+from array import array
+
+Key = Tuple[str, str] # имя класса плагина, имя обработчика
+
+def keys(classes: Iterable[type]) -> List[Key]:
+    """
+    Обработчики visit_*/leave_* классов плагинов в определенном порядке.
+    """
+    return [(cls.__name__, name) for cls in classes for name in sorted(dir(cls))
+            if name.startswith(('visit_', 'leave_')) and callable(getattr(cls, name))]
+
+class Profile:
+
+    def __init__(self, initial: Iterable[Key] = ()):
+        self.keys: List[Key] = []
+        self.index: Dict[Key, int] = {}
+        self.calls = array('q')
+        self.times = array('d')
+        for key in initial:
+            self.slot(key)
+
+    def slot(self, key: Key) -> int:
+        """
+        Позиция ключа в массивах (добавляется при первом обращении).
+        """
+        i = self.index.get(key)
+        if i is None:
+            i = self.index[key] = len(self.keys)
+            self.keys.append(key)
+            self.calls.append(0)
+            self.times.append(0.0)
+        return i
+
+    def counters(self) -> Tuple[array, array]:
+        return self.calls, self.times
+
+    def merge(self, calls: Iterable[int], times: Iterable[float]):
+        """
+        Добавляет счетчики другого профиля с теми же первыми ключами.
+        """
+        for i, (n, t) in enumerate(zip(calls, times)):
+            self.calls[i] += n
+            self.times[i] += t
+
+    def plugins(self) -> Dict[str, float]:
+        result: Dict[str, float] = {}
+        for (plugin, _), seconds in zip(self.keys, self.times):
+            result[plugin] = result.get(plugin, 0.0) + seconds
+        return result
+
+    def entries(self) -> List[Tuple[str, str, int, float]]:
+        """
+        Вызывавшиеся обработчики по убыванию времени.
+        """
+        result = [(plugin, hook, n, t) for (plugin, hook), n, t in zip(self.keys, self.calls, self.times) if n]
+        result.sort(key=lambda entry: entry[3], reverse=True)
+        return result
+
+    def table(self, count: int = 10) -> str:
+        lines = ['slowest hooks:', f'{"time":>9} {"calls":>9} {"us/call":>8}  plugin.hook']
+        for plugin, hook, n, t in self.entries()[:count]:
+            lines.append(f'{t:9.4f} {n:9} {t / n * 1e6:8.2f}  {plugin}.{hook}')
+        return '\n'.join(lines)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return [{'plugin': plugin, 'hook': hook, 'calls': n, 'time': t} for plugin, hook, n, t in self.entries()]
@@ -3,9 +3,10 @@
 # license that can be found in the LICENSE file.
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Iterable, BinaryIO
 import output.issues
 import json
+import os.path
 
 class Data:
     def toJSON(self):
@@ -59,4 +60,92 @@ def fromIssues(issues: List[output.issues.Issue]) -> GenericIssueData:
             item.effort
         )
         data.append(issue)
-    return GenericIssueData(data)
\ No newline at end of file
+    return GenericIssueData(data)
+
+#region stream
+
+_dumps = json.JSONEncoder(ensure_ascii=False).encode
+
+def encode(item: output.issues.Issue) -> str:
+    """
+    Замечание в формате Sonar generic issue, те же поля, что и у Issue выше.
+    """
+    location = item.location
+    return (
+        f'{{"engineId": "test", "ruleId": "rule42", '
+        f'"severity": "{item.severity.name}", "type": "{item.kind.name}", '
+        f'"primaryLocation": {{"message": {_dumps(item.message)}, "filePath": {_dumps(location.filepath)}, '
+        f'"textRange": {{"startLine": {location.startLine}, "endLine": {location.endLine}, '
+        f'"startColumn": {location.startColumn}, "endColumn": {location.endColumn}}}}}, '
+        f'"effortMinutes": {item.effort}}}'
+    )
+
+class Writer:
+    """
+    Потоковая запись отчета: замечания пишутся в файл по мере поступления,
+    расход памяти не зависит от их числа.
+    Если задан limit (байт), отчет делится на файлы не больше limit:
+    report.json, report.1.json, report.2.json, ...
+    (файл может превысить limit, только если в нем одно замечание).
+    """
+
+    HEAD = b'{"issues": [\n'
+    TAIL = b'\n]}\n'
+
+    def __init__(self, path: str, limit: Optional[int] = None):
+        self.path = path
+        self.limit = limit
+        self.paths: List[str] = []
+        self.count = 0
+        self.file: Optional[BinaryIO] = None
+        self.size = 0
+        self.items = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def open(self):
+        if self.paths:
+            base, ext = os.path.splitext(self.path)
+            path = f'{base}.{len(self.paths)}{ext}'
+        else:
+            path = self.path
+        self.paths.append(path)
+        self.file = open(path, 'wb')
+        self.file.write(self.HEAD)
+        self.size = len(self.HEAD) + len(self.TAIL)
+        self.items = 0
+
+    def write(self, issues: Iterable[output.issues.Issue]):
+        for item in issues:
+            data = encode(item).encode('utf-8')
+            if self.file is None:
+                self.open()
+            elif self.limit and self.items and self.size + len(data) + 2 > self.limit:
+                self.finish()
+                self.open()
+            assert self.file is not None
+            if self.items:
+                self.file.write(b',\n')
+                self.size += 2
+            self.file.write(data)
+            self.size += len(data)
+            self.items += 1
+            self.count += 1
+
+    def finish(self):
+        assert self.file is not None
+        self.file.write(self.TAIL)
+        self.file.close()
+        self.file = None
+
+    def close(self):
+        if self.file is None and not self.paths:
+            self.open() # пустой отчет
+        if self.file is not None:
+            self.finish()
+
+#endregion stream
@@ -0,0 +1,167 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Анализ только затронутых изменениями модулей.
+Список измененных файлов берется у git по диапазону ревизий. Модуль анализируется заново, если
+изменился он сам или файл метаданных, из которого построена его область видимости (ModuleFile.deps),
+либо изменилась область видимости конфигурации (имена объектов, экспорт глобальных модулей
+и модуля приложения) - тогда анализируются все модули. Для остальных модулей
+берутся результаты прошлого запуска из кэша.
+Кэш пишется после каждого запуска и должен соответствовать началу диапазона ревизий.
+"""
+
+from typing import List, Optional, Dict, Set, Tuple
+from array import array
+import subprocess
+import marshal
+import os
+import os.path
+
+from bsl.ast import Scope
+from md.visitor import ModuleFile
+from output.wire import Batch
+from runner.pipeline import configuration_scope, signature
+from sources import normpath
+
+class GitError(Exception):
+    """
+    Команда git завершилась ошибкой (ROOT вне репозитория, неизвестная ревизия, нет git).
+    """
+
+def directory(root: str) -> str:
+    """
+    Каталог выгрузки: ROOT может быть и путем к Configuration.xml.
+    """
+    return (os.path.dirname(root) or '.') if root.lower().endswith('.xml') else root
+
+def git(root: str, *args: str) -> str:
+    try:
+        return subprocess.run(['git', '-C', directory(root), *args], capture_output=True, text=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise GitError(e.stderr.strip() or str(e)) from e
+    except OSError as e:
+        raise GitError(str(e)) from e
+
+def changed_paths(root: str, revisions: str) -> Set[str]:
+    """
+    Файлы, измененные в диапазоне ревизий (как в git diff), полные пути.
+    """
+    top = git(root, 'rev-parse', '--show-toplevel').strip()
+    names = git(root, '-c', 'core.quotepath=off', 'diff', '--name-only', '-z', revisions)
+    return {normpath(os.path.join(top, name)) for name in names.split('\0') if name}
+
+def revision(root: str, name: str = 'HEAD') -> Optional[str]:
+    try:
+        return git(root, 'rev-parse', '--verify', '--quiet', name + '^{commit}').strip() or None
+    except GitError:
+        return None
+
+def base(revisions: str) -> str:
+    """
+    Начало диапазона: A для A..B и A...B, сама ревизия для A.
+    """
+    return revisions.split('..')[0] or 'HEAD'
+
+def ends(revisions: str) -> List[str]:
+    """
+    Ревизии диапазона: A и B для A..B и A...B, сама ревизия для A.
+    """
+    if '..' not in revisions:
+        return [revisions]
+    return [base(revisions), revisions.split('..', 1)[1].lstrip('.') or 'HEAD']
+
+def since(revisions: str, start: str) -> str:
+    """
+    Тот же диапазон от ревизии start (ревизии кэша, если он построен не на начале диапазона).
+    """
+    return f'{start}..{ends(revisions)[1]}' if '..' in revisions else start
+
+def check(root: str, revisions: str) -> Optional[str]:
+    """
+    Ошибка для --changed или None: ROOT вне репозитория git или неизвестная ревизия диапазона.
+    """
+    try:
+        git(root, 'rev-parse', '--show-toplevel')
+    except GitError as e:
+        return str(e)
+    for name in ends(revisions):
+        if revision(root, name) is None:
+            return f'неизвестная ревизия {name}'
+    return None
+
+# Результат модуля в кэше: пути, сообщения, строки output.wire.Batch.
+Entry = Tuple[Tuple[str, ...], Tuple[str, ...], bytes]
+
+class Cache:
+
+    VERSION = 1
+
+    def __init__(self):
+        self.revision: Optional[str] = None
+        self.signature: Optional[str] = None
+        self.modules: Dict[str, Entry] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'Cache':
+        cache = cls()
+        try:
+            with open(path, 'rb') as f:
+                version, cache.revision, cache.signature, cache.modules = marshal.loads(f.read())
+            if version != cls.VERSION:
+                return cls()
+        except (OSError, EOFError, ValueError, TypeError):
+            return cls()
+        return cache
+
+    def save(self, path: str):
+        tmp = f'{path}.{os.getpid()}'
+        with open(tmp, 'wb') as f:
+            marshal.dump((self.VERSION, self.revision, self.signature, self.modules), f)
+        os.replace(tmp, path)
+
+    def get(self, path: str) -> Optional[Batch]:
+        if (entry := self.modules.get(path)) is None:
+            return None
+        paths, messages, rows = entry
+        return Batch(paths, messages, array('i', rows))
+
+    def put(self, path: str, batch: Batch):
+        self.modules[path] = (batch.paths, batch.messages, batch.rows.tobytes())
+
+class Changes:
+    """
+    Решает по каждому модулю, взять ли результат из кэша (см. Pipeline.reuse),
+    и собирает результаты запуска в новый кэш (см. Pipeline.store).
+    Без диапазона ревизий (changed = None) анализируются все модули.
+    """
+
+    def __init__(self, cache: Cache, changed: Optional[Set[str]] = None):
+        self.cache = cache
+        self.changed = changed
+        self.result = Cache()
+        self.all = changed is None
+        self.affected: List[str] = []
+
+    def check_scope(self, module: ModuleFile):
+        if self.result.signature is None:
+            self.result.signature = signature(configuration_scope(module.scope))
+            if self.result.signature != self.cache.signature:
+                self.all = True
+
+    def reuse(self, module: ModuleFile) -> Optional[Batch]:
+        self.check_scope(module)
+        path = normpath(module.path)
+        batch = None
+        if not self.all:
+            assert self.changed is not None
+            if path not in self.changed and not any(normpath(dep) in self.changed for dep in module.deps):
+                batch = self.cache.get(path)
+        if batch is None:
+            self.affected.append(path)
+        return batch
+
+    def store(self, module: ModuleFile, batch: Batch, digest: Optional[bytes] = None):
+        self.check_scope(module)
+        self.result.put(normpath(module.path), batch)
@@ -0,0 +1,147 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Контрольные точки полного запуска.
+Результаты готовых модулей дописываются в файл порциями не реже раза в interval сек.
+(запись marshal в конец файла, недописанная последняя порция при чтении отбрасывается).
+Первая запись - сигнатура области видимости конфигурации: если метаданные изменились,
+контрольная точка не используется. При продолжении (resume) результат модуля берется
+из файла, только если совпадают хэш его текста и области видимости (см. runner.pipeline.fingerprint),
+иначе модуль анализируется заново. Метаданные при продолжении загружаются снова.
+"""
+
+from typing import Optional, Dict, Tuple, List, BinaryIO, Any
+from array import array
+import marshal
+import time
+import os
+import os.path
+
+from bsl.ast import Scope
+from md.visitor import ModuleFile
+from output.wire import Batch
+from runner.pipeline import configuration_scope, signature, fingerprint
+import sources
+from sources import normpath, content_hash
+
+# путь, хэш текста, fingerprint, пути, сообщения, строки output.wire.Batch
+Entry = Tuple[str, bytes, str, Tuple[str, ...], Tuple[str, ...], bytes]
+
+class Checkpoint:
+
+    VERSION = 1
+
+    def __init__(self, path: str, interval: float = 30.0):
+        self.path = path
+        self.interval = interval
+        self.done: Dict[str, Entry] = {}   # результаты прерванного запуска
+        self.previous: Optional[str] = None # сигнатура конфигурации прерванного запуска
+        self.signature: Optional[str] = None
+        self.pending: List[Entry] = []
+        self.file: Optional[BinaryIO] = None
+        self.last = time.perf_counter()
+        self.scopes: Dict[int, str] = {}    # id области видимости -> fingerprint
+        self.end = 0                        # конец последней целой порции в файле
+        self.resumed = 0
+
+    @classmethod
+    def load(cls, path: str, interval: float = 30.0) -> 'Checkpoint':
+        """
+        Читает контрольную точку прерванного запуска (пустую, если файла нет или он другой версии).
+        """
+        checkpoint = cls(path, interval)
+        try:
+            with open(path, 'rb') as f:
+                header: Any = marshal.load(f)
+                if not isinstance(header, tuple) or header[0] != cls.VERSION:
+                    return checkpoint
+                checkpoint.previous = header[1]
+                checkpoint.end = f.tell()
+                while True:
+                    try:
+                        entries = marshal.load(f)
+                    except (EOFError, ValueError, TypeError):
+                        break
+                    for entry in entries:
+                        checkpoint.done[entry[0]] = entry
+                    checkpoint.end = f.tell()
+        except (OSError, EOFError, ValueError, TypeError):
+            checkpoint.done.clear()
+        return checkpoint
+
+    def fingerprint(self, scope: Scope) -> str:
+        if (result := self.scopes.get(id(scope))) is None:
+            result = self.scopes[id(scope)] = fingerprint(scope)
+        return result
+
+    def open(self, module: ModuleFile):
+        """
+        Начинает файл при первом модуле (область видимости конфигурации уже заполнена).
+        Если конфигурация та же, новые результаты дописываются к прерванному запуску.
+        """
+        self.signature = signature(configuration_scope(module.scope))
+        if self.done and self.signature == self.previous:
+            # недописанная порция прерванного запуска отбрасывается
+            self.file = open(self.path, 'r+b')
+            self.file.truncate(self.end)
+            self.file.seek(self.end)
+            return
+        self.done.clear()
+        self.file = open(self.path, 'wb')
+        marshal.dump((self.VERSION, self.signature), self.file)
+        self.file.flush()
+
+    def reuse(self, module: ModuleFile) -> Optional[Batch]:
+        """
+        Результат модуля из прерванного запуска (см. Pipeline.reuse).
+        """
+        if self.file is None:
+            self.open(module)
+        if (entry := self.done.get(normpath(module.path))) is None:
+            return None
+        _, digest, scope, paths, messages, rows = entry
+        data = sources.current.read(module.path)
+        if data is None or content_hash(data) != digest or self.fingerprint(module.scope) != scope:
+            return None
+        self.resumed += 1
+        return Batch(paths, messages, array('i', rows))
+
+    def store(self, module: ModuleFile, batch: Batch, digest: Optional[bytes]):
+        """
+        Результат модуля (см. Pipeline.store); результаты, взятые из файла (без хэша), уже в нем.
+        """
+        if digest is None:
+            return
+        if self.file is None:
+            self.open(module)
+        self.pending.append((normpath(module.path), digest, self.fingerprint(module.scope),
+                             batch.paths, batch.messages, batch.rows.tobytes()))
+        if time.perf_counter() - self.last >= self.interval:
+            self.flush()
+
+    def flush(self):
+        if self.pending and self.file is not None:
+            marshal.dump(self.pending, self.file)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.pending = []
+        self.last = time.perf_counter()
+
+    def close(self):
+        """
+        Записывает накопленные результаты (в том числе при ошибке запуска).
+        """
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+            self.file = None
+
+    def remove(self):
+        """
+        Удаляет файл после успешного запуска.
+        """
+        self.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
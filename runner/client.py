@@ -0,0 +1,50 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Клиент демона анализа (см. runner.daemon). Импортирует только стандартную библиотеку,
+чтобы запуск из pre-commit и IDE не тратил время на загрузку линтера.
+Запуск: python -m runner.client СОКЕТ ФАЙЛ...
+Код возврата 1, если найдены замечания или ошибки.
+"""
+
+from typing import List, Iterator, Dict, Any
+import socket
+import json
+import sys
+
+def request(address: str, message: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Отправляет запрос демону и возвращает строки ответа по мере поступления.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(address)
+        s.sendall(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+        with s.makefile('rb') as f:
+            for line in f:
+                reply = json.loads(line)
+                yield reply
+                if reply.get('done'):
+                    break
+
+def main(argv: List[str]):
+    if len(argv) < 2:
+        print('использование: python -m runner.client СОКЕТ ФАЙЛ...')
+        return 2
+    if not hasattr(socket, 'AF_UNIX'):
+        print('демон доступен только через Unix-сокет, на этой платформе он не поддерживается')
+        return 2
+    found = 0
+    for reply in request(argv[0], {'lint': argv[1:]}):
+        if 'error' in reply:
+            found += 1
+            print(f'{reply["path"]}: {reply["error"]}')
+        for issue in reply.get('issues', []):
+            found += 1
+            location = issue['primaryLocation']
+            print(f'{location["filePath"]}:{location["textRange"]["startLine"]}: {location["message"]}')
+    return 1 if found else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,188 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Демон анализа: метаданные конфигурации, области видимости и пул рабочих процессов
+загружаются один раз и держатся в памяти, запросы принимаются через Unix-сокет.
+
+Протокол - строки JSON. Запросы:
+    {"lint": ["путь к модулю", ...]}
+    {"stop": true}
+Ответ на lint приходит по мере готовности модулей, по строке на модуль:
+    {"path": "...", "issues": [замечание в формате Sonar generic issue, ...]}
+    {"path": "...", "error": "..."}
+и завершается строкой {"done": true, "modules": N, "time": сек}.
+
+Клиент - runner.client.
+"""
+
+from typing import List, Optional, Iterator, Dict, Tuple, Any
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import socketserver
+import threading
+import json
+import gc
+import os
+import os.path
+import time
+
+from md.visitor import ModuleFile
+import runner.workers as workers
+import runner.metrics as metrics
+from runner.pool import Pool
+import sources
+from sources import normpath
+from runner.pipeline import load
+import reports.sonar as sonar
+
+class Daemon:
+
+    def __init__(self, root: str, count: Optional[int] = None, plugins: Optional[List[str]] = None):
+        self.root = root
+        self.count = count
+        self.plugins = plugins
+        self.modules: List[ModuleFile] = []
+        self.index: Dict[str, int] = {}
+        self.executor: Optional[Executor] = None
+        self.fork = workers.can_fork()
+        self.lock = threading.Lock()
+        self.server: Optional[socketserver.BaseServer] = None
+        self.metrics: Optional[str] = None # файл метрик, обновляется после каждого запроса
+
+    def start(self):
+        """
+        Загружает конфигурацию и запускает пул. Процессы порождаются сразу,
+        пока в основном процессе нет других потоков.
+        При fork пул - runner.pool.Pool: погибший процесс заменяется новым из zygote,
+        и следующие запросы его не замечают. ProcessPoolExecutor (spawn) после гибели
+        процесса пересоздается (см. restart).
+        """
+        workers.select(None if self.plugins is None else [name for name in self.plugins if name in workers.registry])
+        visitor = load(self.root, [])
+        self.modules = visitor.modules
+        self.index = {normpath(module.path): i for i, module in enumerate(self.modules)}
+        if self.fork:
+            workers.modules = self.modules
+            workers.freeze()
+            self.executor = Pool(self.count)
+        else:
+            self.executor = self.spawn()
+        count = self.count or os.cpu_count() or 1
+        for future in [self.executor.submit(os.getpid) for _ in range(count)]:
+            future.result()
+
+    def spawn(self) -> Executor:
+        names = [cls.__name__ for cls in workers.selected]
+        return ProcessPoolExecutor(self.count, mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=workers.init, initargs=(names, sources.current))
+
+    def restart(self, executor: Executor):
+        """
+        Заменяет сломанный пул, если его еще не заменил другой запрос.
+        """
+        with self.lock:
+            if self.executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = Pool(self.count) if self.fork else self.spawn()
+
+    def submit(self, i: int) -> Tuple[Future, Executor]:
+        while True:
+            executor = self.executor
+            assert executor is not None
+            try:
+                if self.fork:
+                    return executor.submit(workers.check_at, i), executor
+                return executor.submit(workers.check_file, self.modules[i]), executor
+            except BrokenProcessPool:
+                self.restart(executor)
+
+    def stop(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+        if self.fork:
+            workers.modules = []
+            gc.unfreeze()
+
+    def lint(self, paths: List[str]) -> Iterator[str]:
+        """
+        Анализирует модули конфигурации, строки ответа выдаются по мере готовности.
+        Модуль читается с диска заново, метаданные остаются загруженными при старте.
+        """
+        assert self.executor is not None
+        strt = time.perf_counter()
+        futures: Dict[Future, Tuple[str, Executor]] = {}
+        for path in paths:
+            i = self.index.get(normpath(path))
+            if i is None:
+                yield json.dumps({'path': path, 'error': 'модуль не найден в конфигурации'}, ensure_ascii=False)
+            else:
+                future, executor = self.submit(i)
+                futures[future] = path, executor
+        metrics.analysis_queue.inc(len(futures))
+        broken: List[Executor] = []
+        for future in as_completed(futures):
+            path, executor = futures[future]
+            metrics.analysis_queue.inc(-1)
+            try:
+                batch, timing = future.result()
+            except BrokenProcessPool as e:
+                # ProcessPoolExecutor после гибели процесса завершает так все свои задачи
+                if executor not in broken:
+                    broken.append(executor)
+                metrics.errors.inc()
+                yield json.dumps({'path': path, 'error': str(e)}, ensure_ascii=False)
+                continue
+            except Exception as e: # в том числе Killed: погиб процесс только этой задачи
+                metrics.errors.inc()
+                yield json.dumps({'path': path, 'error': str(e)}, ensure_ascii=False)
+                continue
+            if timing is not None:
+                metrics.observe(batch, timing, workers.selected)
+            issues = ', '.join(sonar.encode(issue) for issue in batch or [])
+            yield f'{{"path": {json.dumps(path, ensure_ascii=False)}, "issues": [{issues}]}}'
+        for executor in broken:
+            self.restart(executor)
+        elapsed = time.perf_counter() - strt
+        metrics.requests.inc()
+        metrics.request_seconds.inc(elapsed)
+        if self.metrics:
+            metrics.registry.write(self.metrics)
+        yield json.dumps({'done': True, 'modules': len(futures), 'time': elapsed})
+
+    def serve(self, address: str):
+        """
+        Принимает запросы до команды stop.
+        """
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+
+            def handle(self):
+                for line in self.rfile:
+                    request: Dict[str, Any] = json.loads(line)
+                    if request.get('stop'):
+                        self.reply(json.dumps({'done': True}))
+                        threading.Thread(target=server.shutdown).start()
+                        return
+                    for reply in daemon.lint(request.get('lint', [])):
+                        self.reply(reply)
+
+            def reply(self, text: str):
+                self.wfile.write(text.encode('utf-8') + b'\n')
+                self.wfile.flush()
+
+        if os.path.exists(address):
+            os.unlink(address)
+        server = socketserver.ThreadingUnixStreamServer(address, Handler)
+        server.daemon_threads = True
+        self.server = server
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            os.unlink(address)
+            self.server = None
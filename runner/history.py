@@ -0,0 +1,141 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+История запусков в базе sqlite: время анализа каждого модуля (по пути и хэшу содержимого)
+и время обработчиков плагинов за каждый запуск.
+По истории конвейер отправляет на анализ сначала дорогие модули (см. Pipeline.cost),
+а после запуска выводятся предупреждения о модулях, анализ которых заметно замедлился
+при том же содержимом, и о плагинах, у которых выросло время вызова, - обычно это регрессия плагина.
+"""
+
+from typing import List, Optional, Dict, Tuple
+import sqlite3
+import time
+
+from md.visitor import ModuleFile
+from runner.stats import Timing
+from plugins.profile import Profile
+from sources import normpath
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started REAL,
+    seconds REAL,
+    modules INTEGER
+);
+CREATE TABLE IF NOT EXISTS modules (
+    path TEXT,
+    digest BLOB,
+    run INTEGER,
+    size INTEGER,
+    parse REAL,
+    visit REAL,
+    PRIMARY KEY (path, digest)
+);
+CREATE TABLE IF NOT EXISTS plugins (
+    run INTEGER,
+    plugin TEXT,
+    hook TEXT,
+    calls INTEGER,
+    seconds REAL,
+    PRIMARY KEY (run, plugin, hook)
+);
+'''
+
+class History:
+
+    def __init__(self, path: str, growth: float = 2.0, minimum: float = 0.05):
+        self.path = path
+        self.growth = growth    # во сколько раз должно вырасти время для предупреждения
+        self.minimum = minimum  # сек., более быстрые модули не сравниваются (шум)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        self.started = time.time()
+        # последний замер по пути: хэш, размер, сек.
+        self.known: Dict[str, Tuple[bytes, int, float]] = {}
+        for name, digest, size, parse, visit in self.db.execute(
+                'SELECT path, digest, size, parse, visit FROM modules ORDER BY run'):
+            self.known[name] = (digest, size, parse + visit)
+        size = sum(size for _, size, _ in self.known.values())
+        # сек. на байт для модулей без истории
+        self.rate = sum(seconds for _, _, seconds in self.known.values()) / size if size else 0.0
+        self.rows: List[Tuple[str, bytes, int, float, float]] = []
+        self.warnings: List[str] = []
+
+    def __enter__(self) -> 'History':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def cost(self, module: ModuleFile, digest: bytes, size: int) -> float:
+        """
+        Ожидаемое время анализа модуля (см. Pipeline.cost).
+        """
+        if (known := self.known.get(normpath(module.path))) is not None:
+            return known[2]
+        return size * self.rate
+
+    def record(self, module: ModuleFile, digest: bytes, size: int, timing: Timing):
+        """
+        Результат анализа модуля (см. Pipeline.record).
+        """
+        path = normpath(module.path)
+        seconds = timing.parse + timing.visit
+        known = self.known.get(path)
+        if (known is not None and known[0] == digest and known[2] >= self.minimum
+                and seconds > known[2] * self.growth):
+            self.warnings.append(f'warning: {module.path}: analysis time grew {seconds / known[2]:.1f}x '
+                                 f'({known[2]:.3f} -> {seconds:.3f} s) without source change')
+        self.rows.append((path, digest, size, timing.parse, timing.visit))
+
+    def previous(self) -> Optional[int]:
+        row = self.db.execute('SELECT MAX(run) FROM plugins').fetchone()
+        return row[0] if row else None
+
+    def compare(self, profile: Profile):
+        """
+        Предупреждения о плагинах, время вызова которых выросло с прошлого запуска с профилем.
+        """
+        if (run := self.previous()) is None:
+            return
+        before: Dict[str, Tuple[int, float]] = {}
+        for plugin, calls, seconds in self.db.execute(
+                'SELECT plugin, SUM(calls), SUM(seconds) FROM plugins WHERE run = ? GROUP BY plugin', (run,)):
+            before[plugin] = (calls, seconds)
+        after: Dict[str, List[float]] = {}
+        for plugin, _, calls, seconds in profile.entries():
+            entry = after.setdefault(plugin, [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+        for plugin, (calls, seconds) in sorted(after.items()):
+            if (old := before.get(plugin)) is None or not old[0] or not calls or old[1] < self.minimum:
+                continue
+            was, now = old[1] / old[0], seconds / calls
+            if now > was * self.growth:
+                self.warnings.append(f'warning: plugin {plugin}: time per call grew {now / was:.1f}x '
+                                     f'({was * 1e6:.2f} -> {now * 1e6:.2f} us)')
+
+    def save(self, seconds: float, profile: Optional[Profile] = None):
+        """
+        Записывает запуск. Для путей остается только замер последнего содержимого.
+        """
+        if profile is not None:
+            self.compare(profile)
+        with self.db:
+            run = self.db.execute('INSERT INTO runs (started, seconds, modules) VALUES (?, ?, ?)',
+                                  (self.started, seconds, len(self.rows))).lastrowid
+            self.db.executemany('DELETE FROM modules WHERE path = ? AND digest != ?',
+                                [(path, digest) for path, digest, *_ in self.rows])
+            self.db.executemany('INSERT OR REPLACE INTO modules VALUES (?, ?, ?, ?, ?, ?)',
+                                [(path, digest, run, size, parse, visit) for path, digest, size, parse, visit in self.rows])
+            if profile is not None:
+                self.db.executemany('INSERT INTO plugins VALUES (?, ?, ?, ?, ?)',
+                                    [(run, plugin, hook, calls, t) for plugin, hook, calls, t in profile.entries()])
+        self.rows = []
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,150 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Инкрементальная проверка модуля при правке.
+Текст делится на части: заголовок (объявления переменных модуля до первого метода),
+методы и тело модуля. Заново разбирается только изменившаяся часть, в области видимости
+модуля от последнего полного разбора; замечания неизменных частей переносятся
+со сдвигом строк. Правка заголовка или ошибка разбора части ведет к полной проверке.
+Результат может незначительно отличаться от полного (например, при директивах
+препроцессора, охватывающих несколько методов), поэтому после паузы в правках
+следует выполнить полную проверку (см. runner.lsp).
+"""
+
+from typing import List, Optional, Dict, Tuple
+from dataclasses import replace
+import re
+
+from bsl.ast import Scope
+from output.issues import Issue
+import runner.workers as workers
+
+METHOD = re.compile(r'\s*(?:Процедура|Функция|Procedure|Function)\s+(\w+)', re.IGNORECASE)
+END = re.compile(r'\s*(?:КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)\b', re.IGNORECASE)
+PREP_IF = re.compile(r'\s*#\s*(?:Если|If)\b', re.IGNORECASE)
+PREP_ENDIF = re.compile(r'\s*#\s*(?:КонецЕсли|EndIf)\b', re.IGNORECASE)
+DIRECTIVE = re.compile(r'\s*&')
+
+class Chunk:
+
+    def __init__(self, line: int, text: str, names: List[str]):
+        self.line = line # номер первой строки (с 1)
+        self.text = text
+        self.names = names # имена методов в нижнем регистре
+        self.issues: List[Issue] = []
+
+    @property
+    def end(self) -> int:
+        return self.line + self.text.count('\n')
+
+def split(text: str) -> List[Chunk]:
+    """
+    Делит текст модуля на заголовок, методы и тело. Метод заканчивается
+    строкой КонецПроцедуры/КонецФункции вне #Если; директивы и комментарии
+    между методами относятся к следующему методу.
+    """
+    lines = text.splitlines(keepends=True)
+    chunks: List[Chunk] = []
+    start = 0
+    names: List[str] = []
+    depth = 0
+    header = True
+    for i, line in enumerate(lines):
+        if header and (m := METHOD.match(line)):
+            first = i
+            while first > start and DIRECTIVE.match(lines[first - 1]):
+                first -= 1
+            chunks.append(Chunk(1, ''.join(lines[:first]), []))
+            start = first
+            header = False
+        if m := METHOD.match(line):
+            names.append(m.group(1).lower())
+        elif PREP_IF.match(line):
+            depth += 1
+        elif PREP_ENDIF.match(line):
+            depth = max(depth - 1, 0)
+        elif depth == 0 and END.match(line):
+            chunks.append(Chunk(start + 1, ''.join(lines[start:i + 1]), names))
+            start = i + 1
+            names = []
+    if header:
+        chunks.append(Chunk(1, text, []))
+    else:
+        chunks.append(Chunk(start + 1, ''.join(lines[start:]), names))
+    return chunks
+
+def shift(issue: Issue, delta: int) -> Issue:
+    if delta == 0:
+        return issue
+    location = issue.location
+    return replace(issue, location=replace(location, startLine=location.startLine + delta,
+                                           endLine=location.endLine + delta))
+
+class Module:
+    """
+    Состояние проверки одного модуля.
+    """
+
+    def __init__(self, path: str, scope: Optional[Scope] = None):
+        self.path = path
+        self.scope = scope # область видимости модуля из конфигурации
+        self.chunks: List[Chunk] = []
+        self.local: Optional[Scope] = None # область самого модуля от последнего полного разбора
+        self.full = True # последний результат получен полной проверкой
+
+    def issues(self) -> List[Issue]:
+        return [issue for chunk in self.chunks for issue in chunk.issues]
+
+    def check(self, text: str) -> List[Issue]:
+        """
+        Полная проверка текста. Ошибки разбора не перехватываются.
+        """
+        chunks = split(text)
+        ast, self.local = workers.parse(text, self.scope)
+        issues = list(workers.inspect(self.path, text, ast))
+        for chunk in chunks:
+            end = chunk.end
+            chunk.issues = [issue for issue in issues if chunk.line <= issue.location.startLine <= end]
+        # замечания за пределами частей (например, в конце файла) - в последнюю часть
+        rest = [issue for issue in issues if issue.location.startLine > chunks[-1].end]
+        chunks[-1].issues.extend(rest)
+        self.chunks = chunks
+        self.full = True
+        return self.issues()
+
+    def update(self, text: str) -> List[Issue]:
+        """
+        Проверка после правки: разбираются только изменившиеся части.
+        """
+        if self.local is None:
+            return self.check(text)
+        chunks = split(text)
+        old: Dict[str, Chunk] = {chunk.text: chunk for chunk in self.chunks}
+        if chunks[0].text != self.chunks[0].text:
+            return self.check(text)
+        changed: List[Chunk] = []
+        for chunk in chunks:
+            if (prev := old.get(chunk.text)) is not None:
+                chunk.issues = [shift(issue, chunk.line - prev.line) for issue in prev.issues]
+            else:
+                changed.append(chunk)
+        for chunk in changed:
+            try:
+                chunk.issues = self.check_chunk(chunk)
+            except Exception:
+                return self.check(text)
+        self.chunks = chunks
+        self.full = not changed
+        return self.issues()
+
+    def check_chunk(self, chunk: Chunk) -> List[Issue]:
+        assert self.local is not None
+        scope = Scope(self.scope)
+        scope.Vars = dict(self.local.Vars)
+        scope.Methods = {name: item for name, item in self.local.Methods.items() if name not in chunk.names}
+        # пустые строки впереди сохраняют номера строк и колонки
+        src = '\n' * (chunk.line - 1) + chunk.text
+        ast, _ = workers.parse(src, scope)
+        return list(workers.inspect(self.path, src, ast))
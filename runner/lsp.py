@@ -0,0 +1,218 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Сервер Language Server Protocol (транспорт stdio).
+Метаданные конфигурации загружаются один раз при initialize (rootUri),
+после правки буфера заново проверяется только этот модуль с готовой областью видимости,
+а в нем - только изменившиеся методы (см. runner.incremental).
+Проверка откладывается на debounce секунд после последней правки, через settle секунд
+без правок модуль проверяется полностью и замечания уточняются.
+Результат для неизменного текста берется из кэша.
+Запуск: python -m runner.lsp
+"""
+
+from typing import Optional, Dict, Any, List, Tuple, BinaryIO
+from urllib.parse import urlparse, unquote
+from urllib.request import url2pathname, pathname2url
+import threading
+import hashlib
+import json
+import os.path
+import sys
+import time
+
+from bsl.parser import ParserException
+from md.visitor import ModuleFile
+from output.issues import Issue, Severity
+import runner.workers as workers
+from runner.pipeline import load
+from runner.incremental import Module
+
+# Severity -> DiagnosticSeverity (1 - Error, 2 - Warning, 3 - Information, 4 - Hint)
+severities = {
+    Severity.BLOCKER: 1,
+    Severity.CRITICAL: 1,
+    Severity.MAJOR: 2,
+    Severity.MINOR: 2,
+    Severity.INFO: 3,
+}
+
+def uri_path(uri: str) -> str:
+    return os.path.normcase(os.path.abspath(url2pathname(unquote(urlparse(uri).path))))
+
+def path_uri(path: str) -> str:
+    return 'file:' + pathname2url(os.path.abspath(path))
+
+def diagnostic(issue: Issue) -> Dict[str, Any]:
+    location = issue.location
+    return {
+        'range': {
+            'start': {'line': location.startLine - 1, 'character': location.startColumn},
+            'end': {'line': location.endLine - 1, 'character': location.endColumn},
+        },
+        'severity': severities[issue.severity],
+        'source': 'bslinter',
+        'message': issue.message,
+    }
+
+def syntax_error(e: ParserException) -> Dict[str, Any]:
+    position = {'line': e.line - 1, 'character': e.column}
+    return {
+        'range': {'start': position, 'end': position},
+        'severity': 1,
+        'source': 'bslinter',
+        'message': e.text,
+    }
+
+class Server:
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO,
+                 debounce: Optional[float] = 0.05, settle: Optional[float] = 1.0):
+        self.reader = reader
+        self.writer = writer
+        self.debounce = debounce # None - проверять сразу, без таймера
+        self.settle = settle     # None - без полной проверки после паузы
+        self.modules: Dict[str, ModuleFile] = {}
+        self.buffers: Dict[str, str] = {}
+        self.states: Dict[str, Module] = {}
+        self.cache: Dict[str, Tuple[bytes, List[Dict[str, Any]], bool]] = {}
+        self.timers: Dict[str, threading.Timer] = {}   # проверка после правки
+        self.settles: Dict[str, threading.Timer] = {}  # полная проверка после паузы
+        self.lock = threading.Lock()       # одна проверка за раз
+        self.out = threading.Lock()        # запись сообщений
+        self.running = True
+        self.timings: List[float] = []     # сек. на проверку модуля
+
+    #region transport
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        length = 0
+        while True:
+            line = self.reader.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode('ascii').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        return json.loads(self.reader.read(length))
+
+    def send(self, message: Dict[str, Any]):
+        message['jsonrpc'] = '2.0'
+        body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+        with self.out:
+            self.writer.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+            self.writer.flush()
+
+    def serve(self):
+        while self.running and (message := self.read()) is not None:
+            self.handle(message)
+
+    #endregion transport
+
+    def handle(self, message: Dict[str, Any]):
+        method = message.get('method')
+        params = message.get('params') or {}
+        if method == 'initialize':
+            self.initialize(params)
+            self.send({'id': message['id'], 'result': {
+                'capabilities': {'textDocumentSync': {'openClose': True, 'change': 1, 'save': True}},
+                'serverInfo': {'name': 'bslinter'},
+            }})
+        elif method == 'textDocument/didOpen':
+            document = params['textDocument']
+            self.changed(document['uri'], document['text'])
+        elif method == 'textDocument/didChange':
+            # полная синхронизация: последнее изменение содержит весь текст
+            self.changed(params['textDocument']['uri'], params['contentChanges'][-1]['text'])
+        elif method == 'textDocument/didClose':
+            uri = params['textDocument']['uri']
+            self.buffers.pop(uri, None)
+            self.states.pop(uri, None)
+            self.cancel(uri)
+            self.publish(uri, [])
+        elif method == 'shutdown':
+            self.send({'id': message['id'], 'result': None})
+        elif method == 'exit':
+            self.running = False
+        elif 'id' in message and method is not None:
+            self.send({'id': message['id'], 'error': {'code': -32601, 'message': f'Method not found: {method}'}})
+
+    def initialize(self, params: Dict[str, Any]):
+        """
+        Загружает метаданные конфигурации из корня рабочей области, если он указан.
+        """
+        root = params.get('rootUri')
+        if root is None:
+            return
+        path = uri_path(root)
+        if not os.path.isfile(os.path.join(path, 'Configuration.xml')):
+            return
+        visitor = load(path, [])
+        workers.prepare()
+        self.modules = {os.path.normcase(os.path.abspath(module.path)): module for module in visitor.modules}
+
+    def changed(self, uri: str, text: str):
+        self.buffers[uri] = text
+        self.cancel(uri)
+        if self.debounce is None:
+            self.check(uri)
+        else:
+            self.schedule(uri, self.debounce, False)
+
+    def schedule(self, uri: str, delay: float, full: bool):
+        timers = self.settles if full else self.timers
+        timer = timers[uri] = threading.Timer(delay, self.check, (uri, full))
+        timer.daemon = True
+        timer.start()
+
+    def cancel(self, uri: str):
+        for timers in (self.timers, self.settles):
+            if timer := timers.pop(uri, None):
+                timer.cancel()
+
+    def check(self, uri: str, full: bool = False):
+        with self.lock:
+            text = self.buffers.get(uri)
+            if text is None:
+                return
+            strt = time.perf_counter()
+            key = hashlib.sha1(text.encode('utf-8')).digest()
+            cached = self.cache.get(uri)
+            if not full and cached is not None and cached[0] == key:
+                _, diagnostics, exact = cached
+            else:
+                diagnostics, exact = self.analyze(uri, text, full)
+                self.cache[uri] = (key, diagnostics, exact)
+                if full and cached is not None and cached[0] == key and cached[1] == diagnostics:
+                    return # полная проверка подтвердила опубликованное
+            self.timings.append(time.perf_counter() - strt)
+        self.publish(uri, diagnostics)
+        if not exact and self.settle is not None:
+            self.schedule(uri, self.settle, True)
+
+    def analyze(self, uri: str, text: str, full: bool) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Возвращает диагностики и признак того, что они получены полной проверкой.
+        """
+        state = self.states.get(uri)
+        if state is None:
+            path = uri_path(uri)
+            module = self.modules.get(path)
+            state = self.states[uri] = Module(path, module.scope if module is not None else None)
+        try:
+            issues = state.check(text) if full else state.update(text)
+        except ParserException as e:
+            state.local = None
+            return [syntax_error(e)], True
+        return [diagnostic(issue) for issue in issues], state.full
+
+    def publish(self, uri: str, diagnostics: List[Dict[str, Any]]):
+        self.send({'method': 'textDocument/publishDiagnostics', 'params': {'uri': uri, 'diagnostics': diagnostics}})
+
+if __name__ == "__main__":
+    Server(sys.stdin.buffer, sys.stdout.buffer).serve()
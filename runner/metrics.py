@@ -0,0 +1,140 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Метрики линтера в формате Prometheus (text exposition format 0.0.4).
+Счетчики всегда включены: увеличиваются в основном процессе по результатам рабочих
+(см. observe), одно изменение - словарь и блокировка. Экспорт - файл для textfile collector
+(write, запись атомарная) или HTTP (serve, путь /metrics).
+"""
+
+from typing import List, Dict, Tuple, Optional, Iterable
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import threading
+import os
+
+from output.wire import Batch
+from runner.stats import Timing
+
+def escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class Metric:
+
+    def __init__(self, name: str, help: str, kind: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.kind = kind   # counter, gauge
+        self.labels = labels
+        self.values: Dict[Tuple[str, ...], float] = {} if labels else {(): 0.0}
+        self.lock = threading.Lock()
+
+    def inc(self, value: float = 1.0, *labels: str):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0.0) + value
+
+    def set(self, value: float, *labels: str):
+        with self.lock:
+            self.values[labels] = value
+
+    def get(self, *labels: str) -> float:
+        return self.values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.kind}']
+        with self.lock:
+            items = sorted(self.values.items())
+        for labels, value in items:
+            if labels:
+                pairs = ','.join(f'{name}="{escape(label)}"' for name, label in zip(self.labels, labels))
+                lines.append(f'{self.name}{{{pairs}}} {value:g}')
+            else:
+                lines.append(f'{self.name} {value:g}')
+        return lines
+
+class Registry:
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+
+    def add(self, name: str, help: str, kind: str, labels: Tuple[str, ...] = ()) -> Metric:
+        assert name not in self.metrics, name
+        metric = self.metrics[name] = Metric(name, help, kind, labels)
+        return metric
+
+    def counter(self, name: str, help: str, labels: Tuple[str, ...] = ()) -> Metric:
+        return self.add(name, help, 'counter', labels)
+
+    def gauge(self, name: str, help: str, labels: Tuple[str, ...] = ()) -> Metric:
+        return self.add(name, help, 'gauge', labels)
+
+    def render(self) -> str:
+        return ''.join(line + '\n' for metric in self.metrics.values() for line in metric.render())
+
+    def write(self, path: str):
+        """
+        Записывает метрики в файл через временный (collector не увидит файл наполовину).
+        """
+        temp = f'{path}.{os.getpid()}.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(temp, path)
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+        Отдает метрики по HTTP в фоновом потоке. Остановка - shutdown у результата.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='metrics', daemon=True).start()
+        return server
+
+registry = Registry()
+
+runs = registry.counter('bslinter_runs_total', 'Completed configuration runs.')
+run_seconds = registry.gauge('bslinter_run_seconds', 'Duration of the last configuration run.')
+requests = registry.counter('bslinter_requests_total', 'Daemon lint requests.')
+request_seconds = registry.counter('bslinter_request_seconds_total', 'Time spent serving daemon lint requests.')
+modules = registry.counter('bslinter_modules_total', 'Modules analyzed.')
+lines = registry.counter('bslinter_lines_total', 'Lines of analyzed modules.')
+seconds = registry.counter('bslinter_analysis_seconds_total', 'Parse and visit time of analyzed modules, summed over workers.')
+errors = registry.counter('bslinter_errors_total', 'Modules that failed to parse or analyze.')
+over_budget = registry.counter('bslinter_over_budget_total', 'Modules skipped for exceeding the CPU or memory budget, by budget.', ('budget',))
+issues = registry.counter('bslinter_issues_total', 'Issues found, by plugin.', ('plugin',))
+cache_lookups = registry.counter('bslinter_cache_lookups_total', 'Module results looked up in the cache.')
+cache_hits = registry.counter('bslinter_cache_hits_total', 'Module results taken from the cache.')
+duplicates = registry.counter('bslinter_duplicates_total', 'Modules whose issues were copied from an identical module.')
+read_queue = registry.gauge('bslinter_read_queue', 'Modules queued for reading.')
+analysis_queue = registry.gauge('bslinter_analysis_queue', 'Modules submitted for analysis and not finished.')
+
+def observe(batch: Optional[Batch], timing: Timing, plugins: Iterable[type]):
+    """
+    Учитывает результат анализа модуля; plugins - workers.selected (порядок timing.issues).
+    """
+    modules.inc()
+    lines.inc(timing.lines)
+    seconds.inc(timing.parse + timing.visit)
+    if batch is None and not timing.budget: # пропуск по бюджету считается в over_budget
+        errors.inc()
+    for cls, count in zip(plugins, timing.issues):
+        if count:
+            issues.inc(count, cls.__name__)
@@ -0,0 +1,481 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Конвейер анализа конфигурации.
+Загрузка метаданных, поиск модулей и их анализ идут одновременно:
+модуль отправляется на анализ, как только готова его область видимости
+(см. md.visitor.Visitor.seal), а метаданные продолжают загружаться в основном процессе.
+Модули читаются заранее потоками runner.reader и передаются на анализ готовым текстом,
+в обработке одновременно не больше prefetch прочитанных и prefetch отправленных модулей.
+Одинаковые модули (по содержимому и областям видимости, см. fingerprint) анализируются один раз,
+замечания копируются на каждый путь.
+Модули, превысившие бюджет процессорного времени или памяти (см. runner.workers.Budget),
+пропускаются, а процесс, анализировавший модуль, заменяется новым: после прерванного анализа
+в нем могла остаться раздутая куча (см. runner.pool). Бюджеты действуют только с fork.
+"""
+
+from typing import List, Optional, Iterator, Iterable, Dict, Deque, Callable, Tuple
+from collections import deque
+import heapq
+import queue
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import hashlib
+import gc
+import os.path
+import time
+
+from md.base import XMLParser, XMLData
+from md.visitor import ModuleFile
+from bsl.ast import Scope, Item
+from bsl.glob import scope as global_scope
+from output.issues import Issue
+from output.wire import Batch
+import md.conf as cf
+import md.visitor
+import runner.workers as workers
+import runner.metrics as metrics
+from runner.reader import Reader, Text
+from runner.pool import Pool, Killed
+from runner.stats import Stats, Timing
+from plugins.profile import Profile, keys as profile_keys
+import output.trace as trace
+import output.memory as memory
+import sources
+
+from plugins.md.conf.translation import DocumentStandardAttributes
+from plugins.md.conf.rights import InteractiveDelete
+
+# Плагины анализа метаданных по именам.
+registry: Dict[str, type] = {cls.__name__: cls for cls in [
+    DocumentStandardAttributes,
+    InteractiveDelete,
+]}
+
+BACKENDS = ['serial', 'thread', 'process']
+
+def configuration_scope(scope: Scope) -> Scope:
+    """
+    Область видимости конфигурации - последняя перед глобальным контекстом.
+    """
+    while scope.Outer is not None and scope.Outer.Outer is not None:
+        scope = scope.Outer
+    return scope
+
+def signature(scope: Scope) -> str:
+    """
+    Хэш имен и сигнатур области видимости.
+    """
+    h = hashlib.sha1()
+    for kind, table in (('var', scope.Vars), ('method', scope.Methods)):
+        for name in sorted(table):
+            decl = table[name].Decl
+            h.update(f'{kind} {name} {type(decl).__name__}'.encode())
+            for param in getattr(decl, 'Params', None) or []:
+                h.update(f' {param.Name} {getattr(param, "ByVal", None)} {getattr(param, "Value", None) is None}'.encode())
+            h.update(f' {getattr(decl, "Export", None)}\n'.encode())
+    return h.hexdigest()
+
+def fingerprint(scope: Scope) -> str:
+    """
+    Хэш областей видимости модуля до области конфигурации (она общая для всех модулей).
+    """
+    config = configuration_scope(scope)
+    parts = []
+    while scope is not config and scope.Outer is not None:
+        parts.append(signature(scope))
+        scope = scope.Outer
+    return ' '.join(parts)
+
+def plugin_names() -> List[str]:
+    return list(registry) + list(workers.registry)
+
+def load(path: str, plugins: List, on_ready: Optional[Callable[[ModuleFile], None]] = None,
+         profile: Optional[Profile] = None) -> md.visitor.Visitor:
+    """
+    Загружает метаданные конфигурации (каталог выгрузки или Configuration.xml).
+    on_ready вызывается для каждого модуля, как только готова его область видимости.
+    """
+    if not path.lower().endswith('.xml'):
+        path = os.path.join(path, 'Configuration.xml')
+    visitor = md.visitor.Visitor(plugins, profile)
+    visitor.on_ready = on_ready
+    with visitor.phase('Configuration', 1):
+        root = XMLParser(path, cf.Root).parse()
+    mdo: Optional[cf.MetaDataObject] = root.MetaDataObject
+    if mdo is not None and mdo.Configuration is not None:
+        mdo.Configuration.visit(visitor)
+    if memory.enabled():
+        # дерево метаданных еще не освобождено; глобальный контекст не считается
+        types = (XMLData, Scope, Item) + workers.NODES
+        roots = [root, visitor.scope, [module.scope for module in visitor.modules + visitor.global_modules]]
+        memory.census('metadata', memory.walk(roots, types, [global_scope]), types)
+    return visitor
+
+class SerialExecutor(Executor):
+    """
+    Выполняет задачу сразу в вызывающем потоке.
+    """
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+def chain(source: Future, target: Future):
+    """
+    Передает результат source в target по завершении.
+    """
+    def done(future: Future):
+        if future.cancelled():
+            target.cancel()
+        elif (e := future.exception()) is not None:
+            target.set_exception(e)
+        else:
+            target.set_result(future.result())
+    source.add_done_callback(done)
+
+class Job:
+    """
+    Модуль в порядке выдачи: результат анализа (свой или модуля origin, см. dedup)
+    и замечания после обработки (см. Pipeline.finish).
+    """
+
+    __slots__ = ('module', 'future', 'origin', 'done', 'batch')
+
+    def __init__(self, module: ModuleFile, future: Future, origin: ModuleFile):
+        self.module = module
+        self.future: Optional[Future] = future
+        self.origin = origin
+        self.done = False
+        self.batch: Optional[Batch] = None
+
+class Pipeline:
+
+    def __init__(self, backend: str = 'process', count: Optional[int] = None, plugins: Optional[List[str]] = None,
+                 dedup: bool = True, prefetch: int = 64, readers: int = 4):
+        assert backend in BACKENDS
+        self.backend = backend
+        self.count = count
+        if plugins is None:
+            self.md_plugins = list(registry.values())
+            self.bsl_plugins = None
+        else:
+            self.md_plugins = [registry[name] for name in plugins if name in registry]
+            self.bsl_plugins = [name for name in plugins if name in workers.registry]
+        self.executor: Optional[Executor] = None
+        self.prefetch = prefetch
+        self.readers = readers
+        self.reader: Optional[Reader] = None
+        self.inflight: Deque[Future] = deque()
+        self.jobs: Deque[Job] = deque() # модули в порядке выдачи
+        # sink получает замечания модулей по порядку уже во время загрузки метаданных (см. drain),
+        # так в памяти не копятся результаты, готовые раньше конца загрузки (см. main: отчет или output.merge.Sorter)
+        self.sink: Optional[Callable[[Batch], None]] = None
+        self.completed: queue.SimpleQueue = queue.SimpleQueue() # модули с завершенным анализом
+        self.dedup = dedup
+        self.scopes: Dict[int, str] = {} # id области видимости модуля -> fingerprint
+        self.seen: Dict[Tuple[bytes, str], Tuple[ModuleFile, Future]] = {}
+        # reuse возвращает готовый результат модуля (например, из кэша) вместо анализа,
+        # store получает результат каждого модуля и хэш его текста (None, если результат из reuse)
+        # сразу по завершении анализа, еще во время загрузки (см. finish), runner.changes и runner.checkpoint
+        self.reuse: Optional[Callable[[ModuleFile], Optional[Batch]]] = None
+        self.store: Optional[Callable[[ModuleFile, Batch, Optional[bytes]], None]] = None
+        # cost - ожидаемое время анализа модуля по хэшу и размеру текста: прочитанные модули
+        # отправляются на анализ самыми дорогими первыми (в очереди не больше prefetch, поэтому порядок
+        # по стоимости действует только внутри этого окна, а не по всей конфигурации),
+        # record получает время анализа каждого модуля (см. runner.history)
+        self.cost: Optional[Callable[[ModuleFile, bytes, int], float]] = None
+        self.record: Optional[Callable[[ModuleFile, bytes, int, Timing], None]] = None
+        self.queue: List[Tuple[float, int, ModuleFile, Text, Future]] = [] # куча по убыванию cost
+        self.digests: Dict[int, Tuple[bytes, int]] = {} # id модуля -> хэш и размер текста
+        self.frozen = False
+        self.started = 0.0
+        self.first: Optional[float] = None # сек. от запуска до отправки первого модуля
+        self.modules = 0
+        self.reused = 0
+        self.duplicates = 0
+        self.cpu_time = 0.0  # сек. процессора на анализ модулей (сумма по рабочим)
+        self.io_time = 0.0   # сек. чтения модулей (сумма по потокам чтения)
+        self.io_wait = 0.0   # сек. ожидания чтения при отправке на анализ
+        self.stats: Optional[Stats] = None # статистика по модулям, если задана до run
+        # бюджет анализа одного модуля в рабочем процессе: сек. процессора и Мб памяти
+        self.cpu_budget: Optional[float] = None
+        self.memory_budget: Optional[int] = None
+        # пропущенные модули: путь, превышенный бюджет (cpu, memory, killed), время анализа
+        self.skipped: List[Tuple[str, str, Optional[Timing]]] = []
+        self.recycled = 0 # заменено рабочих процессов
+        self.broken = False # пул процессов сломан, ждать его задачи при закрытии нельзя
+
+    def run(self, path: str) -> Iterator[Iterable[Issue]]:
+        """
+        Анализирует конфигурацию (каталог выгрузки или Configuration.xml).
+        Возвращает замечания: сначала по каждому модулю в порядке обнаружения
+        (замечания модуля - output.wire.Batch), затем по метаданным.
+        Если задан sink, готовые по порядку модули передаются ему еще во время загрузки
+        и здесь не возвращаются.
+        """
+        self.started = time.perf_counter()
+        workers.select(self.bsl_plugins)
+        workers.timing = self.stats is not None
+        workers.profile_memory = memory.enabled()
+        workers.cpu_budget, workers.memory_budget = self.cpu_budget, self.memory_budget
+        profile = None
+        if self.stats is not None:
+            # сначала ключи плагинов модулей: рабочие процессы передают счетчики по тем же позициям
+            profile = self.stats.profile = Profile(profile_keys(workers.selected))
+        plugins = [cls() for cls in self.md_plugins]
+        try:
+            with trace.span('metadata', 'metadata', path=path), memory.phase('metadata', sites=True):
+                visitor = load(path, plugins, self.submit, profile)
+            with memory.phase('analysis', sites=True):
+                yield from self.results(visitor, plugins)
+            metrics.runs.inc()
+            metrics.run_seconds.set(time.perf_counter() - self.started)
+        except BrokenProcessPool:
+            self.broken = True
+            raise
+        finally:
+            self.close()
+
+    def results(self, visitor: md.visitor.Visitor, plugins: List) -> Iterator[Iterable[Issue]]:
+        """
+        Результаты модулей по порядку, затем замечания плагинов метаданных.
+        """
+        while self.reader is not None and len(self.reader):
+            self.dispatch(True)
+        self.schedule()
+        if self.stats is not None:
+            self.stats.phases = visitor.phases
+        while self.jobs:
+            job = self.jobs[0]
+            if not job.done:
+                with trace.span('wait', 'pipeline', path=job.module.path):
+                    self.finish(self.completed.get())
+                continue
+            # результат освобождается сразу после выдачи
+            self.jobs.popleft()
+            if job.batch is not None:
+                yield job.batch
+        for p in plugins:
+            yield p.close().items
+
+    def add(self, module: ModuleFile, future: Future, origin: ModuleFile):
+        job = Job(module, future, origin)
+        self.jobs.append(job)
+        future.add_done_callback(lambda _: self.completed.put(job))
+
+    def drain(self):
+        """
+        Обрабатывает модули, анализ которых уже завершен (см. finish), не дожидаясь results,
+        и передает в sink готовое начало очереди.
+        """
+        while True:
+            try:
+                job = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            self.finish(job)
+        if self.sink is not None:
+            while self.jobs and self.jobs[0].done:
+                if (batch := self.jobs.popleft().batch) is not None:
+                    self.sink(batch)
+
+    def finish(self, job: 'Job'):
+        """
+        Учитывает результат модуля сразу по завершении анализа, в любом порядке:
+        метрики, статистика, record, store (контрольная точка и кэш получают модуль сразу).
+        Замечания остаются в job до выдачи по порядку.
+        """
+        module, origin = job.module, job.origin
+        assert job.future is not None
+        try:
+            batch, timing = job.future.result()
+        except Killed:
+            # процесс погиб (например, по RLIMIT_CPU) во время анализа этого модуля, см. runner.pool
+            batch, timing = None, None
+            self.skipped.append((module.path, 'killed', None))
+            if origin is module:
+                metrics.over_budget.inc(1, 'killed')
+        if timing is not None and timing.budget:
+            # копии модуля (см. dedup) пропущены вместе с ним
+            self.skipped.append((module.path, timing.budget, timing))
+            if origin is module:
+                metrics.over_budget.inc(1, timing.budget)
+        if origin is module and timing is not None:
+            self.cpu_time += timing.cpu
+            metrics.observe(batch, timing, workers.selected)
+            if self.stats is not None:
+                self.stats.add(module.path, timing, len(batch) if batch is not None else 0)
+            if trace.enabled():
+                parsed = timing.start + timing.parse
+                trace.complete('parse', 'bsl', timing.start, parsed, timing.pid, timing.tid, path=module.path)
+                trace.complete('visit', 'bsl', parsed, parsed + timing.visit, timing.pid, timing.tid, path=module.path)
+            if memory.current is not None:
+                memory.current.worker(module.path, timing.pid, timing.rss, timing.heap, timing.nodes)
+        digest = self.digests.pop(id(module), None)
+        if self.record and digest is not None and origin is module and timing is not None:
+            self.record(module, digest[0], digest[1], timing)
+        if batch is not None:
+            if origin is not module:
+                batch = batch.rebase(os.path.normpath(origin.path), os.path.normpath(module.path))
+            if self.store:
+                self.store(module, batch, digest[0] if digest is not None else None)
+        job.batch, job.done, job.future = batch, True, None
+
+    def start(self, scope: Scope):
+        """
+        Создает исполнителя. Процессы порождаются fork с первой задачей,
+        поэтому готовая область видимости конфигурации наследуется ими, а не передается.
+        """
+        if self.backend == 'serial':
+            self.executor = SerialExecutor()
+        elif self.backend == 'thread':
+            self.executor = ThreadPoolExecutor(self.count)
+        elif workers.can_fork():
+            workers.share(scope)
+            workers.freeze()
+            self.frozen = True
+            if workers.cpu_budget is not None or workers.memory_budget is not None:
+                # процессы заменяются по одному, их порождает zygote, отделенный до запуска потоков чтения
+                self.executor = Pool(self.count)
+            else:
+                self.executor = ProcessPoolExecutor(self.count, mp_context=multiprocessing.get_context('fork'))
+                # процессы порождаются сразу, до запуска потоков чтения
+                self.executor.submit(os.getpid).result()
+        else:
+            names = [cls.__name__ for cls in workers.selected]
+            self.executor = ProcessPoolExecutor(self.count, mp_context=multiprocessing.get_context('spawn'),
+                                                initializer=workers.init, initargs=(names, sources.current, workers.timing, workers.profile_memory))
+
+    def submit(self, module: ModuleFile):
+        if not sources.exists(module.path):
+            return
+        if self.executor is None:
+            # первый модуль передается после seal, его внешняя область - область конфигурации
+            self.start(configuration_scope(module.scope))
+            self.first = time.perf_counter() - self.started
+            self.reader = Reader(self.readers, self.prefetch)
+        assert self.reader is not None
+        if self.reuse and (batch := self.reuse(module)) is not None:
+            metrics.cache_lookups.inc()
+            metrics.cache_hits.inc()
+            self.reader.put((module, batch), None)
+        else:
+            if self.reuse:
+                metrics.cache_lookups.inc()
+            self.reader.put((module, None), module.path)
+        self.dispatch(self.reader.full())
+
+    def dispatch(self, block: bool = False):
+        """
+        Отправляет на анализ прочитанные модули по порядку (с cost - в очередь по стоимости).
+        При block ждет чтения хотя бы одного.
+        """
+        reader, executor = self.reader, self.executor
+        assert reader is not None and executor is not None
+        while reader.ready() or (block and len(reader)):
+            block = False
+            (module, batch), text = reader.get()
+            if batch is not None:
+                future: Future = Future()
+                future.set_result((batch, None))
+                self.add(module, future, module)
+                self.reused += 1
+                continue
+            if text is None:
+                continue
+            self.digests[id(module)] = text.digest, len(text.text)
+            key = None
+            if self.dedup and module.scope is not None:
+                key = text.digest, self.fingerprint(module.scope)
+                if (seen := self.seen.get(key)) is not None:
+                    origin, future = seen
+                    self.add(module, future, origin)
+                    self.duplicates += 1
+                    metrics.duplicates.inc()
+                    continue
+            if self.cost is None:
+                future = self.analyze(module, text)
+            else:
+                # результат займет место модуля в порядке выдачи, анализ - в порядке стоимости
+                future = Future()
+                heapq.heappush(self.queue, (-self.cost(module, text.digest, len(text.text)), self.modules, module, text, future))
+                if len(self.queue) > self.prefetch:
+                    self.schedule(1)
+            self.add(module, future, module)
+            if key is not None:
+                self.seen[key] = (module, future)
+            self.modules += 1
+        self.drain()
+        self.io_time, self.io_wait = reader.io_time, reader.io_wait
+        metrics.read_queue.set(len(reader))
+        metrics.analysis_queue.set(len(self.inflight))
+
+    def analyze(self, module: ModuleFile, text: Text) -> Future:
+        assert self.executor is not None
+        while self.inflight and (self.inflight[0].done() or len(self.inflight) >= self.prefetch):
+            wait([self.inflight.popleft()])
+        if self.stats is not None:
+            self.stats.read(module.path, text.seconds)
+        future = self.executor.submit(workers.check, module, text.text)
+        self.inflight.append(future)
+        return future
+
+    def schedule(self, count: Optional[int] = None):
+        """
+        Отправляет на анализ отложенные модули (см. cost), самые дорогие первыми.
+        """
+        while self.queue and (count is None or count > 0):
+            _, _, module, text, result = heapq.heappop(self.queue)
+            chain(self.analyze(module, text), result)
+            if count is not None:
+                count -= 1
+
+    def fingerprint(self, scope: Scope) -> str:
+        if (result := self.scopes.get(id(scope))) is None:
+            result = self.scopes[id(scope)] = fingerprint(scope)
+        return result
+
+    @property
+    def dedup_ratio(self) -> float:
+        """
+        Доля модулей, замечания которых взяты у одинакового модуля.
+        """
+        total = self.modules + self.duplicates
+        return self.duplicates / total if total else 0.0
+
+    def close(self):
+        if self.executor is not None:
+            # у сломанного пула процессов нет, ждать нечего
+            self.executor.shutdown(wait=not self.broken, cancel_futures=True)
+            if isinstance(self.executor, Pool):
+                self.recycled = self.executor.replaced
+            self.executor = None
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+        self.inflight.clear()
+        self.jobs.clear()
+        self.completed = queue.SimpleQueue()
+        for *_, result in self.queue:
+            result.cancel()
+        self.queue.clear()
+        self.digests.clear()
+        metrics.read_queue.set(0)
+        metrics.analysis_queue.set(0)
+        self.seen.clear()
+        self.scopes.clear()
+        workers.timing = False
+        workers.profile_memory = False
+        workers.cpu_budget = workers.memory_budget = None
+        if self.frozen:
+            workers.shared.clear()
+            gc.unfreeze()
+            self.frozen = False
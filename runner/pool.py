@@ -0,0 +1,263 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Пул рабочих процессов, в котором гибель процесса затрагивает только его задачу
+(для бюджетов модулей, см. runner.workers.Budget).
+ProcessPoolExecutor при гибели любого процесса ломается целиком, и неизвестно, какую задачу
+тот выполнял. Здесь процесс берет одну задачу за раз: если он завершился, не вернув результат,
+исключением Killed завершается только эта задача, а на место процесса порождается новый.
+Так же заменяется процесс, выставивший runner.workers.retire.
+Новые процессы порождает zygote - процесс, отделенный fork при создании пула, пока в основном
+процессе не запущены потоки чтения (fork многопоточного процесса небезопасен). Zygote наследует
+все, что построено к этому моменту (см. runner.workers), сам потоков не запускает и передает
+каждый новый процесс вместе с его каналом (multiprocessing.reduction.send_handle).
+Только Linux (см. runner.workers.can_fork).
+"""
+
+from typing import List, Optional, Deque, Dict, Tuple, Callable, Any
+from concurrent.futures import Executor, Future, InvalidStateError
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from multiprocessing.reduction import send_handle, recv_handle
+import multiprocessing
+import threading
+import signal
+import os
+import sys
+
+import runner.workers as workers
+
+# результат, функция, позиционные и именованные аргументы
+Task = Tuple[Future, Callable, tuple, Dict[str, Any]]
+
+class Killed(Exception):
+    """
+    Процесс завершился, не вернув результат задачи (например, SIGXCPU по RLIMIT_CPU).
+    """
+
+    def __init__(self, pid: int):
+        super().__init__(f'worker {pid} died')
+        self.pid = pid
+
+def serve(conn: Connection):
+    """
+    Цикл рабочего процесса: задача (функция, аргументы) -> (успех, результат или исключение, retire).
+    """
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        fn, args, kwargs = task
+        try:
+            reply = True, fn(*args, **kwargs)
+        except BaseException as e:
+            reply = False, e
+        try:
+            conn.send((*reply, workers.retire))
+        except OSError:
+            return # пул закрыт
+        except Exception as e: # результат не сериализуется
+            conn.send((False, RuntimeError(f'result is not picklable: {e}'), workers.retire))
+        if workers.retire:
+            return
+
+def zygote(control: Connection, inherited: Connection):
+    """
+    Порождает рабочие процессы по запросу основного процесса, пока тот не закроет канал.
+    inherited - унаследованный при fork конец канала основного процесса: иначе закрытие
+    канала в основном процессе не дошло бы сюда.
+    """
+    inherited.close()
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN) # завершенные процессы не остаются зомби
+    while True:
+        try:
+            control.recv()
+        except EOFError:
+            break
+        parent, child = multiprocessing.Pipe()
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                control.close()
+                parent.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                serve(child)
+            except BaseException:
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        child.close()
+        control.send(pid)
+        send_handle(control, parent.fileno(), 0)
+        parent.close()
+    # пул закрыт: ждет свои процессы, иначе они завершатся сиротами
+    try:
+        while True:
+            os.wait()
+    except ChildProcessError:
+        pass
+
+class Pool(Executor):
+
+    def __init__(self, count: Optional[int] = None):
+        self.count = count or os.cpu_count() or 1
+        self.control, remote = multiprocessing.Pipe()
+        self.zygote = multiprocessing.get_context('fork').Process(target=zygote, args=(remote, self.control), daemon=True)
+        self.zygote.start()
+        remote.close()
+        self.lock = threading.Lock()
+        self.pending: Deque[Task] = deque()
+        self.tasks: Dict[Connection, Optional[Task]] = {} # канал процесса -> его задача (None - простаивает)
+        self.pids: Dict[Connection, int] = {}
+        self.replaced = 0 # процессов заменено: погибших и выставивших retire
+        self.closing = False
+        self.stopped = False
+        self.woken = False # в канале пробуждения уже есть сообщение
+        self.wakeup, self.waker = multiprocessing.Pipe(duplex=False)
+        for _ in range(self.count):
+            self.spawn()
+        self.thread = threading.Thread(target=self.manage, name='pool', daemon=True)
+        self.thread.start()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        with self.lock:
+            if self.closing:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self.pending.append((future, fn, args, kwargs))
+        self.wake()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Как у ProcessPoolExecutor: отправленные задачи дорабатываются (кроме отмененных),
+        затем процессы и zygote завершаются.
+        """
+        with self.lock:
+            self.closing = True
+            if cancel_futures:
+                for future, *_ in self.pending:
+                    future.cancel()
+        self.wake()
+        if wait:
+            self.thread.join()
+
+    def wake(self):
+        with self.lock:
+            if not self.stopped and not self.woken:
+                self.woken = True
+                self.waker.send_bytes(b'')
+
+    def spawn(self):
+        self.control.send(None)
+        pid = self.control.recv()
+        conn = Connection(recv_handle(self.control))
+        self.tasks[conn] = None
+        self.pids[conn] = pid
+
+    def replace(self, conn: Connection):
+        conn.close()
+        del self.tasks[conn], self.pids[conn]
+        self.replaced += 1
+        if not self.closing or self.pending:
+            self.spawn()
+
+    def manage(self):
+        try:
+            while True:
+                self.dispatch()
+                with self.lock:
+                    if self.closing and not self.pending and not any(self.tasks.values()):
+                        break
+                for conn in wait([self.wakeup, *self.tasks]):
+                    if conn is self.wakeup:
+                        with self.lock:
+                            self.woken = False
+                        while conn.poll():
+                            conn.recv_bytes()
+                    else:
+                        self.receive(conn) # type: ignore
+        finally:
+            self.stop()
+
+    def dispatch(self):
+        """
+        Отдает задачи простаивающим процессам.
+        """
+        for conn in [conn for conn, task in self.tasks.items() if task is None]:
+            while True:
+                with self.lock:
+                    if not self.pending:
+                        return
+                    task = self.pending.popleft()
+                # задача, возвращенная после гибели простаивавшего процесса, уже выполняется
+                if task[0].running() or task[0].set_running_or_notify_cancel():
+                    break
+            future, fn, args, kwargs = task
+            try:
+                conn.send((fn, args, kwargs))
+            except OSError: # процесс погиб, пока простаивал
+                with self.lock:
+                    self.pending.appendleft(task)
+                self.replace(conn)
+                self.wake() # задачу возьмет новый процесс
+                continue
+            except Exception as e: # задача не сериализуется
+                future.set_exception(e)
+                continue
+            self.tasks[conn] = task
+
+    def receive(self, conn: Connection):
+        task = self.tasks[conn]
+        try:
+            ok, value, retire = conn.recv()
+        except (EOFError, OSError):
+            # процесс погиб: пропадает только его задача
+            if task is not None:
+                task[0].set_exception(Killed(self.pids[conn]))
+            self.replace(conn)
+            return
+        except Exception as e: # результат не восстанавливается
+            ok, value, retire = False, e, False
+        self.tasks[conn] = None
+        if task is not None:
+            if ok:
+                task[0].set_result(value)
+            else:
+                task[0].set_exception(value)
+        if retire:
+            self.replace(conn)
+
+    def stop(self):
+        """
+        Завершает процессы и zygote. Задачи, оставшиеся после сбоя пула, завершаются BrokenProcessPool.
+        """
+        with self.lock:
+            self.stopped = True
+            left: List[Task] = [*self.pending, *(task for task in self.tasks.values() if task is not None)]
+            self.pending.clear()
+        for future, *_ in left:
+            try:
+                future.set_exception(BrokenProcessPool('worker pool stopped'))
+            except InvalidStateError:
+                pass # отменена
+        for conn in self.tasks:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            conn.close()
+        self.tasks.clear()
+        self.control.close()
+        self.zygote.join()
+        self.wakeup.close()
+        self.waker.close()
@@ -0,0 +1,100 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Предварительное чтение модулей.
+Потоки читают и декодируют следующие модули, пока рабочие процессы заняты разбором,
+и передают готовый текст через ограниченную очередь (не больше depth модулей в памяти).
+Учитывается время чтения (сумма по потокам) и время, которое потребитель ждал чтения.
+"""
+
+from typing import Optional, Deque, Tuple, Any, NamedTuple, Iterable, Iterator
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import time
+
+import output.trace as trace
+import sources
+
+class Text(NamedTuple):
+    digest: bytes  # хэш содержимого файла
+    text: str
+    seconds: float # время чтения и декодирования
+
+def read(path: str) -> Optional[Text]:
+    with trace.span('read', 'io', path=path):
+        strt = time.perf_counter()
+        data = sources.current.read(path)
+        if data is None:
+            return None
+        digest = sources.content_hash(data)
+        return Text(digest, sources.decode(data), time.perf_counter() - strt)
+
+class Reader:
+
+    def __init__(self, threads: int = 4, depth: int = 64):
+        self.executor = ThreadPoolExecutor(threads, thread_name_prefix='reader')
+        self.depth = depth
+        self.pending: Deque[Tuple[Any, Future]] = deque()
+        self.io_time = 0.0 # сек. чтения и декодирования
+        self.io_wait = 0.0 # сек. ожидания чтения потребителем
+
+    def __enter__(self) -> 'Reader':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def put(self, item: Any, path: Optional[str]):
+        """
+        Ставит файл в очередь чтения. Без пути элемент проходит очередь без чтения
+        (сохраняется порядок).
+        """
+        if path is None:
+            future: Future = Future()
+            future.set_result(None)
+        else:
+            future = self.executor.submit(read, path)
+        self.pending.append((item, future))
+
+    def full(self) -> bool:
+        return len(self.pending) >= self.depth
+
+    def ready(self) -> bool:
+        return bool(self.pending) and self.pending[0][1].done()
+
+    def get(self) -> Tuple[Any, Optional[Text]]:
+        """
+        Первый элемент очереди и его текст (ждет окончания чтения).
+        """
+        item, future = self.pending.popleft()
+        if not future.done():
+            strt = time.perf_counter()
+            text = future.result()
+            end = time.perf_counter()
+            self.io_wait += end - strt
+            trace.complete('io wait', 'io', strt, end)
+        else:
+            text = future.result()
+        if text is not None:
+            self.io_time += text.seconds
+        return item, text
+
+    def iterate(self, paths: Iterable[str]) -> Iterator[Tuple[str, Optional[Text]]]:
+        """
+        Тексты файлов по порядку, с чтением не больше чем на depth файлов вперед.
+        """
+        for path in paths:
+            if self.full():
+                yield self.get()
+            self.put(path, path)
+        while self.pending:
+            yield self.get()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+        self.pending.clear()
@@ -0,0 +1,122 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Статистика запуска: время чтения, разбора и обхода каждого модуля, время плагинов,
+число замечаний, время загрузки метаданных по видам объектов, профиль обработчиков
+плагинов (plugins.profile), сложенный по всем рабочим процессам.
+Выводится таблицей самых медленных модулей, плагинов и обработчиков и пишется в файл JSON.
+"""
+
+from typing import List, Dict, Any, Optional, NamedTuple, Tuple
+from array import array
+import json
+
+from plugins.profile import Profile
+
+class Timing(NamedTuple):
+    """
+    Время анализа модуля в рабочем процессе, сек.
+    """
+    cpu: float
+    parse: float
+    visit: float                            # обход AST вместе с плагинами
+    profile: Optional[Tuple[array, array]]  # вызовы и время обработчиков (ключи - plugins.profile.keys(workers.selected))
+    start: float = 0.0                      # time.perf_counter начала разбора (для output.trace)
+    pid: int = 0
+    tid: int = 0
+    rss: int = 0                            # пиковая память процесса, Кб (для output.memory)
+    heap: int = 0                           # пик выделений при анализе, байт (в отдельном процессе)
+    nodes: Optional[Dict[str, List[int]]] = None # узлы AST: тип -> [число, байт]
+    lines: int = 0                          # строк в модуле (для runner.metrics)
+    issues: Tuple[int, ...] = ()            # замечаний по плагинам (порядок workers.selected)
+    budget: str = ''                        # превышенный бюджет (cpu, memory), модуль пропущен
+
+class ModuleStats:
+
+    def __init__(self, path: str, read: float, timing: Timing, plugins: Dict[str, float], issues: int):
+        self.path = path
+        self.read = read
+        self.parse = timing.parse
+        self.visit = timing.visit
+        self.plugins = plugins
+        self.issues = issues
+
+    @property
+    def total(self) -> float:
+        return self.read + self.parse + self.visit
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'read': self.read,
+            'parse': self.parse,
+            'visit': self.visit,
+            'plugins': self.plugins,
+            'issues': self.issues,
+        }
+
+class Stats:
+
+    def __init__(self, profile: Optional[Profile] = None):
+        self.modules: List[ModuleStats] = []
+        self.profile = profile or Profile()
+        self.phases: Dict[str, List[float]] = {} # вид объектов метаданных -> [сек., объектов]
+        self.reads: Dict[str, float] = {}        # сек. чтения модулей, еще не проанализированных
+
+    def read(self, path: str, seconds: float):
+        self.reads[path] = seconds
+
+    @property
+    def plugins(self) -> Dict[str, float]:
+        return self.profile.plugins()
+
+    def add(self, path: str, timing: Timing, issues: int):
+        plugins: Dict[str, float] = {}
+        if timing.profile is not None:
+            calls, times = timing.profile
+            self.profile.merge(calls, times)
+            for (plugin, _), seconds in zip(self.profile.keys, times):
+                plugins[plugin] = plugins.get(plugin, 0.0) + seconds
+        self.modules.append(ModuleStats(path, self.reads.pop(path, 0.0), timing, plugins, issues))
+
+    def slowest(self, count: int) -> List[ModuleStats]:
+        return sorted(self.modules, key=lambda m: m.total, reverse=True)[:count]
+
+    def table(self, count: int = 10) -> str:
+        lines = [f'slowest modules (of {len(self.modules)}):',
+                 f'{"total":>9} {"read":>9} {"parse":>9} {"visit":>9} {"issues":>7}  path']
+        for m in self.slowest(count):
+            lines.append(f'{m.total:9.4f} {m.read:9.4f} {m.parse:9.4f} {m.visit:9.4f} {m.issues:7}  {m.path}')
+        if plugins := self.plugins:
+            total = sum(plugins.values()) or 1.0
+            lines.append('slowest plugins:')
+            lines.append(f'{"time":>9} {"share":>7}  plugin')
+            for name, seconds in sorted(plugins.items(), key=lambda item: item[1], reverse=True)[:count]:
+                lines.append(f'{seconds:9.4f} {seconds / total:7.1%}  {name}')
+            lines.append(self.profile.table(count))
+        if self.phases:
+            lines.append('metadata:')
+            lines.append(f'{"time":>9} {"objects":>7}  kind')
+            for kind, (seconds, objects) in sorted(self.phases.items(), key=lambda item: item[1][0], reverse=True):
+                lines.append(f'{seconds:9.4f} {int(objects):7}  {kind}')
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'modules': [m.to_dict() for m in self.modules],
+            'plugins': self.plugins,
+            'hooks': self.profile.to_list(),
+            'phases': {kind: {'time': seconds, 'objects': int(objects)} for kind, (seconds, objects) in self.phases.items()},
+            'totals': {
+                'read': sum(m.read for m in self.modules),
+                'parse': sum(m.parse for m in self.modules),
+                'visit': sum(m.visit for m in self.modules),
+                'issues': sum(m.issues for m in self.modules),
+            },
+        }
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=1)
@@ -0,0 +1,385 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Рабочие процессы анализа модулей.
+На Linux процессы порождаются через fork после того, как родитель построил все
+неизменяемое состояние: глобальный контекст, области видимости конфигурации, плагины.
+Перед fork вызывается freeze(), чтобы сборщик мусора не обходил унаследованные
+объекты и не портил общие страницы памяти (copy-on-write).
+Задача передается номером модуля, а не сериализованной областью видимости.
+Модули, появившиеся после fork, передаются через pickle, а унаследованные
+области видимости (см. share) сериализуются ссылкой.
+На остальных платформах используется spawn и модули передаются через pickle целиком.
+Бюджет модуля (см. Budget) действует только в рабочем процессе: сторож по таймеру
+ITIMER_PROF и запасные пределы RLIMIT_CPU и RLIMIT_AS.
+"""
+
+from typing import List, Optional, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.reduction import ForkingPickler
+import multiprocessing
+import tracemalloc
+import threading
+import signal
+import gc
+import os.path
+import sys
+import time
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None # type: ignore
+
+from md.visitor import ModuleFile
+from bsl.parser import Parser
+from bsl.glob import scope as global_scope
+from bsl.ast import Scope, Module
+import bsl.visitor
+import bsl.ast
+import output.wire as wire
+import output.memory
+from runner.stats import Timing
+from plugins.profile import Profile, keys as profile_keys
+import sources
+
+import plugins.bsl.comments as comments
+import plugins.bsl.warnings as warnings
+import plugins.bsl.errors as errors
+
+# Плагины анализа модулей по именам.
+registry: Dict[str, type] = {cls.__name__: cls for cls in [
+    comments.ClosingComments,
+    comments.CommentedOutCode,
+    warnings.UnusedVariables,
+    warnings.EmptyExcept,
+    warnings.Concatenation,
+    warnings.StructureConstructor,
+    errors.DuplicateConditions,
+    errors.UnavailableMethods,
+]}
+
+# Плагины, выбранные для анализа (наследуются рабочими процессами при fork).
+selected: List[type] = list(registry.values())
+
+def select(names: Optional[List[str]]):
+    global selected
+    selected = list(registry.values()) if names is None else [registry[name] for name in names]
+
+# Профилирование обработчиков плагинов (см. runner.stats), наследуется при fork.
+timing = False
+# Замеры памяти по модулям (см. output.memory), наследуется при fork.
+profile_memory = False
+
+# Бюджет анализа одного модуля (см. Budget), наследуется при fork (при spawn бюджетов нет).
+cpu_budget: Optional[float] = None # сек. процессорного времени
+memory_budget: Optional[int] = None # Мб прироста резидентной памяти
+# Процесс завершается после текущей задачи (см. runner.pool): после анализа сверх бюджета
+# в нем могла остаться раздутая куча.
+retire = False
+
+# Узлы AST для подсчета объема (см. output.memory.walk).
+NODES = (bsl.ast.Node, bsl.ast.Place, bsl.ast.Comment)
+
+def init(names: Optional[List[str]], source: sources.Source, timed: bool = False, memory: bool = False):
+    """
+    Начальная настройка процесса, порожденного spawn.
+    """
+    global timing, profile_memory
+    select(names)
+    sources.use(source)
+    timing = timed
+    profile_memory = memory
+
+#region budget
+
+class OverBudget(BaseException):
+    """
+    Не Exception: иначе его перехватывали бы обработчики ошибок плагинов (см. bsl.visitor).
+    """
+
+    def __init__(self, budget: str):
+        super().__init__(f'over {budget} budget')
+        self.budget = budget
+
+def statm(field: int) -> int:
+    """
+    Поле /proc/self/statm в байтах: 0 - адресное пространство, 1 - резидентная память (0, если неизвестно).
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[field]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+class Budget:
+    """
+    Пределы на время анализа модуля в рабочем процессе.
+    Сторож - таймер ITIMER_PROF: каждые TICK сек. процессорного времени проверяет
+    прирост резидентной памяти и прерывает анализ исключением OverBudget, когда исчерпано
+    cpu_budget сек. или прирост больше memory_budget Мб.
+    Запасные пределы ядра на случай, когда сигнал не обрабатывается (зависание в C-коде)
+    или память выделена разом: RLIMIT_CPU (SIGXCPU завершает процесс, в основном процессе
+    это runner.pool.Killed) и RLIMIT_AS (MemoryError) с двойным бюджетом.
+    """
+
+    TICK = 0.01
+    SPARE = 64 * 1024 * 1024 # запас адресного пространства сверх двойного бюджета, байт
+
+    def __init__(self):
+        self.active = ((cpu_budget is not None or memory_budget is not None)
+                       and resource is not None and hasattr(signal, 'setitimer')
+                       and multiprocessing.parent_process() is not None
+                       and threading.current_thread() is threading.main_thread())
+        self.handler = None
+        self.armed = False # сторож прерывает анализ только до выхода из with
+        self.left = 0.0   # сек. процессора до исчерпания бюджета
+        self.resident = 0 # предел резидентной памяти, байт
+        self.tick = 0.0
+        self.cpu_limit: Optional[Tuple[int, int]] = None
+        self.memory_limit: Optional[Tuple[int, int]] = None
+
+    def __enter__(self) -> 'Budget':
+        if not self.active:
+            return self
+        self.tick = self.TICK
+        if cpu_budget is not None:
+            self.left = cpu_budget
+            self.tick = min(self.tick, cpu_budget) if memory_budget is not None else cpu_budget
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            self.cpu_limit = resource.getrlimit(resource.RLIMIT_CPU)
+            self.set(resource.RLIMIT_CPU, int(usage.ru_utime + usage.ru_stime + 2 * cpu_budget) + 1, self.cpu_limit)
+        if memory_budget is not None and (rss := statm(1)):
+            self.resident = rss + memory_budget * 1024 * 1024
+            self.memory_limit = resource.getrlimit(resource.RLIMIT_AS)
+            self.set(resource.RLIMIT_AS, statm(0) + 2 * memory_budget * 1024 * 1024 + self.SPARE, self.memory_limit)
+        self.armed = True
+        self.handler = signal.signal(signal.SIGPROF, self.check)
+        signal.setitimer(signal.ITIMER_PROF, self.tick, self.tick)
+        return self
+
+    def check(self, signum, frame):
+        if not self.armed:
+            return
+        over = ''
+        if cpu_budget is not None:
+            self.left -= self.tick
+            if self.left < self.tick / 2:
+                over = 'cpu'
+        if not over and self.resident and statm(1) > self.resident:
+            over = 'memory'
+        if over:
+            # исключение бросается один раз: следующий сигнал не прервет его обработку
+            self.armed = False
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            raise OverBudget(over)
+
+    def set(self, kind: int, soft: int, limit: Tuple[int, int]):
+        hard = limit[1]
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(kind, (soft, hard))
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def stop(self):
+        """
+        Снимает сторожа и пределы. Повторный вызов ничего не делает: сигнал, пришедший
+        в самом начале __exit__, прерывает его до восстановления, и тогда stop повторяет workers.check.
+        """
+        self.armed = False # до остановки таймера: ожидающий сигнал уже ничего не бросит
+        try:
+            if self.handler is not None:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+                signal.signal(signal.SIGPROF, self.handler)
+                self.handler = None
+        finally:
+            try:
+                if self.cpu_limit is not None:
+                    resource.setrlimit(resource.RLIMIT_CPU, self.cpu_limit)
+                    self.cpu_limit = None
+            finally:
+                if self.memory_limit is not None:
+                    resource.setrlimit(resource.RLIMIT_AS, self.memory_limit)
+                    self.memory_limit = None
+
+#endregion budget
+
+def parse(src: str, scope: Optional[Scope] = None) -> Tuple[Module, Scope]:
+    """
+    Разбирает исходный текст модуля. Возвращает AST и область видимости модуля.
+    """
+    parser = Parser(src, scope)
+    return parser.parse(), parser.scope
+
+def inspect(path: str, src: str, module: Module, profile: Optional[Profile] = None,
+            counts: Optional[List[int]] = None) -> wire.Batch:
+    """
+    Проверяет разобранный модуль выбранными плагинами.
+    Если передан profile, в него добавляются вызовы и время обработчиков плагинов,
+    если counts - число замечаний каждого плагина.
+    """
+    plugins = [cls(path, src) for cls in selected]
+    module.visit(bsl.visitor.Visitor(plugins, profile))
+    results = [p.close().items for p in plugins]
+    if counts is not None:
+        counts.extend(map(len, results))
+    return wire.pack(issue for items in results for issue in items)
+
+def check(module: ModuleFile, src: str) -> Tuple[Optional[wire.Batch], Timing]:
+    """
+    Анализ уже прочитанного модуля (см. runner.reader).
+    Возвращает замечания и время анализа (процессорное - в потоке).
+    """
+    global retire
+    # пик выделений меряется только в отдельном процессе: в основном он делится по этапам
+    heap = profile_memory and multiprocessing.parent_process() is not None
+    base = 0
+    if heap:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    nodes = None
+    cpu = time.thread_time()
+    strt = time.perf_counter()
+    parsed: Optional[float] = None
+    profile = Profile(profile_keys(selected)) if timing else None
+    counts: List[int] = []
+    budget = Budget()
+    over = ''
+    try:
+        with budget:
+            ast, _ = parse(src, module.scope)
+            parsed = time.perf_counter()
+            batch: Optional[wire.Batch] = inspect(module.path, src, ast, profile, counts)
+            if profile_memory:
+                nodes = output.memory.count(output.memory.walk(ast, NODES), NODES)
+    except OverBudget as e:
+        budget.stop()
+        batch, over = None, e.budget
+    except Exception as e:
+        if isinstance(e, MemoryError) and budget.active:
+            over = 'memory'
+        else:
+            print(module.path)
+            print(e)
+        batch = None
+    if over:
+        retire = True
+    done = time.perf_counter()
+    if parsed is None: # ошибка разбора
+        parsed = done
+    counters = profile.counters() if profile is not None else None
+    result = Timing(time.thread_time() - cpu, parsed - strt, done - parsed, counters,
+                    strt, os.getpid(), threading.get_native_id(),
+                    lines=src.count('\n') + 1, issues=tuple(counts), budget=over)
+    if profile_memory:
+        peak = tracemalloc.get_traced_memory()[1] - base if heap else 0
+        result = result._replace(rss=output.memory.peak_rss(), heap=peak, nodes=nodes)
+    return batch, result
+
+def check_file(module: ModuleFile) -> Tuple[Optional[wire.Batch], Optional[Timing]]:
+    """
+    То же, что check, с чтением модуля в рабочем процессе (см. runner.daemon).
+    """
+    if not sources.exists(module.path):
+        return None, None
+    return check(module, sources.read_text(module.path))
+
+# Модули, унаследованные рабочими процессами при fork.
+modules: List[ModuleFile] = []
+
+def check_at(index: int) -> Tuple[Optional[wire.Batch], Optional[Timing]]:
+    return check_file(modules[index])
+
+# Области видимости, унаследованные рабочими процессами при fork.
+shared: List[Scope] = []
+
+def share(scope: Scope):
+    """
+    Регистрирует область видимости до fork: далее в задачах она передается номером.
+    """
+    shared.append(scope)
+
+def shared_scope(index: int) -> Scope:
+    return shared[index]
+
+def reduce_scope(scope: Scope):
+    for i, item in enumerate(shared):
+        if item is scope:
+            return shared_scope, (i,)
+    return scope.__reduce_ex__(2)
+
+ForkingPickler.register(Scope, reduce_scope)
+
+def can_fork() -> bool:
+    return sys.platform == 'linux' and 'fork' in multiprocessing.get_all_start_methods()
+
+def prepare():
+    """
+    Достраивает в родителе то, что иначе каждый процесс создавал бы сам:
+    все Item глобального контекста.
+    """
+    for table in (global_scope.Vars, global_scope.Methods):
+        for name in table:
+            table.get(name)
+
+def freeze():
+    """
+    Готовит родителя к fork: достраивает общее состояние (см. prepare) и убирает
+    все построенные объекты из-под сборщика мусора. Отменяется gc.unfreeze().
+    """
+    prepare()
+    gc.collect()
+    gc.freeze()
+
+#region startup
+
+def memory() -> Dict[str, int]:
+    """
+    Память текущего процесса (Кб) по /proc/self/smaps_rollup:
+    Rss - резидентная, Pss - с долей общих страниц, Private - только своя.
+    """
+    result = {'Rss': 0, 'Pss': 0, 'Private': 0}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if name in ('Rss', 'Pss'):
+                    result[name] = int(value.split()[0])
+                elif name in ('Private_Clean', 'Private_Dirty'):
+                    result['Private'] += int(value.split()[0])
+    except OSError:
+        pass
+    return result
+
+def probe(started: float, delay: float):
+    """
+    Задача-замер: время от создания пула до начала работы процесса и его память.
+    Задержка нужна, чтобы каждую задачу взял отдельный процесс.
+    """
+    elapsed = time.time() - started
+    time.sleep(delay)
+    return os.getpid(), elapsed, memory()
+
+def startup(method: str, workers: int, delay: float = 0.5):
+    """
+    Запускает пул указанным способом (fork или spawn) и возвращает замеры по каждому процессу.
+    """
+    ctx = multiprocessing.get_context(method)
+    if method == 'fork':
+        freeze()
+    try:
+        started = time.time()
+        with ProcessPoolExecutor(workers, mp_context=ctx) as executor:
+            results = list(executor.map(probe, [started] * workers, [delay] * workers))
+    finally:
+        if method == 'fork':
+            gc.unfreeze()
+    return list({pid: (elapsed, mem) for pid, elapsed, mem in results}.values())
+
+#endregion startup
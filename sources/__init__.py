@@ -0,0 +1,87 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Источники файлов выгрузки конфигурации.
+Все чтение метаданных (md.base.XMLParser) и модулей идет через текущий источник,
+по умолчанию - файловая система. Другие источники: sources.git, sources.archive.
+Источник сериализуется для рабочих процессов (spawn) и после fork переоткрывает
+свои ресурсы (процессы, файлы) в каждом процессе заново.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+import hashlib
+import io
+import os.path
+
+class Source(ABC):
+
+    @abstractmethod
+    def read(self, path: str) -> Optional[bytes]:
+        """
+        Содержимое файла или None, если его нет.
+        """
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        pass
+
+    def text(self, path: str) -> str:
+        """
+        Текст файла в UTF-8 (с BOM или без) с переводами строк, приведенными к \\n,
+        как при чтении open(path, 'r', encoding='utf-8-sig').
+        """
+        data = self.read(path)
+        if data is None:
+            raise FileNotFoundError(path)
+        return decode(data)
+
+    def close(self):
+        pass
+
+def decode(data: bytes) -> str:
+    return io.TextIOWrapper(io.BytesIO(data), encoding='utf-8-sig').read()
+
+def content_hash(data: bytes) -> bytes:
+    """
+    Хэш содержимого файла, по нему кэши и контрольные точки узнают неизмененные модули.
+    """
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def normpath(path: str) -> str:
+    """
+    Путь модуля как ключ: абсолютный и в регистре файловой системы.
+    """
+    return os.path.normcase(os.path.abspath(path))
+
+class FileSource(Source):
+
+    def read(self, path: str) -> Optional[bytes]:
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def exists(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def text(self, path: str) -> str:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            return f.read()
+
+# Текущий источник (наследуется рабочими процессами при fork).
+current: Source = FileSource()
+
+def use(source: Source):
+    global current
+    current.close()
+    current = source
+
+def read_text(path: str) -> str:
+    return current.text(path)
+
+def exists(path: str) -> bool:
+    return current.exists(path)
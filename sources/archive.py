@@ -0,0 +1,154 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Чтение выгрузки из архива (.zip, .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz) без распаковки в файлы.
+Индекс "путь -> смещение, размер" строится один раз: для zip - по центральному каталогу,
+для tar - по заголовкам. Рабочие процессы читают члены архива по смещению (os.pread),
+из своего дескриптора в каждом процессе и потоке чтения.
+Сжатый tar не допускает произвольного доступа, поэтому он один раз распаковывается
+во временный файл tar (один файл вместо тысяч).
+Пути - относительно корня архива.
+"""
+
+from typing import Optional, Dict, List, Tuple, NamedTuple, BinaryIO
+import threading
+import tempfile
+import tarfile
+import zipfile
+import struct
+import shutil
+import zlib
+import os
+import os.path
+
+from sources import Source
+
+class Member(NamedTuple):
+    offset: int # смещение данных (для zip - локального заголовка)
+    size: int   # размер данных в архиве
+    method: int # zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, для tar - ZIP_STORED
+
+class ArchiveSource(Source):
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.members: Dict[str, Member] = {}
+        self.local = threading.local()
+        self.files: List[Tuple[int, BinaryIO]] = [] # процесс анализа, файл
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['local'] = None
+        state['files'] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+
+    def open(self) -> BinaryIO:
+        local = self.local
+        if getattr(local, 'pid', None) != os.getpid():
+            local.file = open(self.path, 'rb')
+            local.pid = os.getpid()
+            self.files.append((local.pid, local.file))
+        return local.file
+
+    def key(self, path: str) -> str:
+        return os.path.normpath(path).replace(os.sep, '/').lstrip('/')
+
+    def exists(self, path: str) -> bool:
+        return self.key(path) in self.members
+
+    def pread(self, size: int, offset: int) -> bytes:
+        file = self.open()
+        if hasattr(os, 'pread'):
+            return os.pread(file.fileno(), size, offset)
+        file.seek(offset)
+        return file.read(size)
+
+    def read(self, path: str) -> Optional[bytes]:
+        member = self.members.get(self.key(path))
+        if member is None:
+            return None
+        return self.pread(member.size, member.offset)
+
+    def close(self):
+        pid = os.getpid()
+        for owner, file in self.files:
+            if owner == pid:
+                file.close()
+        self.files = []
+        self.local = threading.local()
+
+class ZipSource(ArchiveSource):
+
+    # сигнатура, версия, флаги, метод, время, дата, crc, размеры, длина имени, длина доп. поля
+    LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        with zipfile.ZipFile(self.path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    self.members[self.key(info.filename)] = Member(info.header_offset, info.compress_size, info.compress_type)
+
+    def read(self, path: str) -> Optional[bytes]:
+        key = self.key(path)
+        member = self.members.get(key)
+        if member is None:
+            return None
+        if member.method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            # прочие методы сжатия - через zipfile поверх своего дескриптора
+            with zipfile.ZipFile(self.open()) as archive:
+                return archive.read(key)
+        header = self.LOCAL_HEADER.unpack(self.pread(self.LOCAL_HEADER.size, member.offset))
+        name_length, extra_length = header[-2:]
+        data = self.pread(member.size, member.offset + self.LOCAL_HEADER.size + name_length + extra_length)
+        if member.method == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -zlib.MAX_WBITS)
+        return data
+
+class TarSource(ArchiveSource):
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.temp: Optional[str] = None
+        self.owner = os.getpid()
+        try:
+            self.index()
+        except tarfile.ReadError:
+            # сжатый tar: смещения имеют смысл только в распакованном потоке
+            self.temp = self.unpack()
+            self.path = self.temp
+            self.index()
+
+    def index(self):
+        with tarfile.open(self.path, 'r:') as archive:
+            for info in archive:
+                if info.isfile():
+                    self.members[self.key(info.name)] = Member(info.offset_data, info.size, zipfile.ZIP_STORED)
+
+    def unpack(self) -> str:
+        with tarfile.open(self.path, 'r:*') as archive, \
+                tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as temp:
+            shutil.copyfileobj(archive.fileobj, temp, 1024 * 1024)
+            return temp.name
+
+    def close(self):
+        super().close()
+        if self.temp is not None and self.owner == os.getpid():
+            try:
+                os.unlink(self.temp)
+            except OSError:
+                pass
+            self.temp = None
+
+def open_archive(path: str) -> ArchiveSource:
+    if zipfile.is_zipfile(path):
+        return ZipSource(path)
+    if tarfile.is_tarfile(path):
+        return TarSource(path)
+    raise ValueError(f'Неизвестный формат архива: {path}')
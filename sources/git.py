@@ -0,0 +1,92 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""
+Чтение выгрузки из объектов git заданной ревизии без извлечения в рабочий каталог.
+Список файлов берется один раз (git ls-tree), содержимое - через постоянный
+процесс git cat-file --batch, свой в каждом процессе и потоке чтения.
+Пути - относительно корня репозитория (допустимы и полные пути внутри него).
+"""
+
+from typing import Optional, Dict, List, Tuple, IO
+import subprocess
+import threading
+import os
+import os.path
+
+from sources import Source
+
+class GitSource(Source):
+
+    def __init__(self, repo: str, revision: str = 'HEAD'):
+        self.repo = os.path.abspath(repo)
+        self.top = self.git('rev-parse', '--show-toplevel').strip() or self.repo
+        self.revision = self.git('rev-parse', '--verify', revision + '^{commit}').strip()
+        self.blobs: Dict[str, str] = {} # путь -> идентификатор объекта
+        listing = self.git('ls-tree', '-r', '-z', '--full-tree', self.revision)
+        for entry in listing.split('\0'):
+            if not entry:
+                continue
+            info, _, path = entry.partition('\t')
+            _, kind, oid = info.split()
+            if kind == 'blob':
+                self.blobs[path] = oid
+        self.local = threading.local()
+        self.processes: List[Tuple[int, subprocess.Popen]] = [] # процесс анализа, cat-file
+
+    def git(self, *args: str) -> str:
+        return subprocess.run(['git', '-C', self.repo, '-c', 'core.quotepath=off', *args],
+                              capture_output=True, text=True, check=True).stdout
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['local'] = None
+        state['processes'] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+
+    def process(self) -> subprocess.Popen:
+        local = self.local
+        if getattr(local, 'pid', None) != os.getpid():
+            # процесс родителя после fork не используется: канал общий
+            local.process = subprocess.Popen(['git', '-C', self.repo, 'cat-file', '--batch'],
+                                             stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            local.pid = os.getpid()
+            self.processes.append((local.pid, local.process))
+        return local.process
+
+    def key(self, path: str) -> str:
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self.top)
+        return os.path.normpath(path).replace(os.sep, '/')
+
+    def exists(self, path: str) -> bool:
+        return self.key(path) in self.blobs
+
+    def read(self, path: str) -> Optional[bytes]:
+        oid = self.blobs.get(self.key(path))
+        if oid is None:
+            return None
+        process = self.process()
+        stdin: IO[bytes] = process.stdin # type: ignore
+        stdout: IO[bytes] = process.stdout # type: ignore
+        stdin.write(oid.encode() + b'\n')
+        stdin.flush()
+        header = stdout.readline().split()
+        if len(header) != 3:
+            raise OSError(f'git cat-file: {b" ".join(header).decode()}')
+        data = stdout.read(int(header[2]) + 1)
+        return data[:-1]
+
+    def close(self):
+        pid = os.getpid()
+        for owner, process in self.processes:
+            if owner == pid:
+                process.stdin.close() # type: ignore
+                process.wait()
+        self.processes = []
+        self.local = threading.local()
@@ -0,0 +1,47 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import hashlib
+import os
+
+from bench.corpus import Generator
+from bench.micro import SIZES, run, compare
+from runner.pipeline import Pipeline, load
+
+def digest(root):
+    h = hashlib.sha1()
+    for dirpath, dirnames, names in sorted(os.walk(root)):
+        dirnames.sort()
+        for name in sorted(names):
+            with open(os.path.join(dirpath, name), 'rb') as f:
+                h.update(name.encode() + f.read())
+    return h.hexdigest()
+
+class TestCorpus:
+
+    def test_seed(self, tmp_path):
+        for name, seed in [('a', 1), ('b', 1), ('c', 2)]:
+            Generator(seed).configuration(str(tmp_path / name), **SIZES['tiny'])
+        assert digest(tmp_path / 'a') == digest(tmp_path / 'b')
+        assert digest(tmp_path / 'a') != digest(tmp_path / 'c')
+
+    def test_lint(self, tmp_path, capsys):
+        modules = Generator(1).configuration(str(tmp_path), **SIZES['tiny'])
+        pipeline = Pipeline('serial')
+        issues = sum(len(list(result)) for result in pipeline.run(str(tmp_path)))
+        # глобальные общие модули не анализируются
+        assert pipeline.modules + pipeline.duplicates == len(load(str(tmp_path), []).modules) == len(modules) - 1
+        assert issues > 0
+        assert capsys.readouterr().out == '' # модули разбираются без ошибок
+
+class TestMicro:
+
+    def test_run(self, tmp_path):
+        result = run(size='tiny', repeat=1, only=['parse', 'plugin.EmptyExcept', 'report'])
+        assert set(result['benchmarks']) == {'parse', 'plugin.EmptyExcept', 'report'}
+        assert result['benchmarks']['parse']['lines'] == result['corpus']['lines']
+        slower = {**result, 'benchmarks': {name: {**item, 'min': item['min'] * 2}
+                                           for name, item in result['benchmarks'].items()}}
+        assert all(regression for *_, regression in compare(result, slower, 0.5))
+        assert not any(regression for *_, regression in compare(slower, result, 0.5))
@@ -2,6 +2,7 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
+import marshal
 import pytest
 from bsl.parser import Parser, Error
 from bsl.parser import UnexpectedSyntax, UnexpectedChar, UnexpectedToken, UnknownToken
@@ -74,3 +75,49 @@ class TestParser:
     def test_error(self):
 
         error("x = x + 1", Error('Undeclared identifier "x"', 4, 1))
+
+    def test_global_aliases(self):
+
+        m = Parser('x = StrFind("a", "b"); y = СтрНайти("a", "b"); z = стрнайти("a", "b")').parse()
+        heads = [stmt.Right.Head for stmt in m.Body]
+        assert heads[0] is heads[1] is heads[2]
+        assert heads[0].Name == 'StrFind'
+
+class TestGlobalSnapshot:
+
+    def decl(self, item):
+        decl = item.Decl
+        params = [(p.Name, p.Required) for p in getattr(decl, 'Params', [])]
+        return type(decl), item.Name, decl.Name, decl.EnvMask, getattr(decl, 'RetVal', None), params
+
+    def test_same_as_context(self):
+        import bsl.glob as glob
+        import bsl.context as context
+        assert glob.load() == glob.build()
+        for props, table in [(context.props + context.enums, glob.scope.Vars), (context.methods, glob.scope.Methods)]:
+            assert len(table.entries) == len(props)
+            for i, prop in enumerate(props):
+                # запись снимка дает Item с тем же содержимым, что и объявление
+                assert self.decl(table.make(table.entries[i])) == self.decl(prop.item)
+                # каждое написание ведет к сущности с этим именем (имя может быть у двух сущностей)
+                for name in prop.names:
+                    assert name.lower() in map(str.lower, table.entries[table.entity(name)][0])
+                    assert table[name.lower()] is table[table.entries[table.entity(name)][0][0].lower()]
+
+    def test_invalidated(self, tmp_path, monkeypatch):
+        import bsl.glob as glob
+        source = tmp_path / 'context.py'
+        source.write_bytes(open(glob.snapshot_source(), 'rb').read())
+        monkeypatch.setattr(glob, 'snapshot_source', lambda: str(source))
+        path = glob.snapshot_path(str(source))
+        assert glob.load() == glob.build()
+        stale = glob.snapshot_key(str(source))
+        with open(path, 'rb') as f:
+            assert marshal.loads(f.read())[0] == stale
+        with open(path, 'wb') as f:
+            marshal.dump((stale, [], {}, [], {}), f)
+        assert glob.load() == ([], {}, [], {}) # снимок действителен
+        source.write_text(source.read_text('utf-8') + '\n# changed\n', 'utf-8')
+        assert glob.load() == glob.build()
+        with open(path, 'rb') as f:
+            assert marshal.loads(f.read())[0] == glob.snapshot_key(str(source)) != stale
@@ -0,0 +1,112 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import io
+import json
+
+from runner.lsp import Server, path_uri, diagnostic
+from runner.incremental import Module, split
+from tests.test_runner import configuration, SRC
+
+def frame(message):
+    body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    return b'Content-Length: %d\r\n\r\n' % len(body) + body
+
+def replies(data):
+    reader = io.BytesIO(data)
+    result = []
+    while reader.read(len(b'Content-Length: ')):
+        length = int(reader.readline())
+        reader.readline()
+        result.append(json.loads(reader.read(length)))
+    return result
+
+class TestServer:
+
+    def test_diagnostics(self, tmp_path):
+        root = configuration(tmp_path)
+        uri = path_uri(str(root / 'Documents/Заказ/Ext/ObjectModule.bsl'))
+        messages = [
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {'rootUri': path_uri(str(root))}},
+            {'jsonrpc': '2.0', 'method': 'textDocument/didOpen',
+             'params': {'textDocument': {'uri': uri, 'languageId': 'bsl', 'version': 1, 'text': SRC}}},
+            {'jsonrpc': '2.0', 'method': 'textDocument/didChange',
+             'params': {'textDocument': {'uri': uri, 'version': 2}, 'contentChanges': [{'text': 'Процедура Тест(\n'}]}},
+            {'jsonrpc': '2.0', 'method': 'textDocument/didChange',
+             'params': {'textDocument': {'uri': uri, 'version': 3}, 'contentChanges': [{'text': SRC}]}},
+            {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'},
+            {'jsonrpc': '2.0', 'method': 'exit'},
+        ]
+        out = io.BytesIO()
+        server = Server(io.BytesIO(b''.join(map(frame, messages))), out, debounce=None)
+        server.serve()
+        result = replies(out.getvalue())
+        assert result[0]['id'] == 1 and result[0]['result']['capabilities']['textDocumentSync']['change'] == 1
+        assert len(server.modules) == 4
+        opened = result[1]['params']
+        assert opened['uri'] == uri
+        assert 'Пустой блок Исключение' in [d['message'] for d in opened['diagnostics']]
+        broken = result[2]['params']['diagnostics']
+        assert len(broken) == 1 and broken[0]['severity'] == 1
+        assert result[3]['params'] == opened # повторный текст берется из кэша
+        assert result[4] == {'jsonrpc': '2.0', 'id': 2, 'result': None}
+
+    def test_settle(self, tmp_path):
+        uri = path_uri(str(tmp_path / 'Модуль.bsl'))
+        out = io.BytesIO()
+        server = Server(io.BytesIO(), out, debounce=0.01, settle=0.1)
+
+        def change(version, text):
+            server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didChange',
+                           'params': {'textDocument': {'uri': uri, 'version': version}, 'contentChanges': [{'text': text}]}})
+            server.timers[uri].join()
+            if (timer := server.settles.get(uri)) is not None:
+                timer.join()
+
+        def scope():
+            local = server.states[uri].local
+            return sorted(local.Vars), sorted(local.Methods)
+
+        server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didOpen',
+                       'params': {'textDocument': {'uri': uri, 'languageId': 'bsl', 'version': 1, 'text': METHODS}}})
+        change(1, METHODS)
+        opened = scope()
+        # одна и та же часть правится дважды: инкрементальная проверка, затем полная после паузы
+        for version, body in enumerate(['    А = 1;\n', '    Попытка\n    Исключение\n    КонецПопытки;\n'], 2):
+            edited = METHODS.replace('Процедура Метод3(Параметр) Экспорт\n', 'Процедура Метод3(Параметр) Экспорт\n' + body)
+            change(version, edited)
+            assert scope() == opened
+        assert replies(out.getvalue())[-1]['params']['diagnostics'] == [diagnostic(issue) for issue in Module('Модуль.bsl').check(edited)]
+        assert server.states[uri].full
+
+METHODS = ''.join(
+    f'Процедура Метод{i}(Параметр) Экспорт\n'
+    f'    Если Параметр = {i} Тогда\n'
+    f'        Метод{i + 1}(Параметр);\n'
+    f'    КонецЕсли;\n'
+    f'КонецПроцедуры\n\n'
+    for i in range(20)
+) + 'Процедура Метод20(Параметр)\nКонецПроцедуры\n'
+
+class TestIncremental:
+
+    def test_split(self):
+        src = 'Перем А;\n\n&НаСервере\n' + METHODS + 'А = 1;\n'
+        chunks = split(src)
+        assert ''.join(chunk.text for chunk in chunks) == src
+        assert chunks[0].text == 'Перем А;\n\n'
+        assert chunks[1].text.startswith('&НаСервере\nПроцедура Метод0')
+        assert chunks[1].names == ['метод0']
+        assert chunks[-1].text == 'А = 1;\n'
+        assert [chunk.line for chunk in chunks[:3]] == [1, 3, 9]
+
+    def test_update_matches_check(self):
+        src = METHODS.replace('    Если Параметр = 5 Тогда\n', '    Если Параметр = 5 Тогда\n    Попытка\n    Исключение\n    КонецПопытки;\n')
+        edited = src.replace('Процедура Метод3(Параметр) Экспорт\n', 'Процедура Метод3(Параметр) Экспорт\n    Попытка\n    Исключение\n    КонецПопытки;\n\n')
+        module = Module('Модуль.bsl')
+        module.check(src)
+        incremental = module.update(edited)
+        assert not module.full
+        assert incremental == Module('Модуль.bsl').check(edited)
+        assert len(incremental) == 2
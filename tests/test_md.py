@@ -0,0 +1,63 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import sys
+
+import md.base as base
+import md.conf
+import md.rights
+
+def classes(module):
+    return {name: cls for name, cls in vars(module).items()
+            if type(cls) == type and issubclass(cls, base.XMLData)}
+
+def tables(classes):
+    return {name: {field: (td.meta, td.list) for field, td in cls._types.items()}
+            for name, cls in classes.items()}
+
+class TestTypesCache:
+
+    def test_same_as_fresh(self):
+        items = classes(md.conf)
+        cached = tables(items)
+        try:
+            base.build_types(items)
+            assert tables(items) == cached
+        finally:
+            base.fill_types(vars(md.conf))
+
+    def test_stale_key(self, tmp_path):
+        ns = dict(vars(md.rights), __file__=str(tmp_path / 'rights.py'))
+        items = classes(md.rights)
+        expected = tables(items)
+        path = base.types_cache_path(ns)
+        key = base.types_cache_key(ns, items)
+        name = next(iter(items))
+        saved = items[name]._types
+        try:
+            items[name]._types = {}
+            base.save_types(items, path, key)
+            base.fill_types(ns) # ключ совпал - таблицы из кэша
+            assert items[name]._types == {}
+            base.save_types(items, path, 'stale')
+            base.fill_types(ns)
+            assert tables(items) == expected
+        finally:
+            items[name]._types = saved
+
+    def test_key_sources(self, tmp_path, monkeypatch):
+        ns = vars(md.conf)
+        items = classes(md.conf)
+        monkeypatch.setattr(base, 'ROOT', '') # все модули с исходниками
+        key = base.types_cache_key(ns, items)
+        # модули типов аннотаций и предков классов входят в ключ
+        for name in ['md.enums', 'md.common', 'md.base']:
+            module = sys.modules[name]
+            source = tmp_path / f'{name}.py'
+            with open(module.__file__, 'rb') as f:
+                source.write_bytes(f.read() + b'\n# changed\n')
+            with monkeypatch.context() as m:
+                m.setattr(module, '__file__', str(source))
+                assert base.types_cache_key(ns, items) != key
+        assert base.types_cache_key(ns, items) == key
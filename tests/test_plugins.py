@@ -0,0 +1,95 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from bsl.parser import Parser
+import bsl.visitor
+import plugins.bsl.errors as errors
+import plugins.bsl.warnings as warnings
+
+def issues(plugin_class, src):
+    plugin = plugin_class('test.bsl', src)
+    Parser(src).parse().visit(bsl.visitor.Visitor([plugin]))
+    return [issue.message for issue in plugin.close().items]
+
+class TestUnavailableMethods:
+
+    def test_directive(self):
+
+        src = (
+            '&НаКлиенте\n'
+            'Процедура Тест()\n'
+            '    НачатьТранзакцию();\n'
+            '    ПоказатьПредупреждение(, "");\n'
+            'КонецПроцедуры\n'
+            '&НаСервере\n'
+            'Процедура Тест2()\n'
+            '    НачатьТранзакцию();\n'
+            '    ПоказатьПредупреждение(, "");\n'
+            'КонецПроцедуры\n'
+        )
+        assert issues(errors.UnavailableMethods, src) == [
+            'Метод "НачатьТранзакцию" недоступен в окружении: ThinClient, WebClient',
+            'Метод "ПоказатьПредупреждение" недоступен в окружении: Server',
+        ]
+
+    def test_spelling(self):
+
+        src = (
+            '&НаКлиенте\n'
+            'Процедура Тест()\n'
+            '    BeginTransaction();\n'
+            '    НАЧАТЬТРАНЗАКЦИЮ();\n'
+            'КонецПроцедуры\n'
+        )
+        assert issues(errors.UnavailableMethods, src) == [
+            'Метод "BeginTransaction" недоступен в окружении: ThinClient, WebClient',
+            'Метод "НАЧАТЬТРАНЗАКЦИЮ" недоступен в окружении: ThinClient, WebClient',
+        ]
+
+    def test_preprocessor(self):
+
+        src = (
+            'Процедура Тест()\n'
+            '#Если Клиент Тогда\n'
+            '    НачатьТранзакцию();\n'
+            '#Иначе\n'
+            '    НачатьТранзакцию();\n'
+            '#КонецЕсли\n'
+            '    НачатьТранзакцию();\n'
+            'КонецПроцедуры\n'
+        )
+        # ветка Иначе - отрицание, окружение кода вне директив неизвестно
+        assert issues(errors.UnavailableMethods, src) == [
+            'Метод "НачатьТранзакцию" недоступен в окружении: ThinClient, WebClient',
+        ]
+
+    def test_negation(self):
+
+        src = (
+            '&НаКлиенте\n'
+            'Процедура Тест()\n'
+            '#Если НЕ ВебКлиент Тогда\n'
+            '    НачатьТранзакцию();\n'
+            '#КонецЕсли\n'
+            'КонецПроцедуры\n'
+            '#Если НЕ ВебКлиент Тогда\n'
+            'ПоказатьПредупреждение(, "");\n'
+            '#КонецЕсли\n'
+        )
+        # отрицание сужает только окружение директивы
+        assert issues(errors.UnavailableMethods, src) == [
+            'Метод "НачатьТранзакцию" недоступен в окружении: ThinClient',
+        ]
+
+class TestDeprecated:
+
+    def test_spelling(self):
+
+        src = (
+            'Процедура Тест()\n'
+            '    ПолучитьФайл("адрес");\n'
+            '    GetFile("адрес");\n'
+            'КонецПроцедуры\n'
+        )
+        assert issues(warnings.Deprecated, src) == ['Метод устарел', 'Метод устарел']
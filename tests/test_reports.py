@@ -0,0 +1,93 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import json
+import pickle
+
+from output.issues import Issue, Location, Kind, Severity
+import reports.sonar as sonar
+import output.wire as wire
+import output.merge as merge
+
+def make(count):
+    return [
+        Issue(Kind.BUG, Severity.MAJOR, f'Сообщение "{i}"\t', 2, Location('C:\\src\\Модуль.bsl', i, i, 1, 5))
+        for i in range(count)
+    ]
+
+class TestWriter:
+
+    def test_same_as_data(self, tmp_path):
+        issues = make(3)
+        path = tmp_path / 'report.json'
+        with sonar.Writer(str(path)) as writer:
+            writer.write(issues[:1])
+            writer.write(issues[1:])
+        assert json.loads(path.read_text('utf-8')) == json.loads(sonar.fromIssues(issues).toJSON())
+        assert writer.count == 3
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / 'report.json'
+        with sonar.Writer(str(path)):
+            pass
+        assert json.loads(path.read_text('utf-8')) == {'issues': []}
+
+    def test_split(self, tmp_path):
+        issues = make(100)
+        path = tmp_path / 'report.json'
+        with sonar.Writer(str(path), 4096) as writer:
+            writer.write(issues)
+        assert len(writer.paths) > 1
+        assert writer.paths[1] == str(tmp_path / 'report.1.json')
+        messages = []
+        for name in writer.paths:
+            with open(name, 'rb') as f:
+                data = f.read()
+            assert len(data) <= 4096
+            messages += [issue['primaryLocation']['message'] for issue in json.loads(data)['issues']]
+        assert messages == [issue.message for issue in issues]
+
+class TestSorter:
+
+    def shuffled(self):
+        issues = make(50) + [Issue(Kind.CODE_SMELL, Severity.INFO, f'Другое {i}', 1, Location(f'Модуль{i % 7}.bsl', i % 5, i % 5, 1, 2))
+                             for i in range(50)]
+        return issues[::-3] + issues[1::3] + issues[-2::-3]
+
+    def test_sorted(self, tmp_path, monkeypatch):
+        issues = self.shuffled()
+        expected = sorted(issues, key=merge.key)
+        with merge.Sorter() as sorter:
+            sorter.write(issues)
+            assert list(sorter) == expected and sorter.spilled == 0
+        # маленький буфер, промежуточные слияния
+        monkeypatch.setattr(merge, 'FANIN', 3)
+        monkeypatch.setattr(merge, 'CHUNK', 4)
+        with merge.Sorter(7, str(tmp_path)) as sorter:
+            for i in range(0, len(issues), 10):
+                sorter.write(issues[i:i+10])
+            assert sorter.count == len(issues)
+            assert list(sorter) == expected
+            assert sorter.spilled > len(issues) // 7
+        assert list(tmp_path.iterdir()) == []
+
+    def test_report(self, tmp_path):
+        issues = self.shuffled()
+        paths = []
+        for order in (issues, issues[::-1]):
+            path = tmp_path / f'report{len(paths)}.json'
+            with merge.Sorter(10, str(tmp_path)) as sorter, sonar.Writer(str(path)) as writer:
+                sorter.write(order)
+                writer.write(sorter)
+            paths.append(path)
+        assert paths[0].read_bytes() == paths[1].read_bytes()
+
+class TestWire:
+
+    def test_roundtrip(self):
+        issues = make(10) + [Issue(Kind.CODE_SMELL, Severity.INFO, 'Другое', 1, Location('Другой.bsl', 1, 2, 3, 4))]
+        batch = pickle.loads(pickle.dumps(wire.pack(issues)))
+        assert len(batch) == len(issues)
+        assert list(batch) == issues
+        assert batch.paths == ('C:\\src\\Модуль.bsl', 'Другой.bsl')
@@ -0,0 +1,565 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import gc
+import json
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from md.visitor import ModuleFile, ModuleKinds
+import runner.workers as workers
+from runner.reader import Reader
+from runner.stats import Stats, Timing
+from runner.history import History
+from runner.checkpoint import Checkpoint
+from runner.pipeline import Pipeline
+from runner.daemon import Daemon
+from runner.client import request
+from runner.changes import Cache, Changes, changed_paths, revision, base, since
+from sources import normpath
+import output.trace as trace
+import output.memory as memory
+import runner.metrics as metrics
+
+SRC = (
+    'Процедура Тест()\n'
+    '    Попытка\n'
+    '        А = 1;\n'
+    '    Исключение\n'
+    '    КонецПопытки;\n'
+    'КонецПроцедуры\n'
+)
+
+def messages(batches):
+    return [[issue.message for issue in batch] for batch in batches]
+
+class TestWorkers:
+
+    @pytest.mark.skipif(not workers.can_fork(), reason='fork недоступен')
+    def test_fork_matches_spawn(self, tmp_path, monkeypatch):
+        root = configuration(tmp_path)
+        forked = messages(Pipeline('process', 2).run(str(root)))
+        monkeypatch.setattr(workers, 'can_fork', lambda: False)
+        spawned = messages(Pipeline('process', 2).run(str(root)))
+        assert forked == spawned
+        assert any(forked)
+        # состояние родителя восстановлено после работы пула
+        assert workers.shared == []
+        assert gc.get_freeze_count() == 0
+
+def configuration(root):
+    """
+    Минимальная выгрузка: общий модуль, глобальный модуль и документ с модулями.
+    """
+    def write(path, text):
+        path = root / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    write('Configuration.xml',
+        '<MetaDataObject><Configuration><Properties><Name>Тест</Name></Properties><ChildObjects>'
+        '<CommonModule>Общий</CommonModule><CommonModule>Глобальный</CommonModule>'
+        '<Document>Заказ</Document>'
+        '</ChildObjects></Configuration></MetaDataObject>')
+    write('Ext/ManagedApplicationModule.bsl', '')
+    for name, glob in [('Общий', 'false'), ('Глобальный', 'true')]:
+        write(f'CommonModules/{name}.xml',
+            f'<MetaDataObject><CommonModule><Properties><Name>{name}</Name>'
+            f'<Global>{glob}</Global></Properties></CommonModule></MetaDataObject>')
+    write('CommonModules/Общий/Ext/Module.bsl', SRC)
+    write('CommonModules/Глобальный/Ext/Module.bsl', 'Процедура Глобальная() Экспорт\nКонецПроцедуры\n')
+    write('Documents/Заказ.xml',
+        '<MetaDataObject><Document><Properties><Name>Заказ</Name></Properties>'
+        '<ChildObjects></ChildObjects></Document></MetaDataObject>')
+    write('Documents/Заказ/Ext/ObjectModule.bsl', SRC)
+    write('Documents/Заказ/Ext/ManagerModule.bsl', SRC)
+    return root
+
+def duplicate(root):
+    """
+    Добавляет в выгрузку документ Счет - копию документа Заказ.
+    """
+    xml = (root / 'Configuration.xml').read_text(encoding='utf-8')
+    (root / 'Configuration.xml').write_text(xml.replace('<Document>Заказ</Document>',
+        '<Document>Заказ</Document><Document>Счет</Document>'), encoding='utf-8')
+    (root / 'Documents/Счет.xml').write_text(
+        (root / 'Documents/Заказ.xml').read_text(encoding='utf-8').replace('Заказ', 'Счет'), encoding='utf-8')
+    shutil.copytree(root / 'Documents/Заказ', root / 'Documents/Счет')
+    return root
+
+check = workers.check
+
+def dying(module, src):
+    """
+    Анализ, на модулях документов завершающий процесс (как SIGXCPU по RLIMIT_CPU).
+    """
+    if 'Documents' in module.path:
+        os._exit(1)
+    return check(module, src)
+
+class TestPipeline:
+
+    def run(self, root, backend, plugins=None):
+        pipeline = Pipeline(backend, 2, plugins)
+        return [[issue.message for issue in result] for result in pipeline.run(str(root))], pipeline
+
+    def test_backends(self, tmp_path):
+        root = configuration(tmp_path)
+        serial, pipeline = self.run(root, 'serial')
+        assert pipeline.modules == 4
+        assert sum(len(result) for result in serial) > 0
+        for backend in ['thread', 'process']:
+            assert self.run(root, backend)[0] == serial
+        assert workers.shared == []
+
+    def test_plugins(self, tmp_path):
+        root = configuration(tmp_path)
+        results, _ = self.run(root, 'serial', ['EmptyExcept'])
+        # общий модуль, модуль приложения, модули объекта и менеджера документа
+        assert results == [['Пустой блок Исключение'], [], ['Пустой блок Исключение'], ['Пустой блок Исключение']]
+
+    def test_dedup(self, tmp_path):
+        root = duplicate(configuration(tmp_path))
+        pipeline = Pipeline('serial', dedup=False)
+        expected = [list(result) for result in pipeline.run(str(root))]
+        pipeline = Pipeline('serial')
+        assert [list(result) for result in pipeline.run(str(root))] == expected
+        assert pipeline.duplicates == 2 and pipeline.modules == 4
+        assert pipeline.dedup_ratio == 2 / 6
+        paths = {issue.location.filepath for result in expected for issue in result}
+        assert os.path.normpath(str(root / 'Documents/Счет/Ext/ObjectModule.bsl')) in paths
+
+    def test_sink(self, tmp_path):
+        root = configuration(tmp_path)
+        expected = [list(result) for result in Pipeline('serial').run(str(root))]
+        pipeline = Pipeline('process', 2)
+        sunk = []
+        pipeline.sink = sunk.append
+        returned = [list(result) for result in pipeline.run(str(root))]
+        # модули, готовые во время загрузки, ушли в sink, остальное и замечания метаданных - в конце
+        assert [list(batch) for batch in sunk] + returned == expected
+        assert len(returned) >= len(pipeline.md_plugins)
+
+    def test_stats(self, tmp_path):
+        root = configuration(tmp_path)
+        expected, _ = self.run(root, 'serial')
+        pipeline = Pipeline('serial')
+        pipeline.stats = Stats()
+        assert [[issue.message for issue in result] for result in pipeline.run(str(root))] == expected
+        stats = pipeline.stats
+        assert len(stats.modules) == pipeline.modules == 4
+        assert set(stats.plugins) == set(workers.registry) | {'DocumentStandardAttributes', 'InteractiveDelete'}
+        hooks = {(plugin, hook): calls for plugin, hook, calls, _ in stats.profile.entries()}
+        assert hooks[('EmptyExcept', 'visit_ExceptStmt')] > 0
+        assert hooks[('DocumentStandardAttributes', 'visit_DocumentProperties')] == 1
+        assert sum(m.issues for m in stats.modules) == sum(map(len, expected[:-2]))
+        assert stats.phases['Document'][1] == 1 and stats.phases['CommonModule'][1] == 2
+        assert not workers.timing
+        # счетчики рабочих процессов складываются в один профиль
+        pipeline = Pipeline('process', 2)
+        pipeline.stats = Stats()
+        list(pipeline.run(str(root)))
+        assert {(plugin, hook): calls for plugin, hook, calls, _ in pipeline.stats.profile.entries()} == hooks
+        table = stats.table(2)
+        assert 'slowest modules (of 4)' in table and 'UnusedVariables' in table
+        stats.save(str(tmp_path / 'stats.json'))
+
+    def test_trace(self, tmp_path):
+        root = configuration(tmp_path)
+        trace.start()
+        try:
+            list(Pipeline('process', 2).run(str(root)))
+        finally:
+            events = trace.stop()
+        assert not trace.enabled()
+        names = {event['name'] for event in events}
+        assert {'metadata', 'Configuration', 'Document', 'XMLParser.parse', 'read', 'parse', 'visit'} <= names
+        parsed = [event for event in events if event['name'] == 'parse']
+        assert len(parsed) == 4 and all(event['pid'] != os.getpid() for event in parsed)
+        assert all(event['ph'] == 'X' and event['dur'] >= 0 and event['ts'] >= 0 for event in events)
+        path = tmp_path / 'trace.json'
+        trace.save(str(path), events)
+        data = json.loads(path.read_text(encoding='utf-8'))
+        assert {event['args']['name'] for event in data['traceEvents'] if event['ph'] == 'M'} >= {'bslinter'}
+
+    def test_memory(self, tmp_path):
+        root = configuration(tmp_path)
+        expected, _ = self.run(root, 'serial')
+        for backend in ('serial', 'process'):
+            memory.start()
+            try:
+                assert messages(Pipeline(backend, 2).run(str(root))) == expected
+            finally:
+                recorder = memory.stop()
+            assert not memory.enabled() and not workers.profile_memory
+            assert {'metadata', 'scopes', 'analysis'} <= set(recorder.phases)
+            assert recorder.phases['metadata'].sites
+            assert {'Scope', 'Item'} <= set(recorder.census['metadata'])
+            assert recorder.census['ast']['Module'][0] == 4
+            assert recorder.rss > 0
+        assert recorder.workers and len(recorder.modules) == 4
+        assert 'peak rss' in recorder.table()
+        recorder.save(str(tmp_path / 'memory.json'))
+
+    @pytest.mark.skipif(not workers.can_fork(), reason='бюджеты модулей - только Linux')
+    def test_budget(self, tmp_path):
+        root = configuration(tmp_path)
+        expected, _ = self.run(root, 'process')
+        body = ''.join(f'    Попытка\n        А{i} = {i};\n    Исключение\n    КонецПопытки;\n' for i in range(5000))
+        (root / 'CommonModules/Общий/Ext/Module.bsl').write_text(f'Процедура Тест()\n{body}КонецПроцедуры\n', encoding='utf-8')
+        errors = metrics.errors.get()
+        for budget, cpu, mem in [('cpu', 0.01, None), ('memory', None, 1)]:
+            pipeline = Pipeline('process', 2)
+            pipeline.cpu_budget, pipeline.memory_budget = cpu, mem
+            results = [[issue.message for issue in result] for result in pipeline.run(str(root))]
+            # модуль пропущен, остальные проанализированы, его процесс заменен
+            assert any(results == expected[:i] + expected[i + 1:] for i in range(len(expected)))
+            [(path, over, timing)] = pipeline.skipped
+            assert path.endswith('Module.bsl') and over == budget and timing.budget == budget
+            assert pipeline.recycled == 1 and workers.cpu_budget is None
+        # пропуск по бюджету - не ошибка анализа
+        assert metrics.over_budget.get('cpu') >= 1 and metrics.errors.get() == errors
+
+    @pytest.mark.skipif(not workers.can_fork(), reason='бюджеты модулей - только Linux')
+    def test_killed(self, tmp_path, monkeypatch):
+        root = duplicate(configuration(tmp_path))
+        monkeypatch.setattr(workers, 'check', dying)
+        pipeline = Pipeline('process', 2)
+        pipeline.cpu_budget = 60
+        results = list(pipeline.run(str(root)))
+        # пропущены только модули погибших процессов и их копии, остальные проанализированы
+        assert sorted(os.path.relpath(path, root) for path, _, _ in pipeline.skipped) == [
+            os.path.join('Documents', name, 'Ext', module)
+            for name in ['Заказ', 'Счет'] for module in ['ManagerModule.bsl', 'ObjectModule.bsl']]
+        assert all(over == 'killed' and timing is None for _, over, timing in pipeline.skipped)
+        assert len(results) == 2 + 2 and pipeline.recycled == 2
+
+    @pytest.mark.skipif(not workers.can_fork(), reason='fork недоступен')
+    def test_broken(self, tmp_path, monkeypatch):
+        root = configuration(tmp_path)
+        monkeypatch.setattr(workers, 'check', dying)
+        pipeline = Pipeline('process', 2)
+        # без бюджетов гибель процесса ломает пул, и закрытие его не ждет
+        with pytest.raises(BrokenProcessPool):
+            list(pipeline.run(str(root)))
+        assert pipeline.broken and pipeline.executor is None
+
+class TestMetrics:
+
+    def test_render(self, tmp_path):
+        registry = metrics.Registry()
+        counter = registry.counter('test_total', 'Test.', ('rule',))
+        gauge = registry.gauge('test_depth', 'Depth.')
+        counter.inc(2, 'a"b')
+        counter.inc(1, 'c')
+        gauge.set(3)
+        assert registry.render() == (
+            '# HELP test_total Test.\n# TYPE test_total counter\n'
+            'test_total{rule="a\\"b"} 2\ntest_total{rule="c"} 1\n'
+            '# HELP test_depth Depth.\n# TYPE test_depth gauge\ntest_depth 3\n'
+        )
+        path = tmp_path / 'bslinter.prom'
+        registry.write(str(path))
+        assert path.read_text(encoding='utf-8') == registry.render()
+        server = registry.serve(0)
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{server.server_address[1]}/metrics') as response:
+                assert response.read().decode('utf-8') == registry.render()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_pipeline(self, tmp_path):
+        root = configuration(tmp_path)
+        before = {name: metric.get() for name, metric in metrics.registry.metrics.items()}
+        issues = metrics.issues.get('EmptyExcept')
+        result = list(Pipeline('process', 2).run(str(root)))
+        delta = {name: metric.get() - before[name] for name, metric in metrics.registry.metrics.items()}
+        assert delta['bslinter_modules_total'] == 4 and delta['bslinter_runs_total'] == 1
+        assert delta['bslinter_lines_total'] >= 4 and delta['bslinter_errors_total'] == 0
+        assert metrics.issues.get('EmptyExcept') > issues
+        assert sum(metrics.issues.values.values()) >= sum(map(len, result[:-2]))
+        assert metrics.analysis_queue.get() == metrics.read_queue.get() == 0
+
+class TestHistory:
+
+    def test_order(self, tmp_path, monkeypatch):
+        root = configuration(tmp_path)
+        expected, _ = TestPipeline().run(root, 'serial')
+        order = []
+        check = workers.check
+        def spy(module, src):
+            order.append(module.path)
+            return check(module, src)
+        monkeypatch.setattr(workers, 'check', spy)
+        pipeline = Pipeline('serial')
+        pipeline.cost = lambda module, digest, size: size
+        sizes = {}
+        pipeline.record = lambda module, digest, size, timing: sizes.setdefault(module.path, size)
+        # порядок выдачи не зависит от порядка анализа
+        assert messages(pipeline.run(str(root))) == expected
+        assert len(order) == 4 and [sizes[path] for path in order] == sorted(sizes.values(), reverse=True)
+
+    def test_history(self, tmp_path):
+        root = configuration(tmp_path)
+        path = str(tmp_path / 'history.db')
+        with History(path) as history:
+            pipeline = Pipeline('process', 2)
+            pipeline.stats = Stats()
+            pipeline.cost, pipeline.record = history.cost, history.record
+            list(pipeline.run(str(root)))
+            history.save(1.0, pipeline.stats.profile)
+            assert not history.warnings
+        with History(path, minimum=0.0) as history:
+            assert len(history.known) == 4 and history.rate > 0
+            module = ModuleFile(ModuleKinds.CommonModule, str(root / 'CommonModules/Общий/Ext/Module.bsl'))
+            digest, size, seconds = history.known[os.path.normcase(os.path.abspath(module.path))]
+            assert history.cost(module, digest, size) == seconds
+            unknown = ModuleFile(ModuleKinds.CommonModule, str(root / 'Новый.bsl'))
+            assert history.cost(unknown, b'', 1000) == 1000 * history.rate
+            # то же содержимое, время выросло
+            history.record(module, digest, size, Timing(0.0, seconds * 3, 0.0, None))
+            history.record(unknown, b'', 1000, Timing(0.0, 1.0, 0.0, None))
+            assert len(history.warnings) == 1 and 'without source change' in history.warnings[0]
+            history.save(1.0)
+        with History(path) as history:
+            assert len(history.known) == 5
+
+class Interrupted(Exception):
+    pass
+
+class TestCheckpoint:
+
+    def run(self, root, checkpoint, count=None):
+        pipeline = Pipeline('serial')
+        stored = []
+        def store(module, batch, digest):
+            if len(stored) == count:
+                raise Interrupted # прерванный запуск: результаты уже записаны при interval=0
+            checkpoint.store(module, batch, digest)
+            stored.append(module)
+        pipeline.reuse, pipeline.store = checkpoint.reuse, store
+        results = []
+        try:
+            for batch in pipeline.run(str(root)):
+                results.append([issue.message for issue in batch])
+        except Interrupted:
+            pass
+        return results
+
+    def test_resume(self, tmp_path):
+        root = configuration(tmp_path / 'src')
+        expected, _ = TestPipeline().run(root, 'serial')
+        path = str(tmp_path / 'run.checkpoint')
+        # модули записываются по мере анализа, еще во время загрузки метаданных
+        assert self.run(root, Checkpoint(path, 0.0), 2) == []
+        with open(path, 'ab') as f:
+            f.write(b'\xff\x00') # недописанная порция
+        checkpoint = Checkpoint.load(path, 0.0)
+        assert len(checkpoint.done) == 2
+        assert self.run(root, checkpoint) == expected
+        assert checkpoint.resumed == 2
+        checkpoint.close()
+        # измененный модуль анализируется заново, остальные берутся из файла
+        (root / 'CommonModules/Общий/Ext/Module.bsl').write_text('Процедура Тест()\nКонецПроцедуры\n', encoding='utf-8')
+        expected, _ = TestPipeline().run(root, 'serial')
+        checkpoint = Checkpoint.load(path, 0.0)
+        assert len(checkpoint.done) == 4
+        assert self.run(root, checkpoint) == expected
+        assert checkpoint.resumed == 3
+        checkpoint.remove()
+        assert not os.path.exists(path)
+
+    def test_metadata_changed(self, tmp_path):
+        root = configuration(tmp_path / 'src')
+        path = str(tmp_path / 'run.checkpoint')
+        checkpoint = Checkpoint(path, 0.0)
+        self.run(root, checkpoint)
+        checkpoint.close()
+        xml = (root / 'CommonModules/Глобальный.xml').read_text(encoding='utf-8')
+        (root / 'CommonModules/Глобальный.xml').write_text(xml.replace('true', 'false'), encoding='utf-8')
+        checkpoint = Checkpoint.load(path, 0.0)
+        assert len(checkpoint.done) == 4
+        self.run(root, checkpoint)
+        assert checkpoint.resumed == 0
+        checkpoint.close()
+        # файл начат заново с новой сигнатурой
+        assert Checkpoint.load(path).previous == checkpoint.signature != checkpoint.previous
+
+class TestReader:
+
+    def test_iterate(self, tmp_path):
+        paths = []
+        for i in range(10):
+            path = tmp_path / f'{i}.bsl'
+            path.write_bytes(b'\xef\xbb\xbf' + f'// {i}\r\n'.encode())
+            paths.append(str(path))
+        paths.append(str(tmp_path / 'нет.bsl'))
+        with Reader(2, 3) as reader:
+            result = list(reader.iterate(paths))
+            assert len(reader) == 0
+        assert [path for path, _ in result] == paths
+        assert [text.text for _, text in result[:2]] == ['// 0\n', '// 1\n']
+        assert result[-1][1] is None
+        assert reader.io_time > 0
+
+class TestDaemon:
+
+    def test_lint(self, tmp_path):
+        root = configuration(tmp_path / 'src')
+        address = str(tmp_path / 'bslinter.sock')
+        d = Daemon(str(root), 2)
+        d.start()
+        server = threading.Thread(target=d.serve, args=(address,))
+        server.start()
+        try:
+            for _ in range(100):
+                if os.path.exists(address):
+                    break
+                time.sleep(0.01)
+            module = str(root / 'Documents/Заказ/Ext/ObjectModule.bsl')
+            replies = list(request(address, {'lint': [module, 'Нет.bsl']}))
+            assert replies[0] == {'path': 'Нет.bsl', 'error': 'модуль не найден в конфигурации'}
+            assert replies[1]['path'] == module
+            assert 'Пустой блок Исключение' in [issue['primaryLocation']['message'] for issue in replies[1]['issues']]
+            assert replies[2]['done'] and replies[2]['modules'] == 1
+            assert list(request(address, {'stop': True})) == [{'done': True}]
+        finally:
+            server.join(5)
+            d.stop()
+        assert not os.path.exists(address)
+
+    def test_killed(self, tmp_path, monkeypatch):
+        root = configuration(tmp_path)
+        monkeypatch.setattr(workers, 'check', dying)
+        d = Daemon(str(root), 2)
+        d.start()
+        try:
+            document = str(root / 'Documents/Заказ/Ext/ObjectModule.bsl')
+            module = str(root / 'CommonModules/Общий/Ext/Module.bsl')
+            replies = [json.loads(reply) for reply in d.lint([document, module])]
+            assert 'died' in next(reply for reply in replies if reply.get('path') == document)['error']
+            assert 'issues' in next(reply for reply in replies if reply.get('path') == module)
+            # погибший процесс заменен, следующий запрос обслуживается
+            replies = [json.loads(reply) for reply in d.lint([module])]
+            assert 'issues' in replies[0] and replies[1]['done']
+            assert d.executor.replaced == 1
+        finally:
+            d.stop()
+
+    def test_restart(self, tmp_path, monkeypatch):
+        root = configuration(tmp_path)
+        monkeypatch.setattr(workers, 'can_fork', lambda: False)
+        d = Daemon(str(root), 1)
+        d.start()
+        try:
+            executor = d.executor
+            executor.submit(os._exit, 1).exception()
+            module = str(root / 'CommonModules/Общий/Ext/Module.bsl')
+            replies = [json.loads(reply) for reply in d.lint([module])]
+            assert 'issues' in replies[0] and replies[1]['done']
+            assert d.executor is not executor
+        finally:
+            d.stop()
+
+    def test_no_unix_sockets(self, tmp_path, monkeypatch, capsys):
+        import main
+        import runner.client as client
+        monkeypatch.delattr(socket, 'AF_UNIX')
+        with pytest.raises(SystemExit):
+            main.arguments([str(tmp_path), '--serve', str(tmp_path / 'bslinter.sock')])
+        assert 'Unix' in capsys.readouterr().err
+        assert client.main([str(tmp_path / 'bslinter.sock'), 'Модуль.bsl']) == 2
+
+class TestChanges:
+
+    def commit(self, root):
+        subprocess.run(['git', '-C', str(root), 'add', '-A'], check=True)
+        subprocess.run(['git', '-C', str(root), '-c', 'user.name=test', '-c', 'user.email=test@test',
+                        'commit', '-q', '-m', 'test'], check=True)
+
+    def run(self, root, cache, changed=None):
+        changes = Changes(cache, changed)
+        pipeline = Pipeline('serial')
+        pipeline.reuse = changes.reuse
+        pipeline.store = changes.store
+        results = [[issue.message for issue in batch] for batch in pipeline.run(str(root))]
+        changes.result.revision = revision(str(root))
+        return results, changes
+
+    def test_affected(self, tmp_path):
+        root = configuration(tmp_path)
+        subprocess.run(['git', 'init', '-q', str(root)], check=True)
+        self.commit(root)
+        full, changes = self.run(root, Cache())
+        assert len(changes.affected) == 4
+        changes.result.save(str(tmp_path / 'cache'))
+        cache = Cache.load(str(tmp_path / 'cache'))
+        assert cache.revision == revision(str(root))
+
+        # изменен модуль объекта: анализируется только он
+        module = root / 'Documents/Заказ/Ext/ObjectModule.bsl'
+        module.write_text('Процедура Тест()\nКонецПроцедуры\n', encoding='utf-8')
+        self.commit(root)
+        results, changes = self.run(root, cache, changed_paths(str(root), 'HEAD~1..HEAD'))
+        assert changes.affected == [normpath(str(module))]
+        assert len(results) == len(full) and results != full
+
+        # изменен файл метаданных документа: модули объекта и менеджера
+        xml = root / 'Documents/Заказ.xml'
+        xml.write_text(xml.read_text('utf-8').replace('<ChildObjects>', '<ChildObjects> '), encoding='utf-8')
+        self.commit(root)
+        _, changes = self.run(root, changes.result, changed_paths(str(root), 'HEAD~1..HEAD'))
+        assert sorted(os.path.basename(path) for path in changes.affected) == ['ManagerModule.bsl', 'ObjectModule.bsl']
+
+        # изменен экспорт глобального модуля: анализируются все модули
+        glob = root / 'CommonModules/Глобальный/Ext/Module.bsl'
+        glob.write_text('Процедура Глобальная(Параметр) Экспорт\nКонецПроцедуры\n', encoding='utf-8')
+        self.commit(root)
+        _, changes = self.run(root, changes.result, changed_paths(str(root), 'HEAD~1..HEAD'))
+        assert len(changes.affected) == 4
+
+    def test_root_forms(self, tmp_path, capsys):
+        import main
+        root = configuration(tmp_path / 'src')
+        subprocess.run(['git', 'init', '-q', str(root)], check=True)
+        self.commit(root)
+        module = root / 'Documents/Заказ/Ext/ObjectModule.bsl'
+        module.write_text('Процедура Тест()\nКонецПроцедуры\n', encoding='utf-8')
+        # ROOT - путь к Configuration.xml: git запускается в каталоге выгрузки
+        xml = str(root / 'Configuration.xml')
+        assert changed_paths(xml, 'HEAD') == changed_paths(str(root), 'HEAD') == {normpath(str(module))}
+        assert main.arguments([xml, '--changed', 'HEAD']).changed == 'HEAD'
+        # вне репозитория и с неизвестной ревизией - ошибка аргументов, а не исключение
+        other = configuration(tmp_path / 'other')
+        for path, revisions in [(str(other), 'HEAD'), (xml, 'HEAD~5..HEAD')]:
+            with pytest.raises(SystemExit):
+                main.arguments([path, '--changed', revisions])
+            assert '--changed' in capsys.readouterr().err
+
+    def test_stale_cache(self, tmp_path):
+        root = configuration(tmp_path)
+        subprocess.run(['git', 'init', '-q', str(root)], check=True)
+        self.commit(root)
+        _, changes = self.run(root, Cache())
+        cache = changes.result
+        # кэш построен две ревизии назад, диапазон - только последняя
+        changed = []
+        for name in ['ObjectModule.bsl', 'ManagerModule.bsl']:
+            module = root / 'Documents/Заказ/Ext' / name
+            module.write_text('Процедура Тест()\nКонецПроцедуры\n', encoding='utf-8')
+            self.commit(root)
+            changed.append(normpath(str(module)))
+        assert revision(str(root), base('HEAD~1..HEAD')) != cache.revision
+        revisions = since('HEAD~1..HEAD', cache.revision)
+        assert revisions == f'{cache.revision}..HEAD' and since('HEAD', cache.revision) == cache.revision
+        _, changes = self.run(root, cache, changed_paths(str(root), revisions))
+        assert sorted(changes.affected) == sorted(changed)
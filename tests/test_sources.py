@@ -0,0 +1,84 @@
+# Copyright 2019 Tsukanov Alexander. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import os
+import shutil
+import subprocess
+import tarfile
+import zipfile
+
+import sources
+from sources.git import GitSource
+from sources.archive import open_archive, ZipSource, TarSource
+from runner.pipeline import Pipeline
+from tests.test_runner import configuration
+
+def lint(root, backend='serial'):
+    return [[issue.message for issue in batch] for batch in Pipeline(backend, 2).run(root)]
+
+class TestGitSource:
+
+    def test_revision(self, tmp_path):
+        repo = tmp_path / 'repo'
+        root = configuration(repo / 'src')
+        (repo / 'crlf.txt').write_bytes(b'\xef\xbb\xbfa\r\nb\r\n')
+        expected = lint(str(root))
+        subprocess.run(['git', 'init', '-q', str(repo)], check=True)
+        subprocess.run(['git', '-C', str(repo), 'add', '-A'], check=True)
+        subprocess.run(['git', '-C', str(repo), '-c', 'user.name=test', '-c', 'user.email=test@test',
+                        'commit', '-q', '-m', 'test'], check=True)
+        shutil.rmtree(root)
+        source = GitSource(str(repo), 'HEAD')
+        assert source.text('crlf.txt') == 'a\nb\n'
+        assert source.exists(str(repo / 'src/Configuration.xml'))
+        assert not source.exists('src/Нет.xml')
+        sources.use(source)
+        try:
+            assert lint('src') == expected
+            assert lint('src', 'process') == expected
+        finally:
+            sources.use(sources.FileSource())
+
+class TestArchiveSource:
+
+    def archives(self, tmp_path):
+        root = configuration(tmp_path / 'src')
+        (root / 'crlf.txt').write_bytes(b'\xef\xbb\xbfa\r\nb\r\n')
+        expected = lint(str(root))
+        paths = []
+        for compression in (zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED, zipfile.ZIP_BZIP2):
+            path = tmp_path / f'dump{compression}.zip'
+            with zipfile.ZipFile(path, 'w', compression) as archive:
+                for file in root.rglob('*'):
+                    archive.write(file, file.relative_to(tmp_path).as_posix())
+            paths.append(path)
+        for mode, ext in (('w', 'tar'), ('w:gz', 'tar.gz')):
+            path = tmp_path / f'dump.{ext}'
+            with tarfile.open(path, mode) as archive:
+                archive.add(root, 'src')
+            paths.append(path)
+        shutil.rmtree(root)
+        return paths, expected
+
+    def test_archive(self, tmp_path):
+        paths, expected = self.archives(tmp_path)
+        for path in paths:
+            source = open_archive(str(path))
+            assert isinstance(source, TarSource if '.tar' in path.name else ZipSource)
+            assert source.text('src/crlf.txt') == 'a\nb\n'
+            assert source.exists('./src/Configuration.xml')
+            assert not source.exists('src/Нет.xml')
+            sources.use(source)
+            try:
+                assert lint('src') == expected
+                assert lint('src', 'process') == expected
+            finally:
+                sources.use(sources.FileSource())
+
+    def test_temp(self, tmp_path):
+        paths, _ = self.archives(tmp_path)
+        source = open_archive(str(paths[-1]))
+        assert source.temp is not None and os.path.exists(source.temp)
+        source.close()
+        assert not os.path.exists(source.path)